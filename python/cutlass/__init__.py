@@ -83,6 +83,12 @@ def cuda_install_path():
     return _CUDA_INSTALL_PATH
 
 CACHE_FILE = "compiled_cache.db"
+# Directory holding the compiled modules indexed by CACHE_FILE
+CACHE_DIR = "compiled_cache"
+# Database of autotuning results consulted when running operations
+TUNING_FILE = os.path.join(CACHE_DIR, "tuning.db")
+# Database of traced epilogue visitors reused by cutlass.epilogue.trace
+EVT_TRACE_FILE = os.path.join(CACHE_DIR, "evt_traces.db")
 
 from cutlass_library import (
     DataType,
@@ -131,7 +137,7 @@ def get_option_registry():
     """
     if this._option_registry is None:
         this.logger.info("Initializing option registry")
-        this._option_registry = OptionRegistry(device_cc())
+        this._option_registry = OptionRegistry(device_cc(), cache_dir=os.path.join(CACHE_DIR, "options"))
     return this._option_registry
 
 this.__version__ = '3.8.0'
@@ -151,11 +157,36 @@ def get_memory_pool():
     Helper method for on-demand memory pool. This avoids allocating the memory pool unnecessarily
     whe CUTLASS is imported.
     """
-    if this.use_rmm and this.memory_pool is None:
+    if this.memory_pool is None:
+        # Without RMM, this is a caching allocator that does not reserve memory up front
         this.memory_pool = create_memory_pool(init_pool_size=2 ** 30, max_pool_size=2 ** 32)
     return this.memory_pool
 
 
+this._tuning_database = None
+def get_tuning_database():
+    """
+    Helper method for on-demand construction of the database of autotuning results. The database
+    file is only created once a result is recorded.
+    """
+    if this._tuning_database is None:
+        from cutlass.backend.tuning import TuningDatabase
+        this._tuning_database = TuningDatabase(TUNING_FILE)
+    return this._tuning_database
+
+
+this._trace_cache = None
+def get_trace_cache():
+    """
+    Helper method for on-demand construction of the cache of traced epilogue visitors. The database
+    file is only created once a trace is recorded.
+    """
+    if this._trace_cache is None:
+        from cutlass.backend.evt.trace_cache import TraceCache
+        this._trace_cache = TraceCache(EVT_TRACE_FILE)
+    return this._trace_cache
+
+
 from cuda import cuda, cudart
 
 this._device_id = None
@@ -38,7 +38,7 @@ import numpy as np
 
 import cutlass
 from cutlass.backend.frontend import CupyFrontend, NumpyFrontend, TorchFrontend
-from cutlass.backend.memory_manager import DevicePtrWrapper
+from cutlass.backend.memory_manager import device_buffer_cache, device_mem_free, tohost
 from cutlass.utils.datatypes import is_cupy_tensor, is_numpy_tensor, is_torch_tensor
 
 
@@ -83,7 +83,7 @@ class ArgumentBase:
         if is_numpy_tensor(tensor):
             if is_output:
                 assert name
-            self.buffers[name] = NumpyFrontend.argument(tensor, is_output)
+            self.buffers[name] = NumpyFrontend.argument(tensor, is_output, self.stream)
             if is_output:
                 self.host_tensors[name] = tensor
             return self.buffers[name].ptr
@@ -102,15 +102,11 @@ class ArgumentBase:
             if err != cuda.CUresult.CUDA_SUCCESS:
                 raise RuntimeError("CUDA Error %s" % str(err))
 
-        for key in self.host_tensors.keys():
-            host_tensor = self.host_tensors[key]
-            (err,) = cuda.cuMemcpyDtoH(
-                host_tensor,
-                self.buffers[key].ptr,
-                host_tensor.size * host_tensor.itemsize,
-            )
-            if err != cuda.CUresult.CUDA_SUCCESS:
-                raise RuntimeError("CUDA Error %s" % str(err))
+        if len(self.host_tensors) > 0:
+            # Copy results back through pinned staging buffers on the argument's stream
+            tohost([(host_tensor, self.buffers[key].ptr) for key, host_tensor in self.host_tensors.items()], self.stream)
+            for host_tensor in self.host_tensors.values():
+                device_buffer_cache.synchronized(host_tensor)
 
         self.free()
 
@@ -121,13 +117,8 @@ class ArgumentBase:
         # Free any device memory allocated manually
         if not cutlass.use_rmm:
             for name, buf in self.buffers.items():
-                if isinstance(buf, DevicePtrWrapper):
-                    err, = cudart.cudaFree(buf.ptr)
-                    if err != cudart.cudaError_t.cudaSuccess:
-                        raise RuntimeError(f"cudaFree failed with error {err}")
+                device_mem_free(buf)
 
-            if hasattr(self, "workspace_buffer") and isinstance(self.workspace_buffer, DevicePtrWrapper):
-                err, = cudart.cudaFree(self.workspace_buffer.ptr)
-                if err != cudart.cudaError_t.cudaSuccess:
-                    raise RuntimeError(f"cudaFree failed with error {err}")
+            if hasattr(self, "workspace_buffer"):
+                device_mem_free(self.workspace_buffer)
                 del self.workspace_buffer
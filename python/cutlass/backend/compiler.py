@@ -31,18 +31,19 @@
 #################################################################################################
 
 import ctypes
-import json
 import os
-import sqlite3
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from cuda import cuda, nvrtc
 from cutlass_library import SubstituteTemplate
 
 import cutlass
-from cutlass import CACHE_FILE, CUTLASS_PATH, cuda_install_path, logger
+from cutlass import CACHE_DIR, CACHE_FILE, CUTLASS_PATH, cuda_install_path, logger
 from cutlass.backend.gemm_operation import GemmOperationUniversal
+from cutlass.backend.kernel_cache import KernelCache, short_hash
 from cutlass.backend.library import ApiVersion
 from cutlass.backend.utils.device import device_cc
 
@@ -120,34 +121,13 @@ def convertToBinaryData(filename):
     return blobData
 
 
-def CDLLBin(host_binary):
-    tempfile.tempdir = "./"
-    temp_so = tempfile.NamedTemporaryFile(prefix="host_func", suffix=".so", delete=True)
-    with open(temp_so.name, "wb") as file:
-        file.write(host_binary)
-    host_lib = ctypes.CDLL(temp_so.name)
-    return host_lib
-
-
 class ArtifactManager:
     """
     Artifact manager
     """
 
     def __init__(self) -> None:
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        # Create the table if it does not already exist
-        sqlite_create_table_query = """
-        CREATE TABLE IF NOT EXISTS compiled_operations(op_key TEXT NOT NULL UNIQUE,
-                                                        cubin BLOB NOT NULL,
-                                                        hostbin BLOB NOT NULL,
-                                                        op_name TEXT NOT NULL,
-                                                        op_attrs TEXT NOT NULL)
-        """
-        cursor.execute(sqlite_create_table_query)
-        connection.commit()
-        cursor.close()
+        self.cache = KernelCache(CACHE_FILE, CACHE_DIR)
 
         self._nvrtc_compile_options = ["-std=c++17", "-default-device"]
         self._nvcc_compile_options = [
@@ -158,6 +138,13 @@ class ArtifactManager:
         self.nvcc()
         self.compiled_cache_device = {}
         self.compiled_cache_host = {}
+        # Loaded (CUmodule, host library) pairs keyed by module key
+        self.loaded_modules = {}
+
+        # Maximum number of modules compiled concurrently by `add_module`
+        self.max_workers = 1
+        # Seconds spent compiling the module containing each kernel, keyed by kernel name
+        self.compile_times = {}
 
     def nvrtc(self):
         self.backend = "nvrtc"
@@ -167,66 +154,116 @@ class ArtifactManager:
         self.backend = "nvcc"
         self.default_compile_options = self._nvcc_compile_options
 
-    def insert_operation(self, op_key, cubin, hostfile, op_name, op_attrs):
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        sqlite_insert_blob_query = """ INSERT OR IGNORE INTO compiled_operations (op_key, cubin, hostbin, op_name, op_attrs) VALUES (?, ?, ?, ?, ?)"""
-
+    def insert_module(self, cubin, hostfile, kernels):
+        """
+        Insert a compiled module into the database
+
+        :param cubin: cubin image of the module
+        :type cubin: bytes
+        :param hostfile: path to the host library of the module
+        :type hostfile: str
+        :param kernels: list of (kernel key, operation name, operation attributes) tuples for the kernels in the module
+        :type kernels: list
+        """
         hostbin = convertToBinaryData(hostfile)
+        return self.cache.insert(cubin, hostbin, kernels)
 
-        data_tuple = (op_key, cubin, hostbin, op_name, json.dumps(op_attrs))
-
-        cursor.execute(sqlite_insert_blob_query, data_tuple)
-        connection.commit()
-        cursor.close()
+    def load_module(self, module_key):
+        """
+        Load the cubin and host library of a cached module. Each module is loaded at most once per process.
 
-    def load_operation(self, op_key, extra_funcs):
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        sqlite_fetch_blob_query = """SELECT * from compiled_operations where op_key = ?"""
-        cursor.execute(sqlite_fetch_blob_query, (op_key,))
-        record = cursor.fetchall()
-        if len(record) == 0:
-            return False
-        for row in record:
-            key, cubin_image, host_binary, operation_name, op_attr = row
-            op_attr = json.loads(op_attr)
+        :return: tuple containing the loaded CUmodule and host library
+        :rtype: tuple
+        """
+        if module_key not in self.loaded_modules:
+            cubin_path, host_path = self.cache.module_paths(module_key)
+            cubin_image = convertToBinaryData(cubin_path)
             err, module = cuda.cuModuleLoadData(cubin_image)
             if err != cuda.CUresult.CUDA_SUCCESS:
                 raise RuntimeError("Cuda Error: {}".format(err))
+            self.loaded_modules[module_key] = (module, ctypes.CDLL(host_path))
+        return self.loaded_modules[module_key]
 
-            err, kernel = cuda.cuModuleGetFunction(module, bytes(str.encode(operation_name)))
-            self.compiled_cache_device[key] = kernel
+    def load_operation(self, op_key, extra_funcs):
+        record = self.cache.lookup(op_key)
+        if record is None:
+            return False
 
-            compiled_host_fns = {}
-            host_lib = CDLLBin(host_binary)
+        module_key, operation_name, op_attr = record
+        try:
+            module, host_lib = self.load_module(module_key)
+        except OSError:
+            # The module was evicted by another process between lookup and load
+            return False
 
-            func_name = operation_name + "_get_params"
-            func = getattr(host_lib, func_name)
-            func.restype = ctypes.POINTER(ctypes.c_char * op_attr[0])
-            compiled_host_fns["get_args"] = func
+        err, kernel = cuda.cuModuleGetFunction(module, bytes(str.encode(operation_name)))
+        self.compiled_cache_device[op_key] = kernel
 
-            func_name = operation_name + "_shared_memory_size"
-            func = getattr(host_lib, func_name)
-            compiled_host_fns["shared_memory_capacity"] = func()
+        compiled_host_fns = {}
 
-            for attr in op_attr:
-                if isinstance(attr, str):
-                    func_name = operation_name + "_" + attr
-                    func = getattr(host_lib, func_name)
+        func_name = operation_name + "_get_params"
+        func = getattr(host_lib, func_name)
+        func.restype = ctypes.POINTER(ctypes.c_char * op_attr[0])
+        compiled_host_fns["get_args"] = func
 
-                    # Set the return type of the function
-                    if attr in extra_funcs and extra_funcs[attr] != None:
-                        func.restype = extra_funcs[attr]
+        func_name = operation_name + "_shared_memory_size"
+        func = getattr(host_lib, func_name)
+        compiled_host_fns["shared_memory_capacity"] = func()
 
-                    compiled_host_fns[attr] = func
+        for attr in op_attr:
+            if isinstance(attr, str):
+                func_name = operation_name + "_" + attr
+                func = getattr(host_lib, func_name)
 
-            self.compiled_cache_host[key] = compiled_host_fns
+                # Set the return type of the function
+                if attr in extra_funcs and extra_funcs[attr] != None:
+                    func.restype = extra_funcs[attr]
+
+                compiled_host_fns[attr] = func
+
+        self.compiled_cache_host[op_key] = compiled_host_fns
         return True
 
-    def emit_compile_(self, operation_list, compilation_options, host_compilation_options):
+    def toolkit_version(self):
         """
-        Compile a list of kernels and store them into database
+        Returns the version of the compiler used by the current backend
+
+        :return: compiler version
+        :rtype: str
+        """
+        if self.backend == "nvrtc":
+            err, major, minor = nvrtc.nvrtcVersion()
+            if err != nvrtc.nvrtcResult.NVRTC_SUCCESS:
+                raise RuntimeError("NVRTC Error: {}".format(err))
+            return f"{major}.{minor}"
+        return cutlass.nvcc_version()
+
+    def operation_key(self, operation, compile_options):
+        """
+        Returns the key under which a compiled operation is cached. The key is a short SHA-256 digest of the
+        emitted source, the compilation flags, the compiler version and the target architecture.
+
+        :return: cache key of the operation
+        :rtype: str
+        """
+        return short_hash(
+            operation.rt_module.emit(),
+            operation.procedural_name(),
+            self.backend,
+            " ".join(compile_options.flags),
+            self.toolkit_version(),
+            str(compile_options.arch),
+        )
+
+    def emit_source_(self, operation_list):
+        """
+        Emit the device and host sources for a list of kernels
+
+        :param operation_list: runtime modules of the kernels to emit
+        :type operation_list: list
+
+        :return: tuple containing the device source and the host source
+        :rtype: tuple
         """
         source_buffer_device = ""
         source_buffer_host = ""
@@ -264,6 +301,20 @@ class ArtifactManager:
             )
             source_buffer_host += SubstituteTemplate(operation.HostTemplate, values)
 
+        return source_buffer_device, source_buffer_host
+
+    def compile_device_(self, source_buffer_device, compilation_options,
+                        error_file="./cutlass_python_compilation_device_error.txt"):
+        """
+        Compile the device source of a module into a cubin image
+
+        :param error_file: file to which nvcc compilation errors are written. If None, a file named after the
+                           temporary source, and so unique to this translation unit, is used
+        :type error_file: str
+
+        :return: cubin image
+        :rtype: bytes
+        """
         if self.backend == "nvrtc":
             # 3. compile
             err, program = nvrtc.nvrtcCreateProgram(
@@ -305,11 +356,10 @@ class ArtifactManager:
 
         else:  # with nvcc backend
             # emit code
-            tempfile.tempdir = "./"
             temp_cu = tempfile.NamedTemporaryFile(
-                prefix="kernel", suffix=".cu", delete=True)
+                prefix="kernel", suffix=".cu", dir="./", delete=True)
             temp_cubin = tempfile.NamedTemporaryFile(
-                prefix="kernel", suffix=".cubin", delete=True)
+                prefix="kernel", suffix=".cubin", dir="./", delete=True)
             with open(temp_cu.name, "w") as file:
                 file.write(source_buffer_device)
 
@@ -322,22 +372,37 @@ class ArtifactManager:
                 "tarfile": temp_cubin.name,
             }
             cmd = SubstituteTemplate(cmd_template, values)
-            compile_with_nvcc(cmd.split(" "), source_buffer_device, "./cutlass_python_compilation_device_error.txt")
+            if error_file is None:
+                error_file = f"./cutlass_python_compilation_device_error_{os.path.splitext(os.path.basename(temp_cu.name))[0]}.txt"
+            compile_with_nvcc(cmd.split(" "), source_buffer_device, error_file)
 
             # load the cubin image
             with open(temp_cubin.name, "rb") as file:
                 cubin_image = file.read()
 
-        tempfile.tempdir = "./"
+        return cubin_image
+
+    def compile_host_(self, source_buffer_host, host_compilation_options,
+                      error_file="./cutlass_python_compilation_host_error.txt"):
+        """
+        Compile the host source of a module into a shared library
+
+        :param error_file: file to which compilation errors are written. If None, a file named after the
+                           temporary source, and so unique to this translation unit, is used
+        :type error_file: str
+
+        :return: temporary file holding the shared library. The file is removed once the returned object is closed.
+        :rtype: tempfile.NamedTemporaryFile
+        """
         temp_src = tempfile.NamedTemporaryFile(
-            prefix="host_src", suffix=".cu", delete=True)
+            prefix="host_src", suffix=".cu", dir="./", delete=True)
 
         # Write the host source
         with open(temp_src.name, "w") as outfile:
             outfile.write(source_buffer_host)
 
         temp_dst = tempfile.NamedTemporaryFile(
-            prefix="host_func", suffix=".so", delete=True)
+            prefix="host_func", suffix=".so", dir="./", delete=True)
 
         # Set up host compilation arguments
         cmd = []
@@ -346,15 +411,148 @@ class ArtifactManager:
         cmd.extend(host_compilation_options.get_str().split(" "))
         cmd.extend(["-shared", "-o", temp_dst.name, temp_src.name, "-lcudart", "-lcuda"])
 
-        # Comile and load the library
-        compile_with_nvcc( cmd, source_buffer_host, error_file="./cutlass_python_compilation_host_error.txt")
+        # Comile the library
+        if error_file is None:
+            error_file = f"./cutlass_python_compilation_host_error_{os.path.splitext(os.path.basename(temp_src.name))[0]}.txt"
+        compile_with_nvcc(cmd, source_buffer_host, error_file=error_file)
+
+        return temp_dst
+
+    def emit_compile_(self, operation_list, compilation_options, host_compilation_options):
+        """
+        Compile a list of kernels and store them into database
+        """
+        source_buffer_device, source_buffer_host = self.emit_source_(operation_list)
+        cubin_image = self.compile_device_(source_buffer_device, compilation_options)
+        temp_dst = self.compile_host_(source_buffer_host, host_compilation_options)
         host_lib = ctypes.CDLL(temp_dst.name)
 
         return cubin_image, host_lib, temp_dst
 
-    def add_module(self, operations, compile_options=None, bypass_cache=False):
+    def emit_compile_parallel_(self, groups, compilation_options, host_compilation_options, max_workers):
+        """
+        Compile several groups of kernels concurrently. Each group is emitted as its own device and
+        host translation unit, and every translation unit is compiled by a separate worker.
+
+        Workers are threads driving the compiler rather than forked processes: the CUDA context
+        has already been initialized in this process and must not be inherited across ``fork``.
+        Each ``nvcc`` invocation still runs in its own process, and writes any errors to a file of its own.
+
+        :param groups: list of lists of runtime modules. Each inner list forms one module
+        :type groups: list
+        :param max_workers: maximum number of translation units to compile at once
+        :type max_workers: int
+
+        :return: list containing a tuple of (cubin image, host library, host file, device seconds, host seconds)
+                 for each group, in the order of ``groups``
+        :rtype: list
+        """
+        # Emit all sources up front so that workers only operate on strings
+        sources = [self.emit_source_(group) for group in groups]
+
+        def timed(fn, *args):
+            start = time.perf_counter()
+            result = fn(*args)
+            return result, time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            device_futures = [
+                executor.submit(timed, self.compile_device_, device_src, compilation_options, None)
+                for device_src, _ in sources]
+            host_futures = [
+                executor.submit(timed, self.compile_host_, host_src, host_compilation_options, None)
+                for _, host_src in sources]
+
+            results = []
+            for device_future, host_future in zip(device_futures, host_futures):
+                cubin_image, device_time = device_future.result()
+                host_file, host_time = host_future.result()
+                host_lib = ctypes.CDLL(host_file.name)
+                results.append((cubin_image, host_lib, host_file, device_time, host_time))
+
+        return results
+
+    def load_module_(self, operation_list, operation_key, cubin_image, host_lib, host_file):
+        """
+        Load a freshly compiled module, bind its device kernels and host functions to the
+        runtime modules in ``operation_list``, and insert the result into the database
+        """
+        err, module = cuda.cuModuleLoadData(cubin_image)
+        if err != cuda.CUresult.CUDA_SUCCESS:
+            raise RuntimeError("Cuda Error: {}".format(err))
+
+        operation_name = []
+        operation_attr = []
+        for operation, key in zip(operation_list, operation_key):
+            # get device kernels
+            err, operation.kernel = cuda.cuModuleGetFunction(
+                module,
+                bytes(str.encode(operation.name()))
+            )
+            operation_name.append(operation.name())
+            self.compiled_cache_device[key] = operation.kernel
+            # get host functions
+            compiled_host_fns = {}
+            op_attr = []
+
+            # get param size
+            func_name = operation.name() + "_get_param_size"
+            func = getattr(host_lib, func_name)
+            param_size = func()
+
+            func_name = operation.name() + "_get_params"
+            func = getattr(host_lib, func_name)
+            func.argtype = operation.argtype
+            func.restype = ctypes.POINTER(ctypes.c_char * param_size)
+            setattr(operation, "get_args", func)
+            compiled_host_fns["get_args"] = func
+
+            # set shared memory size
+            func_name = operation.name() + "_shared_memory_size"
+            func = getattr(host_lib, func_name)
+            setattr(operation, "shared_memory_capacity", func())
+            compiled_host_fns["shared_memory_capacity"] = func()
+            # set the maximum dynamic shared size
+            operation.initialize()
+
+            # get extra functions
+            op_attr.append(param_size)
+
+            if hasattr(operation, "extra_funcs"):
+                for suffix, ret_type  in operation.extra_funcs.items():
+                    func_name = operation.name() + "_" + suffix
+                    func = getattr(host_lib, func_name)
+                    if ret_type is not None:
+                        func.restype = ret_type
+                    setattr(operation, suffix, func)
+                    compiled_host_fns[suffix] = func
+                    op_attr.append(suffix)
+
+            operation_attr.append(op_attr)
+            self.compiled_cache_host[key] = compiled_host_fns
+
+        # Store the module once, regardless of the number of kernels it contains
+        module_key = self.insert_module(
+            cubin_image, host_file.name, list(zip(operation_key, operation_name, operation_attr)))
+        self.loaded_modules[module_key] = (module, host_lib)
+
+    def add_module(self, operations, compile_options=None, bypass_cache=False, max_workers=None):
         """
         Insert a new compiled device module
+
+        Operations that are not found in the cache are compiled together in a single module by default.
+        When ``max_workers`` is greater than one, they are instead sharded into at most ``max_workers``
+        modules that are compiled concurrently. The time spent compiling the module containing each
+        kernel is recorded in ``self.compile_times``.
+
+        :param operations: operations to compile
+        :type operations: list
+        :param compile_options: options used for compiling device code
+        :type compile_options: CompilationOptions
+        :param bypass_cache: whether to skip looking up operations in the database
+        :type bypass_cache: bool
+        :param max_workers: maximum number of modules to compile concurrently. Defaults to ``self.max_workers``
+        :type max_workers: int
         """
         include_paths = [
             cuda_install_path() + "/include",
@@ -375,8 +573,8 @@ class ArtifactManager:
         operation_key = []
         operation_list = []
         for operation in operations:
-            # step 1: get kernel string as key
-            key = operation.rt_module.emit() + operation.procedural_name() + self.backend
+            # step 1: get digest of kernel string and compilation configuration as key
+            key = self.operation_key(operation, compile_options)
             # step 1: check if the operation is in cache
             compiled_kernel = self.compiled_cache_device.get(key)
 
@@ -396,64 +594,31 @@ class ArtifactManager:
                 operation_list.append(operation.rt_module)
                 operation_key.append(key)
 
-        if len(operation_list) > 0:
-            cubin_image, host_lib, host_file = self.emit_compile_(
-                operation_list, compile_options, host_compile_options)
-
-            err, module = cuda.cuModuleLoadData(cubin_image)
-            if err != cuda.CUresult.CUDA_SUCCESS:
-                raise RuntimeError("Cuda Error: {}".format(err))
+        if len(operation_list) == 0:
+            return
 
-            operation_name = []
-            operation_attr = []
-            for operation, key in zip(operation_list, operation_key):
-                # get device kernels
-                err, operation.kernel = cuda.cuModuleGetFunction(
-                    module,
-                    bytes(str.encode(operation.name()))
-                )
-                operation_name.append(operation.name())
-                self.compiled_cache_device[key] = operation.kernel
-                # get host functions
-                compiled_host_fns = {}
-                op_attr = []
-
-                # get param size
-                func_name = operation.name() + "_get_param_size"
-                func = getattr(host_lib, func_name)
-                param_size = func()
+        if max_workers is None:
+            max_workers = self.max_workers
 
-                func_name = operation.name() + "_get_params"
-                func = getattr(host_lib, func_name)
-                func.argtype = operation.argtype
-                func.restype = ctypes.POINTER(ctypes.c_char * param_size)
-                setattr(operation, "get_args", func)
-                compiled_host_fns["get_args"] = func
-
-                # set shared memory size
-                func_name = operation.name() + "_shared_memory_size"
-                func = getattr(host_lib, func_name)
-                setattr(operation, "shared_memory_capacity", func())
-                compiled_host_fns["shared_memory_capacity"] = func()
-                # set the maximum dynamic shared size
-                operation.initialize()
-
-                # get extra functions
-                op_attr.append(param_size)
-
-                if hasattr(operation, "extra_funcs"):
-                    for suffix, ret_type  in operation.extra_funcs.items():
-                        func_name = operation.name() + "_" + suffix
-                        func = getattr(host_lib, func_name)
-                        if ret_type is not None:
-                            func.restype = ret_type
-                        setattr(operation, suffix, func)
-                        compiled_host_fns[suffix] = func
-                        op_attr.append(suffix)
-
-                operation_attr.append(op_attr)
-                self.compiled_cache_host[key] = compiled_host_fns
-
-            for (key, operation_name, operation_attr,) in zip(operation_key, operation_name, operation_attr):
-                self.insert_operation(
-                    key, cubin_image, host_file.name, operation_name, operation_attr)
+        if max_workers <= 1:
+            start = time.perf_counter()
+            cubin_image, host_lib, host_file = self.emit_compile_(
+                operation_list, compile_options, host_compile_options)
+            elapsed = time.perf_counter() - start
+            compiled = [(operation_list, operation_key, cubin_image, host_lib, host_file, elapsed)]
+        else:
+            # Shard operations round-robin across groups so that each module is compiled as its own
+            # translation unit. The device and host halves of each module are compiled concurrently.
+            num_groups = min(max_workers, len(operation_list))
+            op_groups = [operation_list[i::num_groups] for i in range(num_groups)]
+            key_groups = [operation_key[i::num_groups] for i in range(num_groups)]
+            results = self.emit_compile_parallel_(op_groups, compile_options, host_compile_options, max_workers)
+            compiled = []
+            for ops, keys, (cubin_image, host_lib, host_file, device_time, host_time) in zip(op_groups, key_groups, results):
+                compiled.append((ops, keys, cubin_image, host_lib, host_file, max(device_time, host_time)))
+
+        for ops, keys, cubin_image, host_lib, host_file, elapsed in compiled:
+            self.load_module_(ops, keys, cubin_image, host_lib, host_file)
+            for operation in ops:
+                self.compile_times[operation.name()] = elapsed
+                logger.info(f"Compiled {operation.name()} in a module of {len(ops)} kernel(s) in {elapsed:.2f} s")
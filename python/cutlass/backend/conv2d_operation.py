@@ -160,10 +160,10 @@ class Conv2dArguments(ArgumentBase):
         # Allocate and initialize device workspace
         device_workspace_size = self.operation.rt_module.get_workspace_size(self.c_arguments)
         if device_workspace_size > 0:
-            self.workspace_buffer = device_mem_alloc(device_workspace_size)
+            self.workspace_buffer = device_mem_alloc(device_workspace_size, self.stream)
             workspace_ptr = self.workspace_buffer.ptr
-            err, = cuda.cuMemsetD32(
-                workspace_ptr, 0, device_workspace_size // 4)
+            err, = cuda.cuMemsetD32Async(
+                workspace_ptr, 0, device_workspace_size // 4, self.stream)
         else:
             workspace_ptr = None
 
@@ -38,6 +38,24 @@ from cutlass_library import DataTypeTag
 from cutlass.backend.evt.ir import TopoVisitorNode, DAGIR
 
 
+class EmittedFusionCallbacks:
+    """
+    Fusion callbacks previously emitted from the same DAG IR. Fusion callbacks depend only on the DAG IR,
+    so they can be emitted once and reused by every operation using the epilogue.
+
+    :param callback_decl: C++ declarations of the visitor nodes
+    :type callback_decl: str
+    :param callback_name: name of the root visitor type
+    :type callback_name: str
+    """
+    def __init__(self, callback_decl: str, callback_name: str) -> None:
+        self.callback_decl = callback_decl
+        self.callback_name = callback_name
+
+    def emit(self):
+        return self.callback_decl, self.callback_name
+
+
 class FusionCallbacks:
     def __init__(self, dag_ir: DAGIR, cc: int, emit_CD=True) -> None:
         """
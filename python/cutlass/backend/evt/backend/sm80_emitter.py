@@ -39,8 +39,14 @@ from cutlass.backend import GemmOperationUniversal
 
 
 class Sm80Emitter:
-    def __init__(self, operation: GemmOperationUniversal, graph) -> None:
-        self.fusion_callbacks = FusionCallbacks(graph, cc=80)
+    def __init__(self, operation: GemmOperationUniversal, graph, fusion_callbacks=None) -> None:
+        if fusion_callbacks is None:
+            fusion_callbacks = self.make_fusion_callbacks(graph)
+        self.fusion_callbacks = fusion_callbacks
+
+    @staticmethod
+    def make_fusion_callbacks(graph):
+        return FusionCallbacks(graph, cc=80)
 
     def emit(self):
         callback_decl, callback_name = self.fusion_callbacks.emit()
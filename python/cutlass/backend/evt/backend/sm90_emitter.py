@@ -83,8 +83,9 @@ using EpilogueDescriptor = cutlass::epilogue::collective::detail::EpilogueDescri
 
 
 class Sm90Emitter:
-    def __init__(self, operation: GemmOperationUniversal, graph) -> None:
-        fusion_callbacks = FusionCallbacks(graph, cc=90, emit_CD=False)
+    def __init__(self, operation: GemmOperationUniversal, graph, fusion_callbacks=None) -> None:
+        if fusion_callbacks is None:
+            fusion_callbacks = self.make_fusion_callbacks(graph)
 
         self.collective_epilogue = CollectiveEpilogue(
             tile_description=operation.tile_description,
@@ -94,5 +95,9 @@ class Sm90Emitter:
             fusion_callbacks=fusion_callbacks
         )
 
+    @staticmethod
+    def make_fusion_callbacks(graph):
+        return FusionCallbacks(graph, cc=90, emit_CD=False)
+
     def emit(self):
         return self.collective_epilogue.emit()
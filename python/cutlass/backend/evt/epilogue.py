@@ -42,6 +42,7 @@ import numpy as np
 
 from cutlass.backend.epilogue import EpilogueFunctorBase
 import cutlass.backend.evt.backend
+from cutlass.backend.evt.backend.emitter_base import EmittedFusionCallbacks
 from cutlass.backend.frontend import TensorFrontend
 from cutlass.utils.datatypes import is_numpy_tensor
 from cutlass.backend.evt.passes.util import cc_map
@@ -157,7 +158,10 @@ class EpilogueFunctorVisitor(EpilogueFunctorBase):
         """
         Emit the C++ code
         """
-        emitter = self.emit_cls(operation, self.graph)
+        if self.visitor.fusion_callbacks is None:
+            callback_decl, callback_name = self.emit_cls.make_fusion_callbacks(self.graph).emit()
+            self.visitor.set_fusion_callbacks(EmittedFusionCallbacks(callback_decl, callback_name))
+        emitter = self.emit_cls(operation, self.graph, self.visitor.fusion_callbacks)
         return emitter.emit()
 
     def get_smem_size(self, tile_description):
@@ -56,6 +56,7 @@ from cutlass.backend.evt.passes import (
     PassPreprocessRed,
     PassShapeTypePropagation,
 )
+from cutlass.backend.evt.trace_cache import TracedEpilogue
 from cutlass.backend.utils import device_cc
 from cutlass.epilogue.evt_ops import permute, reshape
 from cutlass.utils.datatypes import library_type
@@ -91,6 +92,12 @@ class EVTFrontendBase:
         else:
             self._epilogue_stages = None
 
+        # Key and cache of the trace, if traced through cutlass.epilogue.trace
+        self.trace_key = None
+        self.trace_cache = None
+        # Emitted fusion callbacks of the visitor, shared by all operations using it
+        self.fusion_callbacks = None
+
     @property
     def epilogue_stages(self):
         return self._epilogue_stages
@@ -109,6 +116,9 @@ class EVTFrontendBase:
 
         # Run the passes
         self.pass_manager()
+        self._set_argument_types()
+
+    def _set_argument_types(self):
         # Set the epilogue type
         self.epilogue_thread_type = self.dag_ir.epilogue_thread_type
         if self.cc == 90:
@@ -116,6 +126,40 @@ class EVTFrontendBase:
             self.arg_d_type = self.dag_ir.arg_d_type
         self.reduction_names = self.dag_ir.reduction_names
 
+    def traced(self):
+        """
+        Returns the result of tracing, to be recorded in a trace cache. The DAG IR is copied, so that
+        later changes to that of this epilogue do not affect the recorded trace.
+        """
+        return TracedEpilogue(self.dag_ir, self.return_names, self.reduction_names, self.fusion_callbacks).copy()
+
+    def restore(self, traced):
+        """
+        Restores the result of a previous trace of an identical epilogue, skipping the pass pipeline
+
+        :param traced: result of the previous trace, which is copied rather than modified
+        :type traced: cutlass.backend.evt.trace_cache.TracedEpilogue
+        """
+        traced = traced.copy()
+        self.dag_ir = traced.dag_ir
+        self.return_names = traced.return_names
+        self.fusion_callbacks = traced.fusion_callbacks
+        # The argument types of a trace loaded from disk are rebuilt from its DAG IR
+        if not self.dag_ir.has_argument_types():
+            PassGetArgumentType(self.dag_ir)()
+        self._set_argument_types()
+
+    def set_fusion_callbacks(self, fusion_callbacks):
+        """
+        Sets the emitted fusion callbacks of the visitor, recording them in the trace cache
+
+        :param fusion_callbacks: emitted fusion callbacks
+        :type fusion_callbacks: cutlass.backend.evt.backend.emitter_base.EmittedFusionCallbacks
+        """
+        self.fusion_callbacks = fusion_callbacks
+        if self.trace_cache is not None:
+            self.trace_cache.record_fusion_callbacks(self.trace_key, fusion_callbacks)
+
     #
     # Helper functions for DAG IR manipulation
     #
@@ -34,7 +34,7 @@
 DAG IR used by Python EVT
 """
 
-import networkx as nx
+import heapq
 
 from cutlass_library import DataType
 
@@ -50,8 +50,16 @@ class DAGIR:
     In the DAGIR, ``node`` is an string of its name. ``node_meta`` is the underlying class of the node
     """
     def __init__(self, element_compute=DataType.f32, cc: int=None) -> None:
-        # The EVT DAGIR is managed through the nextworkX Digraph class
-        self._graph = nx.DiGraph()
+        # The EVT DAGIR is managed as adjacency maps. Nodes and edges are kept in insertion order
+        # node -> meta
+        self._nodes = {}
+        # node -> {user: weight}
+        self._users = {}
+        # node -> {input: weight}
+        self._inputs = {}
+        # Results of graph traversals, invalidated whenever the graph is mutated
+        self._topological_order = None
+        self._reachable = {}
 
         self.element_compute = element_compute
 
@@ -59,6 +67,23 @@ class DAGIR:
 
         self.cc = cc if cc else device_cc()
 
+    # Argument types are ctypes structures constructed at runtime. They are rebuilt from the
+    # implementations of the nodes by PassGetArgumentType rather than being serialized.
+    _argument_type_attrs = ["epilogue_thread_type", "arg_c_type", "arg_d_type"]
+
+    def __getstate__(self):
+        return {key: value for key, value in self.__dict__.items() if key not in self._argument_type_attrs}
+
+    def has_argument_types(self) -> bool:
+        """
+        Returns whether the argument types of the epilogue have been constructed
+        """
+        return hasattr(self, "epilogue_thread_type")
+
+    def _invalidate(self):
+        self._topological_order = None
+        self._reachable = {}
+
     #
     # IR manipulator
     #
@@ -69,7 +94,10 @@ class DAGIR:
         """
         if self.has_node(meta.name):
             raise SyntaxError(f"Variable '{meta.name}' cannot be defined twice.")
-        self._graph.add_node(meta.name, meta=meta)
+        self._nodes[meta.name] = meta
+        self._users[meta.name] = {}
+        self._inputs[meta.name] = {}
+        self._invalidate()
 
     def add_edge(self, src: str, dst: str, weight: int=0):
         """
@@ -79,19 +107,32 @@ class DAGIR:
             raise SyntaxError(f"Variable '{src}' is undefined.")
         if not self.has_node(dst):
             raise SyntaxError(f"Variable '{dst}' is undefined.")
-        self._graph.add_edge(src, dst, weight=weight)
+        self._users[src][dst] = weight
+        self._inputs[dst][src] = weight
+        self._invalidate()
 
     def remove_node(self, node: str):
         """
         Remove node from dag ir
         """
-        self._graph.remove_node(node)
+        if not self.has_node(node):
+            raise KeyError(f"Node {node} is not in the graph.")
+        for user in self._users.pop(node):
+            del self._inputs[user][node]
+        for input_node in self._inputs.pop(node):
+            del self._users[input_node][node]
+        del self._nodes[node]
+        self._invalidate()
 
     def remove_edge(self, src: str, dst: str):
         """
         Remove edge src -> dst
         """
-        self._graph.remove_edge(src, dst)
+        if not self.has_edge(src, dst):
+            raise KeyError(f"Edge {src}->{dst} is not in the graph.")
+        del self._users[src][dst]
+        del self._inputs[dst][src]
+        self._invalidate()
 
     #
     # Helper functions for getting attrs
@@ -101,43 +142,49 @@ class DAGIR:
         """
         Check if the node is in the graph
         """
-        return self._graph.has_node(node)
+        return node in self._nodes
+
+    def has_edge(self, src: str, dst: str) -> bool:
+        """
+        Check if the edge src -> dst is in the graph
+        """
+        return src in self._users and dst in self._users[src]
 
     def in_degree(self, node: str):
         """
         Get the input degree of node
         """
-        return self._graph.in_degree(node)
+        return len(self._inputs[node])
 
     def in_edges(self, node: str):
         """
         Get the input edges of node
         """
-        return [edge for edge in self._graph.in_edges(node)]
+        return [(input_node, node) for input_node in self._inputs[node]]
 
     def out_degree(self, node: str):
         """
         Get the output degree of node
         """
-        return self._graph.out_degree(node)
+        return len(self._users[node])
 
     def out_edges(self, node: str):
         """
         Get the output edges of node
         """
-        return [edge for edge in self._graph.out_edges(node)]
+        return [(node, user) for user in self._users[node]]
 
     def get_node_meta(self, node: str):
         """
         Get the meta data of the node
         """
-        return self._graph.nodes[node]["meta"]
+        return self._nodes[node]
 
     def get_edge_weight(self, src, dst):
         """
         Get the edge weight of edge src->dst
         """
-        return self._graph.get_edge_data(src, dst)["weight"]
+        return self._users[src][dst]
 
     #
     # High-level helper functions
@@ -147,21 +194,34 @@ class DAGIR:
         """
         Get all the nodes reachable from the current node (exclude)
         """
-        return list(nx.dfs_preorder_nodes(self._graph, source=node))
+        if node not in self._reachable:
+            # Depth-first preorder traversal, visiting users in insertion order
+            reachable = [node]
+            visited = {node}
+            stack = [iter(self._users[node])]
+            while stack:
+                for user in stack[-1]:
+                    if user not in visited:
+                        reachable.append(user)
+                        visited.add(user)
+                        stack.append(iter(self._users[user]))
+                        break
+                else:
+                    stack.pop()
+            self._reachable[node] = reachable
+        return list(self._reachable[node])
 
     def get_users(self, node: str):
         """
         Get all users of the current node
         """
-        return [edge[1] for edge in self.out_edges(node)]
+        return list(self._users[node])
 
     def get_all_inputs(self, node: str):
         """
         Get all the input nodes sorted by edge weight
         """
-        in_edges = self.in_edges(node)
-        edge_weights = [self.get_edge_weight(*edge) for edge in in_edges]
-        return [edge[0] for _, edge in sorted(zip(edge_weights, in_edges))]
+        return [input_node for input_node, _ in sorted(self._inputs[node].items(), key=lambda item: (item[1], item[0]))]
 
     def get_all_inputs_meta(self, node: str):
         """
@@ -180,6 +240,25 @@ class DAGIR:
             self.remove_edge(node1, user)
         self.remove_node(node1)
 
+    def subgraph(self, nodes):
+        """
+        Get a new DAG IR with the given nodes and the edges between them. The node metas are
+        shared with this graph.
+
+        :param nodes: nodes of the subgraph
+        :type nodes: set[str]
+
+        :return: DAGIR
+        """
+        subgraph = DAGIR(self.element_compute, self.cc)
+        for node, meta in self._nodes.items():
+            if node in nodes:
+                subgraph.add_node(meta)
+        for src, dst in self.edges:
+            if src in nodes and dst in nodes:
+                subgraph.add_edge(src, dst, self.get_edge_weight(src, dst))
+        return subgraph
+
     #
     # Node accessor
     #
@@ -193,7 +272,22 @@ class DAGIR:
         for each epilogue visitor pattern and ensures the compilation cache can be reused.
         :return: list[str]
         """
-        return list(nx.lexicographical_topological_sort(self._graph))
+        if self._topological_order is None:
+            in_degree = {node: len(inputs) for node, inputs in self._inputs.items()}
+            ready = [node for node, degree in in_degree.items() if degree == 0]
+            heapq.heapify(ready)
+            order = []
+            while ready:
+                node = heapq.heappop(ready)
+                order.append(node)
+                for user in self._users[node]:
+                    in_degree[user] -= 1
+                    if in_degree[user] == 0:
+                        heapq.heappush(ready, user)
+            if len(order) != len(self._nodes):
+                raise RuntimeError("The DAG IR contains a cycle.")
+            self._topological_order = order
+        return list(self._topological_order)
 
     def node_metas_topological_order(self):
         """
@@ -208,7 +302,7 @@ class DAGIR:
         Get all nodes
         :return: list[str]
         """
-        return list(self._graph.nodes)
+        return list(self._nodes)
 
     @property
     def nodes_meta(self):
@@ -216,7 +310,7 @@ class DAGIR:
         Get all node metas
         :return: list[NodeBase]
         """
-        return [data[1]['meta'] for data in self._graph.nodes.data()]
+        return list(self._nodes.values())
 
     @property
     def edges(self):
@@ -224,7 +318,7 @@ class DAGIR:
         Get all edges
         :return: list[(str, str)]
         """
-        return list(self._graph.edges)
+        return [(src, dst) for src, users in self._users.items() for dst in users]
 
     #
     # Path
@@ -233,4 +327,6 @@ class DAGIR:
         """
         Return True is a path exists from src to target
         """
-        return nx.has_path(self._graph, src, target)
+        if not self.has_node(src) or not self.has_node(target):
+            raise KeyError(f"Either source {src} or target {target} is not in the graph.")
+        return target in self.all_reachable_nodes(src)
@@ -107,7 +107,7 @@ class PassDAG2Tree(EVTPassBase):
                 new_subgraph_nodes = set.union(node_to_fuse, all_input_nodes, all_output_nodes)
 
                 # Create the subgraph
-                subgraph_ = self.dag_ir._graph.subgraph(new_subgraph_nodes)
+                subgraph_ = self.dag_ir.subgraph(new_subgraph_nodes)
                 subgraph = DAGIR()
                 for node in subgraph_.nodes:
                     meta = deepcopy(self.dag_ir.get_node_meta(node))
@@ -36,8 +36,6 @@ Pass manager for DAG IR.
 
 from typing import Any
 
-import networkx as nx
-
 from cutlass.backend.evt.ir import DAGIR
 from cutlass.backend.evt.passes.util import cc_map
 
@@ -110,15 +108,16 @@ class EVTPassBase:
             raise NotImplementedError(f"func {func.__name__} is not overwritten for Sm{self.cc}")
 
 
-class EVTPassManager(nx.DiGraph):
+class EVTPassManager:
     """
     Topological-based Pass Manager.
     Each registered pass has a list of dependencies. The pass manager organizes
     the passes as a DAG and launch the compiler passes under topological order.
     """
     def __init__(self, dag_ir: DAGIR, pass_list):
-        super().__init__()
         self.dag_ir = dag_ir
+        # pass name -> pass callable, in registration order
+        self.passes = {}
         for pass_cls in pass_list:
             self.add_pass(pass_cls)
 
@@ -128,7 +127,7 @@ class EVTPassManager(nx.DiGraph):
         """
         Return the callable of the pass
         """
-        return self.nodes[pass_name]["callable"]
+        return self.passes[pass_name]
 
     def add_pass(self, pass_cls):
         """
@@ -138,22 +137,40 @@ class EVTPassManager(nx.DiGraph):
         """
         name = pass_cls.__name__
         pass_callable = pass_cls(self.dag_ir)
-        self.add_node(name, callable=pass_callable)
+        self.passes[name] = pass_callable
 
     def schedule(self):
         """
         Schedule the added passes under topological order
         """
         # Add edges
-        for pass_name in self.nodes:
-            callable = self.get_callable(pass_name)
+        dependents = {pass_name: [] for pass_name in self.passes}
+        in_degree = {pass_name: 0 for pass_name in self.passes}
+        for pass_name, callable in self.passes.items():
             for dependency_cls in callable.dependencies:
-                self.add_edge(
-                    dependency_cls.__name__,
-                    type(callable).__name__)
-
-        # Topological sort
-        return list(nx.topological_sort(self))
+                dependency = dependency_cls.__name__
+                if dependency not in self.passes:
+                    raise Exception(f"Pass {pass_name} depends on {dependency}, which is not registered.")
+                if pass_name not in dependents[dependency]:
+                    dependents[dependency].append(pass_name)
+                    in_degree[pass_name] += 1
+
+        # Topological sort, one generation of passes whose dependencies are satisfied at a time
+        sorted_passes = []
+        generation = [pass_name for pass_name, degree in in_degree.items() if degree == 0]
+        while generation:
+            sorted_passes += generation
+            next_generation = []
+            for pass_name in generation:
+                for dependent in dependents[pass_name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_generation.append(dependent)
+            generation = next_generation
+
+        if len(sorted_passes) != len(self.passes):
+            raise Exception("The dependencies of the EVT passes contain a cycle.")
+        return sorted_passes
 
     def __call__(self) -> Any:
         """
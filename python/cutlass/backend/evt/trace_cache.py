@@ -0,0 +1,277 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Cache of traced epilogue visitors.
+
+Tracing an epilogue parses the user's function into a DAG IR, runs the EVT pass pipeline over it, and
+emits the fusion callbacks of the visitor. The result depends only on the function's AST, the data types
+and shapes of the example tensors, the compute capability, and the options of the frontend, from which
+the key of a trace is derived. Keys also cover the sources of the EVT frontend, IR and passes, so that
+traces recorded by other versions of them are not reused.
+
+Traces are cached in memory for the lifetime of the process and in an SQLite database shared between
+processes. The database stores the DAG IR produced by the pass pipeline, along with the emitted source
+of the fusion callbacks once they have been emitted. The ctypes argument types of the visitor are
+rebuilt from the stored DAG IR, so a trace found in the database skips the pass pipeline entirely.
+"""
+
+import ast
+import copy
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import textwrap
+import time
+
+import cutlass
+from cutlass.backend.evt.backend.emitter_base import EmittedFusionCallbacks
+from cutlass.backend.kernel_cache import SharedIndex, short_hash
+from cutlass.utils.datatypes import get_datatype_and_layout, get_tensor_shape
+
+
+def _evt_digest() -> str:
+    """
+    Returns a digest of the sources of the EVT frontend, IR, passes, and backend, by which traces
+    are keyed so that they are invalidated whenever any of these changes
+
+    :return: hex digest of the EVT sources
+    :rtype: str
+    """
+    global _EVT_DIGEST
+    if _EVT_DIGEST is None:
+        sha = hashlib.sha256()
+        evt_dir = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(evt_dir):
+            dirs.sort()
+            for file_name in sorted(files):
+                if file_name.endswith(".py"):
+                    path = os.path.join(root, file_name)
+                    sha.update(os.path.relpath(path, evt_dir).encode())
+                    with open(path, "rb") as file:
+                        sha.update(file.read())
+        _EVT_DIGEST = sha.hexdigest()[:16]
+    return _EVT_DIGEST
+
+_EVT_DIGEST = None
+
+
+def trace_key(fn, example_tensors: dict, cc: int, element_compute, additional_passes=[]) -> str:
+    """
+    Returns the key under which the trace of ``fn`` on ``example_tensors`` is cached
+
+    :param fn: Python callable being traced
+    :param example_tensors: example inputs for fn
+    :type example_tensors: dict
+    :param cc: compute capability of the target device
+    :type cc: int
+    :param element_compute: data type used for computation in the epilogue
+    :type element_compute: cutlass.DataType
+    :param additional_passes: passes run in addition to the default EVT pass pipeline
+    :type additional_passes: list
+
+    :return: cache key of the trace
+    :rtype: str
+    """
+    tree = ast.dump(ast.parse(textwrap.dedent(inspect.getsource(fn))))
+    examples = []
+    for name in sorted(example_tensors.keys()):
+        example = example_tensors[name]
+        element, layout = get_datatype_and_layout(example)
+        examples.append(f"{name}:{element.name}:{layout.name}:{tuple(get_tensor_shape(example))}")
+    passes = [f"{p.__module__}.{p.__qualname__}" for p in additional_passes]
+    return short_hash(
+        cutlass.__version__, _evt_digest(), tree, ";".join(examples), str(cc), element_compute.name, ";".join(passes))
+
+
+class TracedEpilogue:
+    """
+    Result of tracing an epilogue: the DAG IR produced by the EVT pass pipeline and the names of the
+    outputs and reductions of the epilogue
+
+    Traces held by a ``TraceCache`` are shared by every epilogue traced from them and must not be modified.
+    Use ``copy()`` to obtain a trace that may be.
+
+    :param dag_ir: DAG IR after the pass pipeline has been run
+    :type dag_ir: cutlass.backend.evt.ir.DAGIR
+    :param return_names: names of the values returned by the epilogue
+    :type return_names: list
+    :param reduction_names: names of the reduction outputs of the epilogue
+    :type reduction_names: list
+    :param fusion_callbacks: previously-emitted fusion callbacks of the visitor, optional
+    :type fusion_callbacks: cutlass.backend.evt.backend.emitter_base.EmittedFusionCallbacks
+    """
+
+    def __init__(self, dag_ir, return_names, reduction_names, fusion_callbacks=None) -> None:
+        self.dag_ir = dag_ir
+        self.return_names = return_names
+        self.reduction_names = reduction_names
+        self.fusion_callbacks = fusion_callbacks
+
+    def copy(self):
+        """
+        Returns a copy of the trace whose DAG IR may be modified independently of this one
+
+        :rtype: TracedEpilogue
+        """
+        return TracedEpilogue(copy.deepcopy(self.dag_ir), list(self.return_names), list(self.reduction_names),
+                              self.fusion_callbacks)
+
+
+class TraceCache(SharedIndex):
+    """
+    Cache of traced epilogue visitors, held in memory and in a database shared between processes.
+    The database file is created when the first trace is recorded.
+
+    :param index_file: path to the SQLite database
+    :type index_file: str
+    """
+
+    def __init__(self, index_file: str) -> None:
+        super().__init__(index_file)
+        self._initialized = False
+        # Traces found or recorded by this process
+        self._traces = {}
+
+    def _initialize(self):
+        if self._initialized:
+            return
+        directory = os.path.dirname(self.index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._transaction() as cursor:
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS traces(key TEXT PRIMARY KEY,
+                                              dag_ir BLOB NOT NULL,
+                                              return_names TEXT NOT NULL,
+                                              reduction_names TEXT NOT NULL,
+                                              callback_decl TEXT,
+                                              callback_name TEXT,
+                                              updated REAL NOT NULL)
+            """)
+        self._initialized = True
+
+    def _has_index(self) -> bool:
+        return self._initialized or os.path.exists(self.index_file)
+
+    def lookup(self, key: str):
+        """
+        Returns the trace recorded under ``key``
+
+        :param key: key of the trace, as returned by ``trace_key``
+        :type key: str
+
+        :return: the recorded trace, or None if no trace has been recorded
+        :rtype: TracedEpilogue
+        """
+        if key in self._traces:
+            return self._traces[key]
+        if not self._has_index():
+            return None
+
+        self._initialize()
+        with self._transaction(immediate=False) as cursor:
+            cursor.execute(
+                "SELECT dag_ir, return_names, reduction_names, callback_decl, callback_name FROM traces "
+                "WHERE key = ?", (key,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+
+        dag_ir, return_names, reduction_names, callback_decl, callback_name = row
+        try:
+            dag_ir = pickle.loads(dag_ir)
+        except Exception as e:
+            cutlass.logger.warning(f"Ignoring unreadable trace {key} in {self.index_file}: {e}")
+            return None
+
+        fusion_callbacks = None
+        if callback_decl is not None:
+            fusion_callbacks = EmittedFusionCallbacks(callback_decl, callback_name)
+        traced = TracedEpilogue(dag_ir, json.loads(return_names), json.loads(reduction_names), fusion_callbacks)
+        self._traces[key] = traced
+        return traced
+
+    def record(self, key: str, traced: TracedEpilogue):
+        """
+        Records a trace under ``key``
+
+        :param key: key of the trace, as returned by ``trace_key``
+        :type key: str
+        :param traced: trace to record
+        :type traced: TracedEpilogue
+        """
+        self._traces[key] = traced
+        try:
+            dag_ir = pickle.dumps(traced.dag_ir)
+        except Exception as e:
+            cutlass.logger.debug(f"Trace {key} is cached only for this process: {e}")
+            return
+
+        self._initialize()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO traces VALUES (?, ?, ?, ?, NULL, NULL, ?)",
+                (key, dag_ir, json.dumps(list(traced.return_names)), json.dumps(list(traced.reduction_names)), time.time()))
+
+    def record_fusion_callbacks(self, key: str, fusion_callbacks: EmittedFusionCallbacks):
+        """
+        Records the emitted fusion callbacks of the trace recorded under ``key``
+
+        :param key: key of the trace, as returned by ``trace_key``
+        :type key: str
+        :param fusion_callbacks: emitted fusion callbacks
+        :type fusion_callbacks: cutlass.backend.evt.backend.emitter_base.EmittedFusionCallbacks
+        """
+        if key in self._traces:
+            self._traces[key].fusion_callbacks = fusion_callbacks
+        if not self._has_index():
+            return
+
+        self._initialize()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "UPDATE traces SET callback_decl = ?, callback_name = ?, updated = ? WHERE key = ?",
+                (fusion_callbacks.callback_decl, fusion_callbacks.callback_name, time.time(), key))
+
+    def clear(self):
+        """
+        Removes all recorded traces
+        """
+        self._traces = {}
+        if not self._has_index():
+            return
+        self._initialize()
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM traces")
@@ -33,7 +33,7 @@
 from cuda import cuda
 import numpy as np
 
-from cutlass.backend.memory_manager import device_mem_alloc, todevice
+from cutlass.backend.memory_manager import device_buffer_cache, device_mem_alloc, todevice
 from cutlass.utils.datatypes import is_cupy_tensor, is_numpy_tensor, is_torch_tensor
 
 
@@ -43,19 +43,27 @@ class NumpyFrontend:
     """
 
     @staticmethod
-    def argument(np_tensor: "np.ndarray", is_output: "bool") -> cuda.CUdeviceptr:
+    def argument(np_tensor: "np.ndarray", is_output: "bool", stream=None) -> cuda.CUdeviceptr:
         """Convert the input numpy tensor to CUDA device pointer
 
         :param np_tensor: input numpy nd array
         :param is_output: whether the tensor is output
+        :param stream: stream on which to copy the input asynchronously. If None, the copy is synchronous.
 
         :return: CUDA device pointer
         """
+        if device_buffer_cache.enabled:
+            # Reuse the device-resident copy of the array, if one is up to date
+            if is_output:
+                return device_buffer_cache.output(np_tensor)
+            else:
+                return device_buffer_cache.input(np_tensor, stream)
+
         # copy the data to device
         if is_output:
             return device_mem_alloc(np_tensor.size * np_tensor.itemsize)
         else:
-            return todevice(np_tensor)
+            return todevice(np_tensor, stream=stream)
 
 
 class TorchFrontend:
@@ -30,6 +30,7 @@
 #
 #################################################################################################
 
+import collections
 import copy
 import ctypes
 import enum
@@ -94,8 +95,15 @@ from cutlass.backend.library import (
     TileDescription,
     api_version,
 )
-from cutlass.backend.memory_manager import device_mem_alloc, todevice
-from cutlass.backend.operation import ExecutableOperation, LaunchConfiguration
+from cutlass.backend.memory_manager import (
+    device_buffer_cache,
+    device_mem_alloc,
+    device_mem_free,
+    pinned_host_pool,
+    todevice,
+    tohost,
+)
+from cutlass.backend.operation import ExecutableOperation, LaunchConfiguration, supports_cluster_launch
 from cutlass.backend.type_hint import GemmOperation, Tensor
 from cutlass.backend.utils.device import device_sm_count
 from cutlass.shape import GemmCoord, MatrixCoord
@@ -269,10 +277,11 @@ class GemmArguments2x(ArgumentBase):
                 ptr_C_addr += stride_C
                 ptr_D_addr += stride_D
 
-            self.ptr_A_array_buffer = todevice(self.ptr_A_array, dtype=np.int64)
-            self.ptr_B_array_buffer = todevice(self.ptr_B_array, dtype=np.int64)
-            self.ptr_C_array_buffer = todevice(self.ptr_C_array, dtype=np.int64)
-            self.ptr_D_array_buffer = todevice(self.ptr_D_array, dtype=np.int64)
+            # Registered as buffers so that they are freed along with the operands
+            self.buffers["ptr_A_array"] = todevice(self.ptr_A_array, dtype=np.int64)
+            self.buffers["ptr_B_array"] = todevice(self.ptr_B_array, dtype=np.int64)
+            self.buffers["ptr_C_array"] = todevice(self.ptr_C_array, dtype=np.int64)
+            self.buffers["ptr_D_array"] = todevice(self.ptr_D_array, dtype=np.int64)
 
         if isinstance(self.operation, GemmOperationUniversal):
             self.initialize()
@@ -293,10 +302,10 @@ class GemmArguments2x(ArgumentBase):
                 0,
                 # Remaining arguments
                 self.output_op,
-                int(self.ptr_A_array_buffer.ptr),
-                int(self.ptr_B_array_buffer.ptr),
-                int(self.ptr_C_array_buffer.ptr),
-                int(self.ptr_D_array_buffer.ptr),
+                int(self.buffers["ptr_A_array"].ptr),
+                int(self.buffers["ptr_B_array"].ptr),
+                int(self.buffers["ptr_C_array"].ptr),
+                int(self.buffers["ptr_D_array"].ptr),
                 0, 0, 0,
                 self.lda, self.ldb, self.ldc, self.ldd,
                 self.lda, self.ldb, self.ldc, self.ldd,
@@ -329,10 +338,10 @@ class GemmArguments2x(ArgumentBase):
         device_workspace_size = self.operation.rt_module.get_device_workspace_size(self)
 
         if device_workspace_size > 0:
-            self.workspace_buffer = device_mem_alloc(device_workspace_size)
+            self.workspace_buffer = device_mem_alloc(device_workspace_size, self.stream)
             workspace_ptr = self.workspace_buffer.ptr
-            err, = cuda.cuMemsetD32(
-                workspace_ptr, 0, device_workspace_size // 4)
+            err, = cuda.cuMemsetD32Async(
+                workspace_ptr, 0, device_workspace_size // 4, self.stream)
         else:
             workspace_ptr = None
 
@@ -343,12 +352,8 @@ class GemmArguments2x(ArgumentBase):
         elif workspace_ptr is not None and self.gemm_mode == GemmUniversalMode.Gemm:
             device_workspace = workspace_ptr
 
-        self.get_arguments()
-
-        arguments, grid_tiled_shape, gemm_k_size = self.arguments
-        res_arg = self.operation.rt_module.get_args(
-            ctypes.byref(arguments), ctypes.c_void_p(int(device_workspace)))
-        host_workspace = bytearray(res_arg.contents)
+        self.device_workspace_ptr = device_workspace
+        host_workspace = self.marshal()
 
         device_workspace = None
 
@@ -356,6 +361,20 @@ class GemmArguments2x(ArgumentBase):
         self.device_workspace = device_workspace
         self.launch_config = launch_config
 
+    def marshal(self) -> bytearray:
+        """
+        Encodes the current arguments into the parameter block passed to the kernel
+
+        :return: kernel parameters
+        :rtype: bytearray
+        """
+        self.get_arguments()
+
+        arguments, grid_tiled_shape, gemm_k_size = self.arguments
+        res_arg = self.operation.rt_module.get_args(
+            ctypes.byref(arguments), ctypes.c_void_p(int(self.device_workspace_ptr)))
+        return bytearray(res_arg.contents)
+
     def sync(self, stream_sync=True):
         super().sync(stream_sync)
         if hasattr(self.output_op, "sync"):
@@ -433,10 +452,10 @@ class GemmArguments2xStreamK(GemmArguments2x):
         )
 
         if device_workspace_size > 0:
-            self.workspace_buffer = device_mem_alloc(device_workspace_size)
+            self.workspace_buffer = device_mem_alloc(device_workspace_size, self.stream)
             workspace_ptr = self.workspace_buffer.ptr
-            err, = cuda.cuMemsetD32(
-                workspace_ptr, 0, device_workspace_size // 4)
+            err, = cuda.cuMemsetD32Async(
+                workspace_ptr, 0, device_workspace_size // 4, self.stream)
         else:
             workspace_ptr = None
 
@@ -447,16 +466,10 @@ class GemmArguments2xStreamK(GemmArguments2x):
         elif workspace_ptr is not None and self.gemm_mode == GemmUniversalMode.Gemm:
             device_workspace = workspace_ptr
 
-        arguments = self.get_arguments()
-
-        res_arg = self.operation.rt_module.get_args(
-            ctypes.byref(arguments),
-            ctypes.c_void_p(int(device_workspace)),
-            device_sm_count(),
-            self.operation.rt_module.occupancy
-        )
-        host_workspace = bytearray(res_arg.contents)
+        self.device_workspace_ptr = device_workspace
+        host_workspace = self.marshal()
 
+        arguments = self.get_arguments()
         grid = self.operation.rt_module.get_grid_shape(
             ctypes.byref(arguments),
             device_sm_count(),
@@ -474,6 +487,24 @@ class GemmArguments2xStreamK(GemmArguments2x):
         )
 
 
+    def marshal(self) -> bytearray:
+        """
+        Encodes the current arguments into the parameter block passed to the kernel
+
+        :return: kernel parameters
+        :rtype: bytearray
+        """
+        arguments = self.get_arguments()
+
+        res_arg = self.operation.rt_module.get_args(
+            ctypes.byref(arguments),
+            ctypes.c_void_p(int(self.device_workspace_ptr)),
+            device_sm_count(),
+            self.operation.rt_module.occupancy
+        )
+        return bytearray(res_arg.contents)
+
+
 class GemmArguments3x(GemmArguments2x):
     """
     Argument wrapper for GEMM in CUTLASS 3. It encodes problem information and
@@ -584,10 +615,10 @@ class GemmArguments3x(GemmArguments2x):
         device_workspace_size = self.operation.rt_module.get_device_workspace_size(self)
 
         if device_workspace_size > 0:
-            self.workspace_buffer = device_mem_alloc(device_workspace_size)
+            self.workspace_buffer = device_mem_alloc(device_workspace_size, self.stream)
             workspace_ptr = self.workspace_buffer.ptr
-            err, = cuda.cuMemsetD32(
-                workspace_ptr, 0, device_workspace_size // 4)
+            err, = cuda.cuMemsetD32Async(
+                workspace_ptr, 0, device_workspace_size // 4, self.stream)
         else:
             workspace_ptr = None
 
@@ -598,12 +629,8 @@ class GemmArguments3x(GemmArguments2x):
         elif workspace_ptr is not None and self.gemm_mode == GemmUniversalMode.Gemm:
             device_workspace = workspace_ptr
 
-        self.get_arguments()
-        res_arg = self.operation.rt_module.get_args(
-            ctypes.byref(self.arguments),
-            ctypes.c_void_p(int(device_workspace)),
-        )
-        host_workspace = bytearray(res_arg.contents)
+        self.device_workspace_ptr = device_workspace
+        host_workspace = self.marshal()
 
         grid = self.operation.rt_module.get_grid_shape(
             ctypes.byref(self.arguments),
@@ -622,6 +649,21 @@ class GemmArguments3x(GemmArguments2x):
         )
 
 
+    def marshal(self) -> bytearray:
+        """
+        Encodes the current arguments into the parameter block passed to the kernel
+
+        :return: kernel parameters
+        :rtype: bytearray
+        """
+        self.get_arguments()
+        res_arg = self.operation.rt_module.get_args(
+            ctypes.byref(self.arguments),
+            ctypes.c_void_p(int(self.device_workspace_ptr)),
+        )
+        return bytearray(res_arg.contents)
+
+
 def GemmArguments(operation, problem_size, A, B, C, D, gemm_mode=GemmUniversalMode.Gemm, **kwargs):
     """
     Argument wrapper for GEMM in CUTLASS 2 or 3. It returns either 2x arguments
@@ -661,6 +703,169 @@ def GemmArguments(operation, problem_size, A, B, C, D, gemm_mode=GemmUniversalMo
     return ArgClass(operation, problem_size, A, B, C, D, gemm_mode, **kwargs)
 
 
+class GemmBoundArguments:
+    """
+    GEMM arguments bound once for repeated launches of the same kernel with the same problem size.
+
+    The launch configuration and the kernel's parameter block are computed once from ``arguments``.
+    When the pointers to operands A, B, C, and D are stored verbatim in the parameter block (as is
+    the case for CUTLASS 2.x kernels), their byte offsets are located on construction, and each
+    launch only patches the new pointers into the block before launching the kernel. Otherwise
+    (e.g., for kernels that encode pointers in TMA descriptors), the parameter block is re-encoded
+    from the bound arguments on launches that change pointers.
+
+    :param arguments: fully-initialized arguments from which to bind the launch
+    :type arguments: GemmArguments2x | GemmArguments2xStreamK | GemmArguments3x
+    """
+
+    # Offset added to an operand's pointer to locate where it is stored in the parameter block.
+    # It preserves the pointer's alignment so that the probe is a valid address for encoding.
+    _probe_offset = 1 << 20
+
+    def __init__(self, arguments):
+        self.arguments = arguments
+        self.operation = arguments.operation
+        self.launch_config = arguments.launch_config
+        self.stream = arguments.stream
+
+        # Streams on which kernels have been launched since the last call to ``sync()``, keyed by handle
+        # in order of last use
+        self._launch_streams = {}
+
+        # Operands A and B are swapped when the operation computes the transposed problem
+        if self.operation.switched:
+            self._attrs = {"A": "ptr_B", "B": "ptr_A", "C": "ptr_C", "D": "ptr_D"}
+        else:
+            self._attrs = {"A": "ptr_A", "B": "ptr_B", "C": "ptr_C", "D": "ptr_D"}
+
+        self.host_workspace = bytearray(arguments.host_workspace)
+        self.offsets = self._find_pointer_offsets()
+        self._bind_workspace()
+
+    def _find_pointer_offsets(self):
+        """
+        Returns a dictionary mapping from operand name to the list of byte offsets at which its pointer
+        is stored in the parameter block, or None if a pointer is not stored verbatim
+        """
+        offsets = {}
+        base = self.arguments.marshal()
+        for name, attr in self._attrs.items():
+            original = getattr(self.arguments, attr)
+            probe_ptr = int(original) + self._probe_offset
+            setattr(self.arguments, attr, cuda.CUdeviceptr(probe_ptr))
+            probe = self.arguments.marshal()
+            setattr(self.arguments, attr, original)
+
+            if len(probe) != len(base):
+                return None
+
+            original_bytes = int(original).to_bytes(8, "little")
+            probe_bytes = probe_ptr.to_bytes(8, "little")
+            operand_offsets = []
+            covered = set()
+            for offset in range(0, len(base) - 7):
+                if base[offset:offset + 8] == original_bytes and probe[offset:offset + 8] == probe_bytes:
+                    operand_offsets.append(offset)
+                    covered.update(range(offset, offset + 8))
+
+            # Every byte that changed with the pointer must belong to a verbatim copy of it
+            for idx in range(len(base)):
+                if base[idx] != probe[idx] and idx not in covered:
+                    return None
+            offsets[name] = operand_offsets
+        return offsets
+
+    def _bind_workspace(self):
+        self._c_params = (ctypes.c_char * len(self.host_workspace)).from_buffer(self.host_workspace)
+        self._packed = (ctypes.c_void_p * 1)()
+        self._packed[0] = ctypes.addressof(self._c_params)
+
+    @staticmethod
+    def _to_ptr(tensor) -> int:
+        if isinstance(tensor, int):
+            return tensor
+        if isinstance(tensor, cuda.CUdeviceptr):
+            return int(tensor)
+        if hasattr(tensor, "data_ptr"):
+            # torch.Tensor
+            return tensor.data_ptr()
+        if hasattr(tensor, "data") and hasattr(tensor.data, "ptr"):
+            # cupy.ndarray
+            return int(tensor.data.ptr)
+        raise TypeError(f"Unable to obtain a device pointer from object of type {type(tensor)}. "
+                        "Bound arguments only accept device pointers and device tensors.")
+
+    def _normalize_ptrs(self, ptrs) -> dict:
+        if ptrs is None:
+            return {}
+        if not isinstance(ptrs, dict):
+            ptrs = dict(zip(["A", "B", "C", "D"], ptrs))
+        return {name: self._to_ptr(tensor) for name, tensor in ptrs.items() if tensor is not None}
+
+    def launch(self, ptrs=None, stream=None):
+        """
+        Launches the bound kernel
+
+        :param ptrs: new operands to use, either as a dictionary mapping from operand name ("A", "B", "C", "D")
+                     to a device pointer or device tensor, or as a sequence ordered (A, B, C, D).
+                     Operands that are omitted or None keep their currently-bound pointers.
+        :param stream: stream on which to launch the kernel. Defaults to the stream used when binding
+        :type stream: cuda.CUstream
+        """
+        ptrs = self._normalize_ptrs(ptrs)
+        if len(ptrs) > 0:
+            if self.offsets is not None:
+                for name, ptr in ptrs.items():
+                    for offset in self.offsets[name]:
+                        self.host_workspace[offset:offset + 8] = ptr.to_bytes(8, "little")
+            else:
+                for name, ptr in ptrs.items():
+                    setattr(self.arguments, self._attrs[name], cuda.CUdeviceptr(ptr))
+                self.host_workspace[:] = self.arguments.marshal()
+
+        if stream is None:
+            stream = self.stream
+
+        rt_module = self.operation.rt_module
+        if supports_cluster_launch():
+            err = rt_module.run_with_clusters(self.launch_config, self._packed, stream)
+        else:
+            err = rt_module.run_without_clusters(self.launch_config, self._packed, stream)
+
+        if err != cuda.CUresult.CUDA_SUCCESS:
+            raise RuntimeError("CUDA Error %s" % str(err))
+
+        self._launch_streams.pop(int(stream), None)
+        self._launch_streams[int(stream)] = stream
+
+    def sync(self):
+        """
+        Waits for kernels launched on any stream since the last call to ``sync()`` to complete and copies
+        NumPy outputs bound at construction back to the host on the stream used by the last launch.
+        Device memory remains bound for further launches.
+        """
+        streams = list(self._launch_streams.values()) or [self.stream]
+        self._launch_streams = {}
+        for stream in streams[:-1]:
+            err, = cudart.cudaStreamSynchronize(stream)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError("CUDA Error %s" % str(err))
+
+        host_tensors = self.arguments.host_tensors
+        if len(host_tensors) > 0:
+            tohost([(tensor, self.arguments.buffers[key].ptr) for key, tensor in host_tensors.items()], streams[-1])
+        else:
+            err, = cudart.cudaStreamSynchronize(streams[-1])
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError("CUDA Error %s" % str(err))
+
+    def free(self):
+        """
+        Frees device memory held by the bound arguments
+        """
+        self.arguments.free()
+
+
 class GemmGroupedArguments:
     """
     Argument wrapper for GEMM Grouped. It encodes problem information and
@@ -691,6 +896,9 @@ class GemmGroupedArguments:
     :type stream: :class:`cuda.cuda.CUstream`
     """
 
+    # Alignment in bytes of each array packed into the metadata buffer
+    _alignment = 16
+
     def __init__(self, operation, problem_sizes, A, B, C, D, **kwargs):
         # Get number of problems in the group
         self.problem_count = len(problem_sizes)
@@ -701,17 +909,6 @@ class GemmGroupedArguments:
         assert len(C) == self.problem_count
         assert len(D) == self.problem_count
 
-        problem_size_host = []
-        self.ptr_A_host = []
-        self.ptr_B_host = []
-        self.ptr_C_host = []
-        self.ptr_D_host = []
-
-        lda_host = []
-        ldb_host = []
-        ldc_host = []
-        ldd_host = []
-
         self.partitions = 1
 
         self.operation = operation
@@ -725,59 +922,43 @@ class GemmGroupedArguments:
         )
         self.threadblock_swizzle = operation.swizzling_functor
 
-        self.total_tiles = 0
-
-        self.gemm_arguments = []
-
         self.stream = kwargs.get("stream", cuda.CUstream(0))
 
-        # Process the input arguments
-        for idx, problem_size in enumerate(problem_sizes):
-            M, N, K = problem_size.m, problem_size.n, problem_size.k
-            temp_argument = GemmArguments2x(
-                operation=operation,
-                problem_size=GemmCoord(M, N, K),
-                A=A[idx], B=B[idx], C=C[idx], D=D[idx])
-            self.gemm_arguments.append(temp_argument)
-
-            problem_size_host.append(
-                [temp_argument.problem_size.m,
-                 temp_argument.problem_size.n,
-                 temp_argument.problem_size.k]
-            )
-
-            self.ptr_A_host.append(int(temp_argument.ptr_A))
-            lda_host.append(temp_argument.lda)
+        # Convert the operands of each problem to device pointers. NumPy operands are transferred
+        # on the argument's stream, and NumPy outputs are copied back in ``sync()``.
+        self.gemm_arguments = [
+            ArgumentBase(A[idx], B[idx], C[idx], D[idx], stream=self.stream)
+            for idx in range(self.problem_count)
+        ]
 
-            self.ptr_B_host.append(int(temp_argument.ptr_B))
-            ldb_host.append(temp_argument.ldb)
+        problem_size_host = np.array(
+            [[ps.m, ps.n, ps.k] for ps in problem_sizes], dtype=np.int32).reshape(self.problem_count, 3)
+        ptrs = np.array(
+            [[int(arg.ptr_A), int(arg.ptr_B), int(arg.ptr_C), int(arg.ptr_D)] for arg in self.gemm_arguments],
+            dtype=np.uint64).reshape(self.problem_count, 4).T
 
-            self.ptr_C_host.append(int(temp_argument.ptr_C))
-            ldc_host.append(temp_argument.ldc)
+        if operation.switched:
+            problem_size_host = problem_size_host[:, [1, 0, 2]]
+            ptrs = ptrs[[1, 0, 2, 3]]
 
-            self.ptr_D_host.append(int(temp_argument.ptr_D))
-            ldd_host.append(temp_argument.ldd)
+        # Host copy of the problem sizes, which must remain valid while the arguments are in use
+        self.problem_size_host = np.ascontiguousarray(problem_size_host)
+        self.ptr_A_host, self.ptr_B_host, self.ptr_C_host, self.ptr_D_host = (np.ascontiguousarray(p) for p in ptrs)
 
-            # Get number of tiles
-            grid = self.operation.rt_module.get_grid_shape(
-                self.operation.rt_module.get_tiled_shape(
-                    temp_argument.problem_size.ctype,
-                    self.threadblock_shape.ctype,
-                    temp_argument.batch_count
-                )
-            )
-            self.total_tiles += grid.x * grid.y * grid.z
+        M, N, K = (self.problem_size_host[:, i].astype(np.int64) for i in range(3))
+        self.lda_host = self._leading_dimensions(operation.A.layout, M, K)
+        self.ldb_host = self._leading_dimensions(operation.B.layout, K, N)
+        self.ldc_host = self._leading_dimensions(operation.C.layout, M, N)
+        self.ldd_host = self.ldc_host.copy()
 
-        self.problem_size_buffer = todevice(problem_size_host, np.int32)
-        self.ptr_A_buffer = todevice(self.ptr_A_host, np.int64)
-        self.ptr_B_buffer = todevice(self.ptr_B_host, np.int64)
-        self.ptr_C_buffer = todevice(self.ptr_C_host, np.int64)
-        self.ptr_D_buffer = todevice(self.ptr_D_host, np.int64)
+        # C is treated as a bias if it has only N elements
+        c_numel = np.array([getattr(arg, "tensor_c_numel", -1) for arg in self.gemm_arguments], dtype=np.int64)
+        self.ldc_host[(c_numel == N) & (M != 1)] = 0
 
-        self.lda_buffer = todevice(lda_host, np.int64)
-        self.ldb_buffer = todevice(ldb_host, np.int64)
-        self.ldc_buffer = todevice(ldc_host, np.int64)
-        self.ldd_buffer = todevice(ldd_host, np.int64)
+        # The grouped kernel's problem visitor assigns one threadblock to each output tile
+        self.total_tiles = int(np.sum(
+            ((M + self.threadblock_shape.m - 1) // self.threadblock_shape.m) *
+            ((N + self.threadblock_shape.n - 1) // self.threadblock_shape.n)))
 
         if "output_op" in kwargs.keys():
             self.alpha = kwargs["output_op"].alpha
@@ -791,28 +972,60 @@ class GemmGroupedArguments:
         else:
             self.output_op = self.operation.epilogue_type(1.0, 0.0)
 
-        # Get host problem size
-        self.host_problem_size_ptr = np.array(problem_size_host, dtype=np.int32).__array_interface__["data"][0]
+        self.initialize()
 
-        self.arguments = self.get_arguments()
+    @staticmethod
+    def _leading_dimensions(layout: LayoutType, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        """
+        Returns the leading dimensions of matrices with layout ``layout`` and the given numbers of rows and columns
+        """
+        if layout == LayoutType.RowMajor:
+            return columns.copy()
+        elif layout == LayoutType.ColumnMajor:
+            return rows.copy()
+        else:
+            raise Exception(f"Unsupported layout {layout} for grouped GEMM")
 
-        self.initialize()
+    def _metadata_layout(self, precompute_bytes: int) -> tuple:
+        """
+        Returns the arrays to pack into the metadata buffer, their byte offsets within it, and its total size
+        """
+        arrays = {
+            "problem_sizes": self.problem_size_host,
+            "ptr_A": self.ptr_A_host,
+            "ptr_B": self.ptr_B_host,
+            "ptr_C": self.ptr_C_host,
+            "ptr_D": self.ptr_D_host,
+            "lda": self.lda_host,
+            "ldb": self.ldb_host,
+            "ldc": self.ldc_host,
+            "ldd": self.ldd_host,
+        }
+        offsets = {}
+        nbytes = 0
+        for name, array in arrays.items():
+            offsets[name] = nbytes
+            nbytes += (array.nbytes + self._alignment - 1) // self._alignment * self._alignment
+        offsets["precompute"] = nbytes
+        nbytes += precompute_bytes
+        return arrays, offsets, nbytes
 
     def get_arguments(self):
+        ptr = lambda name: self.metadata_ptr + self.metadata_offsets[name]
         return self.operation.argument_type(
-            self.problem_size_buffer.ptr,
+            ptr("problem_sizes"),
             self.problem_count,
             self.total_tiles,
             self.output_op,
-            self.ptr_A_buffer.ptr,
-            self.ptr_B_buffer.ptr,
-            self.ptr_C_buffer.ptr,
-            self.ptr_D_buffer.ptr,
-            self.lda_buffer.ptr,
-            self.ldb_buffer.ptr,
-            self.ldc_buffer.ptr,
-            self.ldd_buffer.ptr,
-            ctypes.c_void_p(int(self.host_problem_size_ptr)),
+            ptr("ptr_A"),
+            ptr("ptr_B"),
+            ptr("ptr_C"),
+            ptr("ptr_D"),
+            ptr("lda"),
+            ptr("ldb"),
+            ptr("ldc"),
+            ptr("ldd"),
+            ctypes.c_void_p(self.problem_size_host.ctypes.data),
         )
 
     def initialize(self):
@@ -823,19 +1036,48 @@ class GemmGroupedArguments:
         device_workspace_size = self.operation.rt_module.get_device_workspace_size(self)
 
         if device_workspace_size > 0:
-            self.workspace_buffer = device_mem_alloc(device_workspace_size)
+            self.workspace_buffer = device_mem_alloc(device_workspace_size, self.stream)
             workspace_ptr = self.workspace_buffer.ptr
-            err, = cuda.cuMemsetD32(
-                workspace_ptr, 0, device_workspace_size // 4)
+            err, = cuda.cuMemsetD32Async(
+                workspace_ptr, 0, device_workspace_size // 4, self.stream)
         else:
             workspace_ptr = None
 
         if self.operation.precompute_mode == SchedulerMode.Host:
-            device_workspace_ptr = self.operation.rt_module.host_precompute(
-                self, self.operation.rt_module.get_workspace_size(self),)
+            precompute_bytes = self.operation.rt_module.get_workspace_size(self)
+        else:
+            precompute_bytes = 0
+
+        # All per-problem metadata, along with any schedule precomputed on the host, is packed into one
+        # pinned staging buffer and transferred with a single asynchronous copy on the argument's stream.
+        # Both the staging buffer and the device buffer are drawn from caching pools, so that calls with
+        # the same number of problems reuse them.
+        arrays, self.metadata_offsets, nbytes = self._metadata_layout(precompute_bytes)
+        self.metadata_buffer = device_mem_alloc(nbytes, self.stream)
+        self.metadata_ptr = int(self.metadata_buffer.ptr)
+
+        staging = pinned_host_pool.acquire(nbytes)
+        packed = np.ctypeslib.as_array((ctypes.c_uint8 * nbytes).from_address(staging.ptr))
+        for name, array in arrays.items():
+            offset = self.metadata_offsets[name]
+            packed[offset:offset + array.nbytes] = array.reshape(-1).view(np.uint8)
+
+        self.arguments = self.get_arguments()
+
+        if precompute_bytes > 0:
+            offset = self.metadata_offsets["precompute"]
+            packed[offset:offset + precompute_bytes] = np.frombuffer(
+                self.operation.rt_module.host_precompute(self, precompute_bytes), dtype=np.uint8)
+            device_workspace_ptr = self.metadata_ptr + offset
         else:
             device_workspace_ptr = 0
 
+        err, = cudart.cudaMemcpyAsync(
+            self.metadata_ptr, staging.ptr, nbytes, cudart.cudaMemcpyKind.cudaMemcpyHostToDevice, self.stream)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise RuntimeError("CUDA Error %s" % str(err))
+        pinned_host_pool.release(staging, self.stream)
+
         result = self.operation.rt_module.get_args(
             ctypes.byref(self.arguments),
             self.total_tiles,
@@ -853,8 +1095,31 @@ class GemmGroupedArguments:
         err, = cudart.cudaDeviceSynchronize()
         if err != cuda.CUresult.CUDA_SUCCESS:
             raise RuntimeError("CUDA Error %s" % str(err))
+
+        # Copy all NumPy outputs back with a single synchronization of the stream
+        transfers = [
+            (host_tensor, arg.buffers[key].ptr)
+            for arg in self.gemm_arguments for key, host_tensor in arg.host_tensors.items()
+        ]
+        if len(transfers) > 0:
+            tohost(transfers, self.stream)
+            for host_tensor, _ in transfers:
+                device_buffer_cache.synchronized(host_tensor)
+
+        self.free()
+
+    def free(self):
+        """
+        Frees device memory held by the arguments
+        """
         for arg in self.gemm_arguments:
-            arg.sync(stream_sync=False)
+            arg.free()
+        if hasattr(self, "metadata_buffer"):
+            device_mem_free(self.metadata_buffer)
+            del self.metadata_buffer
+        if hasattr(self, "workspace_buffer"):
+            device_mem_free(self.workspace_buffer)
+            del self.workspace_buffer
 
 
 ################################################################################
@@ -1205,6 +1470,7 @@ class EmitGemmUniversalInstance3x:
             "cutlass/numeric_types.h",
             "cutlass/gemm/collective/collective_builder.hpp",
             "cutlass/gemm/kernel/sm90_tile_scheduler.hpp",
+            "cutlass/gemm/kernel/sm90_tile_scheduler_stream_k.hpp",
             "cutlass/gemm/kernel/gemm_universal.hpp",
             "cutlass/epilogue/collective/collective_builder.hpp",
             "cutlass/epilogue/collective/default_epilogue.hpp",
@@ -1451,7 +1717,45 @@ ${operation_name}(${operation_name}${operation_suffix}::Params params) {
         self.argument_type, self.epilogue_type = get_gemm_grouped_arguments(operation.epilogue_functor)
         self.argtype = [ctypes.POINTER(self.argument_type), ctypes.c_int, ctypes.c_void_p]
 
+    # Schedules precomputed on the host, keyed by the procedural name of the kernel and the problem sizes
+    # of the group, least recently used first. Workloads such as mixture-of-experts routing repeat the
+    # same sets of problem sizes across launches. The cache is shared by all runtime modules, as
+    # ``GroupedGemm.run()`` constructs a new operation on each call.
+    schedule_cache = collections.OrderedDict()
+    schedule_cache_capacity = 128
+    schedule_cache_hits = 0
+    schedule_cache_misses = 0
+
+    @classmethod
+    def schedule_cache_info(cls) -> dict:
+        """
+        Returns statistics about the cache of host-precomputed schedules
+
+        :return: dictionary containing the number of cached schedules (size), and the number of
+                 lookups served from the cache (hits) and computed on the host (misses)
+        :rtype: dict
+        """
+        return {
+            "size": len(cls.schedule_cache),
+            "hits": cls.schedule_cache_hits,
+            "misses": cls.schedule_cache_misses,
+        }
+
     def host_precompute(self, arguments, workspace_bytes):
+        """
+        Returns the schedule of the grouped problems in ``arguments`` as computed by the kernel's problem
+        visitor on the host. Schedules are cached by the problem sizes of the group, which, together with
+        the kernel, determine the schedule.
+        """
+        cls = GemmRTGrouped
+        key = (self.operation.procedural_name(), arguments.problem_size_host.tobytes())
+        schedule = cls.schedule_cache.get(key)
+        if schedule is not None:
+            cls.schedule_cache.move_to_end(key)
+            cls.schedule_cache_hits += 1
+            return schedule
+        cls.schedule_cache_misses += 1
+
         self.precompute.argtype = [
             self.argtype[0], ctypes.c_int, ctypes.c_longlong]
         self.precompute.restype = ctypes.POINTER(ctypes.c_byte * workspace_bytes)
@@ -1460,10 +1764,12 @@ ${operation_name}(${operation_name}${operation_suffix}::Params params) {
             ctypes.byref(arguments.arguments),
             arguments.total_tiles,
             workspace_bytes)
-        problem_info_array = bytearray(problem_info.contents)
+        schedule = bytes(problem_info.contents)
 
-        # copy to device memory
-        return todevice(problem_info_array).ptr
+        cls.schedule_cache[key] = schedule
+        if len(cls.schedule_cache) > cls.schedule_cache_capacity:
+            cls.schedule_cache.popitem(last=False)
+        return schedule
 
     def plan(self, arguments):
         return LaunchConfiguration(
@@ -1695,11 +2001,18 @@ class GemmOperationBase:
         else:
             return EpilogueScheduleSuffixes[self.tile_description.epilogue_schedule]
 
+    # Generates a short string representing underlying tile scheduler type
+    def tile_scheduler_name_3x(self):
+        if self.tile_description.tile_scheduler is None:
+            return TileSchedulerSuffixes[TileSchedulerType.Default]
+        else:
+            return TileSchedulerSuffixes[self.tile_description.tile_scheduler]
+
     def procedural_name(self):
         """The full procedural name indicates architecture, extended name, tile size, and layout."""
         opcode_class_name = OpcodeClassNames[self.tile_description.math_instruction.opcode_class]
         if self.api == ApiVersion.v3x and self.arch >= 90:
-            kernel_name_template = "cutlass{p}_sm{ar}_{op}_{ex}_{tbm}x{tbn}x{tbk}_{cm}x{cn}x{ck}_{l}_{s}_align{al}{k}{e}"
+            kernel_name_template = "cutlass{p}_sm{ar}_{op}_{ex}_{tbm}x{tbn}x{tbk}_{cm}x{cn}x{ck}_{l}_{s}_align{al}{t}{k}{e}"
             return kernel_name_template.format(
                 p=self.prefix,
                 ar=self.arch,
@@ -1714,6 +2027,7 @@ class GemmOperationBase:
                 l=self.tile_description.stages,
                 s=self.layout_name_3x(),
                 al=str(self.A.alignment),
+                t=self.tile_scheduler_name_3x(),
                 k=self.kernel_schedule_name_3x(),
                 e=self.epilogue_schedule_name_3x()
             )
@@ -0,0 +1,325 @@
+#################################################################################################
+#
+# Copyright (c) 2025 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Content-addressed on-disk cache of compiled CUTLASS modules.
+
+Each compiled module (a cubin and the host shared library accompanying it) is stored exactly once
+in an artifact directory under a name derived from the SHA-256 of its contents. A small SQLite index
+maps the key of each kernel to the module containing it. Kernel keys are short SHA-256 digests of the
+emitted source, the compilation flags, the compiler version and the target architecture.
+
+The total size of stored modules is bounded: once it exceeds ``max_bytes``, the least-recently-used
+modules are evicted. Artifact files are written atomically and index updates are performed in
+SQLite transactions, so that several processes on one node can share a cache.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+def short_hash(*parts) -> str:
+    """
+    Returns a short SHA-256 hex digest of the concatenation of ``parts``
+
+    :param parts: strings or bytes objects to hash
+    :type parts: str or bytes
+
+    :return: first 32 hex digits of the SHA-256 digest
+    :rtype: str
+    """
+    sha = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        sha.update(part)
+        # Separate parts so that ("ab", "c") and ("a", "bc") hash differently
+        sha.update(b"\0")
+    return sha.hexdigest()[:32]
+
+
+class SharedIndex:
+    """
+    SQLite database shared between threads and processes. Writers are serialized via immediate transactions,
+    while readers use deferred transactions, which do not contend for the write lock.
+
+    :param index_file: path to the SQLite database
+    :type index_file: str
+    """
+
+    # Seconds to wait on a lock held by another process before failing
+    _timeout = 60
+
+    def __init__(self, index_file: str) -> None:
+        self.index_file = index_file
+
+        self._lock = threading.Lock()
+        self._connection = None
+        self._connection_pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns the connection to the index, reopening it if this process was forked
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection = sqlite3.connect(
+                self.index_file, timeout=self._timeout, isolation_level=None, check_same_thread=False)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError:
+                # WAL is unavailable on some network file systems. The default rollback journal still
+                # serializes writers correctly.
+                pass
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    @contextmanager
+    def _transaction(self, immediate: bool = True):
+        """
+        Yields a cursor within a transaction. An immediate transaction holds the index's write lock across
+        processes from its start. A deferred transaction only reads, and runs concurrently with other readers
+        and, in WAL mode, with a writer.
+
+        :param immediate: whether to take the write lock at the start of the transaction
+        :type immediate: bool
+        """
+        with self._lock:
+            cursor = self._connect().cursor()
+            cursor.execute("BEGIN IMMEDIATE" if immediate else "BEGIN DEFERRED")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+
+class KernelCache(SharedIndex):
+    """
+    Content-addressed cache of compiled modules shared between processes
+
+    :param index_file: path to the SQLite index
+    :type index_file: str
+    :param artifact_dir: directory in which module artifacts are stored
+    :type artifact_dir: str
+    :param max_bytes: maximum total size of stored artifacts before least-recently-used modules are evicted
+    :type max_bytes: int
+    """
+
+    # Seconds after which a lookup of a module updates its last use. Lookups of recently-used modules
+    # only read the index.
+    _touch_interval = 60
+
+    def __init__(self, index_file: str, artifact_dir: str, max_bytes: int = 2 ** 32) -> None:
+        super().__init__(index_file)
+        self.artifact_dir = artifact_dir
+        self.max_bytes = max_bytes
+
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        with self._transaction() as cursor:
+            # Earlier versions stored modules as blobs in the index under keys that did not include the
+            # compilation flags, compiler version or architecture. Such entries cannot be reused.
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'compiled_operations'")
+            legacy = cursor.fetchone() is not None
+            if legacy:
+                cursor.execute("DROP TABLE compiled_operations")
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compiled_modules(module_key TEXT NOT NULL PRIMARY KEY,
+                                                        size INTEGER NOT NULL,
+                                                        last_used REAL NOT NULL)
+            """)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compiled_kernels(kernel_key TEXT NOT NULL PRIMARY KEY,
+                                                        module_key TEXT NOT NULL,
+                                                        op_name TEXT NOT NULL,
+                                                        op_attrs TEXT NOT NULL)
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS compiled_kernels_module ON compiled_kernels(module_key)")
+        if legacy:
+            # Return the space held by the dropped blobs to the file system
+            with self._lock:
+                self._connect().execute("VACUUM")
+
+    def module_paths(self, module_key: str) -> tuple:
+        """
+        Returns the paths of the cubin and host library of a module
+
+        :param module_key: key of the module
+        :type module_key: str
+
+        :return: tuple containing the path to the cubin and the path to the host library
+        :rtype: tuple
+        """
+        prefix = os.path.join(self.artifact_dir, module_key)
+        return prefix + ".cubin", prefix + ".so"
+
+    def lookup(self, kernel_key: str):
+        """
+        Looks up a kernel and marks the module containing it as recently used
+
+        :param kernel_key: key of the kernel
+        :type kernel_key: str
+
+        :return: tuple of (module key, operation name, operation attributes) if the kernel is cached and
+                 its module is present on disk, and None otherwise
+        """
+        with self._transaction(immediate=False) as cursor:
+            cursor.execute(
+                "SELECT compiled_kernels.module_key, op_name, op_attrs, last_used FROM compiled_kernels "
+                "JOIN compiled_modules ON compiled_kernels.module_key = compiled_modules.module_key "
+                "WHERE kernel_key = ?", (kernel_key,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+
+        module_key, op_name, op_attrs, last_used = row
+        if not all(os.path.exists(path) for path in self.module_paths(module_key)):
+            # The artifacts were removed from underneath the index. Drop the stale entries.
+            with self._transaction() as cursor:
+                self._remove_modules(cursor, [module_key])
+            return None
+
+        now = time.time()
+        if now - last_used > self._touch_interval:
+            with self._transaction() as cursor:
+                cursor.execute(
+                    "UPDATE compiled_modules SET last_used = ? WHERE module_key = ?", (now, module_key))
+        return module_key, op_name, json.loads(op_attrs)
+
+    def _write_atomic(self, path: str, data: bytes):
+        """
+        Writes ``data`` to ``path`` such that concurrent readers never observe a partial file
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.artifact_dir, prefix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def insert(self, cubin: bytes, hostbin: bytes, kernels: list) -> str:
+        """
+        Stores a compiled module and indexes the kernels it contains
+
+        :param cubin: cubin image of the module
+        :type cubin: bytes
+        :param hostbin: host shared library of the module
+        :type hostbin: bytes
+        :param kernels: list of (kernel key, operation name, operation attributes) tuples, one per kernel
+                        contained in the module
+        :type kernels: list
+
+        :return: key of the module
+        :rtype: str
+        """
+        module_key = short_hash(cubin, hostbin)
+        cubin_path, host_path = self.module_paths(module_key)
+
+        # Identical keys imply identical contents, so a concurrent writer of the same module is harmless
+        if not os.path.exists(cubin_path):
+            self._write_atomic(cubin_path, cubin)
+        if not os.path.exists(host_path):
+            self._write_atomic(host_path, hostbin)
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO compiled_modules (module_key, size, last_used) VALUES (?, ?, ?)",
+                (module_key, len(cubin) + len(hostbin), time.time()))
+            cursor.executemany(
+                "INSERT OR REPLACE INTO compiled_kernels (kernel_key, module_key, op_name, op_attrs) VALUES (?, ?, ?, ?)",
+                [(key, module_key, name, json.dumps(attrs)) for key, name, attrs in kernels])
+            self._evict(cursor, keep=module_key)
+
+        return module_key
+
+    def _remove_modules(self, cursor, module_keys: list):
+        for module_key in module_keys:
+            cursor.execute("DELETE FROM compiled_kernels WHERE module_key = ?", (module_key,))
+            cursor.execute("DELETE FROM compiled_modules WHERE module_key = ?", (module_key,))
+            for path in self.module_paths(module_key):
+                try:
+                    # Processes that already loaded the module keep their mapping of the file
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    def _evict(self, cursor, keep: str = None):
+        """
+        Evicts least-recently-used modules until the cache fits within ``max_bytes``
+        """
+        cursor.execute("SELECT COALESCE(SUM(size), 0) FROM compiled_modules")
+        total = cursor.fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        cursor.execute("SELECT module_key, size FROM compiled_modules ORDER BY last_used ASC")
+        to_remove = []
+        for module_key, size in cursor.fetchall():
+            if total <= self.max_bytes:
+                break
+            if module_key == keep:
+                continue
+            to_remove.append(module_key)
+            total -= size
+        self._remove_modules(cursor, to_remove)
+
+    def size(self) -> int:
+        """
+        Returns the total size in bytes of the modules stored in the cache
+
+        :return: total size of stored modules
+        :rtype: int
+        """
+        with self._transaction(immediate=False) as cursor:
+            cursor.execute("SELECT COALESCE(SUM(size), 0) FROM compiled_modules")
+            return cursor.fetchone()[0]
+
+    def clear(self):
+        """
+        Removes all modules from the cache
+        """
+        with self._transaction() as cursor:
+            cursor.execute("SELECT module_key FROM compiled_modules")
+            self._remove_modules(cursor, [row[0] for row in cursor.fetchall()])
@@ -30,15 +30,18 @@
 #
 #################################################################################################
 
+import ctypes
+import weakref
+
 import numpy as np
 
+from cuda import cudart
+
 import cutlass
 from cutlass.utils.datatypes import is_numpy_tensor
 
 if cutlass.use_rmm:
     import rmm
-else:
-    from cuda import cudart
 
 
 class PoolMemoryManager:
@@ -60,26 +63,407 @@ class DevicePtrWrapper:
     Wrapper around a pointer to device memory to provide a uniform interface with the RMM DeviceBuffer
     (at least in terms of the interface used by the CUTLASS Python interface)
     """
-    def __init__(self, dev_ptr):
+    def __init__(self, dev_ptr, size: int = 0, stream=None, pool=None):
         self.dev_ptr = dev_ptr
+        self.size = size
+        # Stream on which the memory was allocated and the allocator that owns it, if any
+        self.stream = stream
+        self.pool = pool
+        # Event recorded on `stream` when the memory was last returned to `pool`
+        self.event = None
+        # Whether the memory is currently held idle by `pool`
+        self.idle = False
+        # Order in which the memory was last returned to `pool`
+        self.released = 0
 
     @property
     def ptr(self):
         return self.dev_ptr
 
 
-def _todevice(host_data):
+def _stream_handle(stream) -> int:
+    return 0 if stream is None else int(stream)
+
+
+class CachingMemoryManager:
     """
-    Helper for transferring host data to device memory
+    Caching allocator for device memory used when RMM is not available.
+
+    ``cudaMalloc`` and ``cudaFree`` synchronize the device and are expensive relative to small kernels.
+    Instead, freed blocks are kept in free lists binned by size class and are handed out again by
+    later allocations. Reuse is stream ordered: a block is immediately reusable by the stream on which it
+    was last used, and is reusable by other streams once the work enqueued before it was freed has completed.
+    Idle blocks are returned to the device, least recently freed first, when their total size exceeds
+    ``max_cached_size`` or when an allocation fails for lack of device memory.
+
+    :param max_cached_size: maximum number of bytes held in idle blocks
+    :type max_cached_size: int
     """
+
+    # Allocations of at most `_small_size` bytes are rounded up to a multiple of `_small_granularity`.
+    # Larger allocations are rounded up to a multiple of `_large_granularity`.
+    _small_size = 1 << 20
+    _small_granularity = 512
+    _large_granularity = 2 << 20
+
+    def __init__(self, max_cached_size: int = 2 ** 32) -> None:
+        self.max_cached_size = max_cached_size
+
+        # Dictionary mapping from size class to a list of idle blocks of that size, oldest first
+        self.free_blocks = {}
+
+        self.allocated_bytes = 0
+        self.cached_bytes = 0
+        self.peak_allocated_bytes = 0
+        self.peak_reserved_bytes = 0
+        self.num_hits = 0
+        self.num_misses = 0
+        self._releases = 0
+
+    def _size_class(self, size: int) -> int:
+        if size <= self._small_size:
+            return align_size(max(size, 1), self._small_granularity)
+        return align_size(size, self._large_granularity)
+
+    def _find_block(self, size: int, stream) -> DevicePtrWrapper:
+        """
+        Removes and returns an idle block of size class ``size`` that is safe to use on ``stream``, or None
+        """
+        bucket = self.free_blocks.get(size)
+        if not bucket:
+            return None
+        handle = _stream_handle(stream)
+        for idx, block in enumerate(bucket):
+            if _stream_handle(block.stream) == handle:
+                return bucket.pop(idx)
+        for idx, block in enumerate(bucket):
+            err, = cudart.cudaEventQuery(block.event)
+            if err == cudart.cudaError_t.cudaSuccess:
+                return bucket.pop(idx)
+        return None
+
+    def _malloc(self, size: int):
+        err, ptr = cudart.cudaMalloc(size)
+        if err == cudart.cudaError_t.cudaErrorMemoryAllocation:
+            # Clear the error and retry once all idle blocks have been returned to the device
+            cudart.cudaGetLastError()
+            self.release()
+            err, ptr = cudart.cudaMalloc(size)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise Exception(f"cudaMalloc failed with error {err}")
+        return ptr
+
+    def allocate(self, size: int, stream=None) -> DevicePtrWrapper:
+        """
+        Allocates at least ``size`` bytes of device memory to be used on ``stream``
+
+        :param size: number of bytes to allocate
+        :type size: int
+        :param stream: stream on which the memory will be used. Defaults to the legacy default stream
+        :type stream: cuda.CUstream
+
+        :return: wrapper around the allocated device pointer
+        :rtype: DevicePtrWrapper
+        """
+        size = self._size_class(size)
+        block = self._find_block(size, stream)
+        if block is not None:
+            self.num_hits += 1
+            self.cached_bytes -= size
+            block.stream = stream
+            block.idle = False
+        else:
+            self.num_misses += 1
+            block = DevicePtrWrapper(self._malloc(size), size, stream, self)
+
+        self.allocated_bytes += size
+        self.peak_allocated_bytes = max(self.peak_allocated_bytes, self.allocated_bytes)
+        self.peak_reserved_bytes = max(self.peak_reserved_bytes, self.allocated_bytes + self.cached_bytes)
+        return block
+
+    def free(self, block: DevicePtrWrapper):
+        """
+        Returns ``block`` to the cache. The block is not reused by other streams until the work
+        currently enqueued on the stream on which it was used has completed.
+
+        :param block: block returned by ``allocate``
+        :type block: DevicePtrWrapper
+        """
+        if block.idle:
+            # Already returned to the cache
+            return
+        block.idle = True
+
+        if block.event is None:
+            err, block.event = cudart.cudaEventCreateWithFlags(cudart.cudaEventDisableTiming)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise Exception(f"cudaEventCreateWithFlags failed with error {err}")
+        err, = cudart.cudaEventRecord(block.event, _stream_handle(block.stream))
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise Exception(f"cudaEventRecord failed with error {err}")
+
+        self._releases += 1
+        block.released = self._releases
+        self.free_blocks.setdefault(block.size, []).append(block)
+        self.allocated_bytes -= block.size
+        self.cached_bytes += block.size
+
+        if self.cached_bytes > self.max_cached_size:
+            self.release(self.max_cached_size)
+
+    def release(self, target_size: int = 0):
+        """
+        Returns idle blocks to the device, least recently freed first across all size classes, until
+        at most ``target_size`` bytes remain cached
+
+        :param target_size: number of cached bytes to retain
+        :type target_size: int
+        """
+        blocks = sorted((block for bucket in self.free_blocks.values() for block in bucket),
+                        key=lambda block: block.released)
+        for block in blocks:
+            if self.cached_bytes <= target_size:
+                break
+            self.free_blocks[block.size].remove(block)
+            cudart.cudaEventSynchronize(block.event)
+            cudart.cudaEventDestroy(block.event)
+            err, = cudart.cudaFree(block.ptr)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError(f"cudaFree failed with error {err}")
+            self.cached_bytes -= block.size
+        self.free_blocks = {size: bucket for size, bucket in self.free_blocks.items() if bucket}
+
+    def pool_size(self):
+        """
+        Returns the number of bytes of device memory currently reserved by the allocator
+
+        :return: number of bytes allocated or cached
+        :rtype: int
+        """
+        return self.allocated_bytes + self.cached_bytes
+
+    def stats(self) -> dict:
+        """
+        Returns statistics about the allocator
+
+        :return: dictionary containing the number of allocated, cached, peak allocated and peak reserved
+                 bytes, along with the number of allocations served from the cache (hits) and from
+                 the device (misses), and the resulting hit rate
+        :rtype: dict
+        """
+        num_allocations = self.num_hits + self.num_misses
+        return {
+            "allocated_bytes": self.allocated_bytes,
+            "cached_bytes": self.cached_bytes,
+            "peak_allocated_bytes": self.peak_allocated_bytes,
+            "peak_reserved_bytes": self.peak_reserved_bytes,
+            "hits": self.num_hits,
+            "misses": self.num_misses,
+            "hit_rate": self.num_hits / num_allocations if num_allocations > 0 else 0.0,
+        }
+
+    def reset_stats(self):
+        """
+        Resets hit and miss counts and sets peak values to the current ones
+        """
+        self.num_hits = 0
+        self.num_misses = 0
+        self.peak_allocated_bytes = self.allocated_bytes
+        self.peak_reserved_bytes = self.allocated_bytes + self.cached_bytes
+
+
+class PinnedHostBuffer:
+    """
+    Page-locked host buffer owned by a ``PinnedHostPool``
+    """
+    def __init__(self, ptr: int, size: int):
+        self.ptr = ptr
+        self.size = size
+        # Event recorded after the last asynchronous transfer using this buffer, or None if the buffer is idle
+        self.event = None
+        # Order in which the buffer was last returned to its pool
+        self.released = 0
+
+
+class PinnedHostPool:
+    """
+    Pool of page-locked host buffers used to stage transfers between NumPy arrays and device memory.
+
+    Copies from pageable memory are synchronous and slow. Instead, data is copied into a pinned staging
+    buffer and transferred asynchronously on the caller's stream. Buffers are binned into power-of-two
+    size classes and are reused once the transfers that last used them have completed. When the buffers
+    held by the pool exceed ``max_cached_size`` bytes, those whose transfers have completed are freed,
+    least recently released first.
+
+    :param max_cached_size: maximum number of bytes held in buffers returned to the pool
+    :type max_cached_size: int
+    """
+
+    _min_size = 4096
+
+    def __init__(self, max_cached_size: int = 2 ** 28):
+        self.max_cached_size = max_cached_size
+        # Dictionary mapping from size class to a list of buffers of that size
+        self.buffers = {}
+        self.cached_bytes = 0
+        self._releases = 0
+
+    @staticmethod
+    def _is_idle(buffer: PinnedHostBuffer) -> bool:
+        if buffer.event is None:
+            return True
+        err, = cudart.cudaEventQuery(buffer.event)
+        return err == cudart.cudaError_t.cudaSuccess
+
+    @staticmethod
+    def _free(buffer: PinnedHostBuffer):
+        if buffer.event is not None:
+            cudart.cudaEventSynchronize(buffer.event)
+            cudart.cudaEventDestroy(buffer.event)
+            buffer.event = None
+        err, = cudart.cudaFreeHost(buffer.ptr)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise Exception(f"cudaFreeHost failed with error {err}")
+
+    def _size_class(self, nbytes: int) -> int:
+        size = self._min_size
+        while size < nbytes:
+            size *= 2
+        return size
+
+    def acquire(self, nbytes: int) -> PinnedHostBuffer:
+        """
+        Returns an idle pinned buffer of at least ``nbytes`` bytes, allocating one if none is available
+        """
+        size = self._size_class(nbytes)
+        bucket = self.buffers.setdefault(size, [])
+        for buffer in bucket:
+            if self._is_idle(buffer):
+                bucket.remove(buffer)
+                self.cached_bytes -= buffer.size
+                return buffer
+
+        err, ptr = cudart.cudaMallocHost(size)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise Exception(f"cudaMallocHost failed with error {err}")
+        return PinnedHostBuffer(ptr, size)
+
+    def release(self, buffer: PinnedHostBuffer, stream=None):
+        """
+        Returns ``buffer`` to the pool. If ``stream`` is provided, the buffer is not reused until
+        the work currently enqueued on ``stream`` has completed.
+        """
+        if stream is not None:
+            if buffer.event is None:
+                err, buffer.event = cudart.cudaEventCreateWithFlags(cudart.cudaEventDisableTiming)
+                if err != cudart.cudaError_t.cudaSuccess:
+                    raise Exception(f"cudaEventCreateWithFlags failed with error {err}")
+            err, = cudart.cudaEventRecord(buffer.event, stream)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise Exception(f"cudaEventRecord failed with error {err}")
+        elif buffer.event is not None:
+            err, = cudart.cudaEventDestroy(buffer.event)
+            buffer.event = None
+        self._releases += 1
+        buffer.released = self._releases
+        self.buffers.setdefault(buffer.size, []).append(buffer)
+        self.cached_bytes += buffer.size
+        if self.cached_bytes > self.max_cached_size:
+            self.trim(self.max_cached_size)
+
+    def trim(self, target_size: int = 0):
+        """
+        Frees buffers whose transfers have completed, least recently released first, until the pool
+        holds at most ``target_size`` bytes. Buffers with pending transfers are kept.
+
+        :param target_size: number of bytes that may remain in the pool
+        :type target_size: int
+        """
+        candidates = sorted((buffer for bucket in self.buffers.values() for buffer in bucket),
+                            key=lambda buffer: buffer.released)
+        for buffer in candidates:
+            if self.cached_bytes <= target_size:
+                break
+            if self._is_idle(buffer):
+                self.buffers[buffer.size].remove(buffer)
+                self.cached_bytes -= buffer.size
+                self._free(buffer)
+
+    def empty(self):
+        """
+        Frees all pinned buffers held by the pool. Waits for pending transfers to complete.
+        """
+        for bucket in self.buffers.values():
+            for buffer in bucket:
+                self._free(buffer)
+        self.buffers = {}
+        self.cached_bytes = 0
+
+
+pinned_host_pool = PinnedHostPool()
+
+
+def _copy_to_device_async(dev_ptr, host_data, stream):
+    """
+    Copies the contiguous array ``host_data`` to ``dev_ptr`` on ``stream`` via a pinned staging buffer
+    """
+    nbytes = host_data.nbytes
+    staging = pinned_host_pool.acquire(nbytes)
+    ctypes.memmove(staging.ptr, host_data.ctypes.data, nbytes)
+    err, = cudart.cudaMemcpyAsync(
+        dev_ptr, staging.ptr, nbytes, cudart.cudaMemcpyKind.cudaMemcpyHostToDevice, stream)
+    if err != cudart.cudaError_t.cudaSuccess:
+        raise Exception(f"cudaMemcpyAsync failed with error {err}")
+    pinned_host_pool.release(staging, stream)
+
+
+def tohost(transfers: list, stream):
+    """
+    Copies device buffers back to host arrays. All copies are enqueued on ``stream`` via pinned staging
+    buffers, followed by a single synchronization of ``stream``.
+
+    :param transfers: list of (host array, device pointer) pairs. Host arrays must be C-contiguous.
+    :type transfers: list
+    :param stream: stream on which to perform the copies
+    """
+    staged = []
+    for host_tensor, dev_ptr in transfers:
+        nbytes = host_tensor.nbytes
+        staging = pinned_host_pool.acquire(nbytes)
+        err, = cudart.cudaMemcpyAsync(
+            staging.ptr, dev_ptr, nbytes, cudart.cudaMemcpyKind.cudaMemcpyDeviceToHost, stream)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise Exception(f"cudaMemcpyAsync failed with error {err}")
+        staged.append((host_tensor, staging, nbytes))
+
+    err, = cudart.cudaStreamSynchronize(stream)
+    if err != cudart.cudaError_t.cudaSuccess:
+        raise Exception(f"cudaStreamSynchronize failed with error {err}")
+
+    for host_tensor, staging, nbytes in staged:
+        ctypes.memmove(host_tensor.ctypes.data, staging.ptr, nbytes)
+        pinned_host_pool.release(staging)
+
+
+def _todevice(host_data, stream=None):
+    """
+    Helper for transferring host data to device memory. If ``stream`` is provided, the transfer
+    is performed asynchronously on ``stream`` through a pinned staging buffer.
+    """
+    host_data = np.ascontiguousarray(host_data)
+    nbytes = host_data.nbytes
+    if stream is not None:
+        buffer = device_mem_alloc(nbytes, stream)
+        _copy_to_device_async(buffer.ptr, host_data, stream)
+        return buffer
+
     if cutlass.use_rmm:
-        return rmm.DeviceBuffer.to_device(host_data.tobytes())
+        return rmm.DeviceBuffer.to_device(host_data.view(np.uint8).reshape(-1))
     else:
-        nbytes = len(host_data.tobytes())
         dev_ptr_wrapper = device_mem_alloc(nbytes)
         err, = cudart.cudaMemcpy(
             dev_ptr_wrapper.ptr,
-            host_data.__array_interface__['data'][0],
+            host_data.ctypes.data,
             nbytes,
             cudart.cudaMemcpyKind.cudaMemcpyHostToDevice
         )
@@ -88,24 +472,155 @@ def _todevice(host_data):
         return dev_ptr_wrapper
 
 
-def todevice(host_data, dtype=np.float32):
+def todevice(host_data, dtype=np.float32, stream=None):
     """
     Pass the host_data to device memory
     """
     if isinstance(host_data, list):
-        return _todevice(np.array(host_data, dtype=dtype))
+        return _todevice(np.array(host_data, dtype=dtype), stream)
     elif is_numpy_tensor(host_data):
-        return _todevice(host_data)
+        return _todevice(host_data, stream)
+
+
+def _is_read_only(host_data) -> bool:
+    """
+    Returns whether ``host_data`` cannot be modified in place: neither it nor any array whose memory it
+    views is writeable, and the memory is not owned by another mutable object
+    """
+    array = host_data
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return array is None or isinstance(array, bytes)
+
+
+class CachedDeviceBuffer:
+    """
+    Device buffer owned by a ``DeviceBufferCache``. Arguments holding one must not free it.
+    """
+    def __init__(self, buffer, signature):
+        self.buffer = buffer
+        self.signature = signature
+        # Whether the contents of the device buffer match those of the host array
+        self.valid = False
 
+    @property
+    def ptr(self):
+        return self.buffer.ptr
+
+
+class DeviceBufferCache:
+    """
+    Opt-in cache of device-resident copies of NumPy arrays, keyed by array identity.
+
+    When enabled, repeated runs on the same host arrays reuse a single device allocation per array.
+    In-place writes to an array cannot be detected, so the host-to-device copy is skipped only for read-only
+    inputs (see ``numpy.ndarray.flags.writeable``) whose device copy is up to date; other inputs are uploaded
+    on every use. The device copy of an output is up to date once the arguments using it have been
+    synchronized. Entries are released when the host array is garbage collected.
+
+    Callers that make a cached array writeable and modify it must call ``invalidate`` on it before its next use.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # Dictionary mapping from id of a host array to its CachedDeviceBuffer
+        self.entries = {}
+
+    @staticmethod
+    def _signature(host_data) -> tuple:
+        return (host_data.ctypes.data, host_data.shape, host_data.strides, host_data.dtype.str)
+
+    def _entry(self, host_data, stream=None) -> CachedDeviceBuffer:
+        key = id(host_data)
+        signature = self._signature(host_data)
+        entry = self.entries.get(key)
+        if entry is not None and entry.signature != signature:
+            self._evict(key)
+            entry = None
+        if entry is None:
+            entry = CachedDeviceBuffer(device_mem_alloc(host_data.nbytes, stream), signature)
+            self.entries[key] = entry
+            weakref.finalize(host_data, self._evict, key, entry)
+        return entry
+
+    def _evict(self, key, entry=None):
+        current = self.entries.get(key)
+        if current is None or (entry is not None and current is not entry):
+            return
+        del self.entries[key]
+        device_mem_free(current.buffer)
+
+    def input(self, host_data, stream=None) -> CachedDeviceBuffer:
+        """
+        Returns the cached device copy of ``host_data``, uploading it unless ``host_data`` is read-only
+        and the copy is up to date
+        """
+        entry = self._entry(host_data, stream)
+        if not entry.valid or not _is_read_only(host_data):
+            contiguous = np.ascontiguousarray(host_data)
+            if stream is None:
+                stream = cudart.cudaStream_t(0)
+            _copy_to_device_async(entry.ptr, contiguous, stream)
+            entry.valid = True
+        return entry
+
+    def output(self, host_data) -> CachedDeviceBuffer:
+        """
+        Returns the cached device buffer for output ``host_data``. Its contents are considered out of
+        date until ``synchronized`` is called.
+        """
+        entry = self._entry(host_data)
+        entry.valid = False
+        return entry
 
-def device_mem_alloc(size):
+    def synchronized(self, host_data):
+        """
+        Marks the device copy of ``host_data`` as matching the host array after a device-to-host copy
+        """
+        entry = self.entries.get(id(host_data))
+        if entry is not None:
+            entry.valid = True
+
+    def invalidate(self, host_data):
+        """
+        Marks the device copy of ``host_data`` as out of date, e.g., after the host array is modified in place
+        """
+        entry = self.entries.get(id(host_data))
+        if entry is not None:
+            entry.valid = False
+
+    def clear(self):
+        """
+        Releases all cached device buffers
+        """
+        for key in list(self.entries.keys()):
+            self._evict(key)
+
+
+device_buffer_cache = DeviceBufferCache()
+
+
+def device_mem_alloc(size, stream=None):
     if cutlass.use_rmm:
         return rmm.DeviceBuffer(size=size)
     else:
-        err, ptr = cudart.cudaMalloc(size)
-        if err != cudart.cudaError_t.cudaSuccess:
-            raise Exception(f"cudaMalloc failed with error {err}")
-        return DevicePtrWrapper(ptr)
+        return cutlass.get_memory_pool().allocate(size, stream)
+
+
+def device_mem_free(buffer):
+    """
+    Frees device memory returned by ``device_mem_alloc``. Memory owned by RMM is freed once no
+    references to it remain, so this is a no-op for RMM buffers.
+    """
+    if isinstance(buffer, DevicePtrWrapper):
+        if buffer.pool is not None:
+            buffer.pool.free(buffer)
+        else:
+            err, = cudart.cudaFree(buffer.ptr)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError(f"cudaFree failed with error {err}")
 
 
 def align_size(size, alignment=256):
@@ -117,4 +632,5 @@ def create_memory_pool(init_pool_size=0, max_pool_size=2 ** 34):
         memory_pool = PoolMemoryManager(init_pool_size=init_pool_size, max_pool_size=max_pool_size)
         return memory_pool
     else:
-        return None
+        # Memory is cached as it is freed rather than reserved up front, so `init_pool_size` is unused
+        return CachingMemoryManager(max_cached_size=max_pool_size)
@@ -48,7 +48,7 @@ import cutlass
 from cutlass.backend.c_types import MatrixCoord_, TensorRef2D_, get_reduction_params
 from cutlass.backend.frontend import NumpyFrontend, TorchFrontend
 from cutlass.backend.library import TensorDescription
-from cutlass.backend.memory_manager import DevicePtrWrapper
+from cutlass.backend.memory_manager import device_mem_free
 from cutlass.backend.operation import ExecutableOperation, LaunchConfiguration
 from cutlass.shape import MatrixCoord
 from cutlass.utils.datatypes import is_numpy_tensor, is_torch_tensor
@@ -201,11 +201,8 @@ class ReductionArguments:
             for attr in ["destination_buffer", "source_buffer"]:
                 if hasattr(self, attr):
                     buf = getattr(self, attr)
-                    if isinstance(buf, DevicePtrWrapper):
-                        err, = cudart.cudaFree(buf.ptr)
-                        if err != cudart.cudaError_t.cudaSuccess:
-                            raise RuntimeError(f"cudaFree failed with error {err}")
-                        del buf
+                    device_mem_free(buf)
+                    del buf
 
 
 class ReductionRT(ExecutableOperation):
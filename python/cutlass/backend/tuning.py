@@ -0,0 +1,194 @@
+#################################################################################################
+#
+# Copyright (c) 2025 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+
+"""
+Persistent database of autotuning results.
+
+Each record holds the best-performing kernel configuration measured for a class of problems: the
+kind of operation, its data types, layouts and alignments, the compute capability on which it was
+measured, and a bucket of problem sizes. Problem sizes are bucketed by rounding each of M, N, and K
+up to the next power of two, so that a single measurement serves all nearby problem sizes.
+"""
+
+import json
+import os
+import time
+
+from cutlass.backend.kernel_cache import SharedIndex
+
+
+def shape_bucket(*extents) -> tuple:
+    """
+    Returns the bucket in which a problem of the given extents falls. Each extent is rounded up
+    to the next power of two.
+
+    :return: bucketed extents
+    :rtype: tuple
+    """
+    return tuple(1 << max(int(extent) - 1, 0).bit_length() for extent in extents)
+
+
+def tile_description_key(td) -> str:
+    """
+    Returns a string uniquely identifying a tile description among those available to an operation
+
+    :param td: tile description
+    :type td: cutlass.backend.TileDescription
+
+    :rtype: str
+    """
+    mi = td.math_instruction
+    name = lambda x: "auto" if x is None else x.name
+    return "_".join([
+        td.procedural_name(),
+        "x".join(str(x) for x in (td.warp_count or [])),
+        "x".join(str(x) for x in mi.instruction_shape),
+        mi.opcode_class.name,
+        mi.math_operation.name,
+        name(td.kernel_schedule),
+        name(td.epilogue_schedule),
+        name(td.tile_scheduler),
+    ])
+
+
+class TuningDatabase(SharedIndex):
+    """
+    Database of the best kernel configurations measured by autotuning, shared between processes.
+    The database file is created when the first result is recorded.
+
+    :param index_file: path to the SQLite database
+    :type index_file: str
+    """
+
+    def __init__(self, index_file: str) -> None:
+        super().__init__(index_file)
+        self._initialized = False
+
+        # Number of writes made through this object, which ``PRAGMA data_version`` does not reflect
+        self._writes = 0
+
+    def _initialize(self):
+        if self._initialized:
+            return
+        directory = os.path.dirname(self.index_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._transaction() as cursor:
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tuning_results(operation TEXT NOT NULL,
+                                                      problem TEXT NOT NULL,
+                                                      arch INTEGER NOT NULL,
+                                                      m INTEGER NOT NULL,
+                                                      n INTEGER NOT NULL,
+                                                      k INTEGER NOT NULL,
+                                                      config TEXT NOT NULL,
+                                                      runtime REAL NOT NULL,
+                                                      updated REAL NOT NULL,
+                                                      PRIMARY KEY (operation, problem, arch, m, n, k))
+            """)
+        self._initialized = True
+
+    def lookup(self, operation: str, problem: str, arch: int, bucket: tuple):
+        """
+        Returns the configuration recorded for a class of problems
+
+        :param operation: kind of operation (e.g., "gemm")
+        :type operation: str
+        :param problem: description of the data types, layouts, and alignments of the problem
+        :type problem: str
+        :param arch: compute capability on which the configuration was measured
+        :type arch: int
+        :param bucket: bucketed (M, N, K) problem size, as returned by ``shape_bucket``
+        :type bucket: tuple
+
+        :return: the recorded configuration, or None if no configuration has been recorded
+        :rtype: dict
+        """
+        if not self._initialized and not os.path.exists(self.index_file):
+            return None
+        self._initialize()
+        with self._transaction(immediate=False) as cursor:
+            cursor.execute(
+                "SELECT config FROM tuning_results WHERE operation = ? AND problem = ? AND arch = ? "
+                "AND m = ? AND n = ? AND k = ?", (operation, problem, arch, *bucket))
+            row = cursor.fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def version(self):
+        """
+        Returns a value that changes whenever results are recorded in or cleared from the database, by this
+        or any other process. Unlike a lookup, this does not open a transaction.
+
+        :return: version of the database, or None if the database file does not exist
+        """
+        if not self._initialized and not os.path.exists(self.index_file):
+            return None
+        self._initialize()
+        with self._lock:
+            data_version, = self._connect().execute("PRAGMA data_version").fetchone()
+        return self._connection_pid, data_version, self._writes
+
+    def record(self, operation: str, problem: str, arch: int, bucket: tuple, config: dict, runtime: float):
+        """
+        Records the best configuration for a class of problems, replacing any previously-recorded configuration
+
+        :param operation: kind of operation (e.g., "gemm")
+        :type operation: str
+        :param problem: description of the data types, layouts, and alignments of the problem
+        :type problem: str
+        :param arch: compute capability on which the configuration was measured
+        :type arch: int
+        :param bucket: bucketed (M, N, K) problem size, as returned by ``shape_bucket``
+        :type bucket: tuple
+        :param config: JSON-serializable description of the configuration
+        :type config: dict
+        :param runtime: measured runtime of the configuration in milliseconds
+        :type runtime: float
+        """
+        self._initialize()
+        with self._transaction() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO tuning_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (operation, problem, arch, *bucket, json.dumps(config), runtime, time.time()))
+        self._writes += 1
+
+    def clear(self):
+        """
+        Removes all recorded results
+        """
+        if not self._initialized and not os.path.exists(self.index_file):
+            return
+        self._initialize()
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM tuning_results")
+        self._writes += 1
@@ -83,21 +83,23 @@ using ElementCompute = typename DeviceKernel::EpilogueOutputOp::ElementCompute;
 
 cutlass::Status ${name}_kernel_run(int M, int N, int K,
                         const DeviceKernel::ElementA* A, const DeviceKernel::ElementB* B, const DeviceKernel::ElementC* C, DeviceKernel::ElementC* D,
-                        ElementCompute alpha, ElementCompute beta) {
+                        ElementCompute alpha, ElementCompute beta,
+                        cudaStream_t stream, int device_id=0) {
   ${args}
   size_t workspace_size = DeviceKernel::get_workspace_size(arguments);
-  cutlass::device_memory::allocation<uint8_t> workspace(workspace_size);
+  at::Tensor workspace = device_memory_allocation(workspace_size, device_id);
+  void* workspace_ptr = workspace.defined() ? workspace.data_ptr() : nullptr;
 
   DeviceKernel gemm_op;
   cutlass::Status status = gemm_op.initialize(arguments,
-                                              workspace.get(),
-                                              nullptr);     // CUDA stream
+                                              workspace_ptr,
+                                              stream);
 
   if (status != cutlass::Status::kSuccess) {
     return status;
   }
 
-  status = gemm_op();
+  status = gemm_op(stream);
   return status;
 }
 """
@@ -113,7 +115,8 @@ using ElementCompute = typename DeviceKernel::EpilogueOutputOp::ElementCompute;
 cutlass::Status ${name}_kernel_run(
         int M, int N, int K, int L,
         const DeviceKernel::ElementA* A, const DeviceKernel::ElementB* B, const DeviceKernel::ElementC* C, DeviceKernel::ElementC* D,
-        ElementCompute alpha, ElementCompute beta, const cutlass::KernelHardwareInfo& hw_info) {
+        ElementCompute alpha, ElementCompute beta, const cutlass::KernelHardwareInfo& hw_info,
+        cudaStream_t stream) {
 
   typename DeviceKernel::Arguments arguments{
       cutlass::gemm::GemmUniversalMode::kGemm,
@@ -135,12 +138,13 @@ cutlass::Status ${name}_kernel_run(
   };
 
   size_t workspace_size = DeviceKernel::get_workspace_size(arguments);
-  cutlass::device_memory::allocation<uint8_t> workspace(workspace_size);
+  at::Tensor workspace = device_memory_allocation(workspace_size, hw_info.device_id);
+  void* workspace_ptr = workspace.defined() ? workspace.data_ptr() : nullptr;
 
   DeviceKernel gemm_op;
   cutlass::Status status = gemm_op.run(arguments,
-                                       workspace.get(),
-                                       nullptr);     // CUDA stream
+                                       workspace_ptr,
+                                       stream);
 
   return status;
 }
@@ -155,7 +159,8 @@ int threadblock_count = DeviceKernel::sufficient();
 cutlass::Status ${name}_kernel_run(int problem_count, cutlass::gemm::GemmCoord* problem_sizes,
                         DeviceKernel::ElementA** A, DeviceKernel::ElementB** B, DeviceKernel::ElementC** C, DeviceKernel::ElementC** D,
                         int64_t* lda, int64_t* ldb, int64_t* ldc, int64_t* ldd,
-                        ElementCompute alpha, ElementCompute beta) {
+                        ElementCompute alpha, ElementCompute beta,
+                        cudaStream_t stream, int device_id=0) {
 
   typename DeviceKernel::Arguments arguments {
     problem_sizes,
@@ -167,18 +172,19 @@ cutlass::Status ${name}_kernel_run(int problem_count, cutlass::gemm::GemmCoord*
   };
 
   size_t workspace_size = DeviceKernel::get_workspace_size(arguments);
-  cutlass::device_memory::allocation<uint8_t> workspace(workspace_size);
+  at::Tensor workspace = device_memory_allocation(workspace_size, device_id);
+  void* workspace_ptr = workspace.defined() ? workspace.data_ptr() : nullptr;
 
   DeviceKernel gemm_op;
   cutlass::Status status = gemm_op.initialize(arguments,
-                                              workspace.get(),
-                                              nullptr);     // CUDA stream
+                                              workspace_ptr,
+                                              stream);
 
   if (status != cutlass::Status::kSuccess) {
     return status;
   }
 
-  status = gemm_op();
+  status = gemm_op(stream);
   return status;
 }
 """
@@ -245,7 +251,8 @@ cutlass::Status ${name}_kernel_run(cutlass::conv::Conv2dProblemSize* problem_siz
 
   size_t workspace_size = implicit_gemm_op.get_workspace_size(arguments);
 
-  void* workspace_ptr = device_memory_allocation(workspace_size, device_id);
+  at::Tensor workspace = device_memory_allocation(workspace_size, device_id);
+  void* workspace_ptr = workspace.defined() ? workspace.data_ptr() : nullptr;
 
   cutlass::Status status = implicit_gemm_op.can_implement(arguments);
   if (status != cutlass::Status::kSuccess) {
@@ -49,6 +49,14 @@ Example usage with JIT compilation:
     # Run the module
     D = mod.run(A, B, C)
 
+    # Write the result into a preallocated tensor
+    mod.run(A, B, C, out=D)
+
+The module also registers its entry point as the PyTorch custom operator ``torch.ops.cutlass_gemm.run``
+(and ``torch.ops.cutlass_gemm.run.out``), with a meta implementation for shape propagation. This allows
+the kernel to be used within ``torch.compile`` graphs without graph breaks. Kernels run on the current
+PyTorch stream, and workspaces are allocated on that stream through the PyTorch caching allocator, so
+that calls can be captured in CUDA graphs.
 
 Example usage without JIT compilation:
 
@@ -99,19 +107,41 @@ _PYTORCH_CUDA_TEMPLATE = common._CSTYLE_AUTOGEN_COMMENT + """
 #include <torch/extension.h>
 #include <ATen/ATen.h>
 #include <ATen/cuda/CUDAContext.h>
+#include <c10/cuda/CUDAGuard.h>
 #include "cutlass/cutlass.h"
 #include "cutlass/util/device_memory.h"
 
 // helper function allocating the memory
-void* device_memory_allocation(size_t size, int device_id=0) {
+//
+// Workspaces are allocated for each call through the PyTorch caching allocator on the current
+// stream, so that no device allocation happens on the steady state. The returned tensor must be
+// kept alive until the kernel using it has been launched, after which the allocator reuses its
+// memory only for work enqueued later on the stream. Workspaces allocated during CUDA graph
+// capture come from the graph's private memory pool, which outlives the graph's replays.
+at::Tensor device_memory_allocation(size_t size, int device_id) {
     if (size > 0) {
         torch::Device device(torch::kCUDA, device_id);
-        cudaStream_t stream = at::cuda::getCurrentCUDAStream();
-        torch::TensorOptions options = torch::TensorOptions().dtype(torch::kI8).device(device);
-        at::Tensor device_tensor = torch::empty({(long)size,}, options);
-        return reinterpret_cast<void*>(device_tensor.data_ptr());
+        torch::TensorOptions options = torch::TensorOptions().dtype(torch::kByte).device(device);
+        return torch::empty({(int64_t)size,}, options);
+    } else {
+        return at::Tensor();
+    }
+}
+
+// helper function returning the tensor to which the result is written
+//
+// If ``out`` is provided, it is checked to be able to hold the result and is returned.
+// Otherwise, a new tensor is allocated.
+at::Tensor output_tensor(const at::optional<at::Tensor>& out, at::IntArrayRef sizes, const torch::TensorOptions& options) {
+    if (out.has_value()) {
+        at::MemoryFormat memory_format = options.memory_format_opt().value_or(at::MemoryFormat::Contiguous);
+        TORCH_CHECK(out->sizes() == sizes, "out has size ", out->sizes(), " but the result has size ", sizes);
+        TORCH_CHECK(out->dtype() == options.dtype(), "out has dtype ", out->dtype(), " but the result has dtype ", options.dtype());
+        TORCH_CHECK(out->device() == options.device(), "out is on ", out->device(), " but the result is on ", options.device());
+        TORCH_CHECK(out->is_contiguous(memory_format), "out must be contiguous in memory format ", memory_format);
+        return *out;
     } else {
-        return nullptr;
+        return torch::empty(sizes, options);
     }
 }
 
@@ -120,21 +150,72 @@ ${declaration}
 ${impl}
 """
 
+# Conversions from the integer lists of custom operator schemas to the tuples taken by the Conv2d interface
+_PYTORCH_CONV2D_OP_UTILS = """
+std::tuple<int, int> to_pair(at::IntArrayRef values) {
+    TORCH_CHECK(values.size() == 2, "Expected 2 values, but got ", values.size());
+    return std::make_tuple(int(values[0]), int(values[1]));
+}
+
+std::tuple<int, int, int, int> to_quad(at::IntArrayRef values) {
+    TORCH_CHECK(values.size() == 4, "Expected 4 values, but got ", values.size());
+    return std::make_tuple(int(values[0]), int(values[1]), int(values[2]), int(values[3]));
+}
+"""
+
 _PYTORCH_GEMM_CPP_TEMPLATE = common._CSTYLE_AUTOGEN_COMMENT + """
 #include <torch/extension.h>
+#include <torch/library.h>
 #include <ATen/ATen.h>
 #include <pybind11/stl.h>
 
 // CUDA forward declarations
-at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt, float alpha=1.f, float beta=0.f);
+at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt, float alpha=1.f, float beta=0.f,
+                          at::optional<at::Tensor> out=at::nullopt);
 
 // C++ interface
-at::Tensor ${name}(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt, float alpha=1.f, float beta=0.f) {
+at::Tensor ${name}(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt, float alpha=1.f, float beta=0.f,
+                   at::optional<at::Tensor> out=at::nullopt) {
+  return ${name}_kernel(A, B, C, alpha, beta, out);
+}
+
+// Custom operator interface
+at::Tensor ${name}_op(const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C, double alpha, double beta) {
   return ${name}_kernel(A, B, C, alpha, beta);
 }
 
+at::Tensor& ${name}_op_out(const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C, double alpha, double beta, at::Tensor& out) {
+  ${name}_kernel(A, B, C, alpha, beta, out);
+  return out;
+}
+
+// Shape and type propagation without running the kernel, used for meta and fake tensors
+at::Tensor ${name}_meta(const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C, double alpha, double beta) {
+  return at::empty({A.size(0), B.size(1)}, A.options().dtype(${torch_type_C}));
+}
+
+at::Tensor& ${name}_meta_out(const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C, double alpha, double beta, at::Tensor& out) {
+  return out;
+}
+
+TORCH_LIBRARY(${name}, m) {
+  m.def("run(Tensor A, Tensor B, Tensor? C=None, float alpha=1., float beta=0.) -> Tensor");
+  m.def("run.out(Tensor A, Tensor B, Tensor? C=None, float alpha=1., float beta=0., *, Tensor(a!) out) -> Tensor(a!)");
+}
+
+TORCH_LIBRARY_IMPL(${name}, CUDA, m) {
+  m.impl("run", &${name}_op);
+  m.impl("run.out", &${name}_op_out);
+}
+
+TORCH_LIBRARY_IMPL(${name}, Meta, m) {
+  m.impl("run", &${name}_meta);
+  m.impl("run.out", &${name}_meta_out);
+}
+
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
-  m.def("run", py::overload_cast<const at::Tensor&, const at::Tensor&, at::optional<const at::Tensor>, float, float>(&${name}), py::arg("A"), py::arg("B"), py::arg("C") = nullptr, py::arg("alpha") = 1.f, py::arg("beta") = 0.f);
+  m.def("run", py::overload_cast<const at::Tensor&, const at::Tensor&, at::optional<const at::Tensor>, float, float, at::optional<at::Tensor>>(&${name}),
+        py::arg("A"), py::arg("B"), py::arg("C") = nullptr, py::arg("alpha") = 1.f, py::arg("beta") = 0.f, py::arg("out") = nullptr);
 }
 """
 
@@ -144,82 +225,190 @@ _PYTORCH_GROUPED_GEMM_CPP_TEMPLATE = common._CSTYLE_AUTOGEN_COMMENT + """
 #include <pybind11/stl.h>
 
 // CUDA forward declarations
-std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C=at::nullopt, float alpha=1.f, float beta=0.f);
+std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C=at::nullopt, float alpha=1.f, float beta=0.f,
+                                       at::optional<std::vector<at::Tensor>> out=at::nullopt);
 
 // C++ interface
-std::vector<at::Tensor> ${name}(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C=at::nullopt, float alpha=1.f, float beta=0.f) {
-  return ${name}_kernel(A, B, C, alpha, beta);
+std::vector<at::Tensor> ${name}(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C=at::nullopt, float alpha=1.f, float beta=0.f,
+                                at::optional<std::vector<at::Tensor>> out=at::nullopt) {
+  return ${name}_kernel(A, B, C, alpha, beta, out);
 }
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
-  m.def("run", py::overload_cast<const std::vector<at::Tensor>&, const std::vector<at::Tensor>&, at::optional<const std::vector<at::Tensor>>, float, float>(&${name}),
-        py::arg("A"), py::arg("B"), py::arg("C") = nullptr, py::arg("alpha") = 1.f, py::arg("beta") = 0.f);
+  m.def("run", py::overload_cast<const std::vector<at::Tensor>&, const std::vector<at::Tensor>&, at::optional<const std::vector<at::Tensor>>, float, float, at::optional<std::vector<at::Tensor>>>(&${name}),
+        py::arg("A"), py::arg("B"), py::arg("C") = nullptr, py::arg("alpha") = 1.f, py::arg("beta") = 0.f, py::arg("out") = nullptr);
 }
 """
 
 _PYTORCH_CONV2D_FPROP_CPP_TEMPLATE = common._CSTYLE_AUTOGEN_COMMENT + """
 #include <torch/extension.h>
+#include <torch/library.h>
 #include <ATen/ATen.h>
 #include <pybind11/stl.h>
 
 // CUDA forward declarations
 at::Tensor ${name}_kernel(
     const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1},
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1},
     float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1);
+    std::string split_k_mode="serial", int split_k_slices=1,
+    at::optional<at::Tensor> out=at::nullopt);
 
 // C++ interface
 at::Tensor ${name}(
     const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1},
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1},
     float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1) {
-    return ${name}_kernel(A, B, C, stride, padding, dilation, alpha, beta, split_k_mode, split_k_slices);
+    std::string split_k_mode="serial", int split_k_slices=1,
+    at::optional<at::Tensor> out=at::nullopt) {
+    return ${name}_kernel(A, B, C, stride, padding, dilation, alpha, beta, split_k_mode, split_k_slices, out);
+}
+""" + _PYTORCH_CONV2D_OP_UTILS + """
+// Custom operator interface
+at::Tensor ${name}_op(
+    const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices) {
+    return ${name}_kernel(A, B, C, to_pair(stride), to_pair(padding), to_pair(dilation), alpha, beta, std::string(split_k_mode), split_k_slices);
+}
+
+at::Tensor& ${name}_op_out(
+    const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices, at::Tensor& out) {
+    ${name}_kernel(A, B, C, to_pair(stride), to_pair(padding), to_pair(dilation), alpha, beta, std::string(split_k_mode), split_k_slices, out);
+    return out;
+}
+
+// Shape and type propagation without running the kernel, used for meta and fake tensors
+at::Tensor ${name}_meta(
+    const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices) {
+    int64_t P = (A.size(2) + 2 * padding[0] - dilation[0] * (B.size(2) - 1) - 1) / stride[0] + 1;
+    int64_t Q = (A.size(3) + 2 * padding[1] - dilation[1] * (B.size(3) - 1) - 1) / stride[1] + 1;
+    return at::empty({A.size(0), B.size(0), P, Q}, A.options().dtype(${torch_type_C}).memory_format(at::MemoryFormat::ChannelsLast));
+}
+
+at::Tensor& ${name}_meta_out(
+    const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices, at::Tensor& out) {
+    return out;
+}
+
+TORCH_LIBRARY(${name}, m) {
+  m.def("run(Tensor A, Tensor B, Tensor? C=None, int[2] stride=[1, 1], int[2] padding=[1, 1], int[2] dilation=[1, 1], "
+        "float alpha=1., float beta=0., str split_k_mode='serial', int split_k_slices=1) -> Tensor");
+  m.def("run.out(Tensor A, Tensor B, Tensor? C=None, int[2] stride=[1, 1], int[2] padding=[1, 1], int[2] dilation=[1, 1], "
+        "float alpha=1., float beta=0., str split_k_mode='serial', int split_k_slices=1, *, Tensor(a!) out) -> Tensor(a!)");
+}
+
+TORCH_LIBRARY_IMPL(${name}, CUDA, m) {
+  m.impl("run", &${name}_op);
+  m.impl("run.out", &${name}_op_out);
+}
+
+TORCH_LIBRARY_IMPL(${name}, Meta, m) {
+  m.impl("run", &${name}_meta);
+  m.impl("run.out", &${name}_meta_out);
 }
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def("run",
   py::overload_cast<
     const at::Tensor&, const at::Tensor&, at::optional<const at::Tensor>,
-    std::tuple<int, int>, std::tuple<int, int>, std::tuple<int, int>, float, float,  std::string, int>(
+    std::tuple<int, int>, std::tuple<int, int>, std::tuple<int, int>, float, float,  std::string, int, at::optional<at::Tensor>>(
         &${name}), py::arg("A"), py::arg("B"), py::arg("C") = nullptr,
         py::arg("stride") = std::make_tuple(1, 1), py::arg("padding") = std::make_tuple(1, 1), py::arg("dilation") = std::make_tuple(1, 1),
         py::arg("alpha") = 1.f, py::arg("beta") = 0.f,
-        py::arg("split_k_mode") = "serial", py::arg("split_k_slices") = 1);
+        py::arg("split_k_mode") = "serial", py::arg("split_k_slices") = 1,
+        py::arg("out") = nullptr);
 }
 """
 
 _PYTORCH_CONV2D_GRAD_CPP_TEMPLATE = common._CSTYLE_AUTOGEN_COMMENT + """
 #include <torch/extension.h>
+#include <torch/library.h>
 #include <ATen/ATen.h>
 #include <pybind11/stl.h>
 
 // CUDA forward declarations
 at::Tensor ${name}_kernel(
     std::tuple<int, int, int, int> result_size, const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1},
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1},
     float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1);
+    std::string split_k_mode="serial", int split_k_slices=1,
+    at::optional<at::Tensor> out=at::nullopt);
 
 // C++ interface
 at::Tensor ${name}(
     std::tuple<int, int, int, int> result_size, const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1},
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1},
     float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1) {
-    return ${name}_kernel(result_size, A, B, C, stride, padding, dilation, alpha, beta, split_k_mode, split_k_slices);
+    std::string split_k_mode="serial", int split_k_slices=1,
+    at::optional<at::Tensor> out=at::nullopt) {
+    return ${name}_kernel(result_size, A, B, C, stride, padding, dilation, alpha, beta, split_k_mode, split_k_slices, out);
+}
+""" + _PYTORCH_CONV2D_OP_UTILS + """
+// Custom operator interface
+at::Tensor ${name}_op(
+    at::IntArrayRef result_size, const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices) {
+    return ${name}_kernel(to_quad(result_size), A, B, C, to_pair(stride), to_pair(padding), to_pair(dilation), alpha, beta, std::string(split_k_mode), split_k_slices);
+}
+
+at::Tensor& ${name}_op_out(
+    at::IntArrayRef result_size, const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices, at::Tensor& out) {
+    ${name}_kernel(to_quad(result_size), A, B, C, to_pair(stride), to_pair(padding), to_pair(dilation), alpha, beta, std::string(split_k_mode), split_k_slices, out);
+    return out;
+}
+
+// Shape and type propagation without running the kernel, used for meta and fake tensors
+at::Tensor ${name}_meta(
+    at::IntArrayRef result_size, const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices) {
+    return at::empty(result_size, A.options().dtype(${torch_type_C}).memory_format(at::MemoryFormat::ChannelsLast));
+}
+
+at::Tensor& ${name}_meta_out(
+    at::IntArrayRef result_size, const at::Tensor& A, const at::Tensor& B, const at::optional<at::Tensor>& C,
+    at::IntArrayRef stride, at::IntArrayRef padding, at::IntArrayRef dilation,
+    double alpha, double beta, c10::string_view split_k_mode, int64_t split_k_slices, at::Tensor& out) {
+    return out;
+}
+
+TORCH_LIBRARY(${name}, m) {
+  m.def("run(int[4] result_size, Tensor A, Tensor B, Tensor? C=None, int[2] stride=[1, 1], int[2] padding=[1, 1], int[2] dilation=[1, 1], "
+        "float alpha=1., float beta=0., str split_k_mode='serial', int split_k_slices=1) -> Tensor");
+  m.def("run.out(int[4] result_size, Tensor A, Tensor B, Tensor? C=None, int[2] stride=[1, 1], int[2] padding=[1, 1], int[2] dilation=[1, 1], "
+        "float alpha=1., float beta=0., str split_k_mode='serial', int split_k_slices=1, *, Tensor(a!) out) -> Tensor(a!)");
+}
+
+TORCH_LIBRARY_IMPL(${name}, CUDA, m) {
+  m.impl("run", &${name}_op);
+  m.impl("run.out", &${name}_op_out);
+}
+
+TORCH_LIBRARY_IMPL(${name}, Meta, m) {
+  m.impl("run", &${name}_meta);
+  m.impl("run.out", &${name}_meta_out);
 }
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
   m.def("run",
   py::overload_cast<
     std::tuple<int, int, int, int>, const at::Tensor&, const at::Tensor&, at::optional<const at::Tensor>,
-    std::tuple<int, int>, std::tuple<int, int>, std::tuple<int, int>, float, float, std::string, int>(
+    std::tuple<int, int>, std::tuple<int, int>, std::tuple<int, int>, float, float, std::string, int, at::optional<at::Tensor>>(
         &${name}), py::arg("result_size"), py::arg("A"), py::arg("B"), py::arg("C") = nullptr,
         py::arg("stride") = std::make_tuple(1, 1), py::arg("padding") = std::make_tuple(1, 1), py::arg("dilation") = std::make_tuple(1, 1),
         py::arg("alpha") = 1.f, py::arg("beta") = 0.f,
-        py::arg("split_k_mode") = "serial", py::arg("split_k_slices") = 1);
+        py::arg("split_k_mode") = "serial", py::arg("split_k_slices") = 1,
+        py::arg("out") = nullptr);
 }
 """
 
@@ -261,22 +450,31 @@ _CUTLASS_TYPE_TO_TORCH_TYPE = {
 _PYTORCH_GEMM_IMPL_TEMPLATE_2x = (
     common._CUTLASS_KERNEL_RUN_GEMM_2x
     + """
-at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C, float alpha, float beta) {
+at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C, float alpha, float beta,
+                          at::optional<at::Tensor> out) {
     int M = A.size(0);
     int N = B.size(1);
     int K = A.size(1);
 
+    const at::cuda::OptionalCUDAGuard device_guard(B.device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+
+    // Keep contiguous copies of the operands alive until the kernel has been launched
+    at::Tensor A_ = A.contiguous();
+    at::Tensor B_ = B.contiguous();
+    at::Tensor C_ = (C == at::nullopt) ? at::Tensor() : C->contiguous();
     typename DeviceKernel::ElementC* ptrC = (C == at::nullopt) ?
                                             nullptr :
-                                            reinterpret_cast<typename DeviceKernel::ElementC*>(C->contiguous().data_ptr());
-    at::Tensor D = B.new_empty({M, N}, ${torch_type_C});
+                                            reinterpret_cast<typename DeviceKernel::ElementC*>(C_.data_ptr());
+    at::Tensor D = output_tensor(out, {M, N}, B.options().dtype(${torch_type_C}));
 
     cutlass::Status status = ${name}_kernel_run(M, N, K,
-                                                reinterpret_cast<typename DeviceKernel::ElementA*>(A.contiguous().data_ptr()),
-                                                reinterpret_cast<typename DeviceKernel::ElementB*>(B.contiguous().data_ptr()),
+                                                reinterpret_cast<typename DeviceKernel::ElementA*>(A_.data_ptr()),
+                                                reinterpret_cast<typename DeviceKernel::ElementB*>(B_.data_ptr()),
                                                 ptrC,
-                                                reinterpret_cast<typename DeviceKernel::ElementC*>(D.contiguous().data_ptr()),
-                                                ElementCompute(alpha), ElementCompute(beta));
+                                                reinterpret_cast<typename DeviceKernel::ElementC*>(D.data_ptr()),
+                                                ElementCompute(alpha), ElementCompute(beta),
+                                                stream, B.device().index());
 
     TORCH_CHECK(status == cutlass::Status::kSuccess, "CUTLASS kernel failed");
     return D;
@@ -290,30 +488,39 @@ _PYTORCH_GEMM_IMPL_TEMPLATE_3x = (
 bool hw_info_queried = false;
 cutlass::KernelHardwareInfo hw_info;
 
-at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C, float alpha, float beta) {
+at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C, float alpha, float beta,
+                          at::optional<at::Tensor> out) {
     int M = A.size(0);
     int N = B.size(1);
     int K = A.size(1);
     int L = 1;
 
-    // Query hardware info if we haven't already
-    if (!hw_info_queried) {
-        hw_info.device_id = 0;
+    const at::cuda::OptionalCUDAGuard device_guard(B.device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+
+    // Query hardware info if we haven't already for this device
+    if (!hw_info_queried || hw_info.device_id != B.device().index()) {
+        hw_info.device_id = B.device().index();
         hw_info.sm_count = cutlass::KernelHardwareInfo::query_device_multiprocessor_count(hw_info.device_id);
+        hw_info_queried = true;
     }
 
+    // Keep contiguous copies of the operands alive until the kernel has been launched
+    at::Tensor A_ = A.contiguous();
+    at::Tensor B_ = B.contiguous();
+    at::Tensor C_ = (C == at::nullopt) ? at::Tensor() : C->contiguous();
     typename DeviceKernel::ElementC* ptrC = (C == at::nullopt) ?
                                             nullptr :
-                                            reinterpret_cast<typename DeviceKernel::ElementC*>(C->contiguous().data_ptr());
-    at::Tensor D = B.new_empty({M, N}, ${torch_type_C});
+                                            reinterpret_cast<typename DeviceKernel::ElementC*>(C_.data_ptr());
+    at::Tensor D = output_tensor(out, {M, N}, B.options().dtype(${torch_type_C}));
 
     cutlass::Status status = ${name}_kernel_run(M, N, K, L,
-                                                reinterpret_cast<typename DeviceKernel::ElementA*>(A.contiguous().data_ptr()),
-                                                reinterpret_cast<typename DeviceKernel::ElementB*>(B.contiguous().data_ptr()),
+                                                reinterpret_cast<typename DeviceKernel::ElementA*>(A_.data_ptr()),
+                                                reinterpret_cast<typename DeviceKernel::ElementB*>(B_.data_ptr()),
                                                 ptrC,
-                                                reinterpret_cast<typename DeviceKernel::ElementC*>(D.contiguous().data_ptr()),
+                                                reinterpret_cast<typename DeviceKernel::ElementC*>(D.data_ptr()),
                                                 ElementCompute(alpha), ElementCompute(beta),
-                                                hw_info);
+                                                hw_info, stream);
 
     TORCH_CHECK(status == cutlass::Status::kSuccess, "CUTLASS kernel failed");
     return D;
@@ -325,14 +532,19 @@ at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional
 _PYTORCH_GROUPED_GEMM_IMPL_TEMPLATE = (
     common._CUTLASS_KERNEL_RUN_GROUPED_GEMM_2x
     + """
-std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C, float alpha, float beta) {
+std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const std::vector<at::Tensor>& B, at::optional<const std::vector<at::Tensor>> C, float alpha, float beta,
+                                       at::optional<std::vector<at::Tensor>> out) {
     size_t num = A.size();
+    TORCH_CHECK(out == at::nullopt || out->size() == num, "Expected ", num, " output tensors, but got ", out->size());
+
+    const at::cuda::OptionalCUDAGuard device_guard(B[0].device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
 
     // To avoid performing many small cudaMallocs and host-to-device copies,
     // we serialize the grouped GEMM arguments on the host, allocate one
-    // large chunk of device memory, and perform a single cudaMemcpy to
-    // copy the host data to the device. Allocation overheads could be
-    // avoided by using a memory pool.
+    // large chunk of device memory, and perform a single cudaMemcpyAsync to
+    // copy the host data to the device. Both buffers come from the PyTorch
+    // caching allocators, so no allocation happens on the steady state.
 
     // Calculate the total size of the data to be copied from host to device
     size_t total_size = sizeof(cutlass::gemm::GemmCoord) +
@@ -358,8 +570,8 @@ std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const s
     int64_t padding = 8 - (total_size % 8);
     total_size += padding;
 
-    uint8_t* host_data = new uint8_t[total_size];
-    cutlass::DeviceAllocation<uint8_t> device_data(total_size);
+    at::Tensor host_tensor = torch::empty({(int64_t)total_size,}, torch::TensorOptions().dtype(torch::kUInt8).pinned_memory(true));
+    uint8_t* host_data = host_tensor.data_ptr<uint8_t>();
 
     uint8_t* start = host_data;
     cutlass::gemm::GemmCoord* problem_sizes_host = reinterpret_cast<cutlass::gemm::GemmCoord*>(start);
@@ -395,6 +607,8 @@ std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const s
     int64_t* ldc_host = reinterpret_cast<int64_t*>(start);
     start += num * sizeof(int64_t);
 
+    // Keep contiguous copies of the operands alive until the kernel has been launched
+    std::vector<at::Tensor> A_(num), B_(num), C_(num);
     std::vector<at::Tensor> D(num);
 
     bool need_C = (C != at::nullopt) && (beta != 0.f);
@@ -403,40 +617,44 @@ std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const s
         int N = B[i].size(1);
         int K = A[i].size(1);
         *(problem_sizes_host + i) = {M, N, K};
-        *(ptr_A_host + i) = reinterpret_cast<typename DeviceKernel::ElementA*>(A[i].contiguous().data_ptr());
-        *(ptr_B_host + i) = reinterpret_cast<typename DeviceKernel::ElementB*>(B[i].contiguous().data_ptr());
+        A_[i] = A[i].contiguous();
+        B_[i] = B[i].contiguous();
+        *(ptr_A_host + i) = reinterpret_cast<typename DeviceKernel::ElementA*>(A_[i].data_ptr());
+        *(ptr_B_host + i) = reinterpret_cast<typename DeviceKernel::ElementB*>(B_[i].data_ptr());
 
         if (need_C) {
-            *(ptr_C_host + i) = reinterpret_cast<typename DeviceKernel::ElementC*>(C->at(i).contiguous().data_ptr());
+            C_[i] = C->at(i).contiguous();
+            *(ptr_C_host + i) = reinterpret_cast<typename DeviceKernel::ElementC*>(C_[i].data_ptr());
         }
         else {
             *(ptr_C_host + i) = nullptr;
         }
 
-        D[i] = B[i].new_empty({M, N}, ${torch_type_C});
-        *(ptr_D_host + i) = reinterpret_cast<typename DeviceKernel::ElementC*>(D[i].contiguous().data_ptr());
+        D[i] = output_tensor(out ? at::optional<at::Tensor>(out->at(i)) : at::nullopt, {M, N}, B[i].options().dtype(${torch_type_C}));
+        *(ptr_D_host + i) = reinterpret_cast<typename DeviceKernel::ElementC*>(D[i].data_ptr());
 
         *(lda_host + i) = DeviceKernel::LayoutA::packed({M, K}).stride(0);
         *(ldb_host + i) = DeviceKernel::LayoutB::packed({K, N}).stride(0);
         *(ldc_host + i) = DeviceKernel::LayoutC::packed({M, N}).stride(0);
     }
 
-    device_data.copy_from_host(host_data);
+    // The caching host allocator keeps the pinned buffer alive until the copy has completed
+    at::Tensor device_tensor = host_tensor.to(B[0].device(), /*non_blocking=*/true);
+    uint8_t* device_data = device_tensor.data_ptr<uint8_t>();
 
     cutlass::Status status = ${name}_kernel_run(
         num,
-        reinterpret_cast<cutlass::gemm::GemmCoord*>(device_data.get()),
-        reinterpret_cast<DeviceKernel::ElementA**>(device_data.get() + ptr_A_offset),
-        reinterpret_cast<DeviceKernel::ElementB**>(device_data.get() + ptr_B_offset),
-        reinterpret_cast<DeviceKernel::ElementC**>(device_data.get() + ptr_C_offset),
-        reinterpret_cast<DeviceKernel::ElementC**>(device_data.get() + ptr_D_offset),
-        reinterpret_cast<int64_t*>(device_data.get() + lda_offset),
-        reinterpret_cast<int64_t*>(device_data.get() + ldb_offset),
-        reinterpret_cast<int64_t*>(device_data.get() + ldc_offset),
-        reinterpret_cast<int64_t*>(device_data.get() + ldc_offset),
-        ElementCompute(alpha), ElementCompute(beta));
-
-    delete[] host_data;
+        reinterpret_cast<cutlass::gemm::GemmCoord*>(device_data),
+        reinterpret_cast<DeviceKernel::ElementA**>(device_data + ptr_A_offset),
+        reinterpret_cast<DeviceKernel::ElementB**>(device_data + ptr_B_offset),
+        reinterpret_cast<DeviceKernel::ElementC**>(device_data + ptr_C_offset),
+        reinterpret_cast<DeviceKernel::ElementC**>(device_data + ptr_D_offset),
+        reinterpret_cast<int64_t*>(device_data + lda_offset),
+        reinterpret_cast<int64_t*>(device_data + ldb_offset),
+        reinterpret_cast<int64_t*>(device_data + ldc_offset),
+        reinterpret_cast<int64_t*>(device_data + ldc_offset),
+        ElementCompute(alpha), ElementCompute(beta),
+        stream, B[0].device().index());
 
     TORCH_CHECK(status == cutlass::Status::kSuccess, "CUTLASS kernel failed");
     return D;
@@ -445,8 +663,6 @@ std::vector<at::Tensor> ${name}_kernel(const std::vector<at::Tensor>& A, const s
 )
 
 _PYTORCH_CONV2D_IMPL_TEMPLATE_2x = """
-    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
-
     cutlass::Status status = ${name}_kernel_run(
         &problem_size,
         reinterpret_cast<typename UnderlyingKernel::ElementA*>(A.data_ptr()),
@@ -465,8 +681,9 @@ _PYTORCH_CONV2D_FPROP_IMPL_TEMPLATE_2x = (
     common._CUTLASS_KERNEL_RUN_CONV2D_2x
     + """
 at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1},
-    float alpha=1.f, float beta=0.f, std::string split_k_mode="serial", int split_k_slices=1) {
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1},
+    float alpha=1.f, float beta=0.f, std::string split_k_mode="serial", int split_k_slices=1,
+    at::optional<at::Tensor> out=at::nullopt) {
     int N, H, W, C_, K, R, S, P, Q;
     N = A.size(0);
     C_ = A.size(1);
@@ -490,12 +707,16 @@ at::Tensor ${name}_kernel(const at::Tensor& A, const at::Tensor& B, at::optional
     P = problem_size.P;
     Q = problem_size.Q;
 
+    const at::cuda::OptionalCUDAGuard device_guard(B.device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+
     typename UnderlyingKernel::ElementC* ptrC = (C == at::nullopt) ?
                                             nullptr :
                                             reinterpret_cast<typename UnderlyingKernel::ElementC*>(C->data_ptr());
 
     torch::TensorOptions options = torch::TensorOptions().dtype(${torch_type_C}).device(B.device()).memory_format(at::MemoryFormat::ChannelsLast);
-    at::Tensor D = torch::zeros({N, K, P, Q}, options);
+    at::Tensor D = output_tensor(out, {N, K, P, Q}, options);
+    D.zero_();
 """ + _PYTORCH_CONV2D_IMPL_TEMPLATE_2x
 )
 
@@ -504,8 +725,8 @@ _PYTORCH_CONV2D_DGRAD_IMPL_TEMPLATE_2x = (
     common._CUTLASS_KERNEL_RUN_CONV2D_2x
     + """
 at::Tensor ${name}_kernel(std::tuple<int, int, int, int> input_size, const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1}, float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1) {
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1}, float alpha=1.f, float beta=0.f,
+    std::string split_k_mode="serial", int split_k_slices=1, at::optional<at::Tensor> out=at::nullopt) {
     int N, H, W, C_, K, R, S;
     N = std::get<0>(input_size);
     C_ = std::get<1>(input_size);
@@ -526,12 +747,15 @@ at::Tensor ${name}_kernel(std::tuple<int, int, int, int> input_size, const at::T
         split_k_slices
     );
 
+    const at::cuda::OptionalCUDAGuard device_guard(B.device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+
     typename UnderlyingKernel::ElementC* ptrC = (C == at::nullopt) ?
                                             nullptr :
                                             reinterpret_cast<typename UnderlyingKernel::ElementC*>(C->data_ptr());
 
     torch::TensorOptions options = torch::TensorOptions().dtype(${torch_type_C}).device(B.device()).memory_format(at::MemoryFormat::ChannelsLast);
-    at::Tensor D = torch::empty({N, C_, H, W}, options);
+    at::Tensor D = output_tensor(out, {N, C_, H, W}, options);
 """ + _PYTORCH_CONV2D_IMPL_TEMPLATE_2x
 )
 
@@ -540,8 +764,8 @@ _PYTORCH_CONV2D_WGRAD_IMPL_TEMPLATE_2x = (
     common._CUTLASS_KERNEL_RUN_CONV2D_2x
     + """
 at::Tensor ${name}_kernel(std::tuple<int, int, int, int> weight_size, const at::Tensor& A, const at::Tensor& B, at::optional<const at::Tensor> C=at::nullopt,
-    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={0, 0}, std::tuple<int, int> dilation={1, 1}, float alpha=1.f, float beta=0.f,
-    std::string split_k_mode="serial", int split_k_slices=1) {
+    std::tuple<int, int> stride={1, 1}, std::tuple<int, int> padding={1, 1}, std::tuple<int, int> dilation={1, 1}, float alpha=1.f, float beta=0.f,
+    std::string split_k_mode="serial", int split_k_slices=1, at::optional<at::Tensor> out=at::nullopt) {
     int N, H, W, C_, K, R, S;
     K = std::get<0>(weight_size);
     C_ = std::get<1>(weight_size);
@@ -562,12 +786,15 @@ at::Tensor ${name}_kernel(std::tuple<int, int, int, int> weight_size, const at::
         split_k_slices
     );
 
+    const at::cuda::OptionalCUDAGuard device_guard(B.device());
+    cudaStream_t stream = at::cuda::getCurrentCUDAStream();
+
     typename UnderlyingKernel::ElementC* ptrC = (C == at::nullopt) ?
                                             nullptr :
                                             reinterpret_cast<typename UnderlyingKernel::ElementC*>(C->data_ptr());
 
     torch::TensorOptions options = torch::TensorOptions().dtype(${torch_type_C}).device(B.device()).memory_format(at::MemoryFormat::ChannelsLast);
-    at::Tensor D = torch::empty({K, C_, R, S}, options);
+    at::Tensor D = output_tensor(out, {K, C_, R, S}, options);
 """ + _PYTORCH_CONV2D_IMPL_TEMPLATE_2x
 )
 
@@ -762,7 +989,11 @@ def _pytorch_gemm(op, name: str, cc: int, jit: bool = False, sourcedir: str = ""
     cpp_file = os.path.join(sourcedir, name + ".cpp")
     cpp_source = SubstituteTemplate(
         _PYTORCH_GEMM_CPP_TEMPLATE,
-        {"name": name, "description": f"CUTLASS {op.procedural_name()} GEMM"},
+        {
+            "name": name,
+            "description": f"CUTLASS {op.procedural_name()} GEMM",
+            "torch_type_C": _CUTLASS_TYPE_TO_TORCH_TYPE[op.C.element],
+        },
     )
     with open(cpp_file, "w") as outfile:
         outfile.write(cpp_source)
@@ -889,7 +1120,11 @@ def _pytorch_conv2d(op, name: str, cc: int, jit: bool = False, sourcedir: str =
     cpp_file = os.path.join(sourcedir, name + ".cpp")
     cpp_source = SubstituteTemplate(
         cpp_template,
-        {"name": name, "description": f"CUTLASS {op.procedural_name()} Conv2d"},
+        {
+            "name": name,
+            "description": f"CUTLASS {op.procedural_name()} Conv2d",
+            "torch_type_C": _CUTLASS_TYPE_TO_TORCH_TYPE[op.C.element],
+        },
     )
     with open(cpp_file, "w") as outfile:
         outfile.write(cpp_source)
@@ -111,7 +111,9 @@ def get_activation_epilogue(
 """
 Frontend for EVT that generates epilogue functor through tracing the input function
 """
+import cutlass
 from cutlass.backend.evt.frontend import PythonASTFrontend
+from cutlass.backend.evt.trace_cache import trace_key
 
 
 def trace(fn, example_tensors, **kwargs):
@@ -152,7 +154,20 @@ def trace(fn, example_tensors, **kwargs):
         setattr(EpilogueFunctor, "__call__", staticmethod(fn))
 
         epilogue_functor = EpilogueFunctor(**kwargs)
-        epilogue_functor.trace(example_tensors)
+
+        # Reuse the result of tracing an identical function on tensors of the same types and shapes
+        trace_cache = cutlass.get_trace_cache()
+        key = trace_key(fn, example_tensors, epilogue_functor.cc, epilogue_functor.element_compute,
+                        kwargs.get("additional_passes", []))
+        traced = trace_cache.lookup(key)
+        if traced is None:
+            epilogue_functor.trace(example_tensors)
+            trace_cache.record(key, epilogue_functor.traced())
+        else:
+            epilogue_functor.restore(traced)
+
+        epilogue_functor.trace_key = key
+        epilogue_functor.trace_cache = trace_cache
         return epilogue_functor
     else:
         raise NotImplementedError("Expect a callable Python function")
@@ -34,20 +34,30 @@
 Classes containing valid operations for a given compute capability and data types.
 """
 
+import copy
+import hashlib
 from itertools import combinations_with_replacement
 import logging
+import os
+import pickle
+import tempfile
 
 from cuda import __version__
 import cutlass_library
 from cutlass_library.library import ConvKind, IteratorAlgorithm, StrideSupport, GroupMode
+from cutlass_library.sm90_utils import is_valid_schedule
 
 import cutlass
 from cutlass.utils.check import valid_stage_count
+from cutlass.utils.heuristics import rank_operations
 from cutlass.utils.datatypes import td_from_profiler_td, td_from_profiler_op
 
 
 _generator_ccs = [50, 60, 61, 70, 75, 80, 90]
 
+# Number of problem sizes for which the operations proposed for a data type combination are cached
+_MAX_PROPOSALS = 4096
+
 # Strip any additional information from the CUDA version
 _cuda_version = __version__.split("rc")[0]
 
@@ -66,6 +76,28 @@ if len(_nvcc_list) > len(_cuda_list):
         raise Exception(f"Python CUDA version of {_cuda_version} must be greater than or equal to NVCC version of {_nvcc_version}")
 
 
+def _is_valid_sm90_operation(operation) -> bool:
+    """
+    Returns whether the kernel schedule, epilogue schedule, tile scheduler, and cluster shape of an
+    SM90 operation form a combination accepted by the rules ``cutlass_library.sm90_utils`` uses to
+    generate kernels
+    """
+    td = operation.tile_description
+    data_types = {
+        "a_type": operation.A.element,
+        "b_type": operation.B.element,
+        "c_type": operation.C.element,
+        "d_type": operation.D.element,
+        "acc_type": td.math_instruction.element_accumulator,
+        "epi_type": operation.element_epilogue,
+    }
+    layout = [[tensor.layout, tensor.alignment] for tensor in (operation.A, operation.B, operation.C)]
+    is_aligned = all(cutlass_library.DataTypeSize[tensor.element] * tensor.alignment >= 128
+                     for tensor in (operation.A, operation.B))
+    return is_valid_schedule(td, _nvcc_version, is_aligned, data_types, layout, operation.kernel_schedule,
+                             operation.epilogue_schedule, operation.tile_scheduler, gemm_kind=operation.gemm_kind)
+
+
 class KernelsForDataType:
     """
     Container class for keeping track of kernels that correspond to a particular combination
@@ -81,6 +113,14 @@ class KernelsForDataType:
         # constraint for the data type combination
         self.kernels_by_alignment = {}
 
+        # Operations proposed for previously seen problems, keyed by alignments, math operation,
+        # problem size, and device
+        self._proposals = {}
+
+        # Operations with schedules or cluster shapes other than those generated, keyed by alignments,
+        # math operation, and the schedules and cluster shape requested
+        self._schedule_variants = {}
+
     def add(self, operation):
         """
         Add an operation to the list of supported kernels
@@ -89,8 +129,22 @@ class KernelsForDataType:
         if alignment_key not in self.kernels_by_alignment:
             self.kernels_by_alignment[alignment_key] = []
         self.kernels_by_alignment[alignment_key].append(operation)
+        self._proposals.clear()
+        self._schedule_variants.clear()
         self.math_operations.add(operation.tile_description.math_instruction.math_operation)
 
+    def __getstate__(self):
+        # Proposals and schedule variants are rebuilt on demand, so they are not stored in option snapshots
+        state = self.__dict__.copy()
+        state["_proposals"] = {}
+        state["_schedule_variants"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_proposals", {})
+        self.__dict__.setdefault("_schedule_variants", {})
+
     def alignments(self, operand: str):
         """
         Returns an unsorted list of alignments supported by this data type combination
@@ -124,9 +178,61 @@ class KernelsForDataType:
             kernels = [x for x in kernels if x.tile_description.math_instruction.math_operation == math_operation]
         return kernels[0]
 
-    def operations(self, alignment_A: int, alignment_B: int, alignment_C: int, math_operation: cutlass.MathOperation):
+    def schedule_variants(self, operations: list, kernel_schedule: cutlass.KernelScheduleType = None,
+                          epilogue_schedule: cutlass.EpilogueScheduleType = None,
+                          tile_scheduler: cutlass.TileSchedulerType = None, cluster_shape: list = None) -> list:
         """
-        Returns operations satisfying the alignment constraints
+        Returns the SM90 operations obtained by substituting the given schedules and cluster shape
+        for those of ``operations``, keeping only valid combinations. Arguments that are None keep
+        the values of each operation. If all are None, ``operations`` is returned unchanged.
+
+        :param operations: operations from which to derive variants
+        :type operations: list
+        :param kernel_schedule: kernel schedule to use
+        :type kernel_schedule: cutlass.KernelScheduleType
+        :param epilogue_schedule: epilogue schedule to use
+        :type epilogue_schedule: cutlass.EpilogueScheduleType
+        :param tile_scheduler: tile scheduler to use
+        :type tile_scheduler: cutlass.TileSchedulerType
+        :param cluster_shape: shape of the thread block cluster to use
+        :type cluster_shape: list
+
+        :return: list of operations
+        :rtype: list
+        """
+        if kernel_schedule is None and epilogue_schedule is None and tile_scheduler is None and cluster_shape is None:
+            return operations
+
+        variants = {}
+        for op in operations:
+            if not getattr(op, "is_3x", False):
+                continue
+            variant = copy.copy(op)
+            if cluster_shape is not None:
+                td = op.tile_description
+                variant.tile_description = cutlass_library.TileDescription(
+                    td.threadblock_shape, td.stages, td.warp_count, td.math_instruction,
+                    td.minimum_compute_capability, td.maximum_compute_capability, list(cluster_shape))
+            if kernel_schedule is not None:
+                variant.kernel_schedule = kernel_schedule
+            if epilogue_schedule is not None:
+                variant.epilogue_schedule = epilogue_schedule
+            if tile_scheduler is not None:
+                variant.tile_scheduler = tile_scheduler
+
+            # Variants of different operations may coincide
+            key = (variant.procedural_name(), tuple(variant.tile_description.math_instruction.instruction_shape))
+            if key not in variants and _is_valid_sm90_operation(variant):
+                variants[key] = variant
+        return list(variants.values())
+
+    def operations(self, alignment_A: int, alignment_B: int, alignment_C: int, math_operation: cutlass.MathOperation,
+                   kernel_schedule: cutlass.KernelScheduleType = None,
+                   epilogue_schedule: cutlass.EpilogueScheduleType = None,
+                   tile_scheduler: cutlass.TileSchedulerType = None, cluster_shape: list = None):
+        """
+        Returns operations satisfying the alignment constraints and, for SM90 operations, using the
+        schedules and cluster shape passed in (see ``schedule_variants``)
 
         :param alignment_A: alignment constraint of operations to return
         :type alignment_A: int
@@ -136,6 +242,14 @@ class KernelsForDataType:
         :type alignment_C: int
         :param math_operation: math operation to consider
         :type math_operation: cutlass.MathOperation
+        :param kernel_schedule: kernel schedule to use, or None for any
+        :type kernel_schedule: cutlass.KernelScheduleType
+        :param epilogue_schedule: epilogue schedule to use, or None for any
+        :type epilogue_schedule: cutlass.EpilogueScheduleType
+        :param tile_scheduler: tile scheduler to use, or None for any
+        :type tile_scheduler: cutlass.TileSchedulerType
+        :param cluster_shape: shape of the thread block cluster to use, or None for any
+        :type cluster_shape: list
 
         :return: list of operations
         :rtype: list
@@ -167,7 +281,75 @@ class KernelsForDataType:
         ops = self.kernels_by_alignment[key]
         if math_operation is not None:
             ops = [op for op in ops if op.tile_description.math_instruction.math_operation == math_operation]
-        return ops
+
+        schedule = (kernel_schedule, epilogue_schedule, tile_scheduler,
+                    None if cluster_shape is None else tuple(cluster_shape))
+        if schedule == (None, None, None, None):
+            return ops
+        variant_key = (key, math_operation) + schedule
+        if variant_key not in self._schedule_variants:
+            self._schedule_variants[variant_key] = self.schedule_variants(ops, *schedule)
+        return self._schedule_variants[variant_key]
+
+    def propose_operation(self, alignment_A: int, alignment_B: int, alignment_C: int,
+                          math_operation: cutlass.MathOperation, problem_size, batch_count: int,
+                          sm_count: int, cc: int, max_split_k_slices: int = 1,
+                          kernel_schedule: cutlass.KernelScheduleType = None,
+                          epilogue_schedule: cutlass.EpilogueScheduleType = None,
+                          tile_scheduler: cutlass.TileSchedulerType = None, cluster_shape: list = None) -> tuple:
+        """
+        Returns the operation satisfying the alignment constraints with the least runtime estimated
+        analytically for a problem size (see ``cutlass.utils.heuristics``), along with the number of
+        split-K slices with which to run it. Proposals are cached per problem size.
+
+        :param alignment_A: alignment constraint of operations to consider
+        :type alignment_A: int
+        :param alignment_B: alignment constraint of operations to consider
+        :type alignment_B: int
+        :param alignment_C: alignment constraint of operations to consider
+        :type alignment_C: int
+        :param math_operation: math operation to consider
+        :type math_operation: cutlass.MathOperation
+        :param problem_size: size of the GEMM, or of the implicit GEMM of a convolution
+        :type problem_size: cutlass.shape.GemmCoord
+        :param batch_count: number of batches of the problem
+        :type batch_count: int
+        :param sm_count: number of SMs on the device
+        :type sm_count: int
+        :param cc: compute capability of the device
+        :type cc: int
+        :param max_split_k_slices: upper bound on the number of split-K slices to propose
+        :type max_split_k_slices: int
+        :param kernel_schedule: kernel schedule to use, or None for any
+        :type kernel_schedule: cutlass.KernelScheduleType
+        :param epilogue_schedule: epilogue schedule to use, or None for any
+        :type epilogue_schedule: cutlass.EpilogueScheduleType
+        :param tile_scheduler: tile scheduler to use, or None for any
+        :type tile_scheduler: cutlass.TileSchedulerType
+        :param cluster_shape: shape of the thread block cluster to use, or None for any
+        :type cluster_shape: list
+
+        :return: tuple of the operation and its number of split-K slices
+        :rtype: tuple
+        """
+        schedule = (kernel_schedule, epilogue_schedule, tile_scheduler, cluster_shape)
+        key = (alignment_A, alignment_B, alignment_C, math_operation, problem_size.m, problem_size.n,
+               problem_size.k, batch_count, sm_count, cc, max_split_k_slices,
+               kernel_schedule, epilogue_schedule, tile_scheduler, None if cluster_shape is None else tuple(cluster_shape))
+        if key not in self._proposals:
+            ops = self.operations(alignment_A, alignment_B, alignment_C, math_operation, *schedule)
+            if len(ops) == 0:
+                schedule_str = ""
+                if schedule != (None, None, None, None):
+                    schedule_str = (f" with kernel schedule {kernel_schedule}, epilogue schedule {epilogue_schedule}, "
+                                    f"tile scheduler {tile_scheduler}, and cluster shape {cluster_shape}")
+                raise Exception(f"No operations of math operation {math_operation} found for data type and layout "
+                                f"combination {self.datatype_comb} {self.layout_comb}{schedule_str}")
+            if len(self._proposals) >= _MAX_PROPOSALS:
+                self._proposals.clear()
+            self._proposals[key] = rank_operations(ops, problem_size.m, problem_size.n, problem_size.k,
+                                                   batch_count, sm_count, cc, max_split_k_slices)[0]
+        return self._proposals[key]
 
     def _operand_idx(self, key: str) -> int:
         operand_list = ["A", "B", "C"]
@@ -221,6 +403,8 @@ class KernelsForDataType:
         )
         for alignment in self.kernels_by_alignment.keys():
             self.kernels_by_alignment[alignment].sort(key=key, reverse=True)
+        self._proposals.clear()
+        self._schedule_variants.clear()
 
     def supports_math_operation(self, math_operation: cutlass.MathOperation) -> bool:
         """
@@ -557,24 +741,113 @@ class ArchOptions:
         return self.operations_by_opclass[op_class][(datatype_comb, layout_comb)]
 
 
+def _generator_digest() -> str:
+    """
+    Returns a digest of the sources of the CUTLASS library generator and of this module. Option
+    snapshots are keyed by this digest so that they are invalidated whenever either changes.
+
+    :return: hex digest of the generator sources
+    :rtype: str
+    """
+    global _GENERATOR_DIGEST
+    if _GENERATOR_DIGEST is None:
+        sha = hashlib.sha256()
+        library_dir = os.path.dirname(cutlass_library.__file__)
+        paths = [os.path.join(library_dir, file_name) for file_name in sorted(os.listdir(library_dir))
+                 if file_name.endswith(".py")]
+        for path in paths + [__file__]:
+            with open(path, "rb") as file:
+                sha.update(file.read())
+        _GENERATOR_DIGEST = sha.hexdigest()[:16]
+    return _GENERATOR_DIGEST
+
+_GENERATOR_DIGEST = None
+
+# Version of the on-disk format of option snapshots. Increment when the structure of ArchOptions changes.
+_SNAPSHOT_VERSION = 3
+
+
 class OptionRegistry:
     """
     Container of all architecture-specific options
 
+    Options for a given compute capability and operation kind are constructed on first use. Because
+    constructing them requires running the CUTLASS library generator for that compute capability,
+    the result is also serialized to a versioned snapshot in ``cache_dir``, from which later processes
+    load it directly.
+
     :param target_cc: compute capability of the device on which operations will be run
     :type target_cc: int
+    :param cache_dir: directory in which to store option snapshots. If None, snapshots are not used.
+    :type cache_dir: str
     """
 
-    def __init__(self, target_cc: int):
+    def __init__(self, target_cc: int, cache_dir: str = None):
+        self.target_cc = target_cc
+        self.cache_dir = cache_dir
+        self.gemm_kinds = [cutlass_library.GemmKind.Universal, cutlass_library.GemmKind.Universal3x]
+
+        # Dictionary mapping from kernel CC to a dictionary mapping from operation kind to ArchOptions.
+        # Entries are populated on first use.
         self.registry = {}
 
-        gemm_kinds = [cutlass_library.GemmKind.Universal, cutlass_library.GemmKind.Universal3x]
-        operation_kinds = [cutlass_library.OperationKind.Gemm, cutlass_library.OperationKind.Conv2d]
-        # Construct options for each CC
-        for kernel_cc in _generator_ccs:
-            self.registry[kernel_cc] = {}
-            for opkind in operation_kinds:
-                self.registry[kernel_cc][opkind] = ArchOptions(target_cc, kernel_cc, opkind, gemm_kinds)
+    def _snapshot_path(self, kernel_cc: int, op_kind) -> str:
+        key = "_".join([
+            str(_SNAPSHOT_VERSION), _generator_digest(), _nvcc_version, str(self.target_cc), str(kernel_cc),
+            op_kind.name, ",".join(kind.name for kind in self.gemm_kinds)])
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"options_sm{kernel_cc}_{op_kind.name.lower()}_{digest}.pkl")
+
+    def _load_snapshot(self, path: str):
+        try:
+            with open(path, "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            cutlass.logger.warning(f"Ignoring unreadable option snapshot {path}: {e}")
+            return None
+
+    def _save_snapshot(self, path: str, options: ArchOptions):
+        # Snapshots only speed up later constructions of the options, so failing to write one is not an error
+        temp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(options, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Replace atomically so that concurrent readers never observe a partial snapshot
+            os.replace(temp_path, path)
+            temp_path = None
+        except Exception as e:
+            cutlass.logger.warning(f"Unable to write option snapshot {path}: {e}")
+        finally:
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def _build(self, kernel_cc: int, op_kind) -> ArchOptions:
+        """
+        Loads the options for ``kernel_cc`` and ``op_kind`` from a snapshot, if one exists. Otherwise,
+        constructs them by running the generator and saves a snapshot for later use.
+        """
+        if self.cache_dir is None:
+            return ArchOptions(self.target_cc, kernel_cc, op_kind, self.gemm_kinds)
+
+        path = self._snapshot_path(kernel_cc, op_kind)
+        options = self._load_snapshot(path)
+        if options is None:
+            cutlass.logger.info(f"Constructing {op_kind.name} options for CC {kernel_cc}")
+            options = ArchOptions(self.target_cc, kernel_cc, op_kind, self.gemm_kinds)
+            self._save_snapshot(path, options)
+        return options
 
     def options_for_cc(self, cc: int, op_kind=cutlass_library.OperationKind.Gemm) -> ArchOptions:
-        return self.registry.get(cc, None)[op_kind]
+        if cc not in _generator_ccs:
+            return None
+        cc_options = self.registry.setdefault(cc, {})
+        if op_kind not in cc_options:
+            cc_options[op_kind] = self._build(cc, op_kind)
+        return cc_options[op_kind]
@@ -110,6 +110,18 @@
         # Do other work...
 
         args.sync()
+
+    The reduction dimension of the implicit GEMM can be split across threadblocks via the ``split_k``
+    argument of ``run()``. With ``split_k=("auto", None)``, the number of slices is chosen from the problem
+    size and the number of SMs on the device, and partial results are reduced serially within the
+    convolution kernel, without launching a separate reduction kernel. As partial results are passed
+    between slices through the output, no split is proposed when C or D is narrower than the accumulator:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        plan = cutlass.op.Conv2dWgrad(element=np.float16)
+        plan.run(grad_output, input, C, grad_weight, split_k=("auto", None))
 """
 
 from cuda import cuda
@@ -129,9 +141,18 @@ from cutlass.backend import compiler
 from cutlass.backend.conv2d_operation import Conv2dArguments, Conv2dOperation
 from cutlass.backend.reduction_operation import ReductionOperation, ReductionArguments
 from cutlass.backend.library import TensorDescription, TileDescription
+from cutlass.backend.utils.device import device_sm_count
 from cutlass.op.op import OperationBase
 from cutlass.shape import Conv2DProblemSize, MatrixCoord
-from cutlass.utils import check, datatypes
+from cutlass.utils import check, datatypes, heuristics
+
+
+# Maximum number of slices proposed for split-K. Slices reduce their partial results serially
+# in the epilogue, so the cost of the reduction grows with the number of slices.
+_SPLIT_K_MAX_SLICES = 16
+
+# Minimum number of mainloop iterations each split-K slice should perform
+_SPLIT_K_MIN_ITERATIONS = 4
 
 
 class Conv2d(OperationBase):
@@ -534,6 +555,41 @@ class Conv2d(OperationBase):
 
         return StrideSupport.Strided
 
+    def _propose_split_k_slices(self, problem_size, operation, max_slices=None) -> int:
+        """
+        Proposes the number of slices into which to split the reduction dimension of the implicit GEMM
+        of ``problem_size``. Splitting is used only when the output tiles alone are too few to occupy
+        every SM on the device, which is typical of wgrad on small spatial sizes, where the reduction
+        dimension (N * P * Q) is large relative to the output.
+
+        :param problem_size: size of the convolution problem
+        :type problem_size: cutlass.shape.Conv2DProblemSize
+        :param operation: operation that will be run
+        :type operation: cutlass.backend.Conv2dOperation
+        :param max_slices: upper bound on the number of slices, optional
+        :type max_slices: int
+
+        :return: number of split-K slices
+        :rtype: int
+        """
+        # Split-K is not supported for strided dgrad
+        if self.conv_kind == ConvKind.Dgrad and (problem_size.stride_h > 1 or problem_size.stride_w > 1):
+            return 1
+
+        # Partial sums are converted to the output type between slices, which loses precision (or saturates)
+        # when it is narrower than the accumulator
+        accumulator_size = DataTypeSize[self._element_accumulator]
+        if DataTypeSize[self._element_c] < accumulator_size or DataTypeSize[self._element_d] < accumulator_size:
+            return 1
+
+        if max_slices is None:
+            max_slices = _SPLIT_K_MAX_SLICES
+        gemm_size = problem_size.implicit_gemm_size(self.conv_kind)
+        candidates = heuristics.split_k_candidates(
+            gemm_size.m, gemm_size.n, gemm_size.k, 1, operation, device_sm_count(),
+            min(max_slices, _SPLIT_K_MAX_SLICES), _SPLIT_K_MIN_ITERATIONS)
+        return candidates[-1]
+
     #
     # Construct and Compilation
     #
@@ -543,11 +599,14 @@ class Conv2d(OperationBase):
         alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
         iterator_algorithm: IteratorAlgorithm = None,
         stride_support = None, swizzling_functor: cutlass.swizzle = None,
-        epilogue_functor=None) -> cutlass.backend.Conv2dOperation:
+        epilogue_functor=None, problem_size: Conv2DProblemSize = None) -> cutlass.backend.Conv2dOperation:
         """
         Constructs a ``cutlass.backend.Conv2dOperation`` based on the input parameters and current
         kernel specification of the ``Conv2d`` object.
 
+        If no tile description is given or has been set, the tile description is chosen analytically
+        for the implicit GEMM of ``problem_size`` when it is provided (see ``cutlass.utils.heuristics``).
+
         :param tile_description: tile description specifying shapes and operand types to use in the kernel
         :type tile_description: cutlass.backend.TileDescription
         :param alignment_A: alignment of operand A
@@ -563,6 +622,8 @@ class Conv2d(OperationBase):
         :param swizzling_functor: the swizzling functor
         :type swizzling_functor: cutlass.swizzle
         :param epilogue_functor: the epilogue functor
+        :param problem_size: size of the problem for which to choose a tile description, optional
+        :type problem_size: cutlass.shape.Conv2DProblemSize
 
         :return: operation that was constructed
         :rtype: cutlass.backend.Conv2dOperation
@@ -579,9 +640,14 @@ class Conv2d(OperationBase):
         if tile_description is None:
             if self.tile_description is not None:
                 tile_description = self.tile_description
-            else:
+            elif problem_size is None:
                 op = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)[0]
                 tile_description = datatypes.td_from_profiler_op(op)
+            else:
+                op, _ = self.possible_operations.propose_operation(
+                    alignment_A, alignment_B, alignment_C, self._math_operation,
+                    problem_size.implicit_gemm_size(self.conv_kind), 1, device_sm_count(), self.current_cc)
+                tile_description = datatypes.td_from_profiler_op(op)
         else:
             valid, err_str = self._valid_tile_description(tile_description)
             if not valid:
@@ -634,7 +700,8 @@ class Conv2d(OperationBase):
                 alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
                 iterator_algorithm: IteratorAlgorithm = None,
                 stride_support = None, swizzling_functor: cutlass.swizzle = None,
-                epilogue_functor = None, print_module: bool = False) -> cutlass.backend.Conv2dOperation:
+                epilogue_functor = None, print_module: bool = False,
+                problem_size: Conv2DProblemSize = None) -> cutlass.backend.Conv2dOperation:
         """
         Emits and compiles the kernel currently specified. If ``tile_description`` and any
         of the ``alignment`` parameters are set, the kernel will be chosen using this
@@ -656,6 +723,10 @@ class Conv2d(OperationBase):
         :param swizzling_functor: the swizzling functor
         :type swizzling_functor: cutlass.swizzle
         :param epilogue_functor: the epilogue functor
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param problem_size: size of the problem for which to choose a tile description, optional
+        :type problem_size: cutlass.shape.Conv2DProblemSize
 
         :return: operation that was compiled
         :rtype: cutlass.backend.Conv2dOperation
@@ -663,7 +734,7 @@ class Conv2d(OperationBase):
 
         self.operation = self.construct(
             tile_description, alignment_A, alignment_B, alignment_C,
-            iterator_algorithm, stride_support, swizzling_functor, epilogue_functor)
+            iterator_algorithm, stride_support, swizzling_functor, epilogue_functor, problem_size)
 
         if print_module:
             print(self.operation.rt_module.emit())
@@ -757,7 +828,11 @@ class Conv2d(OperationBase):
         :param dilation: (dilation_h, dilation_w) describing the dilation of convolution. Default: (1, 1)
         :param alpha: scalar paramter alpha from GEMM computation that scales the product of operands A and B
         :param beta: scalar parameter beta from GEMM operation that scales operand C
-        :param split_k: a tuple (split_k_mode, split_k_slices)
+        :param split_k: a tuple (split_k_mode, split_k_slices). ``split_k_mode`` is one of "serial", in which
+                        slices reduce their partial results within the convolution kernel, "parallel", in which
+                        partial results are reduced by a separate reduction kernel, or "auto", in which the number
+                        of slices is proposed from the problem size and device, bounded above by ``split_k_slices``
+                        if it is not ``None``, and slices are reduced serially
         :param sync: whether the call should wait for the kernel to complete before returning
         :type sync: bool
         :param print_module: whether to print the emitted C++ code
@@ -825,7 +900,17 @@ class Conv2d(OperationBase):
             else:
                 epilogue_args.append(self._activation_args)
 
-        if split_k[0] == "parallel" and split_k[1] > 1:
+        split_k_mode, split_k_slices = split_k
+        if split_k_mode not in ["serial", "parallel", "auto"]:
+            raise Exception(f"Invalid split-K mode {split_k_mode}. Expected one of 'serial', 'parallel', or 'auto'")
+
+        # Automatic split-K reduces slices serially within the convolution kernel
+        auto_split_k = split_k_mode == "auto"
+        if auto_split_k:
+            split_k_mode = "serial"
+
+        parallel_split_k = split_k_mode == "parallel" and split_k_slices > 1
+        if parallel_split_k:
             epilogue_functor = self._create_epilogue_functor_activation(epilogue.identity)
         else:
             epilogue_functor = self.epilogue_functor
@@ -833,10 +918,15 @@ class Conv2d(OperationBase):
         # The alignment is determined by the iterator function (I believe)
         self.compile(tile_description=self.tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
                      alignment_C=alignment_c, iterator_algorithm=iterator_algorithm, stride_support=stride_support,
-                     swizzling_functor=swizzling_functor, epilogue_functor=epilogue_functor, print_module=print_module)
+                     swizzling_functor=swizzling_functor, epilogue_functor=epilogue_functor, print_module=print_module,
+                     problem_size=problem_size)
+
+        if auto_split_k:
+            split_k_slices = self._propose_split_k_slices(problem_size, self.operation, split_k_slices)
+            cutlass.logger.debug(f"Proposed {split_k_slices} split-K slices for {self.conv_kind} problem {problem_size}")
 
         # Create reduction operation for parallel split-k
-        if split_k[0] == "parallel" and split_k[1] > 1:
+        if parallel_split_k:
             epilogue_functor_reduction = self._reset_epilogue_functor_alignment(alignment_c, self.epilogue_functor)
             self.reduction_operation = ReductionOperation(
                 shape=MatrixCoord(4, 32 * alignment_c), C=self.operation.C,
@@ -853,19 +943,19 @@ class Conv2d(OperationBase):
             operation=self.operation, problem_size=problem_size,
             A=A, B=B, C=C, D=D,
             output_op=self.operation.epilogue_type(*epilogue_args),
-            split_k_mode=datatypes.getattr_enum(SplitKMode, split_k[0]),
-            split_k_slices=split_k[1],
+            split_k_mode=datatypes.getattr_enum(SplitKMode, split_k_mode),
+            split_k_slices=split_k_slices,
             stream=stream
         )
 
         self.operation.run(arguments)
 
-        if split_k[0] == "parallel" and split_k[1] > 1:
+        if parallel_split_k:
             implicit_gemm_size = arguments.problem_size.implicit_gemm_size(self.conv_kind)
             reduction_arguments = ReductionArguments(
                 self.reduction_operation,
                 problem_size=[implicit_gemm_size.m, implicit_gemm_size.n],
-                partitions=split_k[1],
+                partitions=split_k_slices,
                 workspace=arguments.ptr_D,
                 destination=D,
                 source=C,
@@ -875,7 +965,7 @@ class Conv2d(OperationBase):
             self.reduction_operation.run(reduction_arguments)
 
         if sync:
-            if split_k[0] == "parallel" and split_k[1] > 1:
+            if parallel_split_k:
                 reduction_arguments.sync()
 
                 # Free memory allocated by args because we are not
@@ -112,28 +112,55 @@
         # Do other work...
 
         args.sync()
+
+    Unless a tile description has been set, or one has been recorded for the problem by ``autotune()``,
+    ``run()`` chooses the tile description and number of split-K slices for each problem size from an
+    analytical model of the device, without benchmarking. Split-K is proposed only for outputs at least as
+    wide as the accumulator unless ``max_proposed_split_k_slices`` is set.
+
+    On SM90 and beyond, the kernels considered can be restricted to a kernel schedule, epilogue schedule,
+    tile scheduler, and thread block cluster shape. Those left unset may take any valid value:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        plan = cutlass.op.Gemm(element=torch.float16, layout=cutlass.LayoutType.RowMajor, cc=90)
+        plan.kernel_schedule = cutlass.KernelScheduleType.TmaWarpSpecializedCooperative
+        plan.tile_scheduler = cutlass.TileSchedulerType.StreamK
+        plan.cluster_shape = [2, 1, 1]
+        plan.run(A, B, C, D)
+
+    A tile description that has been set explicitly carries its own schedules and cluster shape, which
+    take precedence over these.
 """
 
 from math import prod
+import os
 
 from cuda import cuda
 from cutlass_library import (
     DataType,
     DataTypeSize,
     GemmUniversalMode,
+    SwizzlingFunctor,
 )
 
 import cutlass
 from cutlass import epilogue, swizzle
-from cutlass.backend import compiler
+from cutlass.backend import compiler, tuning
 from cutlass.backend.evt import EpilogueFunctorVisitor
-from cutlass.backend.gemm_operation import GemmArguments, GemmOperationUniversal
+from cutlass.backend.gemm_operation import GemmArguments, GemmBoundArguments, GemmOperationUniversal
 from cutlass.backend.library import TensorDescription, TileDescription
+from cutlass.backend.utils.device import device_sm_count
 from cutlass.op.op import OperationBase
 from cutlass.shape import GemmCoord
 from cutlass.utils import check, datatypes
 
 
+# Maximum number of slices proposed for serial split-K when no tile description has been set
+_SPLIT_K_MAX_SLICES = 16
+
+
 class Gemm(OperationBase):
     """
     Constructs a ``Gemm`` object.
@@ -274,10 +301,31 @@ class Gemm(OperationBase):
         self.op_class = None
         self._tile_description = None
 
+        # Schedules and cluster shape to which SM90 kernels are restricted. None permits any value.
+        self._kernel_schedule = None
+        self._epilogue_schedule = None
+        self._tile_scheduler = None
+        self._cluster_shape = None
+
         self._reset_operations()
 
         self._swizzling_functor = cutlass.swizzle.IdentitySwizzle1
 
+        # Database of autotuning results consulted by ``run()`` when no tile description has been set.
+        # Set to None to always use the default kernel.
+        self.tuning_database = cutlass.get_tuning_database()
+        self._tuned_configs = {}
+        # Problems for which no configuration was found, mapped to the database and its version at the time
+        self._tuning_misses = {}
+
+        # Number of split-K slices proposed with the tile description chosen for the last problem run
+        self.proposed_split_k_slices = 1
+
+        # Largest number of split-K slices that ``run()`` may propose. Serial split-K passes partial sums
+        # through D, so by default it is proposed only when C and D are at least as wide as the accumulator;
+        # set this to opt in for narrower outputs, or to 1 to disable proposing split-K.
+        self.max_proposed_split_k_slices = None
+
     def _reset_operations(self, reset_epilogue: bool = True):
         # Set the default op class
         datatype_comb = (self._element_a, self._element_b, self._element_accumulator)
@@ -300,6 +348,16 @@ class Gemm(OperationBase):
             raise Exception(f'No kernel configuration found for supported data type and layout '
                             f'combination {datatype_comb}x{layout_comb}{math_op_str}')
 
+        # Schedules and cluster shapes only apply to SM90 kernels, which may have been replaced by
+        # SM80 kernels (e.g., to support a math operation or activation function)
+        if self.current_cc < 90 and any(value is not None for value in self._schedule().values()):
+            cutlass.logger.warning("Lifting restrictions on kernel schedule, epilogue schedule, tile scheduler, "
+                                   "and cluster shape, which apply only to SM90 kernels.")
+            self._kernel_schedule = None
+            self._epilogue_schedule = None
+            self._tile_scheduler = None
+            self._cluster_shape = None
+
         if reset_epilogue:
             self._reset_epilogue_functor_activation(cutlass.epilogue.identity)
 
@@ -322,9 +380,120 @@ class Gemm(OperationBase):
                 raise Exception('ThreadblockSwizzleStreamK is currently only supported with opcode class TensorOp')
 
             if self.current_cc == 90:
-                raise Exception('ThreadblockSwizzleStreamK is currently unsupported on SM90')
+                raise Exception('ThreadblockSwizzleStreamK is currently unsupported on SM90. '
+                                'Set tile_scheduler to cutlass.TileSchedulerType.StreamK instead.')
         self._swizzling_functor = swizzling_functor
 
+    #
+    # Schedule related
+    #
+
+    @property
+    def kernel_schedule(self) -> cutlass.KernelScheduleType:
+        """
+        Returns the kernel schedule to which SM90 kernels are restricted, or None if any may be used
+        """
+        return self._kernel_schedule
+
+    @kernel_schedule.setter
+    def kernel_schedule(self, kernel_schedule: cutlass.KernelScheduleType):
+        """
+        Restricts SM90 kernels to the kernel schedule ``kernel_schedule``. None lifts the restriction.
+        """
+        self._set_schedule(kernel_schedule=kernel_schedule)
+
+    @property
+    def epilogue_schedule(self) -> cutlass.EpilogueScheduleType:
+        """
+        Returns the epilogue schedule to which SM90 kernels are restricted, or None if any may be used
+        """
+        return self._epilogue_schedule
+
+    @epilogue_schedule.setter
+    def epilogue_schedule(self, epilogue_schedule: cutlass.EpilogueScheduleType):
+        """
+        Restricts SM90 kernels to the epilogue schedule ``epilogue_schedule``. None lifts the restriction.
+        """
+        self._set_schedule(epilogue_schedule=epilogue_schedule)
+
+    @property
+    def tile_scheduler(self) -> cutlass.TileSchedulerType:
+        """
+        Returns the tile scheduler to which SM90 kernels are restricted, or None if any may be used
+        """
+        return self._tile_scheduler
+
+    @tile_scheduler.setter
+    def tile_scheduler(self, tile_scheduler: cutlass.TileSchedulerType):
+        """
+        Restricts SM90 kernels to the tile scheduler ``tile_scheduler`` (e.g., ``cutlass.TileSchedulerType.StreamK``).
+        None lifts the restriction.
+        """
+        self._set_schedule(tile_scheduler=tile_scheduler)
+
+    @property
+    def cluster_shape(self) -> list:
+        """
+        Returns the thread block cluster shape to which SM90 kernels are restricted, or None if any may be used
+        """
+        return self._cluster_shape
+
+    @cluster_shape.setter
+    def cluster_shape(self, cluster_shape: list):
+        """
+        Restricts SM90 kernels to the thread block cluster shape ``cluster_shape``. None lifts the restriction.
+        """
+        if cluster_shape is not None:
+            cluster_shape = list(cluster_shape)
+            valid, msg = check.valid_cluster_shape(self.current_cc, cluster_shape)
+            if not valid:
+                raise Exception(msg)
+        self._set_schedule(cluster_shape=cluster_shape)
+
+    def _schedule(self) -> dict:
+        """
+        Returns the schedules and cluster shape to which SM90 kernels are restricted, keyed by
+        the names of the corresponding parameters of ``KernelsForDataType.operations()``
+        """
+        return {
+            "kernel_schedule": self._kernel_schedule,
+            "epilogue_schedule": self._epilogue_schedule,
+            "tile_scheduler": self._tile_scheduler,
+            "cluster_shape": self._cluster_shape,
+        }
+
+    def _set_schedule(self, **kwargs):
+        """
+        Updates the schedules and cluster shape to which SM90 kernels are restricted. Raises an exception,
+        leaving them unchanged, if no kernel for the data types and layouts of the GEMM supports the
+        resulting combination.
+        """
+        schedule = {**self._schedule(), **kwargs}
+        if any(value is not None for value in kwargs.values()):
+            if self.current_cc < 90:
+                raise Exception(f"Kernel schedules, tile schedulers, and cluster shapes can only be selected for "
+                                f"SM90 and beyond. Kernels are being generated for SM{self.current_cc}.")
+            if len(self.possible_operations.schedule_variants(self._math_operations(), **schedule)) == 0:
+                raise Exception(f"No kernel for data type and layout combination "
+                                f"{self.possible_operations.datatype_comb} {self.possible_operations.layout_comb} "
+                                f"supports kernel schedule {schedule['kernel_schedule']}, epilogue schedule "
+                                f"{schedule['epilogue_schedule']}, tile scheduler {schedule['tile_scheduler']}, "
+                                f"and cluster shape {schedule['cluster_shape']}")
+
+        self._kernel_schedule = schedule["kernel_schedule"]
+        self._epilogue_schedule = schedule["epilogue_schedule"]
+        self._tile_scheduler = schedule["tile_scheduler"]
+        self._cluster_shape = schedule["cluster_shape"]
+
+    def _math_operations(self) -> list:
+        """
+        Returns all operations for the data types and layouts of the GEMM that use its math operation
+        """
+        ops = self.possible_operations.all_operations
+        if self._math_operation is not None:
+            ops = [op for op in ops if op.tile_description.math_instruction.math_operation == self._math_operation]
+        return ops
+
     #
     # Tile description Related
     #
@@ -396,23 +565,28 @@ class Gemm(OperationBase):
 
     def tile_descriptions(self) -> list:
         """
-        Returns a list of valid tile descriptions for the operations
+        Returns a list of valid tile descriptions for the operations, restricted to the schedules
+        and cluster shape that have been set
 
         :returns: list of valid tile descriptions for the operations
         :rtype: list
         """
-        tds = [datatypes.td_from_profiler_op(op) for op in self.possible_operations.all_operations]
-        if self._math_operation is not None:
-            tds = [td for td in tds if td.math_instruction.math_operation == self._math_operation]
-        return tds
+        ops = self.possible_operations.schedule_variants(self._math_operations(), **self._schedule())
+        return [datatypes.td_from_profiler_op(op) for op in ops]
 
     def construct(
         self, tile_description: TileDescription = None,
-        alignment_A: int = None, alignment_B: int = None, alignment_C: int = None) -> GemmOperationUniversal:
+        alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
+        problem_size: GemmCoord = None, batch_count: int = 1) -> GemmOperationUniversal:
         """
         Constructs a ``cutlass.backend.GemmUniversalOperation`` based on the input parameters and current
         kernel specification of the ``Gemm`` object.
 
+        If no tile description is given or has been set, the tile description is chosen analytically
+        for ``problem_size`` when it is provided (see ``cutlass.utils.heuristics``), along with a number
+        of split-K slices, which is recorded in ``proposed_split_k_slices``. Only kernels using the
+        schedules and cluster shape that have been set are considered.
+
         :param tile_description: tile description specifying shapes and operand types to use in the kernel
         :type tile_description: cutlass.backend.TileDescription
         :param alignment_A: alignment of operand A
@@ -421,6 +595,10 @@ class Gemm(OperationBase):
         :type alignment_B: int
         :param alignment_C: alignment of operand C
         :type alignment_C: int
+        :param problem_size: size of the problem for which to choose a tile description, optional
+        :type problem_size: cutlass.shape.GemmCoord
+        :param batch_count: number of batches of the problem
+        :type batch_count: int
 
         :return: operation that was constructed
         :rtype: cutlass.backend.GemmOperationUniversal
@@ -438,9 +616,21 @@ class Gemm(OperationBase):
             if self._element_c != DataType.void:
                 alignment_C = min(128 // DataTypeSize[self._element_c], alignment_C)
 
+        self.proposed_split_k_slices = 1
         if tile_description is None:
             if self._tile_description is None:
-                op = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)[0]
+                if problem_size is None:
+                    ops = self.possible_operations.operations(alignment_A, alignment_B, alignment_C,
+                                                              self._math_operation, **self._schedule())
+                    if len(ops) == 0:
+                        raise Exception(f"No kernel of alignments {alignment_A} {alignment_B} {alignment_C} "
+                                        f"supports the schedules and cluster shape {self._schedule()}")
+                    op = ops[0]
+                else:
+                    op, self.proposed_split_k_slices = self.possible_operations.propose_operation(
+                        alignment_A, alignment_B, alignment_C, self._math_operation, problem_size, batch_count,
+                        device_sm_count(), self.current_cc, self._max_split_k_slices(batch_count),
+                        **self._schedule())
                 tile_description = datatypes.td_from_profiler_op(op)
 
                 # The selected op may have lower alignment than that determined above, so we must
@@ -469,7 +659,8 @@ class Gemm(OperationBase):
 
     def compile(self, tile_description: TileDescription = None,
                 alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
-                print_module: bool = False) -> cutlass.backend.GemmOperationUniversal:
+                print_module: bool = False, problem_size: GemmCoord = None,
+                batch_count: int = 1) -> cutlass.backend.GemmOperationUniversal:
         """
         Emits and compiles the kernel currently specified. If ``tile_description`` and any
         of the ``alignment`` parameters are set, the kernel will be chosen using this
@@ -486,11 +677,16 @@ class Gemm(OperationBase):
         :type alignment_C: int
         :param print_module: whether to print the emitted C++ code
         :type print_module: bool
+        :param problem_size: size of the problem for which to choose a tile description, optional
+        :type problem_size: cutlass.shape.GemmCoord
+        :param batch_count: number of batches of the problem
+        :type batch_count: int
 
         :return: operation that was compiled
         :rtype: cutlass.backend.GemmOperationUniversal
         """
-        self.operation = self.construct(tile_description, alignment_A, alignment_B, alignment_C)
+        self.operation = self.construct(tile_description, alignment_A, alignment_B, alignment_C,
+                                        problem_size, batch_count)
 
         if print_module:
             print(self.operation.rt_module.emit())
@@ -498,6 +694,25 @@ class Gemm(OperationBase):
         compiler.add_module([self.operation,])
         return self.operation
 
+    def _max_split_k_slices(self, batch_count: int) -> int:
+        """
+        Returns the largest number of split-K slices that may be proposed for a problem
+        with ``batch_count`` batches
+        """
+        # Serial split-K is used only by unbatched CUTLASS 2.x kernels with linear-combination epilogues
+        if (batch_count > 1 or self.current_cc >= 90 or isinstance(self.epilogue_functor, EpilogueFunctorVisitor)
+                or self._swizzling_functor == swizzle.ThreadblockSwizzleStreamK):
+            return 1
+        if self.max_proposed_split_k_slices is not None:
+            return self.max_proposed_split_k_slices
+
+        # Partial sums are converted to the output type between slices, which loses precision (or saturates)
+        # when it is narrower than the accumulator
+        accumulator_size = DataTypeSize[self._element_accumulator]
+        if DataTypeSize[self._element_c] < accumulator_size or DataTypeSize[self._element_d] < accumulator_size:
+            return 1
+        return _SPLIT_K_MAX_SLICES
+
     def _verify_rank(self, tensor):
         """
         Verifies that ``tensor`` has rank greater than 1
@@ -621,38 +836,15 @@ class Gemm(OperationBase):
                                 f'does not match the expected type and '
                                 f'layout of ({ref_type}, {ref_layout}) and transpose failed.')
 
-    def run(self, A=None, B=None, C=None, D=None,
-            alpha=None, beta=None, sync: bool = True, print_module: bool = False, visitor_args: dict = None,
-            stream: cuda.CUstream = cuda.CUstream(0)) -> GemmArguments:
+    def _verify_operands(self, A, B, C, D, alpha, beta) -> tuple:
         """
-        Runs the kernel currently specified. If it has not already been, the kernel is emitted and
-        compiled. Tensors holding operands and outputs of the kernel are sourced either from the
-        ``A``, ``B``, ``C``, ``D``, ``alpha``, and ``beta``
-        parameters provided in this call, or from those
-        passed in on the construction of this object -- one of the two must be specified.
-
-        By default, this call returns only once the kernel has completed. To launch the kernel
-        and immediately return, set ``sync=False``. In this case, it is the responsibility of the
-        caller to syncrhonize the results of the kernel before attempting to access outputs
-        by calling ``sync()`` on the arguments returned from this call.
+        Verifies the operands provided and determines the alignments to use for them.
+        See ``run()`` for descriptions of the parameters.
 
-        :param A: tensor representing data type and layout of operand A
-        :param B: tensor representing data type and layout of operand B
-        :param C: tensor representing data type and layout of operand C
-        :param D: tensor representing data type and layout of operand D
-        :param alpha: scalar paramter alpha from GEMM computation that scales the product of operands A and B
-        :param beta: scalar parameter beta from GEMM operation that scales operand C
-        :param sync: whether the call should wait for the kernel to complete before returning
-        :type sync: bool
-        :param print_module: whether to print the emitted C++ code
-        :type print_module: bool
-        :param stream: cuda stream, defaults to cuda.cuda.CUstream(0)
-        :type stream: :class:`cuda.cuda.CUstream`
-
-        :return: arguments passed in to the kernel
-        :rtype: cutlass.backend.GemmArguments
+        :return: tuple containing the verified A, B, C, D, alpha, and beta, followed by a tuple of
+                 the alignments of A, B, and C
+        :rtype: tuple
         """
-        super().run_setup()
         A = self._verify_tensor(A, self.A, self._element_a, self._layout_a, "A")
         B = self._verify_tensor(B, self.B, self._element_b, self._layout_b, "B")
         C = self._verify_tensor(C, self.C, self._element_c, self._layout_c, "C")
@@ -674,13 +866,15 @@ class Gemm(OperationBase):
         # Set C alignment based on D.shape so as to correctly get an alignment with void-C
         # kernels, for which `C` is None.
         alignment_c = self.possible_operations.find_alignment(D.shape, self._layout_c, operand="C")
-        self.compile(self._tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
-                     alignment_C=alignment_c, print_module=print_module)
 
-        problem_size, mode, batch_count = self._get_problem_args(A, B, C, D)
+        return A, B, C, D, alpha, beta, (alignment_a, alignment_b, alignment_c)
 
+    def _argument_kwargs(self, A, B, C, D, mode, batch_count, split_k_slices, stream) -> dict:
+        """
+        Returns the keyword arguments describing batching and split-K to pass to ``GemmArguments``
+        """
         if mode == GemmUniversalMode.Gemm or batch_count == 1:
-            kwargs = {'split_k_slices': 1}
+            kwargs = {'split_k_slices': split_k_slices}
         else:
             kwargs = {
                 'batch': batch_count,
@@ -693,13 +887,45 @@ class Gemm(OperationBase):
             }
 
         kwargs['stream'] = stream
+        return kwargs
+
+    def _create_arguments(self, A, B, C, D, alpha, beta, print_module, visitor_args, stream) -> GemmArguments:
+        """
+        Verifies the operands provided, compiles the kernel if needed, and constructs the arguments
+        used for launching it. See ``run()`` for descriptions of the parameters.
+
+        :return: arguments to pass to the kernel
+        :rtype: cutlass.backend.GemmArguments
+        """
+        super().run_setup()
+        A, B, C, D, alpha, beta, alignments = self._verify_operands(A, B, C, D, alpha, beta)
+        problem_size, mode, batch_count = self._get_problem_args(A, B, C, D)
+
+        split_k_slices = 1
+        config = self._tuned_config(alignments, problem_size)
+        if config is None:
+            self.compile(self._tile_description, alignment_A=alignments[0], alignment_B=alignments[1],
+                         alignment_C=alignments[2], print_module=print_module,
+                         problem_size=problem_size, batch_count=batch_count)
+            split_k_slices = self.proposed_split_k_slices
+        else:
+            self.operation = self._construct_config(
+                config["tile_description"], config["swizzling_functor"], *alignments)
+            if print_module:
+                print(self.operation.rt_module.emit())
+            compiler.add_module([self.operation,])
+
+            if mode == GemmUniversalMode.Gemm and batch_count == 1:
+                split_k_slices = config["split_k_slices"]
+
+        kwargs = self._argument_kwargs(A, B, C, D, mode, batch_count, split_k_slices, stream)
 
         if isinstance(self.epilogue_functor, EpilogueFunctorVisitor):
             output_op = self.operation.epilogue_type(visitor_args)
         else:
             output_op = self.operation.epilogue_type(alpha, beta)
 
-        arguments = GemmArguments(
+        return GemmArguments(
             operation=self.operation, problem_size=problem_size,
             A=A, B=B, C=C, D=D,
             output_op=output_op,
@@ -707,6 +933,314 @@ class Gemm(OperationBase):
             **kwargs
         )
 
+    #
+    # Autotuning related
+    #
+
+    def _tuning_problem(self, alignments: tuple) -> str:
+        """
+        Returns a description of the data types, layouts, alignments, and opcode class of the GEMM,
+        which, along with the compute capability and problem size, keys results in the tuning database
+        """
+        parts = [dt.name for dt in (self._element_a, self._element_b, self._element_c,
+                                    self._element_d, self._element_accumulator)]
+        parts += [layout.name for layout in (self._layout_a, self._layout_b, self._layout_c)]
+        parts += [str(alignment) for alignment in alignments]
+        parts.append(self.opclass.name)
+        if self._math_operation is not None:
+            parts.append(self._math_operation.name)
+        for value in (self._kernel_schedule, self._epilogue_schedule, self._tile_scheduler):
+            if value is not None:
+                parts.append(value.name)
+        if self._cluster_shape is not None:
+            parts.append("cluster" + "x".join(str(x) for x in self._cluster_shape))
+        return "_".join(parts)
+
+    def _resolve_config(self, config: dict):
+        """
+        Converts a configuration read from the tuning database into one that can be constructed,
+        returning None if the configuration is no longer available
+        """
+        tds = {tuning.tile_description_key(td): td for td in self.tile_descriptions()}
+        td = tds.get(config["tile_description"])
+        if td is None or not self._valid_tile_description(td)[0]:
+            return None
+        if config["swizzling_functor"] not in SwizzlingFunctor.__members__:
+            return None
+        return {
+            "tile_description": td,
+            "swizzling_functor": SwizzlingFunctor[config["swizzling_functor"]],
+            "split_k_slices": config["split_k_slices"],
+        }
+
+    def _tuned_config(self, alignments: tuple, problem_size: GemmCoord):
+        """
+        Returns the configuration recorded in the tuning database for a problem, or None if no
+        configuration is recorded or a tile description has been set explicitly
+        """
+        if self.tuning_database is None or self._tile_description is not None:
+            return None
+
+        key = (self._tuning_problem(alignments), tuning.shape_bucket(problem_size.m, problem_size.n, problem_size.k))
+        if key not in self._tuned_configs:
+            # Misses are looked up again only once the database has changed, so that results later added
+            # to it, whether by this object or another process sharing it, are picked up
+            version = (self.tuning_database, self.tuning_database.version())
+            miss = self._tuning_misses.get(key)
+            if miss is not None and miss[0] is version[0] and miss[1] == version[1]:
+                return None
+            config = self.tuning_database.lookup(self.name, key[0], self.current_cc, key[1])
+            config = None if config is None else self._resolve_config(config)
+            if config is None:
+                self._tuning_misses[key] = version
+                return None
+            self._tuned_configs[key] = config
+        return self._tuned_configs[key]
+
+    def _construct_config(self, tile_description: TileDescription, swizzling_functor,
+                          alignment_A: int, alignment_B: int, alignment_C: int) -> GemmOperationUniversal:
+        """
+        Constructs an operation with the given tile description and swizzling functor without changing
+        those set for the ``Gemm`` object
+        """
+        original_td, original_functor = self._tile_description, self._swizzling_functor
+        try:
+            self._swizzling_functor = swizzling_functor
+            return self.construct(tile_description, alignment_A, alignment_B, alignment_C)
+        finally:
+            self._tile_description, self._swizzling_functor = original_td, original_functor
+
+    def _tuning_swizzling_functors(self, mode) -> list:
+        """
+        Returns the swizzling functors considered by default when autotuning
+        """
+        if self.current_cc >= 90:
+            # Threadblock swizzling is not used by CUTLASS 3.x kernels
+            return [swizzle.IdentitySwizzle1]
+
+        functors = [swizzle.IdentitySwizzle1, swizzle.IdentitySwizzle2,
+                    swizzle.IdentitySwizzle4, swizzle.IdentitySwizzle8]
+        if self.opclass == cutlass.OpcodeClass.TensorOp and mode == GemmUniversalMode.Gemm:
+            functors.append(swizzle.ThreadblockSwizzleStreamK)
+        return functors
+
+    def autotune(self, A=None, B=None, C=None, D=None, alpha=None, beta=None,
+                 tile_descriptions: list = None, swizzling_functors: list = None, split_k_slices: list = None,
+                 warmup_iterations: int = 5, iterations: int = 20, max_workers: int = None,
+                 stream: cuda.CUstream = cuda.CUstream(0)) -> dict:
+        """
+        Measures candidate kernels for the problem described by the operands provided and records the
+        fastest in the tuning database. Subsequent calls to ``run()`` on problems with the same data types,
+        layouts, and alignments, and whose M, N, and K round up to the same powers of two, use the recorded
+        kernel unless a tile description has been set explicitly.
+
+        Candidates are formed from each combination of tile description, swizzling functor, and number of
+        split-K slices. They are compiled concurrently and timed with CUDA events. The contents of ``D``
+        are unspecified after autotuning.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            plan = cutlass.op.Gemm(element=torch.float16, layout=cutlass.LayoutType.RowMajor)
+            plan.autotune(A, B, C, D)
+
+            # Uses the kernel found to be the fastest above
+            plan.run(A, B, C, D)
+
+        :param A: tensor representing data type and layout of operand A
+        :param B: tensor representing data type and layout of operand B
+        :param C: tensor representing data type and layout of operand C
+        :param D: tensor representing data type and layout of operand D
+        :param alpha: scalar paramter alpha from GEMM computation that scales the product of operands A and B
+        :param beta: scalar parameter beta from GEMM operation that scales operand C
+        :param tile_descriptions: tile descriptions to consider. Defaults to all valid ``tile_descriptions()``
+        :type tile_descriptions: list
+        :param swizzling_functors: swizzling functors to consider. Defaults to identity swizzles and, where
+                                   supported, stream-K
+        :type swizzling_functors: list
+        :param split_k_slices: numbers of serial split-K slices to consider. Defaults to those of [1, 2, 4]
+                               that may be proposed for the problem (see ``_max_split_k_slices``)
+        :type split_k_slices: list
+        :param warmup_iterations: number of untimed launches of each candidate
+        :type warmup_iterations: int
+        :param iterations: number of timed launches of each candidate
+        :type iterations: int
+        :param max_workers: maximum number of modules to compile concurrently. Defaults to the number of CPUs
+        :type max_workers: int
+        :param stream: cuda stream, defaults to cuda.cuda.CUstream(0)
+        :type stream: :class:`cuda.cuda.CUstream`
+
+        :return: dictionary describing the fastest candidate, with keys "tile_description",
+                 "swizzling_functor", "split_k_slices", and "runtime" (in milliseconds)
+        :rtype: dict
+        """
+        from cutlass.utils.profiler import GpuTimer
+
+        if isinstance(self.epilogue_functor, EpilogueFunctorVisitor):
+            raise Exception("Autotuning is not supported for GEMMs with epilogue visitors")
+
+        super().run_setup()
+        A, B, C, D, alpha, beta, alignments = self._verify_operands(A, B, C, D, alpha, beta)
+        problem_size, mode, batch_count = self._get_problem_args(A, B, C, D)
+
+        if tile_descriptions is None:
+            tile_descriptions = [td for td in self.tile_descriptions() if self._valid_tile_description(td)[0]]
+        if swizzling_functors is None:
+            swizzling_functors = self._tuning_swizzling_functors(mode)
+        max_split_k_slices = self._max_split_k_slices(batch_count) if mode == GemmUniversalMode.Gemm else 1
+        if split_k_slices is None:
+            split_k_slices = [s for s in (1, 2, 4) if s <= max_split_k_slices]
+        elif max(split_k_slices) > max_split_k_slices:
+            raise Exception(f"Invalid split-K slices {split_k_slices}. At most {max_split_k_slices} "
+                            "slices may be used for this GEMM")
+
+        operations = []
+        for td in tile_descriptions:
+            for swizzling_functor in swizzling_functors:
+                try:
+                    operation = self._construct_config(td, swizzling_functor, *alignments)
+                except Exception as e:
+                    cutlass.logger.info(f"Skipping tile description {td} with {swizzling_functor}: {e}")
+                    continue
+                operations.append((td, swizzling_functor, operation))
+
+        try:
+            compiler.add_module([op for _, _, op in operations], max_workers=(max_workers or os.cpu_count()))
+        except Exception:
+            # Compile candidates individually so that only those that fail to compile are discarded
+            compiled = []
+            for td, swizzling_functor, operation in operations:
+                try:
+                    compiler.add_module([operation,])
+                    compiled.append((td, swizzling_functor, operation))
+                except Exception as e:
+                    cutlass.logger.info(f"Skipping {operation.procedural_name()}, which failed to compile: {e}")
+            operations = compiled
+
+        timer = GpuTimer()
+        best = None
+        for td, swizzling_functor, operation in operations:
+            for split_k in split_k_slices:
+                if split_k > 1 and (mode != GemmUniversalMode.Gemm or
+                                    swizzling_functor == swizzle.ThreadblockSwizzleStreamK):
+                    continue
+
+                arguments = None
+                try:
+                    arguments = GemmArguments(
+                        operation=operation, problem_size=problem_size,
+                        A=A, B=B, C=C, D=D,
+                        output_op=operation.epilogue_type(alpha, beta),
+                        gemm_mode=mode,
+                        **self._argument_kwargs(A, B, C, D, mode, batch_count, split_k, stream)
+                    )
+                    for _ in range(warmup_iterations):
+                        operation.run(arguments)
+                    timer.start(stream)
+                    for _ in range(iterations):
+                        operation.run(arguments)
+                    timer.stop_and_wait(stream)
+                    runtime = timer.duration(iterations)
+                except Exception as e:
+                    cutlass.logger.info(f"Skipping {operation.procedural_name()} with {split_k} split-K slices: {e}")
+                    continue
+                finally:
+                    if arguments is not None:
+                        arguments.free()
+
+                cutlass.logger.info(f"{operation.procedural_name()} with {split_k} split-K slices: {runtime} ms")
+                if best is None or runtime < best["runtime"]:
+                    best = {
+                        "tile_description": td,
+                        "swizzling_functor": swizzling_functor,
+                        "split_k_slices": split_k,
+                        "runtime": runtime,
+                    }
+
+        if best is None:
+            raise Exception("None of the candidate kernels could be compiled and run for the problem provided")
+
+        bucket = tuning.shape_bucket(problem_size.m, problem_size.n, problem_size.k)
+        problem = self._tuning_problem(alignments)
+        if self.tuning_database is not None:
+            config = {
+                "tile_description": tuning.tile_description_key(best["tile_description"]),
+                "swizzling_functor": best["swizzling_functor"].name,
+                "split_k_slices": best["split_k_slices"],
+            }
+            self.tuning_database.record(self.name, problem, self.current_cc, bucket, config, best["runtime"])
+        self._tuned_configs[(problem, bucket)] = {k: v for k, v in best.items() if k != "runtime"}
+
+        return best
+
+    def plan(self, A=None, B=None, C=None, D=None,
+             alpha=None, beta=None, print_module: bool = False, visitor_args: dict = None,
+             stream: cuda.CUstream = cuda.CUstream(0)) -> GemmBoundArguments:
+        """
+        Verifies the operands, compiles the kernel, and binds its launch configuration and parameters
+        for repeated launches without the Python overhead of ``run()``. Operands are provided as in ``run()``.
+
+        The returned object launches the kernel via ``launch(ptrs, stream)``, in which only the pointers to
+        operands may change. Later launches must use operands with the same shapes, data types, layouts,
+        and alignment as those provided here.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            bound = plan.plan(A, B, C, D)
+            for (A, B, C, D) in batches:
+                bound.launch((A, B, C, D), stream)
+
+        :param A: tensor representing data type and layout of operand A
+        :param B: tensor representing data type and layout of operand B
+        :param C: tensor representing data type and layout of operand C
+        :param D: tensor representing data type and layout of operand D
+        :param alpha: scalar paramter alpha from GEMM computation that scales the product of operands A and B
+        :param beta: scalar parameter beta from GEMM operation that scales operand C
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param stream: cuda stream, defaults to cuda.cuda.CUstream(0)
+        :type stream: :class:`cuda.cuda.CUstream`
+
+        :return: arguments bound for repeated launches
+        :rtype: cutlass.backend.GemmBoundArguments
+        """
+        arguments = self._create_arguments(A, B, C, D, alpha, beta, print_module, visitor_args, stream)
+        return GemmBoundArguments(arguments)
+
+    def run(self, A=None, B=None, C=None, D=None,
+            alpha=None, beta=None, sync: bool = True, print_module: bool = False, visitor_args: dict = None,
+            stream: cuda.CUstream = cuda.CUstream(0)) -> GemmArguments:
+        """
+        Runs the kernel currently specified. If it has not already been, the kernel is emitted and
+        compiled. Tensors holding operands and outputs of the kernel are sourced either from the
+        ``A``, ``B``, ``C``, ``D``, ``alpha``, and ``beta``
+        parameters provided in this call, or from those
+        passed in on the construction of this object -- one of the two must be specified.
+
+        By default, this call returns only once the kernel has completed. To launch the kernel
+        and immediately return, set ``sync=False``. In this case, it is the responsibility of the
+        caller to syncrhonize the results of the kernel before attempting to access outputs
+        by calling ``sync()`` on the arguments returned from this call.
+
+        :param A: tensor representing data type and layout of operand A
+        :param B: tensor representing data type and layout of operand B
+        :param C: tensor representing data type and layout of operand C
+        :param D: tensor representing data type and layout of operand D
+        :param alpha: scalar paramter alpha from GEMM computation that scales the product of operands A and B
+        :param beta: scalar parameter beta from GEMM operation that scales operand C
+        :param sync: whether the call should wait for the kernel to complete before returning
+        :type sync: bool
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param stream: cuda stream, defaults to cuda.cuda.CUstream(0)
+        :type stream: :class:`cuda.cuda.CUstream`
+
+        :return: arguments passed in to the kernel
+        :rtype: cutlass.backend.GemmArguments
+        """
+        arguments = self._create_arguments(A, B, C, D, alpha, beta, print_module, visitor_args, stream)
+
         self.operation.run(arguments)
 
         if sync:
@@ -54,6 +54,7 @@
 from cutlass_library import DataTypeSize
 
 from cuda import cuda
+import cutlass
 from cutlass.backend.gemm_operation import (
     GemmGroupedArguments,
     GemmOperationGrouped,
@@ -68,6 +69,16 @@ from cutlass.shape import GemmCoord
 from cutlass.utils import check, datatypes
 
 
+# Minimum number of problems in a group for which scheduling on the host is considered. The device-side
+# problem visitor has each warp scan the problem sizes of up to 32 problems at a time when advancing to
+# the next tile, so its per-tile overhead grows with the number of problems in the group.
+_HOST_SCHEDULE_MIN_PROBLEMS = 32
+
+# Maximum number of tiles for which scheduling on the host is considered. The precomputed schedule
+# occupies 8 bytes per tile and is computed serially on the host when not already cached.
+_HOST_SCHEDULE_MAX_TILES = 1 << 16
+
+
 class GroupedGemm(Gemm):
     """
     Constructs a ``GroupedGemm`` object.
@@ -137,6 +148,28 @@ class GroupedGemm(Gemm):
 
         self.name = "grouped_gemm"
 
+        # Mode used to schedule tiles of the group onto threadblocks. ``None`` selects the mode on each
+        # call to ``run()`` based on the problem sizes of the group.
+        self._scheduler_mode = None
+
+    @property
+    def scheduler_mode(self) -> SchedulerMode:
+        """
+        Returns the mode used to schedule tiles of the group onto threadblocks, or ``None`` if the
+        mode is selected automatically
+        """
+        return self._scheduler_mode
+
+    @scheduler_mode.setter
+    def scheduler_mode(self, mode: SchedulerMode):
+        """
+        Sets the mode used to schedule tiles of the group onto threadblocks. Setting ``None`` causes
+        the mode to be selected automatically on each call to ``run()``.
+        """
+        if mode is not None and not isinstance(mode, SchedulerMode):
+            raise Exception(f"Invalid scheduler mode {mode}. Expected a cutlass.backend.library.SchedulerMode or None")
+        self._scheduler_mode = mode
+
     @Gemm.swizzling_functor.setter
     def swizzling_functor(self, swizzling_functor):
         """
@@ -147,11 +180,17 @@ class GroupedGemm(Gemm):
     def construct(self, tile_description: TileDescription = None,
                   alignment_A: int = None,
                   alignment_B: int = None,
-                  alignment_C: int = None) -> GemmOperationGrouped:
+                  alignment_C: int = None,
+                  problem_size: list = None,
+                  batch_count: int = 1) -> GemmOperationGrouped:
         """
         Constructs a ``cutlass.backend.GemmOperationGrouped`` based on the input parameters and current
         kernel specification of the ``Gemm`` object.
 
+        Tiles of the group are scheduled onto threadblocks using ``scheduler_mode``. If it is ``None``,
+        the mode is selected based on ``problem_size`` when it is provided, and tiles are otherwise
+        scheduled on the device.
+
         :param tile_description: tile description specifying shapes and operand types to use in the kernel
         :type tile_description: cutlass.backend.TileDescription
         :param alignment_A: alignment of operand A
@@ -160,10 +199,17 @@ class GroupedGemm(Gemm):
         :type alignment_B: int
         :param alignment_C: alignment of operand C
         :type alignment_C: int
+        :param problem_size: sizes of the problems in the group for which to select the scheduler mode, optional
+        :type problem_size: list
+        :param batch_count: number of batches of the problem. Grouped GEMMs support only a batch count of 1
+        :type batch_count: int
 
         :return: operation that was constructed
         :rtype: cutlass.backend.GemmOperationGrouped
         """
+        if batch_count != 1:
+            raise Exception(f"Grouped GEMM does not support batched problems. Received a batch count of {batch_count}")
+
         alignment_A = check.alignment_or_default(alignment_A, max(self.possible_operations.alignments("A")))
         alignment_B = check.alignment_or_default(alignment_B, max(self.possible_operations.alignments("B")))
         alignment_C = check.alignment_or_default(alignment_C, max(self.possible_operations.alignments("C")))
@@ -183,16 +229,54 @@ class GroupedGemm(Gemm):
                 raise Exception(f"Invalid tile description. {err_str}")
             self.tile_description = tile_description
 
-        operation = GemmOperationGrouped(
-            arch=self.current_cc,
-            tile_description=tile_description,
-            A=tensor_A, B=tensor_B, C=tensor_C,
-            epilogue_functor=self.epilogue_functor,
-            swizzling_functor=self._swizzling_functor,
-            precompute_mode=SchedulerMode.Device)
-
+        def make_operation(precompute_mode):
+            return GemmOperationGrouped(
+                arch=self.current_cc,
+                tile_description=tile_description,
+                A=tensor_A, B=tensor_B, C=tensor_C,
+                epilogue_functor=self.epilogue_functor,
+                swizzling_functor=self._swizzling_functor,
+                precompute_mode=precompute_mode)
+
+        if self._scheduler_mode is not None:
+            return make_operation(self._scheduler_mode)
+
+        operation = make_operation(SchedulerMode.Device)
+        if problem_size is not None:
+            precompute_mode = self._select_scheduler_mode(problem_size, operation)
+            cutlass.logger.debug(f"Selected {precompute_mode} scheduling for group of {len(problem_size)} problems")
+            if precompute_mode != SchedulerMode.Device:
+                operation = make_operation(precompute_mode)
         return operation
 
+    def _select_scheduler_mode(self, problem_sizes: list, operation: GemmOperationGrouped) -> SchedulerMode:
+        """
+        Selects the mode used to schedule tiles of the group onto threadblocks. Scheduling on the host
+        removes the device-side search over problem sizes, and is used for large groups whose schedule
+        is small enough to compute and transfer cheaply. Host schedules are cached by the kernel, so
+        repeated groups of problem sizes pay for the host computation only once.
+
+        :param problem_sizes: sizes of the problems in the group
+        :type problem_sizes: list
+        :param operation: operation whose threadblock shape is used to tile the problems
+        :type operation: cutlass.backend.GemmOperationGrouped
+
+        :return: scheduler mode to use
+        :rtype: cutlass.backend.library.SchedulerMode
+        """
+        if len(problem_sizes) < _HOST_SCHEDULE_MIN_PROBLEMS:
+            return SchedulerMode.Device
+
+        tb_m, tb_n, _ = operation.tile_description.threadblock_shape
+        if operation.switched:
+            tb_m, tb_n = tb_n, tb_m
+
+        total_tiles = sum(((ps.m + tb_m - 1) // tb_m) * ((ps.n + tb_n - 1) // tb_n) for ps in problem_sizes)
+        if total_tiles > _HOST_SCHEDULE_MAX_TILES:
+            return SchedulerMode.Device
+
+        return SchedulerMode.Host
+
     def run(self, A, B, C, D,
             alpha=None, beta=None, sync: bool = True,
             print_module: bool = False,
@@ -246,7 +330,7 @@ class GroupedGemm(Gemm):
         alignment_b = min((self.possible_operations.find_alignment(B.shape, self._layout_b, operand="B") for B in Bs))
         alignment_c = min((self.possible_operations.find_alignment(C.shape, self._layout_c, operand="C") for C in Cs))
         self.compile(self.tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
-                     alignment_C=alignment_c, print_module=print_module)
+                     alignment_C=alignment_c, print_module=print_module, problem_size=problem_sizes)
 
         arguments = GemmGroupedArguments(
             operation=self.operation,
@@ -218,7 +218,8 @@ def valid_schedule(
         return (False, "Kernel and epilogue schedules must either both be auto or neither be auto")
 
     if not tile_scheduler_default:
-        cooperative_kernels = [cutlass.KernelScheduleType.TmaWarpSpecializedCooperative, 
+        cooperative_kernels = [cutlass.KernelScheduleType.TmaWarpSpecializedCooperative,
+                               cutlass.KernelScheduleType.TmaWarpSpecializedCooperativeFP8FastAccum,
                                cutlass.KernelScheduleType.CpAsyncWarpSpecializedCooperative]
         if (tile_scheduler == cutlass.TileSchedulerType.StreamK) and (kernel_schedule not in cooperative_kernels):
             return (False, "Stream-K tile scheduler is currently only supported with the cooperative kernel schedule")
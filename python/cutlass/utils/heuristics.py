@@ -0,0 +1,121 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Analytical selection of a kernel for a problem size, without benchmarking.
+
+Candidate operations are ranked by the runtime estimated by ``cutlass_library.workload.estimate_runtime``,
+which models the efficiency of tiles on the problem, wave quantization on the SMs of the device, occupancy
+as bounded by shared memory and warps, and whether each mainloop iteration is bound by math or by loading
+operands. Estimating a candidate takes on the order of a microsecond.
+"""
+
+from cutlass_library import OperationKind
+from cutlass_library.workload import Workload, estimate_runtime
+
+
+def split_k_candidates(m: int, n: int, k: int, batch_count: int, operation, sm_count: int,
+                       max_split_k_slices: int = 1, min_iterations: int = 4) -> list:
+    """
+    Returns the numbers of split-K slices worth considering for ``operation`` on a problem. Splitting is
+    considered only when the output tiles alone are too few to occupy every SM, and only into slices that
+    each perform at least ``min_iterations`` mainloop iterations.
+
+    :param m: extent of the M dimension of the problem
+    :type m: int
+    :param n: extent of the N dimension of the problem
+    :type n: int
+    :param k: extent of the K dimension of the problem
+    :type k: int
+    :param batch_count: number of batches of the problem
+    :type batch_count: int
+    :param operation: candidate operation
+    :type operation: cutlass_library.gemm_operation.GemmOperation
+    :param sm_count: number of SMs on the device
+    :type sm_count: int
+    :param max_split_k_slices: upper bound on the number of slices
+    :type max_split_k_slices: int
+    :param min_iterations: minimum number of mainloop iterations per slice
+    :type min_iterations: int
+
+    :return: numbers of slices, in increasing order
+    :rtype: list
+    """
+    tb_m, tb_n, tb_k = operation.tile_description.threadblock_shape[:3]
+    tiles = ((m + tb_m - 1) // tb_m) * ((n + tb_n - 1) // tb_n) * batch_count
+    if max_split_k_slices <= 1 or tiles >= sm_count:
+        return [1]
+
+    k_iterations = (k + tb_k - 1) // tb_k
+    limit = min(max_split_k_slices, k_iterations // min_iterations, (sm_count + tiles - 1) // tiles)
+    return [1] + list(range(2, limit + 1))
+
+
+def rank_operations(operations: list, m: int, n: int, k: int, batch_count: int, sm_count: int, cc: int,
+                    max_split_k_slices: int = 1) -> list:
+    """
+    Ranks ``operations`` by their estimated runtime on a GEMM (or implicit GEMM) of size ``m`` x ``n`` x ``k``,
+    each with the number of split-K slices that minimizes its estimate
+
+    :param operations: candidate operations of ``cutlass_library``, all of which support the problem
+    :type operations: list
+    :param m: extent of the M dimension of the problem
+    :type m: int
+    :param n: extent of the N dimension of the problem
+    :type n: int
+    :param k: extent of the K dimension of the problem
+    :type k: int
+    :param batch_count: number of batches of the problem
+    :type batch_count: int
+    :param sm_count: number of SMs on the device
+    :type sm_count: int
+    :param cc: compute capability of the device
+    :type cc: int
+    :param max_split_k_slices: upper bound on the number of split-K slices. Split-K is not used if 1.
+    :type max_split_k_slices: int
+
+    :return: list of tuples of an operation and its number of split-K slices, in increasing order of estimated runtime
+    :rtype: list
+    """
+    workload = Workload(OperationKind.Gemm, m, n, k, batch_count)
+    ranked = []
+    for idx, operation in enumerate(operations):
+        estimates = [
+            (estimate_runtime(operation, workload, sm_count, cc, split_k), split_k)
+            for split_k in split_k_candidates(m, n, k, batch_count, operation, sm_count, max_split_k_slices)
+        ]
+        runtime, split_k = min(estimates)
+        # Ties keep the order of ``operations``, which prefers larger tiles
+        ranked.append((runtime, idx, split_k))
+
+    ranked.sort()
+    return [(operations[idx], split_k) for _, idx, split_k in ranked]
@@ -34,17 +34,27 @@
 Profiler based on the cuda events
 """
 
+import csv
+import json
+import math
 import re
+import statistics
 import subprocess
 
 from cuda import cuda, cudart
 import numpy as np
 
+from cutlass_library import GemmUniversalMode, ShortLayoutTypeNames
+
+import cutlass
 from cutlass import CUTLASS_PATH
+from cutlass.backend import tuning
+from cutlass.backend.gemm_operation import GemmArguments
 from cutlass.backend.library import DataTypeSize
+from cutlass.backend.memory_manager import device_mem_alloc, device_mem_free, todevice
 from cutlass.op.op import OperationBase
 from cutlass.shape import GemmCoord
-from cutlass.utils.datatypes import is_numpy_tensor
+from cutlass.utils.datatypes import is_numpy_tensor, numpy_type
 
 
 class GpuTimer:
@@ -132,7 +142,7 @@ class CUDAEventProfiler:
         batch_count = self.arguments.batch_count
 
         cmd = f"{profiler_path} --kernels={kernel_name} --verification-providers={verification_providers} " \
-              f"--providers={provider} --m={problem_size.m()} --n={problem_size.n()} --k={problem_size.k()} " \
+              f"--providers={provider} --m={problem_size.m} --n={problem_size.n} --k={problem_size.k} " \
               f"--batch_count={batch_count} --alpha={alpha} --beta={beta} "\
               f"--warmup-iterations={self.warmup_iterations} --profiling-iterations={self.iterations}"
 
@@ -154,32 +164,393 @@ class CUDAEventProfiler:
         return runtime
 
     def bytes(self, problem_size, batch_count=1, beta=0.0):
-        m = problem_size.m()
-        n = problem_size.n()
-        k = problem_size.k()
+        return gemm_bytes(self.operation, problem_size, batch_count, beta)
 
-        bytes = (
-            (DataTypeSize[self.operation.A.element] * m // 8) * k
-            + (DataTypeSize[self.operation.B.element] * n // 8) * k
-            + (DataTypeSize[self.operation.C.element] * m // 8) * n
-        )
+    def flops(self, problem_size, batch_count=1, beta=0.0):
+        return gemm_flops(problem_size, batch_count, beta)
 
-        if beta != 0:
-            bytes += (DataTypeSize[self.operation.C.element] * m // 8) * n
 
-        bytes *= batch_count
+def gemm_bytes(operation, problem_size, batch_count=1, beta=0.0):
+    """
+    Returns the number of bytes of global memory accessed by a GEMM, assuming that each operand
+    is read or written once
 
-        return bytes
+    :param operation: GEMM operation
+    :param problem_size: GEMM problem size
+    :type problem_size: cutlass.shape.GemmCoord
+    :param batch_count: number of GEMMs in the batch
+    :type batch_count: int
+    :param beta: scalar parameter beta. Operand C is only read if ``beta`` is nonzero
+    :type beta: float
 
-    def flops(self, problem_size, batch_count=1, beta=0.0):
-        m = problem_size.m()
-        n = problem_size.n()
-        k = problem_size.k()
+    :rtype: int
+    """
+    m = problem_size.m
+    n = problem_size.n
+    k = problem_size.k
+
+    bytes = (
+        (DataTypeSize[operation.A.element] * m // 8) * k
+        + (DataTypeSize[operation.B.element] * n // 8) * k
+        + (DataTypeSize[operation.C.element] * m // 8) * n
+    )
+
+    if beta != 0:
+        bytes += (DataTypeSize[operation.C.element] * m // 8) * n
 
-        flops_ = (m * n * k) * 2 * batch_count
+    bytes *= batch_count
 
-        if beta != 0:
-            flops_ += m * n * batch_count * 2
+    return bytes
 
-        return flops_
 
+def gemm_flops(problem_size, batch_count=1, beta=0.0):
+    """
+    Returns the number of floating-point operations performed by a GEMM
+
+    :param problem_size: GEMM problem size
+    :type problem_size: cutlass.shape.GemmCoord
+    :param batch_count: number of GEMMs in the batch
+    :type batch_count: int
+    :param beta: scalar parameter beta. The epilogue performs additional operations if ``beta`` is nonzero
+    :type beta: float
+
+    :rtype: int
+    """
+    m = problem_size.m
+    n = problem_size.n
+    k = problem_size.k
+
+    flops_ = (m * n * k) * 2 * batch_count
+
+    if beta != 0:
+        flops_ += m * n * batch_count * 2
+
+    return flops_
+
+
+# Critical values of the standard normal distribution for two-sided confidence intervals
+_Z_SCORES = {0.9: 1.645, 0.95: 1.960, 0.99: 2.576}
+
+
+class BenchmarkResult:
+    """
+    Measurement of one kernel on one problem of a ``BenchmarkSuite``
+
+    Runtimes are in milliseconds. ``runtime`` is the mean over ``samples`` samples, and
+    ``confidence_interval`` is the half width of the confidence interval of the mean.
+    """
+
+    fields = [
+        "operation", "tile_description", "element", "element_accumulator", "layout",
+        "m", "n", "k", "batch_count", "beta", "flush_l2",
+        "runtime", "runtime_stddev", "confidence_interval", "samples", "iterations", "converged",
+        "tflops", "gbps",
+    ]
+
+    def __init__(self, **kwargs):
+        for field in BenchmarkResult.fields:
+            setattr(self, field, kwargs.get(field))
+
+    def as_dict(self) -> dict:
+        return {field: getattr(self, field) for field in BenchmarkResult.fields}
+
+    def __repr__(self) -> str:
+        return (f"{self.operation} {self.m}x{self.n}x{self.k}x{self.batch_count}: "
+                f"{self.runtime:.4f} ms +/- {self.confidence_interval:.4f}, "
+                f"{self.tflops:.2f} TFLOP/s, {self.gbps:.2f} GB/s")
+
+
+def write_json(results: list, path: str):
+    """
+    Writes benchmark results to ``path`` as a JSON list of objects
+
+    :param results: results to write
+    :type results: list[BenchmarkResult]
+    :param path: path of the output file
+    :type path: str
+    """
+    with open(path, "w") as outfile:
+        json.dump([result.as_dict() for result in results], outfile, indent=2)
+
+
+def write_csv(results: list, path: str):
+    """
+    Writes benchmark results to ``path`` as CSV with a header row
+
+    :param results: results to write
+    :type results: list[BenchmarkResult]
+    :param path: path of the output file
+    :type path: str
+    """
+    with open(path, "w", newline="") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=BenchmarkResult.fields)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result.as_dict())
+
+
+class BenchmarkSuite:
+    """
+    Benchmarks GEMMs over the grid formed by problem sizes, data types, layouts, and tile descriptions.
+
+    Each kernel is compiled once, and its module is shared by all problem sizes with the same alignments. Operands live in device
+    buffers that are allocated once per operand and data type, grown as needed, and reused across points
+    of the grid. The contents of the buffers are random but otherwise unspecified.
+
+    Each point is timed with CUDA events until the confidence interval of the mean runtime is within
+    ``relative_error`` of the mean or ``max_iterations`` launches have been timed. When ``flush_l2`` is
+    set, the L2 cache is flushed before every timed launch, so that operands are read from DRAM.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        suite = cutlass.utils.profiler.BenchmarkSuite(
+            problem_sizes=[(4096, 4096, 4096), (8192, 1024, 4096, 4)],
+            elements=[cutlass.DataType.f16],
+            layouts=[cutlass.LayoutType.RowMajor],
+            element_accumulator=cutlass.DataType.f32)
+        results = suite.run()
+        cutlass.utils.profiler.write_csv(results, "gemm.csv")
+
+    :param problem_sizes: problem sizes as (M, N, K) or (M, N, K, batch count) tuples or ``GemmCoord`` objects
+    :type problem_sizes: list
+    :param elements: data types of all operands
+    :type elements: list
+    :param layouts: layouts of all operands, or (layout A, layout B, layout C) tuples
+    :type layouts: list
+    :param tile_descriptions: tile descriptions to benchmark. ``None`` in the list, or the list being ``None``,
+                              selects the default tile description of each plan
+    :type tile_descriptions: list
+    :param element_accumulator: data type of the accumulator. Defaults to that of the plan
+    :param alpha: scalar parameter alpha
+    :type alpha: float
+    :param beta: scalar parameter beta
+    :type beta: float
+    :param flush_l2: whether to flush the L2 cache before each timed launch
+    :type flush_l2: bool
+    :param warmup_iterations: number of untimed launches before timing each point
+    :type warmup_iterations: int
+    :param batch_iterations: number of back-to-back launches averaged in each sample when L2 is not flushed
+    :type batch_iterations: int
+    :param min_samples: minimum number of samples for each point
+    :type min_samples: int
+    :param max_iterations: maximum number of timed launches for each point
+    :type max_iterations: int
+    :param confidence: confidence level of the interval, one of 0.9, 0.95, and 0.99
+    :type confidence: float
+    :param relative_error: target half width of the confidence interval, relative to the mean
+    :type relative_error: float
+    :param stream: cuda stream, defaults to cuda.cuda.CUstream(0)
+    :type stream: :class:`cuda.cuda.CUstream`
+    """
+
+    def __init__(self, problem_sizes: list, elements: list, layouts: list, tile_descriptions: list = None,
+                 element_accumulator=None, alpha: float = 1.0, beta: float = 0.0, flush_l2: bool = False,
+                 warmup_iterations: int = 10, batch_iterations: int = 10, min_samples: int = 5,
+                 max_iterations: int = 1000, confidence: float = 0.95, relative_error: float = 0.01,
+                 stream: cuda.CUstream = cuda.CUstream(0)) -> None:
+        if confidence not in _Z_SCORES:
+            raise Exception(f"Unsupported confidence level {confidence}. Supported levels are {list(_Z_SCORES.keys())}")
+
+        self.problem_sizes = [self._problem_size(ps) for ps in problem_sizes]
+        self.elements = elements
+        self.layouts = [layout if isinstance(layout, tuple) else (layout, layout, layout) for layout in layouts]
+        self.tile_descriptions = tile_descriptions if tile_descriptions is not None else [None]
+        self.element_accumulator = element_accumulator
+        self.alpha = alpha
+        self.beta = beta
+        self.flush_l2 = flush_l2
+        self.warmup_iterations = warmup_iterations
+        self.batch_iterations = batch_iterations
+        self.min_samples = min_samples
+        self.max_iterations = max_iterations
+        self.z_score = _Z_SCORES[confidence]
+        self.relative_error = relative_error
+        self.stream = stream
+
+        self.timer = GpuTimer()
+        # Dictionary mapping from (operand, data type) to a (device buffer, size in bytes) pair
+        self._buffers = {}
+        self._flush_buffer = None
+
+    @staticmethod
+    def _problem_size(problem_size) -> tuple:
+        if isinstance(problem_size, GemmCoord):
+            return (problem_size.m, problem_size.n, problem_size.k, 1)
+        if len(problem_size) == 3:
+            return (*problem_size, 1)
+        return tuple(problem_size)
+
+    def _buffer(self, operand: str, element, nbytes: int) -> cuda.CUdeviceptr:
+        """
+        Returns a device buffer of at least ``nbytes`` bytes for ``operand``, filled with random values
+        """
+        key = (operand, element)
+        buffer, size = self._buffers.get(key, (None, 0))
+        if size < nbytes:
+            if buffer is not None:
+                device_mem_free(buffer)
+            np_type = numpy_type(element)
+            if np_type is not None:
+                count = (nbytes * 8 + DataTypeSize[element] - 1) // DataTypeSize[element]
+                buffer = todevice(np.random.randint(-2, 3, size=count).astype(np_type))
+            else:
+                buffer = device_mem_alloc(nbytes)
+                (err,) = cudart.cudaMemset(buffer.ptr, 0, nbytes)
+                if err != cudart.cudaError_t.cudaSuccess:
+                    raise RuntimeError(f"CUDA Error {str(err)}")
+            self._buffers[key] = (buffer, nbytes)
+        return cuda.CUdeviceptr(int(buffer.ptr))
+
+    def _flush(self):
+        """
+        Evicts the contents of the L2 cache by writing to a buffer twice its size
+        """
+        if self._flush_buffer is None:
+            err, device = cudart.cudaGetDevice()
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError(f"CUDA Error {str(err)}")
+            err, l2_size = cudart.cudaDeviceGetAttribute(cudart.cudaDeviceAttr.cudaDevAttrL2CacheSize, device)
+            if err != cudart.cudaError_t.cudaSuccess:
+                raise RuntimeError(f"CUDA Error {str(err)}")
+            self._flush_buffer = (device_mem_alloc(2 * l2_size), 2 * l2_size)
+        buffer, size = self._flush_buffer
+        (err,) = cudart.cudaMemsetAsync(buffer.ptr, 0, size, self.stream)
+        if err != cudart.cudaError_t.cudaSuccess:
+            raise RuntimeError(f"CUDA Error {str(err)}")
+
+    def _time(self, operation, arguments) -> tuple:
+        """
+        Times launches of ``operation`` until the confidence interval of the mean is narrow enough
+
+        :return: tuple containing the mean runtime, its standard deviation, the half width of the confidence
+                 interval, the number of samples, the number of timed launches, and whether the interval
+                 reached the target width
+        :rtype: tuple
+        """
+        for _ in range(self.warmup_iterations):
+            operation.run(arguments)
+
+        launches_per_sample = 1 if self.flush_l2 else self.batch_iterations
+        samples = []
+        while True:
+            if self.flush_l2:
+                self._flush()
+            self.timer.start(self.stream)
+            for _ in range(launches_per_sample):
+                operation.run(arguments)
+            self.timer.stop_and_wait(self.stream)
+            samples.append(self.timer.duration(launches_per_sample))
+
+            mean = statistics.fmean(samples)
+            stddev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+            half_width = self.z_score * stddev / math.sqrt(len(samples))
+            iterations = len(samples) * launches_per_sample
+            converged = len(samples) >= self.min_samples and half_width <= self.relative_error * mean
+            if converged or iterations >= self.max_iterations:
+                return mean, stddev, half_width, len(samples), iterations, converged
+
+    def _plans(self):
+        """
+        Yields a GEMM plan for each combination of data type and layout
+        """
+        from cutlass.op.gemm import Gemm
+
+        for element in self.elements:
+            for layout_A, layout_B, layout_C in self.layouts:
+                plan = Gemm(element=element, layout_A=layout_A, layout_B=layout_B, layout_C=layout_C,
+                            element_accumulator=self.element_accumulator)
+                yield plan, layout_A, layout_B, layout_C
+
+    def _point(self, plan, operation, td_key: str, layout_name: str, problem_size: tuple) -> BenchmarkResult:
+        """
+        Benchmarks ``operation`` on one problem size
+        """
+        M, N, K, L = problem_size
+        size = lambda element, rows, cols: (DataTypeSize[element] * rows * cols * L + 7) // 8
+        A = self._buffer("A", plan._element_a, size(plan._element_a, M, K))
+        B = self._buffer("B", plan._element_b, size(plan._element_b, K, N))
+        C = self._buffer("C", plan._element_c, size(plan._element_c, M, N))
+        D = self._buffer("D", plan._element_d, size(plan._element_d, M, N))
+
+        if L > 1:
+            mode = GemmUniversalMode.Batched
+            kwargs = {"batch": L, "batch_strides": {"A": M * K, "B": K * N, "C": M * N, "D": M * N}}
+        else:
+            mode = GemmUniversalMode.Gemm
+            kwargs = {}
+
+        gemm_coord = GemmCoord(M, N, K)
+        arguments = GemmArguments(
+            operation=operation, problem_size=gemm_coord, A=A, B=B, C=C, D=D,
+            output_op=operation.epilogue_type(self.alpha, self.beta),
+            gemm_mode=mode, stream=self.stream, **kwargs)
+        try:
+            runtime, stddev, half_width, samples, iterations, converged = self._time(operation, arguments)
+        finally:
+            arguments.free()
+
+        return BenchmarkResult(
+            operation=operation.procedural_name(), tile_description=td_key,
+            element=plan._element_a.name, element_accumulator=plan._element_accumulator.name, layout=layout_name,
+            m=M, n=N, k=K, batch_count=L, beta=self.beta, flush_l2=self.flush_l2,
+            runtime=runtime, runtime_stddev=stddev, confidence_interval=half_width,
+            samples=samples, iterations=iterations, converged=converged,
+            tflops=gemm_flops(gemm_coord, L, self.beta) / (runtime * 1e9),
+            gbps=gemm_bytes(operation, gemm_coord, L, self.beta) / (runtime * 1e6))
+
+    def run(self) -> list:
+        """
+        Benchmarks every point of the grid. Points whose kernel cannot be constructed, compiled, or run are
+        skipped and logged.
+
+        :return: results of the points benchmarked
+        :rtype: list[BenchmarkResult]
+        """
+        results = []
+        try:
+            for plan, layout_A, layout_B, layout_C in self._plans():
+                layout_name = "".join(ShortLayoutTypeNames[layout] for layout in (layout_A, layout_B, layout_C))
+                for td in self.tile_descriptions:
+                    # Operations compiled for this tile description, keyed by the alignments of A, B, and C
+                    operations = {}
+                    for problem_size in self.problem_sizes:
+                        M, N, K, _ = problem_size
+                        alignments = (
+                            plan.possible_operations.find_alignment((M, K), layout_A, operand="A"),
+                            plan.possible_operations.find_alignment((K, N), layout_B, operand="B"),
+                            plan.possible_operations.find_alignment((M, N), layout_C, operand="C"),
+                        )
+                        if alignments not in operations:
+                            try:
+                                operations[alignments] = plan.compile(td, *alignments)
+                            except Exception as e:
+                                cutlass.logger.info(f"Skipping tile description {td} with alignments {alignments} "
+                                                    f"for {plan._element_a.name} {layout_name}: {e}")
+                                operations[alignments] = None
+                        operation = operations[alignments]
+                        if operation is None:
+                            continue
+
+                        td_key = tuning.tile_description_key(operation.tile_description)
+                        try:
+                            result = self._point(plan, operation, td_key, layout_name, problem_size)
+                        except Exception as e:
+                            cutlass.logger.info(f"Skipping problem size {problem_size} for {operation.procedural_name()}: {e}")
+                            continue
+                        cutlass.logger.info(str(result))
+                        results.append(result)
+        finally:
+            self.free()
+        return results
+
+    def free(self):
+        """
+        Frees the device buffers of the suite
+        """
+        for buffer, _ in self._buffers.values():
+            device_mem_free(buffer)
+        self._buffers = {}
+        if self._flush_buffer is not None:
+            device_mem_free(self._flush_buffer[0])
+            self._flush_buffer = None
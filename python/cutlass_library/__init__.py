@@ -33,6 +33,7 @@
 import os
 import sys
 
+from . import catalog
 from . import conv2d_operation
 from . import conv3d_operation
 from . import gemm_operation
@@ -46,8 +47,10 @@ from . import library
 from . import manifest
 from . import rank_2k_operation
 from . import rank_k_operation
+from . import sharding
 from . import symm_operation
 from . import trmm_operation
+from . import workload
 
 # Make enum types from library.py accessible via cutlass_library.*
 from .library import *
@@ -0,0 +1,478 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Columnar catalog of the operations generated for a manifest, and an API to query it.
+
+The catalog file holds one row per operation. Every attribute column is dictionary encoded: its distinct
+values are stored once in the header, and each row holds the code of its value. Each column also has an
+inverted index from codes to the rows holding them. Rows are sorted by procedural name. A catalog is
+opened by memory mapping the file, so queries read only the columns and index entries they use:
+
+.. highlight:: python
+.. code-block:: python
+
+    with Catalog("kernel_catalog.bin") as catalog:
+      names = catalog.select(kind="gemm", element_a="bf16", layout_a="t", layout_b="n", alignment_a=8, cc=90)
+"""
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+
+try:
+  import builtins
+  if hasattr(builtins, "CUTLASS_IGNORE_PACKAGE") and CUTLASS_IGNORE_PACKAGE == True:
+    raise ImportError("Disabling attempt to import cutlass_library")
+  from cutlass_library.library import *
+except ImportError:
+  from library import *
+
+###################################################################################################
+
+_MAGIC = b"CUTLCAT\x00"
+_VERSION = 1
+
+# Binary sections of the file are aligned to this many bytes
+_SECTION_ALIGNMENT = 8
+
+# Attribute columns of the catalog, in file order
+CatalogColumns = (
+  "kind", "subkind", "arch", "min_cc", "max_cc",
+  "element_a", "element_b", "element_c", "element_d", "element_accumulator",
+  "layout_a", "layout_b", "layout_c",
+  "alignment_a", "alignment_b", "alignment_c",
+  "opcode_class", "math_operation", "instruction_shape",
+  "tile_m", "tile_n", "tile_k", "cluster_m", "cluster_n", "cluster_k", "stages",
+  "kernel_schedule", "epilogue_schedule", "tile_scheduler", "iterator_algorithm",
+  "smem_usage",
+)
+
+_SUBKIND_NAMES = (
+  ("gemm_kind", GemmKindNames),
+  ("conv_kind", ConvKindNames),
+  ("rank_k_kind", RankKKindNames),
+  ("trmm_kind", TrmmKindNames),
+  ("symm_kind", SymmKindNames),
+)
+
+###################################################################################################
+
+#
+def operation_record(operation, arch):
+  """
+  Returns the attributes of ``operation`` stored in a catalog. Attributes that do not apply to the
+  operation are empty strings (or 0 for numbers).
+
+  :param operation: operation emitted by the generator
+  :param arch: compute capability under which the manifest holds the operation
+  :type arch: int
+
+  :return: dictionary mapping each of ``CatalogColumns`` and "name" to a string or an integer
+  :rtype: dict
+  """
+  tile_description = operation.tile_description
+  math_instruction = tile_description.math_instruction
+
+  subkind = ""
+  for attribute, names in _SUBKIND_NAMES:
+    if hasattr(operation, attribute):
+      subkind = names[getattr(operation, attribute)]
+      break
+
+  def tensor(name):
+    description = getattr(operation, name, None)
+    if description is None:
+      return "", "", 0
+    layout = ShortLayoutTypeNames.get(description.layout, getattr(description.layout, "name", ""))
+    return DataTypeNames[description.element], layout, description.alignment
+
+  def enum_name(attribute):
+    value = getattr(operation, attribute, None)
+    return "" if value is None else value.name
+
+  element_a, layout_a, alignment_a = tensor("A")
+  element_b, layout_b, alignment_b = tensor("B")
+  element_c, layout_c, alignment_c = tensor("C")
+  element_d = tensor("D")[0] or element_c
+  tile_shape = list(tile_description.threadblock_shape)[:3]
+  cluster_shape = list(getattr(tile_description, "cluster_shape", None) or [1, 1, 1])[:3]
+
+  return {
+    "name": operation.procedural_name(),
+    "kind": OperationKindNames[operation.operation_kind],
+    "subkind": subkind,
+    "arch": arch,
+    "min_cc": tile_description.minimum_compute_capability,
+    "max_cc": tile_description.maximum_compute_capability,
+    "element_a": element_a,
+    "element_b": element_b,
+    "element_c": element_c,
+    "element_d": element_d,
+    "element_accumulator": DataTypeNames[math_instruction.element_accumulator],
+    "layout_a": layout_a,
+    "layout_b": layout_b,
+    "layout_c": layout_c,
+    "alignment_a": alignment_a,
+    "alignment_b": alignment_b,
+    "alignment_c": alignment_c,
+    "opcode_class": OpcodeClassNames[math_instruction.opcode_class],
+    "math_operation": math_instruction.math_operation.name,
+    "instruction_shape": "x".join(str(x) for x in math_instruction.instruction_shape),
+    "tile_m": tile_shape[0],
+    "tile_n": tile_shape[1],
+    "tile_k": tile_shape[2],
+    "cluster_m": cluster_shape[0],
+    "cluster_n": cluster_shape[1],
+    "cluster_k": cluster_shape[2],
+    "stages": tile_description.stages,
+    "kernel_schedule": enum_name("kernel_schedule"),
+    "epilogue_schedule": enum_name("epilogue_schedule"),
+    "tile_scheduler": enum_name("tile_scheduler"),
+    "iterator_algorithm": enum_name("iterator_algorithm"),
+    # Kilobytes of shared memory of the mainloop's stages; 0 when the stage count is automatic
+    "smem_usage": CalculateSmemUsage(operation),
+  }
+
+#
+def manifest_records(manifest):
+  """
+  Returns the catalog records of the operations of ``manifest``, sorted by name
+
+  :param manifest: manifest holding the generated operations
+  :type manifest: Manifest
+
+  :return: list of records
+  :rtype: list
+  """
+  records = []
+  for operations_by_cc in manifest.operations.values():
+    for arch, configurations in operations_by_cc.items():
+      for operations in configurations.values():
+        records.extend(operation_record(operation, arch) for operation in operations)
+  records.sort(key=lambda record: record["name"])
+  return records
+
+#
+def write_catalog(path, records):
+  """
+  Writes a catalog file holding ``records``
+
+  :param path: path of the catalog file
+  :type path: str
+  :param records: records with the fields of ``operation_record``, sorted by name
+  :type records: list
+  """
+  sections = bytearray()
+
+  def add_section(values):
+    sections.extend(b"\0" * (-len(sections) % _SECTION_ALIGNMENT))
+    offset = len(sections)
+    sections.extend(values.tobytes())
+    return offset
+
+  names = [record["name"].encode() for record in records]
+  name_offsets = array.array("I", [0])
+  for name in names:
+    name_offsets.append(name_offsets[-1] + len(name))
+  header = {
+    "version": _VERSION,
+    "byteorder": sys.byteorder,
+    "rows": len(records),
+    "names": {"offsets": add_section(name_offsets), "blob": add_section(array.array("B", b"".join(names)))},
+    "columns": [],
+  }
+
+  for column in CatalogColumns:
+    values = sorted(set(record[column] for record in records))
+    code_of_value = {value: code for code, value in enumerate(values)}
+    typecode = "H" if len(values) <= 0xFFFF else "I"
+    codes = array.array(typecode, (code_of_value[record[column]] for record in records))
+
+    # Rows holding each code, in increasing order
+    postings = [[] for _ in values]
+    for row, code in enumerate(codes):
+      postings[code].append(row)
+    index_offsets = array.array("I", [0])
+    index_rows = array.array("I")
+    for rows in postings:
+      index_rows.extend(rows)
+      index_offsets.append(len(index_rows))
+
+    header["columns"].append({
+      "name": column,
+      "values": values,
+      "typecode": typecode,
+      "codes": add_section(codes),
+      "index_offsets": add_section(index_offsets),
+      "index_rows": add_section(index_rows),
+    })
+
+  encoded_header = json.dumps(header, separators=(",", ":")).encode()
+  prefix = _MAGIC + struct.pack("<Q", len(encoded_header)) + encoded_header
+  with open(path, "wb") as catalog_file:
+    catalog_file.write(prefix)
+    catalog_file.write(b"\0" * (-len(prefix) % _SECTION_ALIGNMENT))
+    catalog_file.write(sections)
+
+#
+def emit_catalog(manifest, path):
+  """
+  Writes the catalog of the operations of ``manifest``
+
+  :param manifest: manifest holding the generated operations
+  :type manifest: Manifest
+  :param path: path of the catalog file
+  :type path: str
+  """
+  directory = os.path.dirname(path)
+  if directory:
+    os.makedirs(directory, exist_ok=True)
+  write_catalog(path, manifest_records(manifest))
+
+###################################################################################################
+
+#
+class Catalog:
+  """
+  Catalog of generated operations, memory mapped from a file written by ``write_catalog``. Queries
+  filter rows by conditions on columns (see ``rows``).
+
+  :param path: path of the catalog file
+  :type path: str
+  """
+  def __init__(self, path):
+    self.path = path
+    self._file = open(path, "rb")
+    try:
+      self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+      self._file.close()
+      raise Exception(f"Catalog file {path} is empty")
+    self._views = []
+
+    view = self._view(0, len(self._map))
+    if bytes(view[:len(_MAGIC)]) != _MAGIC:
+      self.close()
+      raise Exception(f"{path} is not a kernel catalog")
+    header_length, = struct.unpack_from("<Q", self._map, len(_MAGIC))
+    header_end = len(_MAGIC) + 8 + header_length
+    header = json.loads(bytes(view[len(_MAGIC) + 8:header_end]))
+    if header["version"] != _VERSION or header["byteorder"] != sys.byteorder:
+      self.close()
+      raise Exception(f"Catalog {path} has version {header['version']} and byte order {header['byteorder']}, "
+                      f"but version {_VERSION} and byte order {sys.byteorder} are supported")
+
+    base = header_end + (-header_end % _SECTION_ALIGNMENT)
+    rows = header["rows"]
+    self._rows = rows
+
+    def section(offset, typecode, count):
+      size = array.array(typecode).itemsize * count
+      view = self._view(base + offset, base + offset + size).cast(typecode)
+      self._views.append(view)
+      return view
+
+    self._name_offsets = section(header["names"]["offsets"], "I", rows + 1)
+    self._names = self._view(base + header["names"]["blob"], base + header["names"]["blob"] + self._name_offsets[rows])
+
+    self.columns = tuple(column["name"] for column in header["columns"])
+    self._values = {}
+    self._code_of_value = {}
+    self._codes = {}
+    self._index_offsets = {}
+    self._index_rows = {}
+    for column in header["columns"]:
+      name, values = column["name"], column["values"]
+      self._values[name] = values
+      self._code_of_value[name] = {value: code for code, value in enumerate(values)}
+      self._codes[name] = section(column["codes"], column["typecode"], rows)
+      self._index_offsets[name] = section(column["index_offsets"], "I", len(values) + 1)
+      self._index_rows[name] = section(column["index_rows"], "I", rows)
+
+  def _view(self, start, end):
+    view = memoryview(self._map)[start:end]
+    self._views.append(view)
+    return view
+
+  def close(self):
+    """
+    Releases the memory mapping of the catalog file
+    """
+    for view in reversed(self._views):
+      view.release()
+    self._views = []
+    self._map.close()
+    self._file.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
+
+  def __len__(self):
+    return self._rows
+
+  def values(self, column):
+    """
+    Returns the distinct values of ``column``, in increasing order
+
+    :param column: name of the column
+    :type column: str
+
+    :rtype: list
+    """
+    self._check_column(column)
+    return list(self._values[column])
+
+  def name(self, row):
+    """
+    Returns the procedural name of the operation of ``row``
+
+    :param row: index of the row
+    :type row: int
+
+    :rtype: str
+    """
+    return bytes(self._names[self._name_offsets[row]:self._name_offsets[row + 1]]).decode()
+
+  def find(self, name):
+    """
+    Returns the row of the operation named ``name``, or None if the catalog holds no such operation
+
+    :param name: procedural name of the operation
+    :type name: str
+
+    :rtype: int
+    """
+    # Rows are sorted by name
+    low, high = 0, self._rows
+    while low < high:
+      middle = (low + high) // 2
+      if self.name(middle) < name:
+        low = middle + 1
+      else:
+        high = middle
+    if low < self._rows and self.name(low) == name:
+      return low
+    return None
+
+  def record(self, row):
+    """
+    Returns the procedural name and attributes of the operation of ``row``
+
+    :param row: index of the row
+    :type row: int
+
+    :return: dictionary mapping "name" and each column to its value
+    :rtype: dict
+    """
+    record = {"name": self.name(row)}
+    for column in self.columns:
+      record[column] = self._values[column][self._codes[column][row]]
+    return record
+
+  def _check_column(self, column):
+    if column not in self._values:
+      raise Exception(f"Unknown catalog column '{column}'. Columns are {', '.join(self.columns)}")
+
+  def _matching_codes(self, column, condition):
+    self._check_column(column)
+    if callable(condition):
+      return {code for code, value in enumerate(self._values[column]) if condition(value)}
+    if isinstance(condition, (list, tuple, set, frozenset)):
+      conditions = condition
+    else:
+      conditions = (condition,)
+    code_of_value = self._code_of_value[column]
+    return {code_of_value[value] for value in conditions if value in code_of_value}
+
+  def rows(self, **filters):
+    """
+    Returns the rows of the operations satisfying all ``filters``. Each filter maps a column to a value,
+    a collection of values any of which may match, or a predicate called on the distinct values of the
+    column. The filter ``cc`` selects operations that run on a compute capability, between their
+    ``min_cc`` and ``max_cc``.
+
+    :return: indices of the matching rows, in increasing order (and thus by name)
+    :rtype: list
+    """
+    conditions = []
+    if "cc" in filters:
+      cc = filters.pop("cc")
+      conditions.append(("min_cc", self._matching_codes("min_cc", lambda value: value <= cc)))
+      conditions.append(("max_cc", self._matching_codes("max_cc", lambda value: value >= cc)))
+    conditions.extend((column, self._matching_codes(column, condition)) for column, condition in filters.items())
+    if not conditions:
+      return list(range(self._rows))
+
+    # Start from the rows of the most selective condition, read from its index
+    def count(condition):
+      column, codes = condition
+      offsets = self._index_offsets[column]
+      return sum(offsets[code + 1] - offsets[code] for code in codes)
+    conditions.sort(key=count)
+
+    column, codes = conditions[0]
+    offsets, index_rows = self._index_offsets[column], self._index_rows[column]
+    rows = []
+    for code in codes:
+      rows.extend(index_rows[offsets[code]:offsets[code + 1]].tolist())
+    if len(codes) > 1:
+      rows.sort()
+
+    for column, codes in conditions[1:]:
+      column_codes = self._codes[column]
+      rows = [row for row in rows if column_codes[row] in codes]
+    return rows
+
+  def select(self, **filters):
+    """
+    Returns the procedural names of the operations satisfying all ``filters`` (see ``rows``)
+
+    :rtype: list
+    """
+    return [self.name(row) for row in self.rows(**filters)]
+
+  def records(self, **filters):
+    """
+    Returns the records of the operations satisfying all ``filters`` (see ``rows`` and ``record``)
+
+    :rtype: list
+    """
+    return [self.record(row) for row in self.rows(**filters)]
+
+###################################################################################################
@@ -367,7 +367,7 @@ ${stub_end}
     _LOGGER.debug('***   configuration_path (file to write): ' +
                   str(self.configuration_path))
     _LOGGER.debug('***   configuration_name: ' + self.configuration_name)
-    self.configuration_file = open(self.configuration_path, "w")
+    self.configuration_file = GeneratedFile(self.configuration_path)
 
     self.configuration_file.write(SubstituteTemplate(self.header_template, {
       'configuration_name': self.configuration_name
@@ -52,6 +52,41 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Constant lookup tables used while naming operations. They are defined once here, rather than on each
+# call, as the generator names millions of candidate operations at high instantiation levels.
+_GEMM_KINDS_3X = frozenset([
+  GemmKind.Universal3x,
+  GemmKind.SparseUniversal3x,
+  GemmKind.BlockScaledUniversal3x,
+  GemmKind.GroupedUniversal3x,
+  GemmKind.GroupedBlockScaledUniversal3x,
+])
+
+_COMPLEX_MATH_OPERATIONS = frozenset([
+  MathOperation.multiply_add_complex,
+  MathOperation.multiply_add_complex_gaussian,
+  MathOperation.multiply_add_complex_fast_f32
+])
+
+_MATH_OPERATION_SUFFIXES = {
+  MathOperation.xor_popc: 'xor',
+  MathOperation.and_popc: 'and',
+  MathOperation.multiply_add_fast_accum: 'fastaccum',
+}
+
+_TENSOR_OPCODE_CLASSES = frozenset([
+  OpcodeClass.TensorOp,
+  OpcodeClass.WmmaTensorOp,
+  OpcodeClass.SparseTensorOp,
+  OpcodeClass.BlockScaledTensorOp,
+])
+
+_MIXED_INPUT_MODE_SUFFIXES = {
+  MixedInputMode.ConvertOnly: "_cvt",
+  MixedInputMode.ScaleOnly: "_scl",
+  MixedInputMode.ScaleWithZeroPoint: "_sclzr"
+}
+
 ###################################################################################################
 #
 # Data structure modeling a GEMM operation
@@ -67,14 +102,7 @@ class GemmOperation:
       tile_scheduler = TileSchedulerType.Default, mixed_input_mode = None, mixed_input_shuffle = False,
       ScaleFactorA = None, ScaleFactorB = None, ScaleFactorD = None):
 
-    kinds_3x = {
-      GemmKind.Universal3x,
-      GemmKind.SparseUniversal3x,
-      GemmKind.BlockScaledUniversal3x, 
-      GemmKind.GroupedUniversal3x,
-      GemmKind.GroupedBlockScaledUniversal3x,
-    }
-    self.is_3x = gemm_kind in kinds_3x
+    self.is_3x = gemm_kind in _GEMM_KINDS_3X
     self.prefix = "3x" if self.is_3x else ""
     self.operation_kind = OperationKind.Gemm
     self.arch = arch
@@ -116,12 +144,7 @@ class GemmOperation:
 
   #
   def is_complex(self):
-    complex_operators = [
-      MathOperation.multiply_add_complex,
-      MathOperation.multiply_add_complex_gaussian,
-      MathOperation.multiply_add_complex_fast_f32
-    ]
-    return self.tile_description.math_instruction.math_operation in complex_operators
+    return self.tile_description.math_instruction.math_operation in _COMPLEX_MATH_OPERATIONS
 
   #
   def is_mixed_input(self):
@@ -155,25 +178,12 @@ class GemmOperation:
     inst_operation = ''
     intermediate_type = ''
 
-    math_operations_map = {
-      MathOperation.xor_popc: 'xor',
-      MathOperation.and_popc: 'and',
-      MathOperation.multiply_add_fast_accum: 'fastaccum',
-    }
-
-    tensor_ops = [
-      OpcodeClass.TensorOp,
-      OpcodeClass.WmmaTensorOp,
-      OpcodeClass.SparseTensorOp,
-      OpcodeClass.BlockScaledTensorOp, 
-    ]
-
-    is_tensor_op = self.tile_description.math_instruction.opcode_class in tensor_ops
+    is_tensor_op = self.tile_description.math_instruction.opcode_class in _TENSOR_OPCODE_CLASSES
 
     if is_tensor_op:
 
       math_op = self.tile_description.math_instruction.math_operation
-      math_op_string = math_operations_map[math_op] if math_op in math_operations_map.keys() else ''
+      math_op_string = _MATH_OPERATION_SUFFIXES.get(math_op, '')
 
       if self.is_3x:
         inst_shape = "{0}x{1}x{2}".format(*tuple(self.tile_description.math_instruction.instruction_shape))
@@ -216,12 +226,7 @@ class GemmOperation:
 
   #
   def mixed_input_mode_name(self):
-    mode_name_mapping = {
-      MixedInputMode.ConvertOnly: "_cvt",
-      MixedInputMode.ScaleOnly: "_scl",
-      MixedInputMode.ScaleWithZeroPoint: "_sclzr"
-    }
-    mode_name = mode_name_mapping.get(self.mixed_input_mode, "")
+    mode_name = _MIXED_INPUT_MODE_SUFFIXES.get(self.mixed_input_mode, "")
     if self.mixed_input_shuffle:
       mode_name = mode_name + "_shfl"
     return mode_name
@@ -1443,7 +1448,7 @@ void initialize_${configuration_name}(Manifest &manifest) {
     _LOGGER.debug("***   configuration_path (file to write): " +
                   str(self.configuration_path))
 
-    self.configuration_file = open(self.configuration_path, "w")
+    self.configuration_file = GeneratedFile(self.configuration_path)
     self.configuration_file.write(self.header_template)
     self.configuration_file.write(self.separator)
 
@@ -35,6 +35,7 @@ Utilities for enumerating CUTLASS library kernels
 """
 
 import argparse
+import concurrent.futures
 import enum
 from itertools import chain, product
 import logging
@@ -90,10 +91,12 @@ try:
     raise ImportError("Disabling attempt to import cutlass_library")
   from cutlass_library.library import *
   from cutlass_library.manifest import *
+  from cutlass_library.catalog import emit_catalog
   from cutlass_library.emit_kernel_listing import emit_gemm_kernel_testlist 
 except ImportError:
   from library import *
   from manifest import *
+  from catalog import emit_catalog
   from emit_kernel_listing import emit_gemm_kernel_testlist 
 ###################################################################################################
 
@@ -9341,6 +9344,40 @@ def GenerateSM90(manifest, cuda_version):
 
 ###################################################################################################
 
+def _generate_operations(args, generator_name):
+  """
+  Runs a single architecture's generator against a fresh manifest. This is the unit of work
+  distributed across processes by ``generate_parallel``.
+
+  :return: operations selected by the manifest, in the order in which they were appended
+  :rtype: list
+  """
+  logging.basicConfig(level=args.log_level)
+  manifest = Manifest(args)
+  globals()[generator_name](manifest, args.cuda_version)
+  return list(manifest.operations_by_name.values())
+
+
+def generate_parallel(manifest, generators, args):
+  """
+  Runs the generators in ``generators`` across ``args.jobs`` processes and merges the operations
+  they select into ``manifest``. Results are merged in the order of ``generators``, which yields the
+  same manifest as calling each generator in turn.
+
+  :param manifest: manifest into which to merge operations
+  :type manifest: Manifest
+  :param generators: generator functions (e.g., GenerateSM80), each taking a manifest and CUDA version
+  :type generators: list
+  :param args: arguments from which ``manifest`` was constructed
+  :type args: argparse.Namespace
+  """
+  with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+    futures = [executor.submit(_generate_operations, args, generator.__name__) for generator in generators]
+    for future in futures:
+      manifest.extend(future.result())
+
+###################################################################################################
+
 def numeric_log_level(log_level: str) -> int:
   """
   Converts the string identifier of the log level
@@ -9365,7 +9402,9 @@ def define_parser():
   parser.add_argument("--operations", default="all", help="Specifies the operation to generate (gemm, all)")
   parser.add_argument("--build-dir", default=".", required=False, help="CUTLASS top-level build directory")
   parser.add_argument("--curr-build-dir", default=".", help="CUTLASS current build directory. cmake files will be emitted in this directory")
-  parser.add_argument("--generator-target", default='library', help="Target of CUTLASS Library Generator.")
+  parser.add_argument("--generator-target", default='library', help="Comma-delimited targets of CUTLASS Library Generator: " +
+                      "library, catalog (a queryable kernel_catalog.bin of the generated kernels, see catalog.py), " +
+                      "kernel_testlist_l0, kernel_testlist_l1.")
   parser.add_argument("--architectures", default='53;60;61;70;75;80;90', help="Target compute architectures")
   parser.add_argument("--kernels", default='', help='Comma-delimited list to filter kernels by name.  ' +
                       'Specifying this as \"all\" includes ALL the kernels, ' +
@@ -9389,6 +9428,22 @@ def define_parser():
   parser.add_argument("--log-level", default='info', type=numeric_log_level, required=False,
                       help='Logging level to be used by the generator script')
   parser.add_argument('--instantiation-level', type=str, default="", required=False, help="Instantiation level for SM90 kernels. Set to `max` and make sure `--kernels` is not empty to generate all possible configurations.")
+  parser.add_argument("--jobs", "-j", type=int, default=1, required=False,
+                      help="Number of processes used to generate and emit kernels. Output does not depend on this value.")
+  parser.add_argument("--shards", type=int, default=0, required=False,
+                      help="Number of translation units of balanced compile cost into which configurations are sharded. " +
+                           "Each operation kind is then built as one library. 0 emits one translation unit per configuration.")
+  parser.add_argument("--compile-timings", type=str, default=None, required=False,
+                      help="Path of a .ninja_log, or of a JSON file mapping configuration names to seconds, with compile " +
+                           "times recorded by a previous build. Used in place of estimated compile costs when sharding.")
+  parser.add_argument("--workload-file", type=str, default=None, required=False,
+                      help="Path of a CSV or JSON file of GEMM and convolution problem shapes, data types, layouts and call " +
+                           "frequencies. Only the kernels of least estimated runtime for some shape are kept.")
+  parser.add_argument("--workload-top-k", type=int, default=3, required=False,
+                      help="Number of kernels kept for each shape of the workload file.")
+  parser.add_argument("--workload-sm-count", type=int, default=0, required=False,
+                      help="Number of SMs of the GPU for which kernels are selected by the workload file. " +
+                           "0 uses that of the highest architecture built.")
   _add_package_disablement_flag(parser)
   return parser
 
@@ -9402,20 +9457,30 @@ if __name__ == "__main__":
 
   manifest = Manifest(args)
 
-  GenerateSM50(manifest, args.cuda_version)
-  GenerateSM60(manifest, args.cuda_version)
-  GenerateSM61(manifest, args.cuda_version)
-  GenerateSM70(manifest, args.cuda_version)
-  GenerateSM75(manifest, args.cuda_version)
-  GenerateSM80(manifest, args.cuda_version)
-  GenerateSM89(manifest, args.cuda_version)
-  GenerateSM90(manifest, args.cuda_version)
+  generators = [
+    GenerateSM50,
+    GenerateSM60,
+    GenerateSM61,
+    GenerateSM70,
+    GenerateSM75,
+    GenerateSM80,
+    GenerateSM89,
+    GenerateSM90,
+  ]
 
-  
   blackwell_enabled_arch = args.architectures == "100a"
   if blackwell_enabled_arch:
-    GenerateSM100(manifest, args.cuda_version)
-  
+    generators.append(GenerateSM100)
+
+  if args.jobs > 1:
+    generate_parallel(manifest, generators, args)
+  else:
+    for generator in generators:
+      generator(manifest, args.cuda_version)
+
+  # The catalog lists every generated kernel that passes the filters, before any workload selection
+  if 'catalog' in args.generator_target.split(','):
+    emit_catalog(manifest, os.path.join(args.curr_build_dir, 'kernel_catalog.bin'))
 
   if 'library' in args.generator_target.split(','):
     manifest.emit(GeneratorTarget.Library)
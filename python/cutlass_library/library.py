@@ -35,7 +35,10 @@ Data types and tags used for emitting CUTLASS C++ kernels
 """
 
 import enum
+import functools
+import os
 import re
+import tempfile
 
 # The following block implements enum.auto() for Python 3.5 variants that don't include it such
 # as the default 3.5.2 on Ubuntu 16.04.
@@ -860,19 +863,117 @@ SharedMemPerCC = {
 
 ###################################################################################################
 
+#
+class TextTemplate:
+  """
+  Template text with ``${key}`` placeholders.
+
+  The text is split into literal text and placeholder keys once, so that rendering it is a single
+  join. Values substituted for placeholders may themselves contain placeholders, which are
+  substituted in turn. Placeholders without a value are left as they are.
+  """
+
+  _placeholder = re.compile(r"\$\{([^${}]*)\}")
+
+  def __init__(self, text):
+    self.text = text
+    # Literal text at even indices, placeholder keys at odd indices
+    self.parts = TextTemplate._placeholder.split(text)
+
+  def render(self, values):
+    parts = self.parts
+    if len(parts) == 1:
+      return self.text
+
+    rendered = parts[:]
+    for idx in range(1, len(parts), 2):
+      key = parts[idx]
+      if key in values:
+        rendered[idx] = _render_value(key, values[key], values)
+      else:
+        rendered[idx] = "${" + key + "}"
+    return "".join(rendered)
+
+#
+def _render_value(key, value, values):
+  # Values have always been substituted as `re.sub` replacement strings, whose backslash escapes are processed
+  if "\\" in value:
+    placeholder = "${" + key + "}"
+    value = re.sub(re.escape(placeholder), value, placeholder)
+  if "${" in value:
+    value = CompileTemplate(value).render(values)
+  return value
+
+#
+@functools.lru_cache(maxsize=4096)
+def CompileTemplate(text):
+  """
+  Returns the ``TextTemplate`` for ``text``, which is split into parts on its first use only
+  """
+  return TextTemplate(text)
+
 #
 def SubstituteTemplate(template, values):
-  text = template
-  changed = True
-  while changed:
-    changed = False
-    for key, value in values.items():
-      regex = "\\$\\{%s\\}" % key
-      newtext = re.sub(regex, value, text)
-      if newtext != text:
-        changed = True
-      text = newtext
-  return text
+  if isinstance(template, TextTemplate):
+    return template.render(values)
+  return CompileTemplate(template).render(values)
+
+###################################################################################################
+
+#
+class GeneratedFile:
+  """
+  Source file written by the generator. Writes are buffered in memory and, on close, the file
+  on disk is only replaced if its contents changed. Unchanged sources thus keep their timestamps,
+  and build systems recompile only the translation units affected by a change in generation.
+
+  While ``GeneratedFile.emitted`` is a set, the path of every file closed is added to it, so that
+  callers can remove stale files left over from previous generations.
+  """
+
+  # Paths of files emitted since tracking was enabled, or None when not tracking
+  emitted = None
+
+  def __init__(self, path):
+    self.name = path
+    self.chunks = []
+    self.closed = False
+
+  def write(self, text):
+    self.chunks.append(text)
+
+  def close(self):
+    if self.closed:
+      return
+    self.closed = True
+
+    contents = "".join(self.chunks).encode()
+    self.chunks = []
+    if GeneratedFile.emitted is not None:
+      GeneratedFile.emitted.add(os.path.abspath(self.name))
+
+    if os.path.isfile(self.name):
+      with open(self.name, "rb") as existing_file:
+        if existing_file.read() == contents:
+          return
+
+    # Replace the file atomically so that an interrupted generation never leaves a partially-written
+    # file whose timestamp is newer than that of its build outputs
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.name) or ".", prefix=".tmp")
+    try:
+      with os.fdopen(fd, "wb") as temp_file:
+        temp_file.write(contents)
+      os.replace(temp_path, self.name)
+    except BaseException:
+      if os.path.exists(temp_path):
+        os.remove(temp_path)
+      raise
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exception_type, exception_value, traceback):
+    self.close()
 
 ###################################################################################################
 
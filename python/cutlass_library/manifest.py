@@ -35,10 +35,11 @@ Utilities for filtering CUTLASS library kernels and emitting library intitializa
 and building code
 """
 
+import concurrent.futures
 import enum
 import logging
 import os.path
-import shutil
+import re
 
 try:
   import builtins
@@ -52,6 +53,8 @@ try:
   from cutlass_library.symm_operation import *
   from cutlass_library.conv2d_operation import *
   from cutlass_library.conv3d_operation import *
+  from cutlass_library.sharding import *
+  from cutlass_library.workload import *
 except ImportError:
   from library import *
   from gemm_operation import *
@@ -61,11 +64,23 @@ except ImportError:
   from symm_operation import *
   from conv2d_operation import *
   from conv3d_operation import *
+  from sharding import *
+  from workload import *
 
 ###################################################################################################
 _LOGGER = logging.getLogger(__name__)
 
 
+def _emit_configuration(emitter_class, operation_path, configuration_name, operations):
+  """
+  Emits the source file of one configuration. This is the unit of work distributed across
+  processes when emitting in parallel.
+  """
+  with emitter_class(operation_path, configuration_name) as configuration_emitter:
+    for operation in operations:
+      configuration_emitter.emit(operation)
+
+
 class EmitOperationKindAll:
   """
   Emit the OperationKind-level CUTLASS library initialization code.
@@ -139,7 +154,7 @@ void initialize_all_${operation_name}_operations(Manifest &manifest) {
     self.top_level_path = os.path.join(self.operation_path, f"all_{OperationKindNames[self.kind]}_operations.cu")
     _LOGGER.debug(f"***   top_level_path (file to write): {str(self.top_level_path)}")
 
-    self.top_level_file = open(self.top_level_path, "w")
+    self.top_level_file = GeneratedFile(self.top_level_path)
     self.top_level_file.write(self.header_template)
 
     self.source_files = [self.top_level_path,]
@@ -207,11 +222,15 @@ class EmitOperationKindLibrary:
   of what happens in each of those subdirectories.
   """
 
-  def __init__(self, generated_path, min_cc, kind, args):
+  def __init__(self, generated_path, min_cc, kind, args, executor = None):
     self.generated_path = generated_path
     self.min_cc = min_cc
     self.kind = kind
     self.args = args
+
+    # When set, configuration files are emitted by this executor rather than inline
+    self.executor = executor
+    self.pending = []
     self.emitters = {
       OperationKind.Gemm: EmitGemmConfigurationLibrary,
       OperationKind.Conv2d: EmitConv2dConfigurationLibrary,
@@ -266,16 +285,19 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
 
     self.operation_path = os.path.join(self.generated_path, OperationKindNames[self.kind], str(self.min_cc))
     _LOGGER.debug(f"***   operation_path (directory to make): {str(self.operation_path)}")
-    os.makedirs(self.operation_path)
+    os.makedirs(self.operation_path, exist_ok=True)
 
     self.top_level_path = os.path.join(self.operation_path, f"all_sm{self.min_cc}_{OperationKindNames[self.kind]}_operations.cu")
     _LOGGER.debug(f"***   top_level_path (file to write): {str(self.top_level_path)}")
 
-    self.top_level_file = open(self.top_level_path, "w")
+    self.top_level_file = GeneratedFile(self.top_level_path)
     self.top_level_file.write(self.header_template)
 
     self.source_files = {}
 
+    # Path of the source file of each configuration
+    self.configuration_paths = {}
+
     # Each {operation_kind x cc} combination is further decomposed by the instruction
     # types used. This dictionary used to track the file handles for the top-level
     # files of each subclass
@@ -303,7 +325,7 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
     if extended_name not in self.subclass_files:
       subclass_path = os.path.join(self.operation_path, extended_name)
       _LOGGER.debug(f"***     subclass_path: {str(subclass_path)}")
-      os.mkdir(subclass_path)
+      os.makedirs(subclass_path, exist_ok=True)
 
       self.subclass_configurations[extended_name] = []
 
@@ -313,7 +335,7 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
       _LOGGER.debug('***     subclass_top_level_path (min_cc, extended_name, ' +
                     'OperationKind): ' + str(subclass_top_level_path))
 
-      self.subclass_files[extended_name] = open(subclass_top_level_path, "w")
+      self.subclass_files[extended_name] = GeneratedFile(subclass_top_level_path)
       self.subclass_files[extended_name].write(self.header_template)
 
       self.source_files[extended_name] = [subclass_top_level_path]
@@ -321,13 +343,21 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
     subclass_dir = os.path.dirname(self.subclass_files[extended_name].name)
     _LOGGER.debug('***   subclass_dir: ' + str(subclass_dir))
 
-    with self.emitters[self.kind](subclass_dir, configuration_name) as configuration_emitter:
-      for operation in operations:
-        configuration_emitter.emit(operation)
+    emitter_class = self.emitters[self.kind]
+    configuration_path = emitter_class(subclass_dir, configuration_name).configuration_path
+    _LOGGER.debug('***   configuration_path: ' + str(configuration_path))
+
+    if self.executor is None:
+      _emit_configuration(emitter_class, subclass_dir, configuration_name, operations)
+    else:
+      self.pending.append(
+        self.executor.submit(_emit_configuration, emitter_class, subclass_dir, configuration_name, operations))
+      # The file is closed in a worker process, so record it as emitted here
+      if GeneratedFile.emitted is not None:
+        GeneratedFile.emitted.add(os.path.abspath(configuration_path))
 
-      _LOGGER.debug('***   configuration_emitter.configuration_path: ' +
-                    str(configuration_emitter.configuration_path))
-      self.source_files[extended_name].append(configuration_emitter.configuration_path)
+    self.source_files[extended_name].append(configuration_path)
+    self.configuration_paths[configuration_name] = configuration_path
 
     self.subclass_configurations[extended_name].append(configuration_name)
     self.subclass_files[extended_name].write(SubstituteTemplate(self.configuration_prototype_template, {'configuration_name': configuration_name} ))
@@ -374,6 +404,10 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
     self.top_level_file.write(self.epilogue_template)
     self.top_level_file.close()
 
+    # Wait for configurations emitted in parallel, raising the first error encountered
+    for future in self.pending:
+      future.result()
+
 class EmitInterfaceLibrary:
   """
   Emit the topmost-level CUTLASS library initialization code.
@@ -448,7 +482,7 @@ ${fn_calls}
     self.top_level_path = os.path.join(self.generated_path, 'initialize_all.cpp')
     _LOGGER.debug("***   top_level_path: " + str(self.top_level_path))
 
-    self.top_level_file = open(self.top_level_path, "w")
+    self.top_level_file = GeneratedFile(self.top_level_path)
     self.top_level_file.write(self.top_level_hdr_template)
 
     self.source_files = [self.top_level_path,]
@@ -484,6 +518,50 @@ ${fn_calls}
 ###################################################################################################
 ###################################################################################################
 
+#
+class KernelNameFilter:
+  '''
+    Matches kernel names against a list of filter strings, compiled once into a single regular expression.
+
+    Filter strings either use the syntax of CUTLASS_LIBRARY_KERNELS, in which a filter string matches a
+    name containing its '*'-separated substrings in order, or are regular expressions searched for in
+    the name (as in kernel filter files).
+  '''
+  def __init__(self, filter_strings, regex = False):
+    self.filter_strings = list(filter_strings)
+    self.patterns = [s if regex else '.*'.join(re.escape(sub) for sub in s.split('*')) for s in self.filter_strings]
+
+    self.compiled = [re.compile(pattern) for pattern in self.patterns]
+
+    # Each pattern is a named group so that the filter string which matched can be reported. Patterns
+    # with groups of their own are matched one by one, as combining them would renumber their backreferences.
+    self.matcher = None
+    if all(compiled.groups == 0 for compiled in self.compiled):
+      try:
+        self.matcher = re.compile('|'.join(f'(?P<f{idx}>{pattern})' for idx, pattern in enumerate(self.patterns)))
+      except re.error:
+        # e.g., inline global flags, which are only allowed at the start of an expression
+        self.matcher = None
+
+  def __len__(self):
+    return len(self.filter_strings)
+
+  def match(self, name):
+    '''
+      Returns the filter string matched by name, or None if it matches none of them.
+    '''
+    if not self.filter_strings:
+      return None
+    if self.matcher is not None:
+      match = self.matcher.search(name)
+      return None if match is None else self.filter_strings[int(match.lastgroup[1:])]
+    for filter_string, compiled in zip(self.filter_strings, self.compiled):
+      if compiled.search(name) is not None:
+        return filter_string
+    return None
+
+###################################################################################################
+
 class Options:
   def __init__(self):
     pass
@@ -560,9 +638,31 @@ class Manifest:
             filter_count = len(self.kernel_filter_list),
             filter_file = args.kernel_filter_file))
 
+    # Filter strings are compiled once, rather than matched one by one against each kernel name
+    self.kernel_names_filter = KernelNameFilter(self.kernel_names)
+    self.ignore_kernel_names_filter = KernelNameFilter(self.ignore_kernel_names)
+    self.exclude_kernel_names_filter = KernelNameFilter(self.exclude_kernel_names)
+    self.kernel_filter_list_filter = KernelNameFilter([f.pattern for f in self.kernel_filter_list], regex = True)
+
     self.operation_count = 0
     self.operations_by_name = {}
     self.disable_full_archs_compilation = args.disable_full_archs_compilation
+    # Number of processes used for emission
+    self.jobs = max(getattr(args, 'jobs', 1), 1)
+    # Number of translation units into which configurations are sharded, or 0 for one per configuration
+    self.shards = max(getattr(args, 'shards', 0), 0)
+    self.compile_timings = getattr(args, 'compile_timings', None)
+
+    # Problem shapes for which the kernels of least estimated runtime are selected
+    self.workloads = []
+    if getattr(args, 'workload_file', None):
+      self.workloads = read_workloads(args.workload_file)
+      _LOGGER.info(f"Selecting kernels for {len(self.workloads)} workloads from {args.workload_file}")
+      # Generate all tile sizes and alignments as candidates, rather than only the largest
+      if self.kernel_filter == '':
+        self.kernel_filter = 'all'
+    self.workload_top_k = getattr(args, 'workload_top_k', 3)
+    self.workload_sm_count = getattr(args, 'workload_sm_count', 0)
     self.is_kernel_filter_set_to_all = args.instantiation_level == "max" and args.kernels != ''
     self.instantiation_level = 0
     try:
@@ -602,32 +702,26 @@ class Manifest:
         return []
 
   #
-  def filter_out_kernels(self, kernel_name, kernel_filter_list):
-
-    for kernel_filter_re in kernel_filter_list:
-        if kernel_filter_re.search(kernel_name) is not None:
-            return True
+  def filter(self, operation, name = None):
+    ''' Filtering operations based on various criteria'''
 
-    return False
+    if len(self.operations_enabled) and not operation.operation_kind in self.operations_enabled:
+      return False
 
+    if name is None:
+      name = operation.procedural_name()
 
-  #
-  def _filter_string_matches(self, filter_string, haystack):
-    ''' Returns true if all substrings appear in the haystack in order'''
-    substrings = filter_string.split('*')
-    for sub in substrings:
-      idx = haystack.find(sub)
-      if idx < 0:
-        return False
-      haystack = haystack[idx + len(sub):]
-    return True
+    # eliminate duplicates
+    if name in self.operations_by_name:
+      return False
 
-  #
-  def filter(self, operation):
-    ''' Filtering operations based on various criteria'''
+    # Filter by name first, as rejecting a name is cheaper than computing shared memory usage
+    if not self.filter_name(name):
+      return False
 
     # filter based on compute capability
-    enabled = not (self.filter_by_cc)
+    if not self.filter_by_cc:
+      return True
 
     for cc in self.compute_capabilities:
 
@@ -635,49 +729,38 @@ class Manifest:
          cc <= operation.tile_description.maximum_compute_capability and \
          (cc not in SharedMemPerCC or SharedMemPerCC[cc] >= CalculateSmemUsage(operation)):
 
-        enabled = True
-        break
-
-    if not enabled:
-      return False
+        return True
 
-    if len(self.operations_enabled) and not operation.operation_kind in self.operations_enabled:
-      return False
+    return False
 
-    name = operation.procedural_name()
+  #
+  def filter_name(self, name):
+    ''' Filtering operations based on their procedural name'''
 
-    # eliminate duplicates
-    if name in self.operations_by_name.keys():
-      return False
+    enabled = True
 
     # Filter based on list of valid substrings
     if len(self.kernel_names):
-      enabled = False
-
       # compare against the include list
-      for name_substr in self.kernel_names:
-        if self._filter_string_matches(name_substr, name):
-          _LOGGER.debug(f"Kernel {name} included due to filter string '{name_substr}'.")
-          enabled = True
-          break
-        else:
-          _LOGGER.debug(f"Kernel {name} NOT included due to not matching '{name_substr}'.")
+      name_substr = self.kernel_names_filter.match(name)
+      enabled = name_substr is not None
+      if enabled:
+        _LOGGER.debug("Kernel %s included due to filter string '%s'.", name, name_substr)
+      else:
+        _LOGGER.debug("Kernel %s NOT included due to not matching any of %s.", name, self.kernel_names)
 
       # compare against the exclude list
-      for name_substr in self.ignore_kernel_names:
-        if self._filter_string_matches(name_substr, name):
-          _LOGGER.debug(f"Kernel {name} ignored due to filter string '{name_substr}'.")
-          enabled = False
-          break
-        else:
-          _LOGGER.debug(f"Kernel {name} NOT ignored due to not matching '{name_substr}'.")
+      name_substr = self.ignore_kernel_names_filter.match(name)
+      if name_substr is not None:
+        _LOGGER.debug("Kernel %s ignored due to filter string '%s'.", name, name_substr)
+        enabled = False
 
     if len(self.kernel_filter_list) > 0:
-      if self.filter_out_kernels(name, self.kernel_filter_list):
-        _LOGGER.debug(f"Kernel {name} matched via kernel filter file.")
+      if self.kernel_filter_list_filter.match(name) is not None:
+        _LOGGER.debug("Kernel %s matched via kernel filter file.", name)
         enabled = True
       else:
-        _LOGGER.debug(f"Kernel {name} culled due to no match in kernel filter file.")
+        _LOGGER.debug("Kernel %s culled due to no match in kernel filter file.", name)
         enabled = False
 
     # CUTLASS_LIBRARY_IGNORE_KERNELS ("ignore" list) only takes effect
@@ -685,13 +768,10 @@ class Manifest:
     # Changing that would break backwards compatibility.
     # Thus, CUTLASS has introduced the new CMake option CUTLASS_LIBRARY_EXCLUDE_KERNELS,
     # that always takes effect, whether or not CUTLASS_LIBRARY_KERNELS was specified.
-    for name_substr in self.exclude_kernel_names:
-      if self._filter_string_matches(name_substr, name):
-        _LOGGER.debug(f"Kernel {name} excluded due to filter string '{name_substr}'.")
-        enabled = False
-        break
-      else:
-        _LOGGER.debug(f"Kernel {name} NOT excluded due to not matching '{name_substr}'.")
+    name_substr = self.exclude_kernel_names_filter.match(name)
+    if name_substr is not None:
+      _LOGGER.debug("Kernel %s excluded due to filter string '%s'.", name, name_substr)
+      enabled = False
 
     # TODO: filter based on compute data type
     return enabled
@@ -705,35 +785,73 @@ class Manifest:
       operation_kind -> configuration_name -> []
     '''
 
-    if self.filter(operation):
+    name = operation.procedural_name()
+    if self.filter(operation, name):
+      self.insert(operation, name)
+    else:
+      _LOGGER.debug("Culled %s from manifest", name)
 
-      self.selected_kernels.append(operation.procedural_name())
+  #
+  def extend(self, operations):
+    '''
+      Inserts operations that were already selected by the filter of another manifest with the same
+      arguments (e.g., one populated in a worker process), skipping those already present.
+    '''
+    for operation in operations:
+      name = operation.procedural_name()
+      if name not in self.operations_by_name:
+        self.insert(operation, name)
 
-      self.operations_by_name[operation.procedural_name()] = operation
+  #
+  def insert(self, operation, name = None):
+    '''
+      Inserts an operation without filtering it.
+    '''
+    if name is None:
+      name = operation.procedural_name()
 
-      # add the configuration
-      configuration_name = operation.configuration_name()
+    self.selected_kernels.append(name)
 
-      # Split operations by minimum CC
-      min_cc = operation.arch
+    self.operations_by_name[name] = operation
 
-      if operation.operation_kind not in self.operations.keys():
-        self.operations[operation.operation_kind] = {}
+    # add the configuration
+    configuration_name = operation.configuration_name()
 
-      if min_cc not in self.operations[operation.operation_kind]:
-        self.operations[operation.operation_kind][min_cc] = {}
+    # Split operations by minimum CC
+    min_cc = operation.arch
 
-      if configuration_name not in self.operations[operation.operation_kind][min_cc].keys():
-        self.operations[operation.operation_kind][min_cc][configuration_name] = []
+    if operation.operation_kind not in self.operations.keys():
+      self.operations[operation.operation_kind] = {}
 
-      self.operations[operation.operation_kind][min_cc][configuration_name].append(operation)
-      self.operation_count += 1
-    else:
-      _LOGGER.debug("Culled {} from manifest".format(operation.procedural_name()))
+    if min_cc not in self.operations[operation.operation_kind]:
+      self.operations[operation.operation_kind][min_cc] = {}
+
+    if configuration_name not in self.operations[operation.operation_kind][min_cc].keys():
+      self.operations[operation.operation_kind][min_cc][configuration_name] = []
+
+    self.operations[operation.operation_kind][min_cc][configuration_name].append(operation)
+    self.operation_count += 1
   #
 
-  def emit_manifest_cmake(self, manifest_path, top_level_path, source_files):
-    with open(manifest_path, "w") as manifest_file:
+  #
+  def select_workload_operations(self):
+    '''
+      Removes all operations but those selected for the workloads of the workload file.
+    '''
+    selected = select_operations(self.operations_by_name, self.workloads, self.compute_capabilities,
+                                 self.workload_sm_count, self.workload_top_k)
+    _LOGGER.info(f"Selected {len(selected)} of {self.operation_count} kernels for {len(self.workloads)} workloads.")
+
+    operations = [(name, operation) for name, operation in self.operations_by_name.items() if name in selected]
+    self.operations = {}
+    self.operations_by_name = {}
+    self.selected_kernels = []
+    self.operation_count = 0
+    for name, operation in operations:
+      self.insert(operation, name)
+
+  def emit_manifest_cmake(self, manifest_path, top_level_path, source_files, shard_files = None):
+    with GeneratedFile(manifest_path) as manifest_file:
 
       target_text = SubstituteTemplate("""cutlass_target_sources(cutlass_library_objs PRIVATE
       """, { })
@@ -746,23 +864,56 @@ class Manifest:
         manifest_file.write(f"    {all_kind_file}\n")
       manifest_file.write(')\n\n')
 
-      for kind in self.operations.keys():
-        for min_cc in sorted(self.operations[kind].keys()):
-          for subclass in sorted(source_files[kind][min_cc].keys()):
-            target_text = SubstituteTemplate("""cutlass_add_cutlass_library(
+      if shard_files is not None:
+        # One library per group of operation kinds sharing shards, built from the top-level files of their
+        # subclasses and their shards. Shards are already balanced, so they are not batched further into
+        # unity sources.
+        for kinds in shard_files.keys():
+          target_text = SubstituteTemplate("""cutlass_add_cutlass_library(
+      SUFFIX ${kinds}
+      BATCH_SOURCES OFF
+""", { 'kinds': '_'.join(OperationKindNames[kind] for kind in kinds) })
+          manifest_file.write(target_text + '\n\n')
+
+          for kind in kinds:
+            for min_cc in sorted(self.operations[kind].keys()):
+              for subclass in sorted(source_files[kind][min_cc].keys()):
+                manifest_file.write("    %s\n" % str(source_files[kind][min_cc][subclass][0].replace('\\', '/')))
+
+          for shard_file in shard_files[kinds]:
+            manifest_file.write("    %s\n" % str(shard_file.replace('\\', '/')))
+
+          manifest_file.write(")\n")
+
+        if self.disable_full_archs_compilation:
+          self.emit_disable_full_archs_compilation(manifest_file,
+            {shard_file: configurations for shards in shard_files.values() for shard_file, configurations in shards.items()})
+      else:
+        for kind in self.operations.keys():
+          for min_cc in sorted(self.operations[kind].keys()):
+            for subclass in sorted(source_files[kind][min_cc].keys()):
+              target_text = SubstituteTemplate("""cutlass_add_cutlass_library(
       SUFFIX ${kind}_sm${min_cc}_${subclass}
 """, { 'min_cc': str(min_cc), 'kind': OperationKindNames[kind], 'subclass': subclass })
-            manifest_file.write(target_text + '\n\n')
+              manifest_file.write(target_text + '\n\n')
 
-            for source_file in source_files[kind][min_cc][subclass]:
-              manifest_file.write("    %s\n" % str(source_file.replace('\\', '/')))
+              for source_file in source_files[kind][min_cc][subclass]:
+                manifest_file.write("    %s\n" % str(source_file.replace('\\', '/')))
 
-            manifest_file.write(")\n")
+              manifest_file.write(")\n")
 
-          if self.disable_full_archs_compilation:
-            self.emit_disable_full_archs_compilation(manifest_file, source_files)
+        if self.disable_full_archs_compilation:
+          # The first source of each subclass is its top-level file, which is compiled for all architectures
+          self.emit_disable_full_archs_compilation(manifest_file,
+            {source_file: [source_file] for kind in self.operations.keys() for min_cc in sorted(self.operations[kind].keys())
+             for subclass in sorted(source_files[kind][min_cc].keys()) for source_file in source_files[kind][min_cc][subclass][1:]})
 
-  def emit_disable_full_archs_compilation(manifest_file, source_files):
+  def emit_disable_full_archs_compilation(self, manifest_file, source_files):
+      '''
+        Restricts the architectures for which each source is compiled to those targeted by its instructions.
+        source_files maps each source to the names of the configurations it contains, from which its
+        instructions are inferred, so that a shard is compiled for the architectures of all its configurations.
+      '''
       def for_hopper(name):
           pass
 
@@ -794,20 +945,23 @@ class Manifest:
           else:
               return " ".join(map(str, intersected_archs))
 
-      for min_cc in sorted(source_files.keys()):
-        for source_file in source_files[min_cc]:
-            if is_cpp(source_file):
-                continue # skip because source is cpp
-            elif for_ampere(source_file):
-                archs_str = get_src_archs_str_given_requested_cuda_archs({80, 87, 90}, source_file)
-            elif for_turing(source_file):
-                archs_str = get_src_archs_str_given_requested_cuda_archs({75}, source_file)
-            elif for_volta(source_file):
-                archs_str = get_src_archs_str_given_requested_cuda_archs({70, 72}, source_file)
-            else:
-                raise RuntimeError("Per file archs are not set {}, as there is no rule specified for this file pattern".format(source_file))
-
-            manifest_file.write("cutlass_apply_cuda_gencode_flags({} SM_ARCHS {})\n".format(str(source_file.replace('\\', '/')), archs_str))
+      def get_archs(name):
+          if for_ampere(name):
+              return {80, 87, 90}
+          elif for_turing(name):
+              return {75}
+          elif for_volta(name):
+              return {70, 72}
+          else:
+              raise RuntimeError("Per file archs are not set {}, as there is no rule specified for this file pattern".format(name))
+
+      for source_file, configurations in source_files.items():
+          if is_cpp(source_file):
+              continue # skip because source is cpp
+          archs = set().union(*(get_archs(name) for name in configurations))
+          archs_str = get_src_archs_str_given_requested_cuda_archs(archs, source_file)
+
+          manifest_file.write("cutlass_apply_cuda_gencode_flags({} SM_ARCHS {})\n".format(str(source_file.replace('\\', '/')), archs_str))
 
   #
   def emit(self, target = GeneratorTarget.Library):
@@ -827,12 +981,31 @@ class Manifest:
 
     generated_path = os.path.join(self.curr_build_dir, 'generated')
 
-    # create generated/
-    if os.path.exists(generated_path):
-      shutil.rmtree(generated_path)
+    if self.workloads:
+      self.select_workload_operations()
 
-    os.mkdir(generated_path)
+    # Files are regenerated in place. Only those whose contents change are rewritten, and files
+    # not emitted by this generation are removed afterward.
+    os.makedirs(generated_path, exist_ok=True)
+    GeneratedFile.emitted = set()
+    executor = None
+    try:
+      # Configuration files, which make up nearly all of the emitted code, are rendered across processes.
+      # All other files are emitted by this process in a fixed order, so the output does not depend on
+      # the number of processes used.
+      if self.jobs > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.jobs)
+      self.emit_files(target, generated_path, operation_emitters, kind_emitters, interface_emitters, executor)
+      emitted = GeneratedFile.emitted
+    finally:
+      GeneratedFile.emitted = None
+      if executor is not None:
+        executor.shutdown()
+
+    self.remove_stale_files(generated_path, emitted)
 
+  #
+  def emit_files(self, target, generated_path, operation_emitters, kind_emitters, interface_emitters, executor = None):
     with interface_emitters[target](generated_path, self.operation_count, self.args) as iface_emitter:
       top_level_path = iface_emitter.top_level_path
       for operation_kind in self.operations.keys():
@@ -844,9 +1017,11 @@ class Manifest:
       for min_cc in self.operations[kind].keys():
         source_files[kind][min_cc] = {}
 
+    configuration_paths = {}
     for operation_kind, ops in self.operations.items():
+      configuration_paths[operation_kind] = {}
       for min_cc, configurations in sorted(ops.items()):
-        with operation_emitters[target](generated_path, min_cc, operation_kind, self.args) as operation_kind_emitter:
+        with operation_emitters[target](generated_path, min_cc, operation_kind, self.args, executor) as operation_kind_emitter:
           for configuration_name, operations in configurations.items():
             _LOGGER.info(f"Emitting {configuration_name} with {len(operations)} operation{'' if len(operations) == 1 else 's'}.")
             operation_kind_emitter.emit(configuration_name, operations)
@@ -855,14 +1030,87 @@ class Manifest:
             if subclass not in source_files[operation_kind][min_cc]:
               source_files[operation_kind][min_cc][subclass] = []
             source_files[operation_kind][min_cc][subclass].extend(operation_kind_emitter.source_files[subclass])
+          configuration_paths[operation_kind].update(operation_kind_emitter.configuration_paths)
 
       # Emit top level all_{gemm, conv2d, ...}_operations.cu files
       with kind_emitters[target](generated_path, operation_kind, self.args) as operation_kind_emitter:
         operation_kind_emitter.emit(ops)
 
+    shard_files = None
+    if self.shards > 0:
+      shard_files = self.emit_shards(generated_path, configuration_paths)
+
     # write the manifest.cmake file containing paths from all targets
     manifest_path = os.path.join(generated_path, "manifest.cmake")
 
-    self.emit_manifest_cmake(manifest_path, top_level_path, source_files)
+    self.emit_manifest_cmake(manifest_path, top_level_path, source_files, shard_files)
+
+  #
+  def emit_shards(self, generated_path, configuration_paths):
+    '''
+      Emits shard sources, each of which includes the sources of configurations of one group of operation
+      kinds, such that the shards are of balanced compile cost. Kinds are grouped only when there are more
+      kinds than shards. Returns a dictionary mapping tuples of operation kinds to dictionaries mapping
+      the paths of their shards to the names of the configurations each includes.
+    '''
+    shard_dir = os.path.join(generated_path, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+
+    timings = read_compile_timings(self.compile_timings) if self.compile_timings else None
+
+    # Costs of all kinds are computed together, so that estimates are calibrated to the same scale
+    configurations = {}
+    for ops in self.operations.values():
+      for min_cc_configurations in ops.values():
+        configurations.update(min_cc_configurations)
+    costs = compile_costs(configurations, timings, shard_dir)
+
+    kind_costs = {}
+    for kind, ops in self.operations.items():
+      kind_costs[kind] = {name: costs[name] for min_cc_configurations in ops.values() for name in min_cc_configurations}
+
+    shard_counts = allocate_shards({kind: sum(costs.values()) for kind, costs in kind_costs.items()}, self.shards)
+
+    shard_files = {}
+    for kinds, shard_count in shard_counts.items():
+      kinds_str = '_'.join(OperationKindNames[kind] for kind in kinds)
+      costs = {name: cost for kind in kinds for name, cost in kind_costs[kind].items()}
+      paths = {name: path for kind in kinds for name, path in configuration_paths[kind].items()}
+      shard_files[kinds] = {}
+      shards = shard_configurations(costs, shard_count)
+      for idx, shard in enumerate(shards):
+        shard_path = os.path.join(shard_dir, f"{kinds_str}_shard_{idx}.cu")
+        with GeneratedFile(shard_path) as shard_file:
+          shard_file.write("""
+/*
+ Generated by manifest.py - Do not edit.
+*/
+
+""")
+          for configuration_name in shard:
+            include_path = os.path.relpath(paths[configuration_name], shard_dir)
+            shard_file.write("#include \"%s\"\n" % include_path.replace('\\', '/'))
+        shard_files[kinds][shard_path] = shard
+
+      costs_per_shard = [sum(costs[name] for name in shard) for shard in shards]
+      _LOGGER.info(f"Sharded {len(costs)} {', '.join(OperationKindNames[kind] for kind in kinds)} configurations into {len(costs_per_shard)} "
+                   f"translation units of cost {min(costs_per_shard):.1f} to {max(costs_per_shard):.1f}.")
+
+    return shard_files
+
+  #
+  def remove_stale_files(self, generated_path, emitted):
+    """
+    Removes files under generated_path that are not in the set of emitted paths, along with any
+    directories left empty, so that sources of kernels no longer selected are not compiled.
+    """
+    for dirpath, dirnames, filenames in os.walk(generated_path, topdown=False):
+      for filename in filenames:
+        path = os.path.abspath(os.path.join(dirpath, filename))
+        if path not in emitted:
+          _LOGGER.debug(f"Removing stale generated file {path}")
+          os.remove(path)
+      if dirpath != generated_path and not os.listdir(dirpath):
+        os.rmdir(dirpath)
 
 ###################################################################################################
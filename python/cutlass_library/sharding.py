@@ -0,0 +1,262 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Utilities for sharding the generated configuration sources of the CUTLASS library into
+translation units of balanced compile cost
+"""
+
+import heapq
+import json
+import logging
+import os.path
+import re
+
+try:
+  import builtins
+  if hasattr(builtins, "CUTLASS_IGNORE_PACKAGE") and CUTLASS_IGNORE_PACKAGE == True:
+    raise ImportError("Disabling attempt to import cutlass_library")
+  from cutlass_library.library import *
+except ImportError:
+  from library import *
+
+_LOGGER = logging.getLogger(__name__)
+
+###################################################################################################
+
+# Relative compile cost of an operation, scaled by the factors below. Units are arbitrary: estimates
+# are only compared with each other, or calibrated against recorded timings.
+_BASE_COMPILE_COST = 1.0
+
+# Kernels built on the 3.x API (CuTe collectives, TMA, warp specialization) take far longer to compile
+_3X_COMPILE_COST_FACTOR = 6.0
+
+_OPCODE_CLASS_COMPILE_COST_FACTORS = {
+  OpcodeClass.Simt: 0.5,
+  OpcodeClass.TensorOp: 1.0,
+  OpcodeClass.WmmaTensorOp: 1.0,
+  OpcodeClass.SparseTensorOp: 1.5,
+  OpcodeClass.BlockScaledTensorOp: 1.5,
+}
+
+# Matches the objects of configuration and shard sources in a .ninja_log
+_NINJA_OUTPUT = re.compile(r"([^/\\]+)\.(cu|cpp)\.(o|obj)$")
+
+#
+def estimate_compile_cost(operation):
+  """
+  Estimates the relative cost of compiling an operation from its attributes
+
+  :param operation: operation emitted by the generator (e.g., GemmOperation, Conv2dOperation)
+
+  :return: relative compile cost
+  :rtype: float
+  """
+  cost = _BASE_COMPILE_COST
+  if getattr(operation, "is_3x", False) or operation.arch >= 90:
+    cost *= _3X_COMPILE_COST_FACTOR
+
+  tile_description = operation.tile_description
+  math_instruction = getattr(tile_description, "math_instruction", None)
+  if math_instruction is not None:
+    cost *= _OPCODE_CLASS_COMPILE_COST_FACTORS.get(math_instruction.opcode_class, 1.0)
+
+  # Larger tiles unroll more of the mainloop and epilogue
+  threadblock_shape = getattr(tile_description, "threadblock_shape", None)
+  if threadblock_shape:
+    cost *= max((threadblock_shape[0] * threadblock_shape[1] * max(threadblock_shape[2], 1)) / (128 * 128 * 32), 0.25) ** 0.5
+
+  # Explicit multistage pipelines unroll each stage
+  stages = getattr(tile_description, "stages", 0)
+  if stages and stages > 2:
+    cost *= 1.0 + 0.1 * (stages - 2)
+
+  kernel_schedule = getattr(operation, "kernel_schedule", None)
+  if kernel_schedule is not None and "WarpSpecialized" in kernel_schedule.name:
+    cost *= 1.5
+  if getattr(operation, "tile_scheduler", None) == TileSchedulerType.StreamK:
+    cost *= 1.25
+  if getattr(operation, "mixed_input_mode", None) is not None:
+    cost *= 1.5
+
+  # Convolutions instantiate activation and filter iterators in addition to the GEMM mainloop
+  if operation.operation_kind in (OperationKind.Conv2d, OperationKind.Conv3d):
+    cost *= 1.5
+
+  return cost
+
+#
+def read_compile_timings(path):
+  """
+  Reads recorded compile times of configuration sources. The file is either a ``.ninja_log`` from a
+  previous build, or a JSON object mapping configuration names (or names of shard sources) to seconds.
+
+  :param path: path of the file of recorded timings
+  :type path: str
+
+  :return: dictionary mapping source names (file names without extension) to seconds
+  :rtype: dict
+  """
+  with open(path, "r") as timings_file:
+    text = timings_file.read()
+
+  if not text.startswith("# ninja log"):
+    return {str(name): float(seconds) for name, seconds in json.loads(text).items()}
+
+  timings = {}
+  for line in text.splitlines()[1:]:
+    fields = line.split("\t")
+    if len(fields) < 4:
+      continue
+    match = _NINJA_OUTPUT.search(fields[3])
+    if match is not None:
+      # Later entries record more recent builds of the same output
+      timings[match.group(1)] = (int(fields[1]) - int(fields[0])) / 1000.0
+  return timings
+
+#
+def read_shard_configurations(shard_path):
+  """
+  Returns the names of the configurations included by a shard source emitted by a previous generation
+
+  :param shard_path: path of the shard source
+  :type shard_path: str
+
+  :return: list of configuration names
+  :rtype: list
+  """
+  if not os.path.isfile(shard_path):
+    return []
+  with open(shard_path, "r") as shard_file:
+    return [os.path.splitext(os.path.basename(include))[0] for include in re.findall(r'#include "([^"]+)"', shard_file.read())]
+
+#
+def compile_costs(configurations, timings = None, shard_dir = None):
+  """
+  Returns the compile cost of each configuration. Recorded timings take precedence over estimates.
+  Estimates are scaled by the ratio of recorded to estimated cost of the configurations that have
+  timings, so that both are in seconds. The recorded time of a shard from a previous sharded build is
+  divided among the configurations it included, in proportion to their estimates.
+
+  :param configurations: dictionary mapping configuration names to lists of operations
+  :type configurations: dict
+  :param timings: dictionary mapping source names to recorded seconds
+  :type timings: dict
+  :param shard_dir: directory containing the shard sources of a previous generation
+  :type shard_dir: str
+
+  :return: dictionary mapping configuration names to costs
+  :rtype: dict
+  """
+  estimates = {name: sum(estimate_compile_cost(operation) for operation in operations)
+               for name, operations in configurations.items()}
+  if not timings:
+    return estimates
+
+  recorded = {name: timings[name] for name in configurations if name in timings}
+  if shard_dir is not None:
+    for shard_name, seconds in timings.items():
+      included = [name for name in read_shard_configurations(os.path.join(shard_dir, f"{shard_name}.cu"))
+                  if name in estimates and name not in recorded]
+      total = sum(estimates[name] for name in included)
+      for name in included:
+        recorded[name] = seconds * estimates[name] / total
+
+  if not recorded:
+    return estimates
+
+  scale = sum(recorded.values()) / sum(estimates[name] for name in recorded)
+  _LOGGER.info(f"Using recorded compile times of {len(recorded)} of {len(estimates)} configurations.")
+  return {name: recorded[name] if name in recorded else estimate * scale for name, estimate in estimates.items()}
+
+#
+def shard_configurations(costs, shard_count):
+  """
+  Partitions configurations into at most ``shard_count`` shards of balanced total cost. Configurations
+  are assigned in order of decreasing cost to the shard of least total cost (longest processing time
+  first), so that no shard exceeds the optimal makespan by more than a third.
+
+  :param costs: dictionary mapping configuration names to costs
+  :type costs: dict
+  :param shard_count: number of shards
+  :type shard_count: int
+
+  :return: list of shards, each a list of configuration names sorted by name
+  :rtype: list
+  """
+  shard_count = max(min(shard_count, len(costs)), 1)
+  shards = [[] for _ in range(shard_count)]
+  loads = [(0.0, idx) for idx in range(shard_count)]
+
+  # Ties are broken by name, so that shards are stable across generations of the same kernels
+  for name in sorted(costs, key=lambda name: (-costs[name], name)):
+    load, idx = heapq.heappop(loads)
+    shards[idx].append(name)
+    heapq.heappush(loads, (load + costs[name], idx))
+
+  return [sorted(shard) for shard in shards]
+
+#
+def allocate_shards(kind_costs, shard_count):
+  """
+  Divides ``shard_count`` shards among operation kinds, giving each further shard to the group of kinds
+  with the greatest cost per shard. Shards do not mix operation kinds unless there are more kinds than
+  shards, in which case the cheapest kinds are merged into groups that share their shards, so that no
+  more than ``shard_count`` shards are emitted.
+
+  :param kind_costs: dictionary mapping operation kinds to their total costs
+  :type kind_costs: dict
+  :param shard_count: total number of shards
+  :type shard_count: int
+
+  :return: dictionary mapping tuples of operation kinds, in the order of ``kind_costs``, to numbers of shards
+  :rtype: dict
+  """
+  order = list(kind_costs.keys())
+  groups = [((kind,), cost) for kind, cost in kind_costs.items()]
+  while len(groups) > max(shard_count, 1):
+    groups.sort(key=lambda group: group[1])
+    (first_kinds, first_cost), (second_kinds, second_cost) = groups[:2]
+    groups = groups[2:] + [(tuple(sorted(first_kinds + second_kinds, key=order.index)), first_cost + second_cost)]
+  groups.sort(key=lambda group: order.index(group[0][0]))
+
+  counts = {kinds: 1 for kinds, _ in groups}
+  loads = [(-cost, idx) for idx, (_, cost) in enumerate(groups)]
+  heapq.heapify(loads)
+  for _ in range(shard_count - len(groups)):
+    _, idx = heapq.heappop(loads)
+    kinds, cost = groups[idx]
+    counts[kinds] += 1
+    heapq.heappush(loads, (-cost / counts[kinds], idx))
+  return counts
+
+###################################################################################################
@@ -103,6 +103,10 @@ def get_pruning_level_from_global_level(global_level: int):
     return (global_level // 1000) % 10
 
 
+# Lowest global instantiation level at which no schedules are pruned
+UNPRUNED_INSTANTIATION_LEVEL = 1000
+
+
 #### Step 1: generate MMA instruction shapes based on levels
 
 try:
@@ -663,6 +667,19 @@ def get_valid_schedules(tile_description, cuda_version, is_aligned, data_types,
     return schedules, stream_k_schedules
 
 
+def is_valid_schedule(tile_description, cuda_version, is_aligned, data_types, layout,
+                      kernel_schedule, epilogue_schedule, tile_scheduler=TileSchedulerType.Default,
+                      enable_fp8_fast_acc=True, gemm_kind=GemmKind.Universal3x):
+    # Checks one combination of schedules against the rules of get_valid_schedules, without
+    # the pruning used to limit the number of kernels the generator stamps out
+    schedules, stream_k_schedules = get_valid_schedules(
+        tile_description, cuda_version, is_aligned, data_types, layout,
+        UNPRUNED_INSTANTIATION_LEVEL, enable_fp8_fast_acc, gemm_kind)
+    if tile_scheduler == TileSchedulerType.StreamK:
+        schedules = stream_k_schedules
+    return [kernel_schedule, epilogue_schedule] in schedules
+
+
 #### Misc: helpers
 
 def generate_data_types_from_math_instruction(math_instruction, element_source = None, element_dest = None, element_epilogue = None):
@@ -394,7 +394,7 @@ void initialize_${configuration_name}(Manifest &manifest) {
 """
 
   def __enter__(self):
-    self.configuration_file = open(self.configuration_path, "w")
+    self.configuration_file = GeneratedFile(self.configuration_path)
     self.configuration_file.write(self.header_template)
 
     self.instance_definitions = []
@@ -0,0 +1,411 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Utilities for selecting the kernels to instantiate for the problem shapes of an application's workload
+"""
+
+import csv
+import heapq
+import json
+import logging
+import math
+
+try:
+  import builtins
+  if hasattr(builtins, "CUTLASS_IGNORE_PACKAGE") and CUTLASS_IGNORE_PACKAGE == True:
+    raise ImportError("Disabling attempt to import cutlass_library")
+  from cutlass_library.library import *
+except ImportError:
+  from library import *
+
+_LOGGER = logging.getLogger(__name__)
+
+###################################################################################################
+
+# Number of SMs of the flagship GPU of each compute capability, used when no SM count is given
+SmCountPerCC = {
+  70: 80,
+  72: 8,
+  75: 68,
+  80: 108,
+  86: 84,
+  87: 16,
+  89: 128,
+  90: 132,
+  100: 148,
+}
+
+# Multiply-adds per clock per SM of 16-bit operands by opcode class on SM70. Throughput scales inversely
+# with operand width for tensor operations, and doubles on SM80 and again with the warpgroup MMAs of SM90.
+_MATH_RATE = {
+  OpcodeClass.Simt: 64,
+  OpcodeClass.TensorOp: 512,
+  OpcodeClass.WmmaTensorOp: 512,
+  OpcodeClass.SparseTensorOp: 1024,
+  OpcodeClass.BlockScaledTensorOp: 512,
+}
+
+# Bytes per clock per SM at which operands are loaded from L2
+_BANDWIDTH_RATE = 32
+
+# Warps resident per SM
+_MAX_WARPS_PER_SM = 64
+
+_GEMM_KINDS = (GemmKind.Gemm, GemmKind.Universal, GemmKind.Universal3x)
+
+# Math operations trading accuracy for throughput, which only workloads that allow it select
+_REDUCED_PRECISION_MATH = (
+  MathOperation.multiply_add_fast_bf16,
+  MathOperation.multiply_add_fast_f16,
+  MathOperation.multiply_add_fast_f32,
+  MathOperation.multiply_add_complex_fast_f32,
+  MathOperation.multiply_add_fast_accum,
+)
+
+_DATA_TYPES_BY_NAME = {name: data_type for data_type, name in DataTypeNames.items()}
+
+_CONV_KINDS_BY_NAME = {name: conv_kind for conv_kind, name in ConvKindNames.items()}
+
+###################################################################################################
+
+#
+class Workload:
+  """
+  Problem shape that an application runs, as read from a workload file. Convolutions are described by
+  the shape of their implicit GEMM.
+  """
+  def __init__(self, kind, m, n, k, batch = 1, element_a = None, element_b = None, element_c = None,
+               layout = None, conv_kind = None, channels = None, frequency = 1.0, fast_math = False,
+               description = ""):
+    self.kind = kind
+    self.m = m
+    self.n = n
+    self.k = k
+    self.batch = batch
+    self.element_a = element_a
+    self.element_b = element_b
+    self.element_c = element_c
+    self.layout = layout
+    self.conv_kind = conv_kind
+    # Input and output channels (c, k) of a convolution, to which operand alignments apply
+    self.channels = channels
+    self.frequency = frequency
+    # Whether math operations of reduced precision may run this workload
+    self.fast_math = fast_math
+    self.description = description
+
+  @staticmethod
+  def from_record(record):
+    """
+    Creates a workload from a record of a workload file. Records have the fields
+
+      kind: "gemm" (default), "conv2d" or "conv3d"
+      m, n, k, batch: GEMM problem size
+      conv_kind: "fprop" (default), "dgrad" or "wgrad"
+      n, h, w, c, k, r, s (and d, t for conv3d): convolution problem size
+      pad_h, pad_w, pad_d, stride_h, stride_w, stride_d, dilation_h, dilation_w, dilation_d
+      a_type, b_type, c_type: data types (e.g., "f16", "bf16", "f32"), matching any if omitted
+      layout: layouts of A, B and optionally C in the short form of kernel names (e.g., "tn", "ntn")
+      math: "exact" (default) or "fast" to also consider math operations of reduced precision
+      frequency: relative number of calls (default 1)
+
+    :param record: dictionary of fields, whose values may be strings
+    :type record: dict
+
+    :return: workload
+    :rtype: Workload
+    """
+    record = {key.strip(): value for key, value in record.items() if value is not None and str(value).strip() != ""}
+
+    def integer(key, default = None):
+      if key not in record:
+        if default is None:
+          raise Exception(f"Workload record {record} has no field '{key}'")
+        return default
+      return int(record[key])
+
+    def data_type(key):
+      if key not in record:
+        return None
+      name = str(record[key]).strip()
+      if name not in _DATA_TYPES_BY_NAME:
+        raise Exception(f"Unknown data type '{name}' in workload record {record}")
+      return _DATA_TYPES_BY_NAME[name]
+
+    kind = str(record.get("kind", "gemm")).strip().lower()
+    math_name = str(record.get("math", "exact")).strip().lower()
+    if math_name not in ("exact", "fast"):
+      raise Exception(f"Unknown math '{math_name}' in workload record {record}")
+    elements = {
+      "element_a": data_type("a_type"),
+      "element_b": data_type("b_type"),
+      "element_c": data_type("c_type"),
+      "frequency": float(record.get("frequency", 1.0)),
+      "fast_math": math_name == "fast",
+      "description": ",".join(f"{key}={value}" for key, value in record.items() if key != "frequency"),
+    }
+
+    if kind == "gemm":
+      return Workload(OperationKind.Gemm, integer("m"), integer("n"), integer("k"), integer("batch", 1),
+                      layout = str(record["layout"]).strip() if "layout" in record else None, **elements)
+
+    if kind not in ("conv2d", "conv3d"):
+      raise Exception(f"Unknown kind '{kind}' in workload record {record}")
+
+    conv_kind_name = str(record.get("conv_kind", "fprop")).strip().lower()
+    if conv_kind_name not in _CONV_KINDS_BY_NAME:
+      raise Exception(f"Unknown conv_kind '{conv_kind_name}' in workload record {record}")
+    conv_kind = _CONV_KINDS_BY_NAME[conv_kind_name]
+
+    # Output extent of each spatial dimension (depth is 1 for conv2d)
+    n, c, k = integer("n"), integer("c"), integer("k")
+    inputs, filters, outputs = 1, 1, 1
+    for extent, filter_extent, suffix in (("h", "r", "h"), ("w", "s", "w"), ("d", "t", "d")):
+      if kind == "conv2d" and suffix == "d":
+        continue
+      size, filter_size = integer(extent), integer(filter_extent)
+      pad, stride, dilation = integer(f"pad_{suffix}", 0), integer(f"stride_{suffix}", 1), integer(f"dilation_{suffix}", 1)
+      inputs *= size
+      filters *= filter_size
+      outputs *= (size + 2 * pad - dilation * (filter_size - 1) - 1) // stride + 1
+
+    if conv_kind == ConvKind.Fprop:
+      m, gemm_n, gemm_k = n * outputs, k, c * filters
+    elif conv_kind == ConvKind.Dgrad:
+      m, gemm_n, gemm_k = n * inputs, c, k * filters
+    else:
+      m, gemm_n, gemm_k = k, c * filters, n * outputs
+
+    operation_kind = OperationKind.Conv2d if kind == "conv2d" else OperationKind.Conv3d
+    return Workload(operation_kind, m, gemm_n, gemm_k, conv_kind = conv_kind, channels = (c, k), **elements)
+
+  #
+  def supports(self, operation):
+    """
+    Returns whether ``operation`` can run this workload: its kind, data types, layouts and alignments match
+
+    :param operation: operation emitted by the generator
+
+    :return: whether the operation can run the workload
+    :rtype: bool
+    """
+    if operation.operation_kind != self.kind:
+      return False
+
+    if not self.fast_math and operation.tile_description.math_instruction.math_operation in _REDUCED_PRECISION_MATH:
+      return False
+
+    for element, tensor in ((self.element_a, operation.A), (self.element_b, operation.B), (self.element_c, operation.C)):
+      if element is not None and tensor.element != element:
+        return False
+
+    if self.kind == OperationKind.Gemm:
+      if operation.gemm_kind not in _GEMM_KINDS:
+        return False
+
+      tensors = (operation.A, operation.B, operation.C)
+      if self.layout is not None and self.layout != "".join(ShortLayoutTypeNames[tensor.layout] for tensor in tensors)[:len(self.layout)]:
+        return False
+
+      # Extent of the contiguous dimension of each operand
+      contiguous = {
+        (0, LayoutType.RowMajor): self.k, (0, LayoutType.ColumnMajor): self.m,
+        (1, LayoutType.RowMajor): self.n, (1, LayoutType.ColumnMajor): self.k,
+        (2, LayoutType.RowMajor): self.n, (2, LayoutType.ColumnMajor): self.m,
+      }
+      for idx, tensor in enumerate(tensors):
+        extent = contiguous.get((idx, tensor.layout))
+        if extent is None or extent % tensor.alignment != 0:
+          return False
+      return True
+
+    if operation.conv_kind != self.conv_kind or getattr(operation, "group_mode", GroupMode.NoneGroup) != GroupMode.NoneGroup:
+      return False
+
+    # Channels contiguous in each operand of the convolution
+    c, k = self.channels
+    contiguous = {
+      ConvKind.Fprop: (c, c, k),
+      ConvKind.Dgrad: (k, c, c),
+      ConvKind.Wgrad: (k, c, c),
+    }[self.conv_kind]
+    for extent, tensor in zip(contiguous, (operation.A, operation.B, operation.C)):
+      if extent % tensor.alignment != 0:
+        return False
+
+    iterator_algorithm = getattr(operation, "iterator_algorithm", None)
+    if iterator_algorithm == IteratorAlgorithm.FixedChannels and c != operation.A.alignment:
+      return False
+    return iterator_algorithm not in (IteratorAlgorithm.FewChannels, IteratorAlgorithm.FixedStrideDilation)
+
+#
+def read_workloads(path):
+  """
+  Reads the workloads of a CSV file with a header row, or of a JSON file holding a list of records
+  (see ``Workload.from_record`` for their fields)
+
+  :param path: path of the workload file
+  :type path: str
+
+  :return: list of workloads
+  :rtype: list
+  """
+  with open(path, "r", newline="") as workload_file:
+    if path.endswith(".json"):
+      records = json.load(workload_file)
+      if isinstance(records, dict):
+        records = records["workloads"]
+    else:
+      records = [record for record in csv.DictReader(line for line in workload_file if not line.startswith("#"))]
+
+  workloads = [Workload.from_record(record) for record in records]
+  return [workload for workload in workloads if workload.frequency > 0]
+
+#
+def estimate_runtime(operation, workload, sm_count, cc, split_k = 1):
+  """
+  Estimates the runtime, in SM clocks, of ``operation`` on ``workload`` on a GPU of compute capability ``cc``
+  with ``sm_count`` SMs, with the K dimension split into ``split_k`` serially reduced slices. The model accounts for
+
+    - tile efficiency: work padded to whole threadblock tiles in M, N and K,
+    - wave quantization: threadblock tiles run in waves of ``sm_count`` times the occupancy, except with
+      a stream-K tile scheduler, which divides the work evenly across SMs,
+    - occupancy: threadblocks per SM as bounded by shared memory (``CalculateSmemUsage``) and warps,
+    - each mainloop iteration being bound either by math or by loading operand tiles, with accesses
+      narrower than 128 bits (by operand alignment) loading less per clock,
+    - each split-K slice but the first reading and writing the partial sums of its tile, which pass
+      through the output in its data type.
+
+  :param operation: operation emitted by the generator
+  :param workload: workload, which the operation supports
+  :type workload: Workload
+  :param sm_count: number of SMs
+  :type sm_count: int
+  :param cc: compute capability on which the operation runs
+  :type cc: int
+  :param split_k: number of slices into which the K dimension is split
+  :type split_k: int
+
+  :return: estimated runtime
+  :rtype: float
+  """
+  tile_description = operation.tile_description
+  tile_m, tile_n, tile_k = tile_description.threadblock_shape[:3]
+  tiles = math.ceil(workload.m / tile_m) * math.ceil(workload.n / tile_n) * workload.batch * split_k
+  k_iterations = math.ceil(math.ceil(workload.k / split_k) / tile_k)
+
+  occupancy = 1
+  warps = max(math.prod(tile_description.warp_count), 1)
+  if tile_description.stages > 0:
+    smem = max(CalculateSmemUsage(operation), 1)
+    occupancy = max(min(SharedMemPerCC.get(cc, 48) // smem, _MAX_WARPS_PER_SM // warps), 1)
+
+  math_instruction = tile_description.math_instruction
+  math_rate = _MATH_RATE.get(math_instruction.opcode_class, _MATH_RATE[OpcodeClass.Simt])
+  if math_instruction.opcode_class != OpcodeClass.Simt:
+    math_rate = math_rate * 16 / DataTypeSize[operation.A.element]
+    if cc >= 80:
+      math_rate *= 2
+    if getattr(operation, "is_3x", False) and cc >= 90:
+      math_rate *= 2
+
+  # Accesses narrower than 128 bits use a proportionally smaller part of the available bandwidth.
+  # Void operands (e.g., a C that is not read) are not accessed.
+  def bytes_per_element(tensor):
+    bits = DataTypeSize[tensor.element]
+    if bits == 0:
+      return 0
+    return bits / 8 * max(128 / (bits * tensor.alignment), 1)
+
+  bytes_a = bytes_per_element(operation.A)
+  bytes_b = bytes_per_element(operation.B)
+  # The epilogue reads C and writes D, which is of the type of C unless given
+  output = getattr(operation, "D", None) or operation.C
+  bytes_c = bytes_per_element(operation.C) + bytes_per_element(output)
+  iteration = max(tile_m * tile_n * tile_k / math_rate, (tile_m * bytes_a + tile_n * bytes_b) * tile_k / _BANDWIDTH_RATE)
+  tile_time = k_iterations * iteration + tile_m * tile_n * bytes_c / _BANDWIDTH_RATE
+  if split_k > 1:
+    bytes_partial = DataTypeSize[output.element] / 8
+    tile_time += 2 * tile_m * tile_n * bytes_partial * (split_k - 1) / split_k / _BANDWIDTH_RATE
+
+  # Threadblocks resident on the same SM share its throughput
+  slots = sm_count * occupancy
+  if getattr(operation, "tile_scheduler", None) == TileSchedulerType.StreamK:
+    waves = max(tiles / slots, 1 / occupancy) * 1.05
+  else:
+    waves = math.ceil(tiles / slots)
+  return waves * occupancy * tile_time
+
+#
+def select_operations(operations, workloads, compute_capabilities, sm_count = None, top_k = 3):
+  """
+  Selects the ``top_k`` operations of least estimated runtime for each workload
+
+  :param operations: dictionary mapping procedural names to operations
+  :type operations: dict
+  :param workloads: workloads to cover
+  :type workloads: list
+  :param compute_capabilities: compute capabilities targeted by the build
+  :type compute_capabilities: list
+  :param sm_count: number of SMs of the target GPU, or None to use that of the highest compute capability
+  :type sm_count: int
+  :param top_k: number of operations to select per workload
+  :type top_k: int
+
+  :return: set of the procedural names of the operations selected
+  :rtype: set
+  """
+  target_cc = max(compute_capabilities)
+  if not sm_count:
+    sm_count = SmCountPerCC.get(target_cc, SmCountPerCC[80])
+
+  selected = set()
+  for workload in sorted(workloads, key=lambda workload: -workload.frequency):
+    candidates = []
+    for name, operation in operations.items():
+      ccs = [cc for cc in compute_capabilities
+             if operation.tile_description.minimum_compute_capability <= cc <= operation.tile_description.maximum_compute_capability]
+      if ccs and workload.supports(operation):
+        candidates.append((estimate_runtime(operation, workload, sm_count, max(ccs)), name))
+
+    best = heapq.nsmallest(top_k, candidates)
+    if not best:
+      _LOGGER.warning(f"No kernel supports workload {workload.description}.")
+      continue
+    _LOGGER.info(f"Selected {len(best)} of {len(candidates)} kernels for workload {workload.description} "
+                 f"(frequency {workload.frequency:g}), e.g., {best[0][1]}.")
+    selected.update(name for _, name in best)
+
+  return selected
+
+###################################################################################################
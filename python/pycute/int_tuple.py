@@ -39,11 +39,21 @@ from itertools import chain
 from typing import Union
 from .typing import Integer
 
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
 
 def is_int(x):
   return isinstance(x, Integer)
 
 
+# NumPy arrays (or scalars) of integers may be used in place of integer coordinates and indices
+def is_array(x):
+  return np is not None and isinstance(x, (np.ndarray, np.integer))
+
+
 def is_tuple(x):
   return isinstance(x, tuple)
 
@@ -34,14 +34,55 @@
 Definition of CuTe Layouts and functions to manipulate them
 """
 
+from functools import lru_cache, wraps
 from itertools import chain
 from typing import Union
 
 from .int_tuple import *
 
 
+# Maximum number of results memoized by each function of the layout algebra
+MEMO_MAXSIZE = 4096
+
+_memoized = []
+
+
+# Memoize a function of the layout algebra with a bounded LRU cache. Layouts are immutable and hashable,
+# so results may be shared between callers. Calls with unhashable arguments bypass the cache.
+def memoize(fn):
+  cached = lru_cache(maxsize=MEMO_MAXSIZE)(fn)
+
+  @wraps(fn)
+  def wrapper(*args, **kwargs):
+    try:
+      hash(args)
+    except TypeError:
+      return fn(*args, **kwargs)
+    return cached(*args, **kwargs)
+
+  wrapper.cache_clear = cached.cache_clear
+  wrapper.cache_info = cached.cache_info
+  _memoized.append(wrapper)
+  return wrapper
+
+
+# Clear the memoized results of all functions of the layout algebra
+def clear_caches():
+  for fn in _memoized:
+    fn.cache_clear()
+
+
 class LayoutBase:
-  pass
+  __slots__ = ()
+
+  # Layouts are immutable
+  def __setattr__(self, name, value):
+    raise AttributeError(f"cannot set attribute '{name}' of immutable {type(self).__name__}")
+
+  # Materialize the index of every coordinate in the domain as a NumPy array, in colexicographic order
+  def to_array(self):
+    assert np is not None, "to_array() requires NumPy"
+    return self(np.arange(size(self)))
 
 
 def is_layout(x):
@@ -49,17 +90,45 @@ def is_layout(x):
 
 
 class Layout(LayoutBase):
+  __slots__ = ("shape", "stride", "flat_shape", "flat_stride", "flat_prefix", "_hash")
+
   def __init__(self, _shape, _stride=None):
-    self.shape  = _shape
     if _stride is None:
-      self.stride = prefix_product(self.shape)
+      _stride = prefix_product(_shape)
+    object.__setattr__(self, "shape", _shape)
+    object.__setattr__(self, "stride", _stride)
+
+  # Flattened views of the modes and the hash are computed on first use
+  def __getattr__(self, name):
+    if name == "flat_shape":
+      value = flatten(self.shape)
+    elif name == "flat_stride":
+      value = flatten(self.stride)
+    elif name == "flat_prefix":
+      value = prefix_product(self.flat_shape)
+    elif name == "_hash":
+      value = hash((self.shape, self.stride))
     else:
-      self.stride = _stride
+      raise AttributeError(f"'Layout' object has no attribute '{name}'")
+    object.__setattr__(self, name, value)
+    return value
 
   # operator ==
   def __eq__(self, other):
+    if self is other:
+      return True
+    if not isinstance(other, Layout):
+      return NotImplemented
     return self.shape == other.shape and self.stride == other.stride
 
+  # hash(L)  (computed once)
+  def __hash__(self):
+    return self._hash
+
+  # pickle and copy
+  def __reduce__(self):
+    return (Layout, (self.shape, self.stride))
+
   # operator len(L)  (len [rank] like tuples)
   def __len__(self):
     if is_tuple(self.shape):
@@ -83,17 +152,27 @@ class Layout(LayoutBase):
         return Layout(slice_(args, self.shape), slice_(args, self.stride))
     else:
       if len(args) == 1:
+        if is_int(args[0]) or is_array(args[0]):
+          return self.flat_idx2idx(args[0])
         return crd2idx(args[0], self.shape, self.stride)
       else:
         return crd2idx(args, self.shape, self.stride)
 
+  # Map a linear index (or NumPy array of linear indices) to an index over the flattened modes.
+  # Equivalent to crd2idx(idx, shape, stride): all but the last mode wrap around their extent.
+  def flat_idx2idx(self, idx):
+    result = 0
+    for s, d, p in zip(self.flat_shape[:-1], self.flat_stride[:-1], self.flat_prefix[:-1]):
+      result = result + (idx // p) % s * d
+    return result + idx // self.flat_prefix[-1] * self.flat_stride[-1]
+
   # operator []    (get-i like tuples)
   def __getitem__(self, i):
     if is_tuple(self.shape):
       return Layout(self.shape[i], self.stride[i])
     else:
       assert i == 0
-      return Layout(self.shape, self.stride)
+      return self
 
   # size(layout)   Size of the domain
   def size(self):
@@ -134,6 +213,7 @@ def cosize(layout):
 
 
 # Layout coalesce -- flatten and combine as many modes as possible while preserving the int-to-int function
+@memoize
 def coalesce(layout, profile=None):
   if is_tuple(profile):
     assert len(layout) >= len(profile)
@@ -142,7 +222,7 @@ def coalesce(layout, profile=None):
 
   result_shape  = [1]
   result_stride = [0]
-  for (shape,stride) in zip(flatten(layout.shape),flatten(layout.stride)):
+  for (shape,stride) in zip(layout.flat_shape,layout.flat_stride):
     # skip their shape-1s
     if shape == 1:
       continue
@@ -165,6 +245,7 @@ def coalesce(layout, profile=None):
 
 
 # Layout filter -- replace all stride-0 modes with size-1 and then coalesce to remove them
+@memoize
 def filter(layout, profile=None):
   if is_tuple(profile):
     assert len(layout) >= len(profile)
@@ -173,7 +254,7 @@ def filter(layout, profile=None):
 
   result_shape  = []
   result_stride = []
-  for (shape,stride) in zip(flatten(layout.shape),flatten(layout.stride)):
+  for (shape,stride) in zip(layout.flat_shape,layout.flat_stride):
     # skip their shape-1s and stride-0s
     if not (shape == 1 or stride == 0):
       result_shape.append(shape)
@@ -187,6 +268,7 @@ def filter(layout, profile=None):
 
 # Layout composition
 # Use tuples-of-layouts to perform this operation by-mode and None as no-op
+@memoize
 def composition(layoutA, layoutB):
   if layoutB is None:
     return layoutA
@@ -206,7 +288,7 @@ def composition(layoutA, layoutB):
     result_stride = []
     rest_shape   = layoutB.shape
     rest_stride  = layoutB.stride
-    for (s, d) in zip(flatten(layoutA.shape)[:-1], flatten(layoutA.stride)[:-1]):
+    for (s, d) in zip(layoutA.flat_shape[:-1], layoutA.flat_stride[:-1]):
       s1 = shape_div(s, rest_stride)
       result_shape.append(min(s1,rest_shape))
       result_stride.append(rest_stride * d)
@@ -214,12 +296,13 @@ def composition(layoutA, layoutB):
       rest_stride = shape_div(rest_stride, s)
 
     result_shape.append(rest_shape)
-    result_stride.append(rest_stride * flatten(layoutA.stride)[-1])
+    result_stride.append(rest_stride * layoutA.flat_stride[-1])
 
     return coalesce(Layout(tuple(result_shape), tuple(result_stride)))
 
 
 # Layout complement
+@memoize
 def complement(layout, max_idx=1):
   if is_int(layout):
     return complement(Layout(layout))
@@ -228,7 +311,7 @@ def complement(layout, max_idx=1):
   result_stride = []
   current_idx = 1
 
-  sorted_DS = sorted(zip(flatten(layout.stride), flatten(layout.shape)))
+  sorted_DS = sorted(zip(layout.flat_stride, layout.flat_shape))
   for (stride, shape) in sorted_DS:
     if stride == 0 or shape == 1:
       continue
@@ -248,6 +331,7 @@ def complement(layout, max_idx=1):
 
 
 # Layout right inverse
+@memoize
 def right_inverse(layout):
   if layout is None:
     return None
@@ -258,9 +342,7 @@ def right_inverse(layout):
   result_stride = []
   current_idx = 1
 
-  flat_shape  = flatten(layout.shape)
-  flat_stride = flatten(layout.stride)
-  sorted_DSA = sorted(zip(flat_stride, flat_shape, prefix_product(flat_shape)))
+  sorted_DSA = sorted(zip(layout.flat_stride, layout.flat_shape, layout.flat_prefix))
   for (stride,shape,rstride) in sorted_DSA:
     if shape == 1:
       continue
@@ -275,6 +357,7 @@ def right_inverse(layout):
 
 
 # Layout left inverse
+@memoize
 def left_inverse(layout):
   if layout is None:
     return None
@@ -285,6 +368,7 @@ def left_inverse(layout):
 
 # Split a layout by the composition of B and the "rest"
 # Use tuples-of-layouts to perform this operation by-mode and None as no-op
+@memoize
 def logical_divide(layoutA, layoutB):
   if layoutB is None:
     return layoutA
@@ -300,6 +384,7 @@ def logical_divide(layoutA, layoutB):
 
 # Reproduce a layoutA over a layoutB
 # Use tuples-of-layouts to perform this operation by-mode and None as no-op
+@memoize
 def logical_product(layoutA, layoutB):
   if layoutB is None:
     return layoutA
@@ -331,22 +416,26 @@ def hier_unzip(splitter, layoutA, layoutB):
 
 
 # Apply logical divide hierarchically and gather the split modes into two modes
+@memoize
 def zipped_divide(layoutA, layoutB):
   return hier_unzip(logical_divide, layoutA, layoutB)
 
 
 # Perform logical divide hierarchically and gather tiles (B-layouts) into a new mode
+@memoize
 def tiled_divide(layoutA, layoutB):
   result = zipped_divide(layoutA, layoutB)
   return make_layout([result[0]] + [result[1][i] for i in range(len(result[1]))])
 
 
 # Apply logical product hierarchically and gather the split modes into two modes
+@memoize
 def zipped_product(layoutA, layoutB):
   return hier_unzip(logical_product, layoutA, layoutB)
 
 
 # Perform logical product hierarchically and gather tiles (B-layouts) into a new mode
+@memoize
 def tiled_product(layoutA, layoutB):
   result = zipped_product(layoutA, layoutB)
   return make_layout([result[0]] + [result[1][i] for i in range(len(result[1]))])
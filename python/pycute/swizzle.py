@@ -69,13 +69,25 @@ class Swizzle:
     self.yyy_msk = bit_msk << (base + max(0,shift))
     self.zzz_msk = bit_msk << (base - min(0,shift))
 
-  # operator ()    (transform integer)
+  # operator ==
+  def __eq__(self, other):
+    if not isinstance(other, Swizzle):
+      return NotImplemented
+    return self.bits == other.bits and self.base == other.base and self.shift == other.shift
+
+  def __hash__(self):
+    return hash((self.bits, self.base, self.shift))
+
+  # operator ()    (transform integer or NumPy array of integers)
   def __call__(self, offset):
-    return offset ^ shiftr(offset & self.yyy_msk, self.shift)
+    if self.shift >= 0:
+      return offset ^ ((offset & self.yyy_msk) >> self.shift)
+    else:
+      return offset ^ ((offset & self.yyy_msk) << -self.shift)
 
   # Size of the domain
   def size(self):
-    return 1 << (bits + base + abs(shift))
+    return 1 << (self.bits + self.base + abs(self.shift))
 
   # Size of the codomain
   def cosize(self):
@@ -91,15 +103,32 @@ class Swizzle:
 
 
 class ComposedLayout(LayoutBase):
+  __slots__ = ("layoutB", "offset", "layoutA", "_hash")
+
   def __init__(self, layoutB, offset, layoutA):
-    self.layoutB = layoutB
-    self.offset  = offset
-    self.layoutA = layoutA
+    object.__setattr__(self, "layoutB", layoutB)
+    object.__setattr__(self, "offset", offset)
+    object.__setattr__(self, "layoutA", layoutA)
+    object.__setattr__(self, "_hash", None)
 
   # operator ==
   def __eq__(self, other):
+    if self is other:
+      return True
+    if not isinstance(other, ComposedLayout):
+      return NotImplemented
     return self.layoutB == other.layoutB and self.offset == other.offset and self.layoutA == other.layoutA
 
+  # hash(L)  (computed once)
+  def __hash__(self):
+    if self._hash is None:
+      object.__setattr__(self, "_hash", hash((self.layoutB, self.offset, self.layoutA)))
+    return self._hash
+
+  # pickle and copy
+  def __reduce__(self):
+    return (ComposedLayout, (self.layoutB, self.offset, self.layoutA))
+
   # operator len(L)  (len [rank] like tuples)
   def __len__(self):
     return len(self.layoutA)
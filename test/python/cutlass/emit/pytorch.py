@@ -150,6 +150,21 @@ class PyTorchExtensionTest(unittest.TestCase):
         D = mod.run(A, B, C, alpha, beta)
         assert torch.allclose(D, D_ref)
 
+        # Write into a preallocated output
+        out = torch.empty_like(D_ref)
+        D = mod.run(A, B, C, alpha, beta, out=out)
+        assert D.data_ptr() == out.data_ptr()
+        assert torch.allclose(out, D_ref)
+
+        # Run through the custom operator, including its meta implementation
+        D = torch.ops.gemm_mod.run(A, B, C, alpha, beta)
+        assert torch.allclose(D, D_ref)
+        D_meta = torch.ops.gemm_mod.run(A.to('meta'), B.to('meta'))
+        assert D_meta.shape == D_ref.shape and D_meta.dtype == D_ref.dtype
+
+        D = torch.compile(lambda a, b, c: torch.ops.gemm_mod.run(a, b, c, alpha, beta), fullgraph=True)(A, B, C)
+        assert torch.allclose(D, D_ref)
+
     def test_grouped_gemm(self):
         random.seed(2023)
 
@@ -185,6 +200,10 @@ class PyTorchExtensionTest(unittest.TestCase):
         Ds = mod.run(As, Bs, Cs, alpha, beta)
         check_all(Ds, Ds_ref)
 
+        outs = [torch.empty_like(d) for d in Ds_ref]
+        Ds = mod.run(As, Bs, Cs, alpha, beta, out=outs)
+        check_all(outs, Ds_ref)
+
     def test_conv2d_fprop(self):
         torch.manual_seed(2023)
 
@@ -227,6 +246,20 @@ class PyTorchExtensionTest(unittest.TestCase):
         D_parallel_split_k = mod.run(A, B, C, stride, padding, alpha=alpha, beta=beta, split_k_mode="parallel", split_k_slices=7)
         assert torch.allclose(D, D_parallel_split_k)
 
+        # Write into a preallocated output
+        out = torch.empty_like(D_ref)
+        mod.run(A, B, C, stride, padding, alpha=alpha, beta=beta, out=out)
+        assert torch.allclose(out, D_ref)
+
+        # Run through the custom operator, including its meta implementation
+        D_op = torch.ops.conv2d_mod.run(A, B, C, stride, padding, alpha=alpha, beta=beta)
+        assert torch.allclose(D_op, D_ref)
+        D_meta = torch.ops.conv2d_mod.run(A.to('meta'), B.to('meta'), None, stride, padding)
+        assert D_meta.shape == D_ref.shape
+
+        # The pybind and custom operator entry points share default arguments
+        assert mod.run(A, B).shape == torch.ops.conv2d_mod.run(A, B).shape
+
 
     def test_conv2d_dgrad(self):
         torch.manual_seed(2023)
@@ -33,13 +33,17 @@
 Unit test for compute node in SM90
 """
 
+import ctypes
 import logging
+import os
+import tempfile
 import unittest
 
 import cutlass
 from cutlass.backend import *
 from cutlass.epilogue import *
 from cutlass import swizzle
+import cutlass.backend.evt.trace_cache
 
 from utils.evt_testbed import EVTTestBed, EVTTestCaseBase
 
@@ -118,5 +122,65 @@ class TestEVTCompute(EVTTestCaseBase):
             result_keys = ["D"]
             launcher.verify((m, n, k), input_keys, result_keys, l)
 
+    def test_trace_cache(self):
+        """
+        Test that identical epilogues are traced once and restored from the trace cache
+        """
+        def evt_trace_cache(accum, C, alpha, beta):
+            D = relu(alpha * accum + beta * C)
+            return D
+
+        m, n, l = 256, 128, 2
+        example_inputs = {
+            "accum": self.fake_tensor(self.element, (l, m, n)),
+            "C": self.fake_tensor(self.element, (l, m, n)),
+            "alpha": 1.5,
+            "beta": 0.5,
+            "D": self.fake_tensor(self.element, (l, m, n))
+        }
+
+        first = cutlass.epilogue.trace(evt_trace_cache, example_inputs)
+        second = cutlass.epilogue.trace(evt_trace_cache, example_inputs)
+        self.assertEqual(first.trace_key, second.trace_key)
+
+        # Epilogues restored from the same trace do not share their DAG IR
+        self.assertIsNot(first.dag_ir, second.dag_ir)
+        self.assertEqual(first.dag_ir.nodes_topological_order(), second.dag_ir.nodes_topological_order())
+        second.dag_ir.remove_node(second.dag_ir.nodes_topological_order()[0])
+        fourth = cutlass.epilogue.trace(evt_trace_cache, example_inputs)
+        self.assertEqual(first.dag_ir.nodes_topological_order(), fourth.dag_ir.nodes_topological_order())
+
+        # Traces are keyed by the sources of EVT
+        trace_cache_module = cutlass.backend.evt.trace_cache
+        digest = trace_cache_module._evt_digest()
+        try:
+            trace_cache_module._EVT_DIGEST = "0" * len(digest)
+            changed_key = trace_cache_module.trace_key(
+                evt_trace_cache, example_inputs, first.cc, first.element_compute)
+        finally:
+            trace_cache_module._EVT_DIGEST = digest
+        self.assertNotEqual(changed_key, first.trace_key)
+
+        # A different problem shape is traced separately
+        example_inputs["C"] = self.fake_tensor(self.element, (l, m, 2 * n))
+        example_inputs["D"] = self.fake_tensor(self.element, (l, m, 2 * n))
+        example_inputs["accum"] = self.fake_tensor(self.element, (l, m, 2 * n))
+        third = cutlass.epilogue.trace(evt_trace_cache, example_inputs)
+        self.assertNotEqual(first.trace_key, third.trace_key)
+
+        # Traces recorded on disk are restored by another process
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = os.path.join(directory, "evt_traces.db")
+            cutlass.backend.evt.trace_cache.TraceCache(cache_file).record(first.trace_key, first.traced())
+            traced = cutlass.backend.evt.trace_cache.TraceCache(cache_file).lookup(first.trace_key)
+            self.assertIsNotNone(traced)
+            self.assertEqual(traced.return_names, first.return_names)
+            self.assertEqual(traced.dag_ir.nodes_topological_order(), first.dag_ir.nodes_topological_order())
+
+            restored = cutlass.epilogue.trace(evt_trace_cache, example_inputs)
+            restored.restore(traced)
+            self.assertEqual(ctypes.sizeof(restored.epilogue_thread_type), ctypes.sizeof(first.epilogue_thread_type))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -280,5 +280,73 @@ class Conv2dErrorTests(unittest.TestCase):
         # Clean up the error message
         os.remove("./cutlass_python_compilation_device_error.txt")
 
+
+@unittest.skipIf(device_cc() < 80, 'Device compute capability is insufficient for SM80 tests.')
+class Conv2dSplitKTests(unittest.TestCase):
+    """
+    Tests automatic selection of split-K slices reduced within the convolution kernel
+    """
+
+    def test_auto_split_k_wgrad(self):
+        if not datatypes.is_torch_available():
+            return
+        import torch
+        from cutlass.backend.utils.device import device_sm_count
+        from cutlass.shape import Conv2DProblemSize
+
+        # Wgrad on a small spatial size has few output tiles and a long reduction over N * P * Q
+        ps = Conv2DProblemSize(32, 8, 8, 64, 64, 3, 3, 64, 1, 1, 1, 1, 1, 1)
+        plan = cutlass.op.Conv2dWgrad(element=torch.float32, element_accumulator=torch.float32)
+
+        def init(size):
+            return torch.ceil(
+                torch.empty(size, dtype=torch.float32, device="cuda").uniform_(-4.5, 3.5)
+            ).to(memory_format=torch.channels_last)
+
+        grad_output = init((ps.N, ps.K, ps.P, ps.Q))
+        input = init((ps.N, ps.C, ps.H, ps.W))
+        C = init((ps.K, ps.C, ps.R, ps.S))
+        D_auto = torch.zeros_like(C)
+        D_ref = torch.zeros_like(C)
+
+        plan.run(grad_output, input, C, D_ref, padding=(1, 1), beta=1.0)
+        plan.run(grad_output, input, C, D_auto, padding=(1, 1), beta=1.0, split_k=("auto", None))
+        assert torch.equal(D_auto, D_ref)
+
+        slices = plan._propose_split_k_slices(ps, plan.operation)
+        tb_m, tb_n, _ = plan.operation.tile_description.threadblock_shape
+        tiles = ceil(ps.K / tb_m) * ceil(ps.R * ps.S * ps.C / tb_n)
+        assert slices > 1 or tiles >= device_sm_count()
+        assert plan._propose_split_k_slices(ps, plan.operation, max_slices=2) <= 2
+
+        with ExpectException(True, 'Invalid split-K mode. The run should fail.'):
+            plan.run(grad_output, input, C, D_auto, padding=(1, 1), split_k=("stream", 2))
+
+    def test_auto_split_k_wgrad_narrow_output(self):
+        if not datatypes.is_torch_available():
+            return
+        import torch
+        from cutlass.shape import Conv2DProblemSize
+
+        ps = Conv2DProblemSize(32, 8, 8, 64, 64, 3, 3, 64, 1, 1, 1, 1, 1, 1)
+        plan = cutlass.op.Conv2dWgrad(element=torch.float16, element_accumulator=torch.float32)
+
+        def init(size):
+            return torch.ceil(
+                torch.empty(size, dtype=torch.float16, device="cuda").uniform_(-4.5, 3.5)
+            ).to(memory_format=torch.channels_last)
+
+        grad_output = init((ps.N, ps.K, ps.P, ps.Q))
+        input = init((ps.N, ps.C, ps.H, ps.W))
+        C = init((ps.K, ps.C, ps.R, ps.S))
+        D_auto = torch.zeros_like(C)
+        D_ref = torch.zeros_like(C)
+
+        # Partial sums would be rounded to the FP16 output between slices, so the reduction is not split
+        plan.run(grad_output, input, C, D_ref, padding=(1, 1), beta=1.0)
+        plan.run(grad_output, input, C, D_auto, padding=(1, 1), beta=1.0, split_k=("auto", None))
+        assert plan._propose_split_k_slices(ps, plan.operation) == 1
+        assert torch.equal(D_auto, D_ref)
+
 if __name__ == '__main__':
     unittest.main()
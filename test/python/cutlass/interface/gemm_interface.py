@@ -35,6 +35,8 @@ Tests the high-level GEMM interface
 """
 
 from math import ceil
+import os
+import tempfile
 import unittest
 
 import cutlass
@@ -347,5 +349,368 @@ class GemmErrorTests(unittest.TestCase):
                 assert False, f'Multiple tile descriptions emitted {code_str}\nTile descriptions are:\n{td}\n{conflicting_td}'
 
 
+class GemmPlanTests(unittest.TestCase):
+    """
+    Tests launches of GEMMs via arguments bound by ``Gemm.plan()``
+    """
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_bound_launch(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+
+        M, N, K = 256, 128, 64
+        plan = cutlass.op.Gemm(element=np.float16, layout=cutlass.LayoutType.RowMajor)
+
+        A = np.random.uniform(-4, 4, (M, K)).astype(np.float16).round()
+        B = np.random.uniform(-4, 4, (K, N)).astype(np.float16).round()
+        C = np.random.uniform(-4, 4, (M, N)).astype(np.float16).round()
+        D_run = np.zeros_like(C)
+        D_bound = np.zeros_like(C)
+
+        plan.run(A, B, C, D_run)
+
+        bound = plan.plan(A, B, C, D_bound)
+        for _ in range(3):
+            bound.launch()
+        bound.sync()
+        assert np.array_equal(D_run, D_bound)
+
+        # Rebind D to the device buffer backing another set of bound arguments
+        D_other = np.zeros_like(C)
+        other = plan.plan(A, B, C, D_other)
+        bound.launch({"D": other.arguments.ptr_D})
+        other.sync()
+        assert np.array_equal(D_run, D_other)
+
+        # Synchronization waits on the stream of the last launch rather than that used when binding
+        from cuda import cudart
+        err, stream = cudart.cudaStreamCreateWithFlags(cudart.cudaStreamNonBlocking)
+        assert err == cudart.cudaError_t.cudaSuccess
+        err, = cudart.cudaMemsetAsync(bound.arguments.ptr_D, 0, D_bound.nbytes, stream)
+        assert err == cudart.cudaError_t.cudaSuccess
+        bound.launch(stream=stream)
+        bound.sync()
+        assert np.array_equal(D_run, D_bound)
+        cudart.cudaStreamDestroy(stream)
+
+        bound.free()
+        other.free()
+
+
+class GemmParallelCompileTests(unittest.TestCase):
+    """
+    Tests compiling several GEMM kernels concurrently into separate modules
+    """
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_parallel_compile(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+        from cutlass.backend import compiler
+
+        M, N, K = 256, 128, 64
+        plan = cutlass.op.Gemm(element=np.float16, layout=cutlass.LayoutType.RowMajor)
+        plan.tuning_database = None
+
+        A = np.random.uniform(-4, 4, (M, K)).astype(np.float16).round()
+        B = np.random.uniform(-4, 4, (K, N)).astype(np.float16).round()
+        C = np.random.uniform(-4, 4, (M, N)).astype(np.float16).round()
+        D_ref = np.zeros_like(C)
+        plan.run(A, B, C, D_ref)
+
+        tds = plan.tile_descriptions()[:2]
+        operations = [plan.construct(td) for td in tds]
+        compiler.add_module(operations, bypass_cache=True, max_workers=2)
+        for operation in operations:
+            assert operation.rt_module.kernel is not None
+            assert compiler.compile_times[operation.rt_module.name()] > 0
+
+        # Each kernel compiled concurrently computes the same result as the default kernel
+        for td in tds:
+            plan.tile_description = td
+            D = np.zeros_like(C)
+            plan.run(A, B, C, D)
+            assert np.array_equal(D, D_ref)
+
+
+class GemmAutotuneTests(unittest.TestCase):
+    """
+    Tests autotuning of GEMMs and the use of its results by ``run()``
+    """
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_autotune(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+        from cutlass.backend.tuning import TuningDatabase, tile_description_key
+
+        M, N, K = 256, 128, 64
+        plan = cutlass.op.Gemm(element=np.float16, layout=cutlass.LayoutType.RowMajor)
+        plan.tuning_database = TuningDatabase(os.path.join(tempfile.mkdtemp(), "tuning.db"))
+
+        A = np.random.uniform(-4, 4, (M, K)).astype(np.float16).round()
+        B = np.random.uniform(-4, 4, (K, N)).astype(np.float16).round()
+        C = np.random.uniform(-4, 4, (M, N)).astype(np.float16).round()
+        D_ref = np.zeros_like(C)
+        plan.run(A, B, C, D_ref)
+
+        # A plan sharing the database that has already run the problem before it was tuned
+        other = cutlass.op.Gemm(element=np.float16, layout=cutlass.LayoutType.RowMajor)
+        other.tuning_database = plan.tuning_database
+        other.run(A, B, C, np.zeros_like(C))
+
+        tds = plan.tile_descriptions()[:3]
+        best = plan.autotune(A, B, C, np.zeros_like(C), tile_descriptions=tds, warmup_iterations=1, iterations=2)
+        assert tile_description_key(best["tile_description"]) in [tile_description_key(td) for td in tds]
+
+        # The plan sharing the database should now run the recorded kernel
+        D = np.zeros_like(C)
+        other.run(A, B, C, D)
+        assert np.array_equal(D, D_ref)
+        assert other.operation.tile_description.procedural_name() == best["tile_description"].procedural_name()
+        assert other.tile_description is None
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_autotune_narrow_output(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+
+        M, N, K = 32, 32, 8192
+        plan = cutlass.op.Gemm(element=np.float16, element_accumulator=np.float32, layout=cutlass.LayoutType.RowMajor)
+        plan.tuning_database = None
+
+        A = np.random.uniform(-4, 4, (M, K)).astype(np.float16).round()
+        B = np.random.uniform(-4, 4, (K, N)).astype(np.float16).round()
+        C = np.random.uniform(-4, 4, (M, N)).astype(np.float16).round()
+        tds = plan.tile_descriptions()[:1]
+
+        # Partial sums would be rounded to the FP16 output between slices, so split-K is not considered
+        best = plan.autotune(A, B, C, np.zeros_like(C), tile_descriptions=tds, warmup_iterations=1, iterations=1)
+        assert best["split_k_slices"] == 1
+
+        with ExpectException(True, "Autotuning an FP16-output GEMM with split-K"):
+            plan.autotune(A, B, C, np.zeros_like(C), tile_descriptions=tds, split_k_slices=[1, 2])
+
+
+class GemmHeuristicTests(unittest.TestCase):
+    """
+    Tests the analytical choice of tile description and split-K slices by ``run()``
+    """
+
+    @unittest.skipIf(device_cc() < 80, "Device compute capability is insufficient for SM80 tests.")
+    def test_heuristic(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+
+        plan = cutlass.op.Gemm(element=np.float16, element_C=np.float32, element_D=np.float32,
+                               element_accumulator=np.float32, layout=cutlass.LayoutType.RowMajor)
+        plan.tuning_database = None
+
+        tiles = {}
+        for M, N, K in [(64, 64, 64), (4096, 4096, 256), (32, 32, 8192)]:
+            A = np.random.randint(-1, 2, (M, K)).astype(np.float16)
+            B = np.random.randint(-1, 2, (K, N)).astype(np.float16)
+            C = np.random.randint(-1, 2, (M, N)).astype(np.float32)
+            D = np.zeros_like(C)
+            plan.run(A, B, C, D)
+            assert np.array_equal(D, A.astype(np.float32) @ B.astype(np.float32) + C)
+            assert plan.tile_description is None
+            tiles[(M, N, K)] = (plan.operation.tile_description.threadblock_shape, plan.proposed_split_k_slices)
+
+        # A large problem favors larger tiles than a small one, and a problem with few output tiles
+        # and a long K dimension is split along K
+        small, large = tiles[(64, 64, 64)][0], tiles[(4096, 4096, 256)][0]
+        assert small[0] * small[1] <= large[0] * large[1]
+        if device_cc() < 90:
+            assert tiles[(32, 32, 8192)][1] > 1
+
+    @unittest.skipIf(device_cc() < 80, "Device compute capability is insufficient for SM80 tests.")
+    def test_heuristic_narrow_output(self):
+        """
+        Split-K is not proposed for outputs narrower than the accumulator, so results match those of
+        running without split-K
+        """
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+
+        M, N, K = 32, 32, 8192
+        for element_ab, element_cd, element_acc in [(np.float16, np.float16, np.float32),
+                                                    (np.int8, np.int8, np.int32)]:
+            A = np.random.randint(-2, 3, (M, K)).astype(element_ab)
+            B = np.random.randint(-2, 3, (K, N)).astype(element_ab)
+            C = np.random.randint(-2, 3, (M, N)).astype(element_cd)
+
+            results = []
+            for max_slices in [None, 1]:
+                plan = cutlass.op.Gemm(element=element_ab, element_C=element_cd, element_D=element_cd,
+                                       element_accumulator=element_acc, layout=cutlass.LayoutType.RowMajor, cc=80)
+                plan.tuning_database = None
+                plan.max_proposed_split_k_slices = max_slices
+                D = np.zeros_like(C)
+                plan.run(A, B, C, D, alpha=1, beta=1)
+                assert plan.proposed_split_k_slices == 1
+                results.append(D)
+
+            assert np.array_equal(results[0], results[1])
+
+
+class GemmScheduleTests(unittest.TestCase):
+    """
+    Tests restricting the kernel schedule, epilogue schedule, tile scheduler, and cluster shape of SM90 kernels
+    """
+
+    @unittest.skipIf(device_cc() < 90, "Device compute capability is insufficient for SM90 tests.")
+    def test_schedules(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+
+        plan = cutlass.op.Gemm(element=np.float16, element_accumulator=np.float32,
+                               layout=cutlass.LayoutType.RowMajor, cc=90)
+        plan.tuning_database = None
+        plan.kernel_schedule = cutlass.KernelScheduleType.TmaWarpSpecializedCooperative
+        plan.tile_scheduler = cutlass.TileSchedulerType.StreamK
+        plan.cluster_shape = [2, 1, 1]
+
+        for td in plan.tile_descriptions():
+            assert td.kernel_schedule == cutlass.KernelScheduleType.TmaWarpSpecializedCooperative
+            assert td.tile_scheduler == cutlass.TileSchedulerType.StreamK
+            assert td.cluster_shape == [2, 1, 1]
+
+        M, N, K = 512, 256, 4096
+        A = np.random.randint(-1, 2, (M, K)).astype(np.float16)
+        B = np.random.randint(-1, 2, (K, N)).astype(np.float16)
+        C = np.random.randint(-1, 2, (M, N)).astype(np.float16)
+        D = np.zeros_like(C)
+        plan.run(A, B, C, D)
+        assert np.array_equal(D, (A.astype(np.float32) @ B.astype(np.float32) + C).astype(np.float16))
+
+        td = plan.operation.tile_description
+        assert td.tile_scheduler == cutlass.TileSchedulerType.StreamK
+        assert td.cluster_shape == [2, 1, 1]
+        assert "_stream_k" in plan.operation.procedural_name()
+
+        # The stream-K tile scheduler requires a cooperative kernel schedule
+        with ExpectException(True, 'Stream-K with a ping-pong kernel schedule should be rejected'):
+            plan.kernel_schedule = cutlass.KernelScheduleType.TmaWarpSpecializedPingpong
+        assert plan.kernel_schedule == cutlass.KernelScheduleType.TmaWarpSpecializedCooperative
+
+        with ExpectException(True, 'Cluster shapes of more than 8 thread blocks should be rejected'):
+            plan.cluster_shape = [4, 4, 1]
+
+        plan.tile_scheduler = None
+        plan.kernel_schedule = cutlass.KernelScheduleType.TmaWarpSpecializedPingpong
+        assert all(td.tile_scheduler != cutlass.TileSchedulerType.StreamK for td in plan.tile_descriptions())
+
+    @unittest.skipIf(device_cc() < 80, "Device compute capability is insufficient for SM80 tests.")
+    def test_schedules_pre_sm90(self):
+        plan = cutlass.op.Gemm(element=cutlass.DataType.f16, layout=cutlass.LayoutType.RowMajor, cc=80)
+        with ExpectException(True, 'Kernel schedules should not be selectable for SM80 kernels'):
+            plan.kernel_schedule = cutlass.KernelScheduleType.TmaWarpSpecializedCooperative
+        assert plan.kernel_schedule is None
+
+
+class GroupedGemmSchedulingTests(unittest.TestCase):
+    """
+    Tests selection of the scheduler mode of grouped GEMMs and caching of host-precomputed schedules
+    """
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_scheduler_modes(self):
+        if not datatypes.is_numpy_available():
+            return
+        import numpy as np
+        from cutlass.backend.library import SchedulerMode
+        from cutlass.shape import GemmCoord
+
+        def problems(count):
+            shapes = [(64 * (1 + i % 3), 128, 64) for i in range(count)]
+            As = [np.random.uniform(-4, 4, (m, k)).astype(np.float16).round() for m, _, k in shapes]
+            Bs = [np.random.uniform(-4, 4, (k, n)).astype(np.float16).round() for _, n, k in shapes]
+            Cs = [np.random.uniform(-4, 4, (m, n)).astype(np.float16).round() for m, n, _ in shapes]
+            Ds = [np.zeros_like(C) for C in Cs]
+            return As, Bs, Cs, Ds
+
+        plan = cutlass.op.GroupedGemm(element=np.float16, layout=cutlass.LayoutType.RowMajor)
+
+        # Small groups are scheduled on the device
+        plan.run(*problems(4))
+        assert plan.operation.precompute_mode == SchedulerMode.Device
+
+        # Large groups are scheduled on the host, and repeated groups reuse the cached schedule
+        As, Bs, Cs, Ds = problems(64)
+        plan.run(As, Bs, Cs, Ds)
+        assert plan.operation.precompute_mode == SchedulerMode.Host
+        info = plan.operation.rt_module.schedule_cache_info()
+        plan.run(As, Bs, Cs, Ds)
+        repeated = plan.operation.rt_module.schedule_cache_info()
+        assert repeated["hits"] == info["hits"] + 1
+        assert repeated["misses"] == info["misses"]
+        assert repeated["size"] == info["size"]
+        for A, B, C, D in zip(As, Bs, Cs, Ds):
+            assert np.array_equal(D, A @ B + C)
+
+        # An explicitly set mode overrides the automatic selection
+        plan.scheduler_mode = SchedulerMode.Device
+        Ds_device = [np.zeros_like(C) for C in Cs]
+        plan.run(As, Bs, Cs, Ds_device)
+        assert plan.operation.precompute_mode == SchedulerMode.Device
+        for D, D_device in zip(Ds, Ds_device):
+            assert np.array_equal(D, D_device)
+
+        with ExpectException(True, "Setting an invalid scheduler mode"):
+            plan.scheduler_mode = "host"
+
+        # Compiling ahead of time with the sizes of the group selects the same mode as ``run()``
+        plan.scheduler_mode = None
+        problem_sizes = [GemmCoord(A.shape[0], B.shape[1], A.shape[1]) for A, B in zip(As, Bs)]
+        assert plan.compile(problem_size=problem_sizes).precompute_mode == SchedulerMode.Host
+        assert plan.compile(problem_size=problem_sizes[:4]).precompute_mode == SchedulerMode.Device
+
+        with ExpectException(True, "Compiling a grouped GEMM with a batch count"):
+            plan.compile(batch_count=2)
+
+
+class GemmBenchmarkSuiteTests(unittest.TestCase):
+    """
+    Tests benchmarking GEMMs over a grid of configurations
+    """
+
+    @unittest.skipIf(device_cc() < 70, "Device compute capability is insufficient for FP16 Tensor Core tests.")
+    def test_benchmark_suite(self):
+        import csv
+        import json
+        from cutlass.utils.profiler import BenchmarkSuite, write_csv, write_json
+
+        problem_sizes = [(256, 128, 64), (128, 128, 128, 2), (136, 128, 64)]
+        layouts = [cutlass.LayoutType.RowMajor, (cutlass.LayoutType.ColumnMajor, cutlass.LayoutType.RowMajor, cutlass.LayoutType.RowMajor)]
+        suite = BenchmarkSuite(problem_sizes, [cutlass.DataType.f16], layouts, element_accumulator=cutlass.DataType.f32,
+                               flush_l2=True, warmup_iterations=1, max_iterations=20)
+        results = suite.run()
+        assert len(results) == len(problem_sizes) * len(layouts)
+
+        for result in results:
+            assert result.runtime > 0 and result.tflops > 0 and result.gbps > 0
+            assert result.samples >= 1 and result.iterations <= 20
+        assert sorted({result.layout for result in results}) == ["ntt", "ttt"]
+        assert {result.batch_count for result in results} == {1, 2}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_json(results, os.path.join(tmpdir, "results.json"))
+            with open(os.path.join(tmpdir, "results.json")) as infile:
+                assert [row["m"] for row in json.load(infile)] == [result.m for result in results]
+
+            write_csv(results, os.path.join(tmpdir, "results.csv"))
+            with open(os.path.join(tmpdir, "results.csv")) as infile:
+                assert len(list(csv.DictReader(infile))) == len(results)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,184 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests the caches of device and pinned host memory used by the Python interface
+"""
+
+import gc
+import unittest
+
+from cuda import cudart
+import numpy as np
+
+import cutlass
+from cutlass.backend.memory_manager import CachingMemoryManager, DeviceBufferCache, PinnedHostPool
+
+
+def device_contents(entry, like):
+    """
+    Returns the contents of the device buffer of ``entry``, interpreted as an array like ``like``
+    """
+    out = np.empty_like(like)
+    err, = cudart.cudaMemcpy(out.ctypes.data, entry.ptr, out.nbytes, cudart.cudaMemcpyKind.cudaMemcpyDeviceToHost)
+    assert err == cudart.cudaError_t.cudaSuccess
+    return out
+
+
+class CachingMemoryManagerTests(unittest.TestCase):
+    """
+    Tests reuse of idle blocks and their release to the device by the caching allocator
+    """
+
+    def setUp(self):
+        cutlass.initialize_cuda_context()
+
+    def test_release(self):
+        small = CachingMemoryManager._small_granularity
+        large = CachingMemoryManager._large_granularity
+        manager = CachingMemoryManager(max_cached_size=2 * large + small)
+
+        # Freed blocks of different size classes, in order: large, small, large
+        blocks = [manager.allocate(large), manager.allocate(small), manager.allocate(large)]
+        for block in blocks:
+            manager.free(block)
+        assert manager.stats()["cached_bytes"] == 2 * large + small
+
+        # Reuse of an idle block is a hit
+        reused = manager.allocate(small)
+        assert reused is blocks[1]
+        assert manager.stats()["hits"] == 1
+        manager.free(reused)
+
+        # Trimming releases the least recently freed blocks first, whatever their size class
+        manager.release(large + small)
+        remaining = [block for bucket in manager.free_blocks.values() for block in bucket]
+        assert sorted(id(block) for block in remaining) == sorted(id(block) for block in blocks[1:])
+        assert manager.stats()["cached_bytes"] == large + small
+
+        manager.release()
+        assert manager.stats()["cached_bytes"] == 0
+        assert manager.free_blocks == {}
+
+
+class DeviceBufferCacheTests(unittest.TestCase):
+    """
+    Tests reuse and invalidation of the device-resident copies of NumPy arrays
+    """
+
+    def setUp(self):
+        cutlass.initialize_cuda_context()
+        self.cache = DeviceBufferCache()
+        self.cache.enabled = True
+
+    def tearDown(self):
+        self.cache.clear()
+
+    def test_reuse(self):
+        A = np.arange(1024, dtype=np.float32)
+        A.flags.writeable = False
+        first = self.cache.input(A)
+        assert self.cache.input(A) is first
+        assert np.array_equal(device_contents(first, A), A)
+
+    def test_writeable_inputs(self):
+        # Writeable inputs reuse their allocation but are uploaded on every use
+        A = np.arange(1024, dtype=np.float32)
+        entry = self.cache.input(A)
+        A[:] = 7
+        assert self.cache.input(A) is entry
+        assert np.array_equal(device_contents(entry, A), A)
+
+        # A read-only view of a writeable array may still change
+        B = np.arange(1024, dtype=np.float32)
+        view = B[:]
+        view.flags.writeable = False
+        entry = self.cache.input(view)
+        B[:] = 5
+        self.cache.input(view)
+        assert np.array_equal(device_contents(entry, view), B)
+
+    def test_invalidate(self):
+        A = np.arange(1024, dtype=np.float32)
+        A.flags.writeable = False
+        entry = self.cache.input(A)
+
+        A.flags.writeable = True
+        A[:] = 3
+        A.flags.writeable = False
+        self.cache.invalidate(A)
+        assert self.cache.input(A) is entry
+        assert np.array_equal(device_contents(entry, A), A)
+
+    def test_release_on_gc(self):
+        A = np.arange(1024, dtype=np.float32)
+        self.cache.input(A)
+        key = id(A)
+        assert key in self.cache.entries
+        del A
+        gc.collect()
+        assert key not in self.cache.entries
+
+
+class PinnedHostPoolTests(unittest.TestCase):
+    """
+    Tests reuse and capacity of the pool of pinned staging buffers
+    """
+
+    def setUp(self):
+        cutlass.initialize_cuda_context()
+
+    def test_capacity(self):
+        pool = PinnedHostPool(max_cached_size=3 * 4096)
+        buffers = [pool.acquire(4096) for _ in range(5)]
+        for buffer in buffers:
+            pool.release(buffer)
+
+        # The least recently released buffers are freed beyond the capacity of the pool
+        assert pool.cached_bytes == 3 * 4096
+        remaining = [buffer for bucket in pool.buffers.values() for buffer in bucket]
+        assert sorted(id(buffer) for buffer in remaining) == sorted(id(buffer) for buffer in buffers[2:])
+
+        # Idle buffers are reused
+        reused = pool.acquire(1000)
+        assert reused in buffers[2:]
+        assert pool.cached_bytes == 2 * 4096
+        pool.release(reused)
+
+        pool.trim(4096)
+        assert pool.cached_bytes == 4096
+        pool.empty()
+        assert pool.cached_bytes == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Benchmark of kernel generation with the compiled template engine of ``cutlass_library`` against
+the legacy ``SubstituteTemplate``, which rescanned the whole template with a regular expression per
+key until no substitution changed it. The generator is run once with each engine, with the same hash
+seed, and the generated trees are compared file by file.
+
+Usage:
+
+.. highlight:: console
+.. code-block:: console
+
+    python benchmark_template.py --architectures "80;90a" --kernels all
+"""
+
+import argparse
+import filecmp
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Runs the generator with the engine selected by the first argument
+_GENERATOR = """
+import re
+import runpy
+import sys
+import warnings
+
+def legacy_substitute_template(template, values):
+  text = template
+  changed = True
+  while changed:
+    changed = False
+    for key, value in values.items():
+      regex = "\\\\$\\\\{%s\\\\}" % key
+      newtext = re.sub(regex, value, text)
+      if newtext != text:
+        changed = True
+      text = newtext
+  return text
+
+engine = sys.argv.pop(1)
+if engine == "legacy":
+  import cutlass_library.library
+  for name, module in list(sys.modules.items()):
+    if name.startswith("cutlass_library") and hasattr(module, "SubstituteTemplate"):
+      module.SubstituteTemplate = legacy_substitute_template
+
+# The package imports the generator, which runpy then executes again as __main__
+warnings.filterwarnings("ignore", category=RuntimeWarning, module="runpy")
+runpy.run_module("cutlass_library.generator", run_name="__main__", alter_sys=True)
+"""
+
+
+def generate(engine: str, build_dir: str, args) -> float:
+  """
+  Generates the kernels selected by ``args`` into ``build_dir`` and returns the elapsed time in seconds
+
+  :param engine: "legacy" or "compiled"
+  :type engine: str
+  :param build_dir: directory into which to generate
+  :type build_dir: str
+
+  :return: elapsed time in seconds
+  :rtype: float
+  """
+  python_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "python")
+  env = dict(os.environ, PYTHONHASHSEED="0", PYTHONPATH=os.path.abspath(python_dir))
+  command = [
+    sys.executable, "-c", _GENERATOR, engine,
+    "--operations", args.operations, "--kernels", args.kernels,
+    "--architectures", args.architectures, "--cuda-version", args.cuda_version,
+    "--build-dir", build_dir, "--curr-build-dir", build_dir, "--log-level", "warning",
+  ]
+  start = time.perf_counter()
+  subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+  return time.perf_counter() - start
+
+
+def differences(dcmp: filecmp.dircmp) -> list:
+  """
+  Returns the relative paths of files that differ or exist on one side only
+
+  :param dcmp: comparison of two directories
+  :type dcmp: filecmp.dircmp
+
+  :return: list of paths
+  :rtype: list
+  """
+  # Compare contents, not only sizes and modification times
+  _, mismatch, errors = filecmp.cmpfiles(dcmp.left, dcmp.right, dcmp.common_files, shallow=False)
+  result = mismatch + errors + dcmp.left_only + dcmp.right_only
+  for name, sub in dcmp.subdirs.items():
+    result += [os.path.join(name, path) for path in differences(sub)]
+  return result
+
+
+def read_lines(path: str, build_dir: str) -> list:
+  """
+  Returns the sorted lines of the generated file at ``path``, with ``build_dir`` replaced by a placeholder.
+  SM90 tile descriptions are generated into a set, so the order in which kernels are declared varies
+  from run to run.
+
+  :param path: path of the generated file
+  :type path: str
+  :param build_dir: directory into which the file was generated
+  :type build_dir: str
+
+  :return: sorted lines of the file
+  :rtype: list
+  """
+  with open(path) as f:
+    return sorted(f.read().replace(build_dir, "<build-dir>").splitlines())
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--operations", default="all", help="Operations to generate")
+  parser.add_argument("--kernels", default="all", help="Kernels to generate")
+  parser.add_argument("--architectures", default="80;90a", help="Architectures for which to generate")
+  parser.add_argument("--cuda-version", default="12.4", help="CUDA version for which to generate")
+  args = parser.parse_args()
+
+  with tempfile.TemporaryDirectory() as tmp:
+    legacy_dir = os.path.join(tmp, "legacy")
+    compiled_dir = os.path.join(tmp, "compiled")
+    legacy_time = generate("legacy", legacy_dir, args)
+    compiled_time = generate("compiled", compiled_dir, args)
+
+    # Generated CMake manifests list absolute paths, which differ between the two build directories
+    mismatched = []
+    for path in differences(filecmp.dircmp(legacy_dir, compiled_dir)):
+      legacy_path, compiled_path = os.path.join(legacy_dir, path), os.path.join(compiled_dir, path)
+      if not (os.path.isfile(legacy_path) and os.path.isfile(compiled_path)) or \
+          read_lines(legacy_path, legacy_dir) != read_lines(compiled_path, compiled_dir):
+        mismatched.append(path)
+
+  print(f"{'engine':<10} {'time (s)':>10}")
+  print(f"{'legacy':<10} {legacy_time:>10.2f}")
+  print(f"{'compiled':<10} {compiled_time:>10.2f}")
+  print(f"speedup: {legacy_time / compiled_time:.1f}x")
+  if mismatched:
+    print(f"{len(mismatched)} generated files differ, e.g. {mismatched[0]}")
+    sys.exit(1)
+  print("generated files are identical")
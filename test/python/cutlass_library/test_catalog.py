@@ -0,0 +1,120 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for writing and querying the catalog of generated kernels
+"""
+
+import os
+import tempfile
+import unittest
+
+from cutlass_library.catalog import *
+from cutlass_library.gemm_operation import GemmOperation
+from cutlass_library.library import *
+
+
+def gemm_operation(element, layouts, alignment, threadblock_shape, min_cc=80, max_cc=1024):
+  math_instruction = MathInstruction([16, 8, 16], element, element, DataType.f32, OpcodeClass.TensorOp, MathOperation.multiply_add)
+  tile_description = TileDescription(threadblock_shape, 3, [2, 2, 1], math_instruction, min_cc, max_cc)
+  layout = {"t": LayoutType.RowMajor, "n": LayoutType.ColumnMajor}
+  A = TensorDescription(element, layout[layouts[0]], alignment)
+  B = TensorDescription(element, layout[layouts[1]], alignment)
+  C = TensorDescription(element, LayoutType.ColumnMajor, alignment)
+  return GemmOperation(GemmKind.Universal, min_cc, tile_description, A, B, C, DataType.f32)
+
+
+class TestCatalog(unittest.TestCase):
+  def setUp(self):
+    self.operations = []
+    for element in (DataType.f16, DataType.bf16):
+      for layouts in ("tn", "nt"):
+        for alignment in (2, 8):
+          for shape in ([64, 64, 32], [128, 256, 64]):
+            self.operations.append(gemm_operation(element, layouts, alignment, shape))
+    self.operations.append(gemm_operation(DataType.bf16, "tn", 8, [128, 128, 64], min_cc=90, max_cc=90))
+
+    self.tmp = tempfile.TemporaryDirectory()
+    self.path = os.path.join(self.tmp.name, "catalog.bin")
+    records = sorted((operation_record(operation, 80) for operation in self.operations), key=lambda record: record["name"])
+    write_catalog(self.path, records)
+
+  def tearDown(self):
+    self.tmp.cleanup()
+
+  def test_query(self):
+    with Catalog(self.path) as catalog:
+      self.assertEqual(len(catalog), len(self.operations))
+      self.assertEqual(catalog.values("element_a"), ["bf16", "f16"])
+
+      names = catalog.select(element_a="bf16", layout_a="t", layout_b="n", alignment_a=8)
+      expected = sorted(operation.procedural_name() for operation in self.operations
+                        if operation.A.element == DataType.bf16 and operation.A.layout == LayoutType.RowMajor
+                        and operation.B.layout == LayoutType.ColumnMajor and operation.A.alignment == 8)
+      self.assertEqual(names, expected)
+      self.assertEqual(len(names), 3)
+
+      self.assertEqual(len(catalog.select(element_a="bf16", layout_a="t", layout_b="n", alignment_a=8, cc=90)), 3)
+      self.assertEqual(len(catalog.select(element_a="bf16", layout_a="t", layout_b="n", alignment_a=8, cc=80)), 2)
+      self.assertEqual(len(catalog.select(alignment_a=[2, 8], tile_m=lambda tile_m: tile_m >= 128)), 9)
+      self.assertEqual(catalog.select(element_a="f32"), [])
+      self.assertEqual(catalog.rows(), list(range(len(self.operations))))
+
+      with self.assertRaises(Exception):
+        catalog.select(swizzle="Identity8")
+
+  def test_record(self):
+    operation = self.operations[-1]
+    with Catalog(self.path) as catalog:
+      row = catalog.find(operation.procedural_name())
+      self.assertIsNotNone(row)
+      record = catalog.record(row)
+      self.assertEqual(record, operation_record(operation, 80))
+      self.assertEqual((record["tile_m"], record["tile_n"], record["tile_k"], record["smem_usage"]),
+                       (128, 128, 64, CalculateSmemUsage(operation)))
+      self.assertIsNone(catalog.find("cutlass_missing"))
+
+  def test_empty(self):
+    path = os.path.join(self.tmp.name, "empty.bin")
+    write_catalog(path, [])
+    with Catalog(path) as catalog:
+      self.assertEqual(len(catalog), 0)
+      self.assertEqual(catalog.select(kind="gemm"), [])
+
+    with open(path, "wb") as catalog_file:
+      catalog_file.write(b"not a catalog")
+    with self.assertRaises(Exception):
+      Catalog(path)
+
+
+if __name__ == "__main__":
+  unittest.main()
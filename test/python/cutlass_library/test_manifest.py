@@ -0,0 +1,132 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for filtering kernels by name and sharding emitted sources in the manifest of cutlass_library
+"""
+
+import os
+import tempfile
+import unittest
+
+from cutlass_library.generator import GenerateSM80, define_parser
+from cutlass_library.library import GeneratorTarget
+from cutlass_library.manifest import KernelNameFilter, Manifest
+
+
+def filter_string_matches(filter_string, haystack):
+  ''' Returns true if all substrings appear in the haystack in order'''
+  for sub in filter_string.split('*'):
+    idx = haystack.find(sub)
+    if idx < 0:
+      return False
+    haystack = haystack[idx + len(sub):]
+  return True
+
+
+NAMES = [
+  "cutlass3x_sm90_tensorop_s64x128x16gemm_f16_f16_f32_f16_f16_128x128x64_1x1x1_0_tnn_align8_warpspecialized_epi_tma",
+  "cutlass3x_sm90_tensorop_s64x128x16gemm_bf16_bf16_f32_bf16_bf16_256x128x64_1x2x1_0_nnn_align8",
+  "cutlass_tensorop_s16816gemm_f16_256x128_32x3_nn_align8",
+  "cutlass_tensorop_h16816fprop_optimized_f16_128x128_64x3_nhwc_align8",
+]
+
+
+class TestKernelNameFilter(unittest.TestCase):
+  def test_glob(self):
+    filter_strings = ["sm90*f16_f16*tnn", "s16816gemm", "fprop*align4", "*", "a**8", "gemm.f16"]
+    for filter_string in filter_strings:
+      name_filter = KernelNameFilter([filter_string])
+      for name in NAMES:
+        expected = filter_string if filter_string_matches(filter_string, name) else None
+        self.assertEqual(name_filter.match(name), expected, f"{filter_string} on {name}")
+
+    name_filter = KernelNameFilter(filter_strings[:3])
+    self.assertEqual(name_filter.match(NAMES[0]), "sm90*f16_f16*tnn")
+    self.assertEqual(name_filter.match(NAMES[2]), "s16816gemm")
+    self.assertIsNone(name_filter.match(NAMES[3]))
+    self.assertIsNone(KernelNameFilter([]).match(NAMES[0]))
+
+  def test_regex(self):
+    name_filter = KernelNameFilter([r"sm90.*_nnn_", r"h16816(fprop|dgrad)"], regex=True)
+    self.assertEqual(name_filter.match(NAMES[1]), r"sm90.*_nnn_")
+    self.assertEqual(name_filter.match(NAMES[3]), r"h16816(fprop|dgrad)")
+    self.assertIsNone(name_filter.match(NAMES[2]))
+
+
+class TestManifestFilter(unittest.TestCase):
+  def manifest(self, *options):
+    with tempfile.TemporaryDirectory() as tmp:
+      args = define_parser().parse_args(["--build-dir", tmp, "--curr-build-dir", tmp, *options])
+      return Manifest(args)
+
+  def test_filter_name(self):
+    manifest = self.manifest("--kernels", "sm90*tnn,s16816gemm", "--ignore-kernels", "epi_tma")
+    self.assertEqual([manifest.filter_name(name) for name in NAMES], [False, False, True, False])
+
+    manifest = self.manifest("--kernels", "all", "--exclude-kernels", "fprop")
+    self.assertEqual([manifest.filter_name(name) for name in NAMES], [True, True, True, False])
+
+  def test_filter_file(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      path = os.path.join(tmp, "filters.list")
+      with open(path, "w") as f:
+        f.write("# comment\nsm90.*bf16\nfprop\n")
+      manifest = self.manifest("--kernels", "all", "--kernel-filter-file", path)
+    self.assertEqual([manifest.filter_name(name) for name in NAMES], [False, True, False, True])
+
+
+class TestManifestShards(unittest.TestCase):
+  def test_shards(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      args = define_parser().parse_args([
+        "--build-dir", tmp, "--curr-build-dir", tmp, "--operations", "gemm,conv2d", "--architectures", "80",
+        "--kernels", "s16816gemm_f16_256x128_32x3_tn_align8,s16816fprop_optimized_f16_256x128_32x3*align8",
+        "--shards", "1", "--disable-full-archs-compilation"])
+      manifest = Manifest(args)
+      GenerateSM80(manifest, args.cuda_version)
+      manifest.emit(GeneratorTarget.Library)
+
+      generated_path = os.path.join(tmp, "generated")
+      # Fewer shards than operation kinds are requested, so the kinds share a shard and its library
+      self.assertEqual(os.listdir(os.path.join(generated_path, "shards")), ["gemm_conv2d_shard_0.cu"])
+      with open(os.path.join(generated_path, "manifest.cmake"), "r") as f:
+        manifest_text = f.read()
+
+    self.assertEqual(manifest_text.count("cutlass_add_cutlass_library("), 1)
+    self.assertIn("SUFFIX gemm_conv2d", manifest_text)
+    self.assertIn("gemm_conv2d_shard_0.cu SM_ARCHS 80)", manifest_text)
+
+
+
+if __name__ == "__main__":
+  unittest.main()
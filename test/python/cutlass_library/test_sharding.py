@@ -0,0 +1,118 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for sharding generated configurations into translation units of balanced compile cost
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from cutlass_library.gemm_operation import GemmOperation
+from cutlass_library.library import *
+from cutlass_library.sharding import *
+
+
+def gemm_operation(threadblock_shape, stages, arch=80, opcode_class=OpcodeClass.TensorOp):
+  math_instruction = MathInstruction([16, 8, 16], DataType.f16, DataType.f16, DataType.f32, opcode_class, MathOperation.multiply_add)
+  tile_description = TileDescription(threadblock_shape, stages, [2, 2, 1], math_instruction, arch, arch)
+  A = TensorDescription(DataType.f16, LayoutType.RowMajor, 8)
+  B = TensorDescription(DataType.f16, LayoutType.ColumnMajor, 8)
+  C = TensorDescription(DataType.f32, LayoutType.RowMajor, 4)
+  return GemmOperation(GemmKind.Universal, arch, tile_description, A, B, C, DataType.f32)
+
+
+class TestSharding(unittest.TestCase):
+  def test_estimate(self):
+    small = estimate_compile_cost(gemm_operation([64, 64, 32], 3))
+    large = estimate_compile_cost(gemm_operation([256, 128, 32], 3))
+    simt = estimate_compile_cost(gemm_operation([64, 64, 32], 3, opcode_class=OpcodeClass.Simt))
+    self.assertLess(small, large)
+    self.assertLess(simt, small)
+
+  def test_shard(self):
+    costs = {f"config_{idx}": float(1 + idx % 7) for idx in range(100)}
+    shards = shard_configurations(costs, 8)
+    self.assertEqual(len(shards), 8)
+    self.assertEqual(sorted(name for shard in shards for name in shard), sorted(costs))
+
+    loads = [sum(costs[name] for name in shard) for shard in shards]
+    self.assertLessEqual(max(loads), sum(costs.values()) / 8 + max(costs.values()))
+    self.assertEqual(shard_configurations(dict(reversed(list(costs.items()))), 8), shards)
+
+    # No shard is left empty
+    self.assertEqual(len(shard_configurations({"a": 1.0, "b": 2.0}, 4)), 2)
+
+  def test_allocate(self):
+    kind_costs = {OperationKind.Gemm: 90.0, OperationKind.Conv2d: 9.0, OperationKind.Trmm: 1.0}
+    counts = allocate_shards(kind_costs, 10)
+    self.assertEqual(sum(counts.values()), 10)
+    self.assertEqual(counts[(OperationKind.Trmm,)], 1)
+    self.assertGreater(counts[(OperationKind.Gemm,)], counts[(OperationKind.Conv2d,)])
+
+    # With fewer shards than kinds, the cheapest kinds share shards
+    self.assertEqual(allocate_shards(kind_costs, 2), {(OperationKind.Gemm,): 1, (OperationKind.Conv2d, OperationKind.Trmm): 1})
+    self.assertEqual(allocate_shards(kind_costs, 1), {(OperationKind.Gemm, OperationKind.Conv2d, OperationKind.Trmm): 1})
+
+  def test_timings(self):
+    operations = {f"config_{idx}": [gemm_operation([128, 128, 32], 3)] for idx in range(4)}
+    with tempfile.TemporaryDirectory() as tmp:
+      with open(os.path.join(tmp, "gemm_shard_0.cu"), "w") as f:
+        f.write('#include "../gemm/80/x/config_2.cu"\n#include "../gemm/80/x/config_3.cu"\n')
+
+      ninja_log = os.path.join(tmp, ".ninja_log")
+      with open(ninja_log, "w") as f:
+        f.write("# ninja log v5\n")
+        f.write("0\t5000\t0\tgenerated/gemm/80/x/config_0.cu.o\t0\n")
+        f.write("0\t3000\t0\tgenerated/gemm/80/x/config_0.cu.o\t0\n")
+        f.write("0\t8000\t0\tgenerated/shards/gemm_shard_0.cu.o\t0\n")
+      timings = read_compile_timings(ninja_log)
+      self.assertEqual(timings, {"config_0": 3.0, "gemm_shard_0": 8.0})
+
+      json_path = os.path.join(tmp, "timings.json")
+      with open(json_path, "w") as f:
+        json.dump({"config_1": 2}, f)
+      self.assertEqual(read_compile_timings(json_path), {"config_1": 2.0})
+
+      costs = compile_costs(operations, timings, tmp)
+
+    # The shard's time is divided among its configurations, and config_1 is estimated on the same scale
+    self.assertEqual(costs["config_0"], 3.0)
+    self.assertAlmostEqual(costs["config_2"], 4.0)
+    self.assertAlmostEqual(costs["config_3"], 4.0)
+    self.assertAlmostEqual(costs["config_1"], 11.0 / 3.0)
+
+
+if __name__ == "__main__":
+  unittest.main()
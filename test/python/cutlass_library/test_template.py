@@ -0,0 +1,73 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for the template engine of cutlass_library
+"""
+
+import unittest
+
+from cutlass_library.library import CompileTemplate, SubstituteTemplate, TextTemplate
+
+
+class TestTemplate(unittest.TestCase):
+  def test_substitute(self):
+    template = "${element} ${layout} = ${element}(${value});"
+    values = {"element": "float", "layout": "RowMajor", "value": "1"}
+    self.assertEqual(SubstituteTemplate(template, values), "float RowMajor = float(1);")
+    self.assertEqual(SubstituteTemplate(TextTemplate(template), values), "float RowMajor = float(1);")
+    self.assertEqual(SubstituteTemplate("no placeholders", values), "no placeholders")
+
+  def test_missing(self):
+    # Placeholders without a value are left for a later substitution
+    template = "${element} x = ${unknown};"
+    self.assertEqual(SubstituteTemplate(template, {"element": "int"}), "int x = ${unknown};")
+    self.assertEqual(SubstituteTemplate("$element {element} $", {"element": "int"}), "$element {element} $")
+
+  def test_nested(self):
+    # Values may themselves contain placeholders
+    template = "using Gemm = ${gemm};"
+    values = {"gemm": "Gemm<${element_a}, ${element_b}>", "element_a": "half_t", "element_b": "${element_a}"}
+    self.assertEqual(SubstituteTemplate(template, values), "using Gemm = Gemm<half_t, half_t>;")
+
+  def test_escapes(self):
+    # Backslash escapes in values are processed as they were by re.sub
+    self.assertEqual(SubstituteTemplate("a${x}b", {"x": "\\n"}), "a\nb")
+    self.assertEqual(SubstituteTemplate("a${x}b", {"x": "\\\\"}), "a\\b")
+
+  def test_cache(self):
+    template = "${element} y;"
+    self.assertIs(CompileTemplate(template), CompileTemplate(template))
+
+
+if __name__ == "__main__":
+  unittest.main()
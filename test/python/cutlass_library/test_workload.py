@@ -0,0 +1,148 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for selecting kernels for the problem shapes of a workload file
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from cutlass_library.gemm_operation import GemmOperation
+from cutlass_library.library import *
+from cutlass_library.workload import *
+
+
+def gemm_operation(threadblock_shape, stages, layouts="tn", alignment=8, math_operation=MathOperation.multiply_add,
+                   tile_scheduler=TileSchedulerType.Default):
+  math_instruction = MathInstruction([16, 8, 16], DataType.f16, DataType.f16, DataType.f32, OpcodeClass.TensorOp, math_operation)
+  tile_description = TileDescription(threadblock_shape, stages, [2, 2, 1], math_instruction, 80, 1024)
+  layout = {"t": LayoutType.RowMajor, "n": LayoutType.ColumnMajor}
+  A = TensorDescription(DataType.f16, layout[layouts[0]], alignment)
+  B = TensorDescription(DataType.f16, layout[layouts[1]], alignment)
+  C = TensorDescription(DataType.f16, LayoutType.ColumnMajor, alignment)
+  return GemmOperation(GemmKind.Universal, 80, tile_description, A, B, C, DataType.f32, tile_scheduler=tile_scheduler)
+
+
+class TestWorkload(unittest.TestCase):
+  def test_from_record(self):
+    workload = Workload.from_record({"m": "1024", "n": "512", "k": "256", "a_type": "f16", "layout": "tn", "c_type": ""})
+    self.assertEqual((workload.kind, workload.m, workload.n, workload.k, workload.batch), (OperationKind.Gemm, 1024, 512, 256, 1))
+    self.assertEqual(workload.element_a, DataType.f16)
+    self.assertIsNone(workload.element_c)
+
+    conv = {"kind": "conv2d", "n": 32, "h": 56, "w": 56, "c": 64, "k": 128, "r": 3, "s": 3, "pad_h": 1, "pad_w": 1}
+    fprop = Workload.from_record(conv)
+    self.assertEqual((fprop.kind, fprop.conv_kind), (OperationKind.Conv2d, ConvKind.Fprop))
+    self.assertEqual((fprop.m, fprop.n, fprop.k), (32 * 56 * 56, 128, 64 * 9))
+    dgrad = Workload.from_record(dict(conv, conv_kind="dgrad"))
+    self.assertEqual((dgrad.m, dgrad.n, dgrad.k), (32 * 56 * 56, 64, 128 * 9))
+    wgrad = Workload.from_record(dict(conv, conv_kind="wgrad", stride_h=2, stride_w=2))
+    self.assertEqual((wgrad.m, wgrad.n, wgrad.k), (128, 64 * 9, 32 * 28 * 28))
+    self.assertEqual(wgrad.channels, (64, 128))
+
+    with self.assertRaises(Exception):
+      Workload.from_record({"m": 1, "n": 1})
+    with self.assertRaises(Exception):
+      Workload.from_record({"m": 1, "n": 1, "k": 1, "a_type": "f17"})
+
+  def test_supports(self):
+    workload = Workload.from_record({"m": 4096, "n": 4096, "k": 4096, "a_type": "f16", "layout": "tn"})
+    self.assertTrue(workload.supports(gemm_operation([128, 128, 32], 3)))
+    self.assertFalse(workload.supports(gemm_operation([128, 128, 32], 3, layouts="nt")))
+    self.assertFalse(workload.supports(gemm_operation([128, 128, 32], 3, math_operation=MathOperation.multiply_add_fast_accum)))
+
+    fast = Workload.from_record({"m": 4096, "n": 4096, "k": 4096, "math": "fast"})
+    self.assertTrue(fast.supports(gemm_operation([128, 128, 32], 3, math_operation=MathOperation.multiply_add_fast_accum)))
+
+    # K is contiguous in a row-major A and must be a multiple of its alignment
+    odd = Workload.from_record({"m": 4096, "n": 4096, "k": 4092})
+    self.assertFalse(odd.supports(gemm_operation([128, 128, 32], 3)))
+    self.assertTrue(odd.supports(gemm_operation([128, 128, 32], 3, alignment=4)))
+
+  def test_estimate_runtime(self):
+    # Small tiles load more operand bytes per multiply-add
+    large = Workload(OperationKind.Gemm, 8192, 8192, 8192)
+    self.assertLess(estimate_runtime(gemm_operation([128, 128, 32], 3), large, 108, 80),
+                    estimate_runtime(gemm_operation([32, 32, 32], 3), large, 108, 80))
+
+    # Narrow accesses are penalized
+    self.assertLess(estimate_runtime(gemm_operation([128, 128, 32], 3), large, 108, 80),
+                    estimate_runtime(gemm_operation([128, 128, 32], 3, alignment=2), large, 108, 80))
+
+    # One tile more than fits in a wave takes a second wave, unless stream-K divides the work evenly
+    operation = gemm_operation([128, 128, 64], 4)
+    full = estimate_runtime(operation, Workload(OperationKind.Gemm, 128 * 16, 128, 4096), 16, 80)
+    spilled = estimate_runtime(operation, Workload(OperationKind.Gemm, 128 * 17, 128, 4096), 16, 80)
+    self.assertAlmostEqual(spilled, 2 * full)
+    stream_k = gemm_operation([128, 128, 64], 4, tile_scheduler=TileSchedulerType.StreamK)
+    self.assertLess(estimate_runtime(stream_k, Workload(OperationKind.Gemm, 128 * 17, 128, 4096), 16, 80), spilled)
+
+    # Splitting K occupies more SMs when output tiles are few
+    narrow = Workload(OperationKind.Gemm, 128, 128, 8192)
+    self.assertLess(estimate_runtime(operation, narrow, 16, 80, split_k=8), estimate_runtime(operation, narrow, 16, 80))
+
+  def test_read_workloads(self):
+    with tempfile.TemporaryDirectory() as tmp:
+      csv_path = os.path.join(tmp, "workloads.csv")
+      with open(csv_path, "w") as csv_file:
+        csv_file.write("# shapes\nkind,m,n,k,a_type,frequency\ngemm,128,256,64,f16,10\ngemm,1,1,1,,0\n")
+      workloads = read_workloads(csv_path)
+      self.assertEqual(len(workloads), 1)
+      self.assertEqual((workloads[0].m, workloads[0].n, workloads[0].k, workloads[0].frequency), (128, 256, 64, 10.0))
+
+      json_path = os.path.join(tmp, "workloads.json")
+      with open(json_path, "w") as json_file:
+        json.dump({"workloads": [{"m": 128, "n": 256, "k": 64}, {"kind": "conv3d", "n": 1, "d": 8, "h": 8, "w": 8,
+                                                                  "c": 16, "k": 32, "t": 1, "r": 1, "s": 1}]}, json_file)
+      workloads = read_workloads(json_path)
+      self.assertEqual([workload.kind for workload in workloads], [OperationKind.Gemm, OperationKind.Conv3d])
+      self.assertEqual((workloads[1].m, workloads[1].n, workloads[1].k), (512, 32, 16))
+
+  def test_select_operations(self):
+    operations = {}
+    for shape in ([64, 64, 32], [128, 128, 32], [256, 128, 32]):
+      for layouts in ("tn", "nt"):
+        operation = gemm_operation(shape, 3, layouts=layouts)
+        operations[operation.procedural_name()] = operation
+
+    workloads = [Workload.from_record({"m": 8192, "n": 8192, "k": 8192, "layout": "tn"})]
+    selected = select_operations(operations, workloads, [80], top_k=2)
+    self.assertEqual(len(selected), 2)
+    self.assertTrue(all(operations[name].A.layout == LayoutType.RowMajor for name in selected))
+    self.assertEqual(select_operations(operations, workloads, [70]), set())
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,96 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Micro-benchmarks of the pycute layout algebra. Each expression is evaluated repeatedly with cold
+memoization caches (cleared before every evaluation) and with warm caches, as happens when the
+same layout expressions are evaluated many times by EVT layout passes and kernel-search scripts.
+
+Usage:
+
+.. highlight:: console
+.. code-block:: console
+
+    python benchmark_layout.py --iterations 1000
+"""
+
+import argparse
+import timeit
+
+from pycute import *
+
+
+# Functions of the layout algebra and the operands with which they are benchmarked
+EXPRESSIONS = {
+  "coalesce": (coalesce, (Layout(((2,2),(2,2),(4,8)), ((1,4),(2,8),(16,64))),)),
+  "complement": (complement, (Layout((4,(2,4)), (2,(1,16))), 1024)),
+  "composition": (composition, (Layout(((4,8),(8,16)), ((8,256),(1,32))), Layout((32,8), (8,1)))),
+  "logical_divide": (logical_divide, (Layout((128,64), (64,1)), (Layout(16), Layout(8)))),
+  "logical_product": (logical_product, (Layout((2,4), (4,1)), Layout((8,16)))),
+  "zipped_divide": (zipped_divide, (Layout(((8,16),(8,8)), ((64,1024),(1,8))), (Layout(64), Layout(16)))),
+  "tiled_divide": (tiled_divide, (Layout((256,128,4), (1,256,32768)), (Layout(128), Layout(64)))),
+}
+
+
+def benchmark(function, operands: tuple, iterations: int) -> tuple:
+  """
+  Returns the average time in microseconds to evaluate ``function`` on ``operands`` with cold and with
+  warm caches
+
+  :param function: function of the layout algebra
+  :param operands: operands with which to call ``function``
+  :type operands: tuple
+  :param iterations: number of evaluations to time
+  :type iterations: int
+
+  :return: tuple of average times with cold and warm caches
+  :rtype: tuple
+  """
+  def cold():
+    clear_caches()
+    function(*operands)
+
+  cold_time = timeit.timeit(cold, number=iterations)
+  function(*operands)
+  warm_time = timeit.timeit(lambda: function(*operands), number=iterations)
+  return cold_time * 1e6 / iterations, warm_time * 1e6 / iterations
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--iterations", default=1000, type=int, help="Number of evaluations of each expression")
+  args = parser.parse_args()
+
+  print(f"{'expression':<16} {'cold (us)':>10} {'warm (us)':>10} {'speedup':>8}")
+  for name, (function, operands) in EXPRESSIONS.items():
+    cold_us, warm_us = benchmark(function, operands, args.iterations)
+    print(f"{name:<16} {cold_us:>10.2f} {warm_us:>10.2f} {cold_us / warm_us:>7.1f}x")
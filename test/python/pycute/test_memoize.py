@@ -0,0 +1,89 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for immutable layouts and memoization of the pycute layout algebra
+"""
+
+import copy
+import logging
+import pickle
+import unittest
+
+from pycute import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestMemoize(unittest.TestCase):
+  def test_immutable(self):
+    layout = Layout(((2,2),4), ((1,8),2))
+    with self.assertRaises(AttributeError):
+      layout.shape = (4,4)
+    with self.assertRaises(AttributeError):
+      ComposedLayout(Swizzle(2,3,3), 0, layout).offset = 1
+
+  def test_hash(self):
+    layout = Layout(((2,2),4), ((1,8),2))
+    self.assertEqual(layout, Layout(((2,2),4), ((1,8),2)))
+    self.assertEqual(hash(layout), hash(Layout(((2,2),4), ((1,8),2))))
+    self.assertNotEqual(layout, Layout(((2,2),4)))
+    self.assertNotEqual(layout, (((2,2),4), ((1,8),2)))
+
+    composed = ComposedLayout(Swizzle(2,3,3), 0, layout)
+    self.assertEqual(composed, ComposedLayout(Swizzle(2,3,3), 0, Layout(((2,2),4), ((1,8),2))))
+    self.assertEqual(hash(composed), hash(ComposedLayout(Swizzle(2,3,3), 0, Layout(((2,2),4), ((1,8),2)))))
+
+    for other in [copy.copy(layout), copy.deepcopy(layout), pickle.loads(pickle.dumps(layout))]:
+      self.assertEqual(other, layout)
+    self.assertEqual(pickle.loads(pickle.dumps(composed)), composed)
+
+  def test_memoize(self):
+    clear_caches()
+    layoutA = Layout((128,64), (64,1))
+    tiler = (Layout(16), Layout(8))
+
+    result = logical_divide(layoutA, tiler)
+    misses = logical_divide.cache_info().misses
+    _LOGGER.debug(f"{layoutA} / {tiler}  =>  {result}")
+
+    # Equal operands hit the cache and return the same result
+    self.assertIs(logical_divide(Layout((128,64), (64,1)), (Layout(16), Layout(8))), result)
+    self.assertEqual(logical_divide.cache_info().misses, misses)
+
+    clear_caches()
+    self.assertEqual(logical_divide.cache_info().currsize, 0)
+    self.assertEqual(logical_divide(layoutA, tiler), result)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,90 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for evaluating pycute layouts on NumPy arrays
+"""
+
+import logging
+import unittest
+
+from pycute import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@unittest.skipIf(np is None, "NumPy is not available")
+class TestNumpy(unittest.TestCase):
+  def helper_test_layout(self, layout):
+    _LOGGER.debug(f"{layout}")
+
+    indices = layout.to_array()
+    self.assertEqual(indices.shape, (size(layout),))
+    for i in range(size(layout)):
+      self.assertEqual(indices[i], layout(i))
+
+    # Coordinates given as a tuple of arrays, one per mode
+    if is_tuple(layout.shape):
+      crds = idx2crd(np.arange(size(layout)), layout.shape)
+      self.assertTrue(np.array_equal(layout(crds), indices))
+
+  def test_layout(self):
+    self.helper_test_layout(Layout(1,0))
+    self.helper_test_layout(Layout(8,2))
+    self.helper_test_layout(Layout((2,4)))
+    self.helper_test_layout(Layout((2,4,6), (1,6,2)))
+    self.helper_test_layout(Layout((2,(4,6)), (12,(1,-2))))
+    self.helper_test_layout(Layout(((2,2),(2,2)), ((1,4),(8,32))))
+
+    # Indices beyond the size of the layout extend its last mode
+    layout = Layout((2,4), (4,1))
+    idx = np.arange(3 * size(layout))
+    self.assertEqual(list(layout(idx)), [layout(int(i)) for i in idx])
+
+  def test_swizzle(self):
+    for swizzle in [Swizzle(3,3,3), Swizzle(2,4,3), Swizzle(2,4,-3), Swizzle(0,0,0)]:
+      offsets = np.arange(1 << 12)
+      self.assertEqual(list(swizzle(offsets)), [swizzle(int(o)) for o in offsets])
+
+  def test_composed_layout(self):
+    layout = ComposedLayout(Swizzle(3,3,3), 0, Layout((128,64), (64,1)))
+    indices = layout.to_array()
+    self.assertEqual(sorted(indices), list(range(size(layout))))
+    for i in range(0, size(layout), 97):
+      self.assertEqual(indices[i], layout(i))
+
+    rows, cols = np.meshgrid(np.arange(128), np.arange(64), indexing="ij")
+    self.assertTrue(np.array_equal(layout((rows, cols)), indices.reshape(64, 128).T))
+
+
+if __name__ == "__main__":
+  unittest.main()